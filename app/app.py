@@ -4,18 +4,37 @@ from flask_migrate import Migrate
 from app.config.development import DevelopmentConfig
 
 from app.extensions.database import db
+from app.extensions.pool import pools
 from app.extensions.jwt import jwt
 from app.extensions.email import mail
 from app.extensions.cors import cors
+from app.extensions.cache import cache
+from app.extensions.counters import counters
+from app.extensions.revocation import revocations
+from app.extensions.passwords import passwords
+from app.extensions.outbox import outbox
+from app.extensions.replicas import replicas
 
-from app.routes.auth import black_list
 from app.routes.auth import auth_routes
 from app.routes.user import user_routes
 from app.routes.community import community_routes
 from app.routes.post import post_routes
 from app.routes.comment import comment_routes
-
-from app.models.user import User
+from app.routes.feed import feed_routes
+from app.routes.health import health_routes
+
+from app.commands.counters import counters_cli
+from app.commands.posts import posts_cli
+from app.commands.feed import feed_cli
+from app.commands.tokens import tokens_cli
+from app.commands.mail import mail_cli
+
+from app.loaders.post import PostFlagsLoader
+from app.loaders.comment import CommentTreeLoader
+from app.loaders.block import BlockGraphLoader
+from app.loaders.viewer import ViewerContextLoader
+from app.loaders.community import CommunityMembershipLoader
+from app.loaders.identity import IdentityLoader
 
 from app.errors.errors import ValidationError
 from app.errors.errors import NotFoundError
@@ -30,6 +49,7 @@ from app.errors.errors import OwnershipError
 from app.errors.errors import UnauthorizedError
 from app.errors.errors import BookmarkError
 from app.errors.errors import VoteError
+from app.errors.errors import OverloadedError
 
 from app.handlers.errors import handler_validation_error
 from app.handlers.errors import handler_not_found
@@ -44,6 +64,7 @@ from app.handlers.errors import handler_ownership_error
 from app.handlers.errors import handler_unauthorized_error
 from app.handlers.errors import handler_bookmark_error
 from app.handlers.errors import handler_vote_error
+from app.handlers.errors import handler_overloaded_error
 
 
 def create_app(config_class=DevelopmentConfig):
@@ -54,33 +75,42 @@ def create_app(config_class=DevelopmentConfig):
     register_extensions(app)
     register_blueprints(app)
     register_handlers(app)
+    register_hooks(app)
+    register_commands(app)
 
     return app
 
 
 def register_extensions(app):
+    pools.init_app(app)
     db.init_app(app)
     migrate = Migrate(app, db)
     jwt.init_app(app)
     mail.init_app(app)
+    cache.init_app(app)
+    counters.init_app(app)
+    revocations.init_app(app)
+    passwords.init_app(app)
+    outbox.init_app(app)
+    replicas.init_app(app)
     cors.init_app(
         app, 
         supports_credentials=True
     )
     
 
+    # Authentication reads from the primary, so a new or changed account
+    # is seen before the replicas catch up
     @jwt.user_lookup_loader
     def user_lookup_callback(_jwt_header, jwt_data):
-        identity = jwt_data["sub"]
-
-        return User.query.filter_by(id=identity).one_or_none()
+        with replicas.primary():
+            return IdentityLoader.load(jwt_data)
 
 
     @jwt.token_in_blocklist_loader
     def check_if_token_in_blacklist(jwt_header, jwt_payload):
-        jti = jwt_payload["jti"]
-
-        return jti in black_list
+        with replicas.primary():
+            return revocations.is_revoked(jwt_payload)
 
 
 def register_blueprints(app):
@@ -89,6 +119,8 @@ def register_blueprints(app):
     app.register_blueprint(community_routes, url_prefix='/community')
     app.register_blueprint(post_routes, url_prefix='/post')
     app.register_blueprint(comment_routes, url_prefix='/comment')
+    app.register_blueprint(feed_routes, url_prefix='/feed')
+    app.register_blueprint(health_routes, url_prefix='/health')
 
 
 def register_handlers(app):
@@ -105,3 +137,36 @@ def register_handlers(app):
     app.register_error_handler(NotInError, handler_not_in_error)
     app.register_error_handler(BookmarkError, handler_bookmark_error)
     app.register_error_handler(VoteError, handler_vote_error)
+    app.register_error_handler(OverloadedError, handler_overloaded_error)
+
+
+def register_hooks(app):
+    @app.before_request
+    def route_reads_to_replicas():
+        replicas.route_reads()
+
+    @app.after_request
+    def pin_writers_to_primary(response):
+        replicas.pin(response)
+
+        return response
+
+    @app.teardown_request
+    def release_replicas(exception):
+        replicas.release()
+
+    @app.teardown_request
+    def clear_loaders(exception):
+        PostFlagsLoader.clear()
+        CommentTreeLoader.clear()
+        BlockGraphLoader.clear()
+        ViewerContextLoader.clear()
+        CommunityMembershipLoader.clear()
+
+
+def register_commands(app):
+    app.cli.add_command(counters_cli)
+    app.cli.add_command(posts_cli)
+    app.cli.add_command(feed_cli)
+    app.cli.add_command(tokens_cli)
+    app.cli.add_command(mail_cli)
@@ -0,0 +1,26 @@
+# Click
+import click
+
+# Flask
+from flask.cli import AppGroup
+
+# Models
+from app.models.post import PostStats
+from app.models.comment import CommentStats
+from app.models.community import CommunityStats
+from app.models.user import UserStats
+
+
+counters_cli = AppGroup('counters', help='Manage the stats counters.')
+
+
+@counters_cli.command('reconcile')
+def reconcile():
+    '''
+    Recompute every stats counter from the rows it counts.
+    '''
+
+    for stats in (PostStats, CommentStats, CommunityStats, UserStats):
+        stats.reconcile()
+
+        click.echo(f'Reconciled {stats.__tablename__}.')
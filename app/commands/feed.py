@@ -0,0 +1,28 @@
+# Click
+import click
+
+# Flask
+from flask.cli import AppGroup
+
+# Extensions
+from app.extensions.database import db
+
+# Models
+from app.models.user import User
+from app.models.feed import FeedItem
+
+
+feed_cli = AppGroup('feed', help='Manage the home feeds.')
+
+
+@feed_cli.command('rebuild')
+def rebuild():
+    '''
+    Deliver to every user the latest posts of their subscriptions and
+    follows.
+    '''
+
+    for user in db.session.scalars(db.select(User).order_by(User.id)):
+        FeedItem.rebuild(user)
+
+    click.echo('Rebuilt the feeds.')
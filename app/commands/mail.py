@@ -0,0 +1,67 @@
+# Click
+import click
+
+# Flask
+from flask import current_app
+from flask.cli import AppGroup
+
+# Extensions
+from app.extensions.outbox import outbox
+
+# Models
+from app.models.email import OutboxEmail
+
+# Utils
+from app.utils.outbox import OutboxWorkers
+
+
+mail_cli = AppGroup('mail', help='Manage the mail outbox.')
+
+
+@mail_cli.command('deliver')
+def deliver():
+    '''
+    Send every due email of the outbox and exit.
+    '''
+
+    claimed = outbox.drain()
+
+    click.echo(f'Claimed {claimed} emails: {outbox.metrics.snapshot()}.')
+
+
+@mail_cli.command('work')
+@click.option('--workers', type=int, default=None, help='Number of worker threads.')
+def work(workers):
+    '''
+    Send the emails of the outbox as they are queued, until interrupted.
+    '''
+
+    app = current_app._get_current_object()
+
+    pool = OutboxWorkers(
+        app,
+        outbox.deliver,
+        workers=workers or app.config.get('MAIL_OUTBOX_WORKERS'),
+        poll_interval=app.config.get('MAIL_OUTBOX_POLL_INTERVAL')
+    )
+
+    pool.start()
+
+    click.echo(f'Started {pool.workers} mail workers.')
+
+    try:
+        pool.wait()
+    except KeyboardInterrupt:
+        pool.stop()
+
+    click.echo(f'Stopped: {outbox.metrics.snapshot()}.')
+
+
+@mail_cli.command('stats')
+def stats():
+    '''
+    Count the emails of the outbox by state.
+    '''
+
+    for state, count in OutboxEmail.stats().items():
+        click.echo(f'{state}: {count}')
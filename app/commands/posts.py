@@ -0,0 +1,23 @@
+# Click
+import click
+
+# Flask
+from flask.cli import AppGroup
+
+# Models
+from app.models.post import PostStats
+
+
+posts_cli = AppGroup('posts', help='Manage the posts.')
+
+
+@posts_cli.command('rerank')
+@click.option('--batch-size', default=1000, show_default=True, help='Number of posts updated per transaction.')
+def rerank(batch_size):
+    '''
+    Recompute the hot and best scores of every post.
+    '''
+
+    PostStats.rescore(batch_size=batch_size)
+
+    click.echo('Reranked the posts.')
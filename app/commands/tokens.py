@@ -0,0 +1,22 @@
+# Click
+import click
+
+# Flask
+from flask.cli import AppGroup
+
+# Extensions
+from app.extensions.revocation import revocations
+
+
+tokens_cli = AppGroup('tokens', help='Manage the revoked tokens.')
+
+
+@tokens_cli.command('purge')
+def purge():
+    '''
+    Delete the revoked tokens that have expired.
+    '''
+
+    purged = revocations.purge()
+
+    click.echo(f'Purged {purged} expired tokens.')
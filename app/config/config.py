@@ -20,9 +20,71 @@ class Config:
     JWT_REFRESH_TOKEN_EXPIRES = datetime.timedelta(days=30)
     JWT_REFRESH_COOKIE_NAME = 'refresh_token'
 
+    # Revocations
+    REVOCATION_STORE = 'memory'
+
+    # Identity
+    USER_IDENTITY_CACHE_TTL = 30
+
+    # Passwords
+    PASSWORD_HASH_ROUNDS = 29000
+    PASSWORD_HASH_WORKERS = 2
+    PASSWORD_HASH_MAX_PENDING = 16
+
     # Flask-Mail
     MAIL_SERVER = os.environ.get('MAIL_SERVER')
     MAIL_PORT = 465
     MAIL_USERNAME = os.environ.get('MAIL_USERNAME')
     MAIL_PASSWORD = os.environ.get('MAIL_PASSWORD')
-    MAIL_USE_SSL = True
\ No newline at end of file
+    MAIL_USE_SSL = True
+
+    # Mail outbox
+    MAIL_OUTBOX_WORKERS = 2
+    MAIL_OUTBOX_BATCH_SIZE = 50
+    MAIL_OUTBOX_POLL_INTERVAL = 5
+    MAIL_OUTBOX_LEASE = 300
+    MAIL_OUTBOX_MAX_ATTEMPTS = 5
+    MAIL_OUTBOX_RETRY_BACKOFF = 30
+    MAIL_OUTBOX_RETRY_BACKOFF_MAX = 3600
+
+    # Cache
+    CACHE_MAX_ENTRIES = 10000
+    CACHE_DEFAULT_TTL = 300
+    RESPONSE_CACHE_TTL = 30
+
+    # Blocks
+    BLOCK_GRAPH_CACHE_TTL = 60
+
+    # Counters
+    COUNTERS_WRITE_BEHIND = False
+    COUNTERS_FLUSH_INTERVAL = 5
+
+    # Connection pool
+    DATABASE_POOL_SIZE = 5
+    DATABASE_POOL_MAX_OVERFLOW = 10
+    DATABASE_POOL_TIMEOUT = 30
+    DATABASE_POOL_RECYCLE = 1800
+    DATABASE_POOL_PRE_PING = True
+    DATABASE_PGBOUNCER = False
+
+    # Health, the bearer token of the /health endpoints, which are off without it
+    HEALTH_TOKEN = os.environ.get('HEALTH_TOKEN')
+
+    # Replicas
+    SQLALCHEMY_REPLICA_BINDS = ()
+    REPLICA_PIN_SECONDS = 5
+    REPLICA_PIN_COOKIE_NAME = 'read_primary'
+
+    # Pagination
+    PAGINATION_COUNT_CACHE_TTL = 60
+
+    # Feed
+    FEED_FANOUT_MAX_SUBSCRIBERS = 10000
+    FEED_BACKFILL_SIZE = 100
+
+    # Comments
+    COMMENT_TREE_MAX_DEPTH = None
+    COMMENT_TREE_MAX_BREADTH = None
+
+    # Votes
+    VOTES_BATCH_MAX_SIZE = 100
@@ -10,4 +10,22 @@ class DevelopmentConfig(Config):
     DEBUG = True
 
     # Flask-SQLAlchemy
-    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URI')
\ No newline at end of file
+    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URI')
+
+    # Connection pool
+    DATABASE_POOL_SIZE = int(os.environ.get('DATABASE_POOL_SIZE', Config.DATABASE_POOL_SIZE))
+    DATABASE_POOL_MAX_OVERFLOW = int(os.environ.get('DATABASE_POOL_MAX_OVERFLOW', Config.DATABASE_POOL_MAX_OVERFLOW))
+    DATABASE_POOL_TIMEOUT = int(os.environ.get('DATABASE_POOL_TIMEOUT', Config.DATABASE_POOL_TIMEOUT))
+    DATABASE_POOL_RECYCLE = int(os.environ.get('DATABASE_POOL_RECYCLE', Config.DATABASE_POOL_RECYCLE))
+    DATABASE_POOL_PRE_PING = os.environ.get('DATABASE_POOL_PRE_PING', 'true') == 'true'
+
+    # PgBouncer in transaction mode in front of the database
+    DATABASE_PGBOUNCER = os.environ.get('DATABASE_PGBOUNCER') == 'true'
+
+    # Revocations, 'database' to share the logouts between the workers
+    REVOCATION_STORE = os.environ.get('REVOCATION_STORE', Config.REVOCATION_STORE)
+
+    # Read replica, e.g. a second SQLite file or Postgres instance
+    if os.environ.get('DATABASE_REPLICA_URI'):
+        SQLALCHEMY_BINDS = {'replica': os.environ.get('DATABASE_REPLICA_URI')}
+        SQLALCHEMY_REPLICA_BINDS = ('replica',)
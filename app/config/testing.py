@@ -6,5 +6,8 @@ class TestingConfig(Config):
     # Flask
     TESTING = True
 
+    # Passwords
+    PASSWORD_HASH_WORKERS = 0
+
     # Flask-SQLAlchemy
     SQLALCHEMY_DATABASE_URI = 'sqlite:///discussify.db'
\ No newline at end of file
@@ -45,4 +45,8 @@ class BookmarkError(Exception):
 
 
 class VoteError(Exception):
+    pass
+
+
+class OverloadedError(Exception):
     pass
\ No newline at end of file
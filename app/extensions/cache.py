@@ -0,0 +1,37 @@
+# Flask
+from flask import current_app
+
+# Utils
+from app.utils.cache import TTLCache
+from app.utils.cache import DEFAULT_TTL
+
+
+class Cache:
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.extensions['cache'] = TTLCache(
+            max_entries=app.config.get('CACHE_MAX_ENTRIES', 10000),
+            default_ttl=app.config.get('CACHE_DEFAULT_TTL', 300)
+        )
+
+    @property
+    def store(self):
+        return current_app.extensions['cache']
+
+    def get(self, key, default=None):
+        return self.store.get(key, default)
+
+    def set(self, key, value, ttl=DEFAULT_TTL):
+        self.store.set(key, value, ttl=ttl)
+
+    def delete(self, key):
+        self.store.delete(key)
+
+    def clear(self):
+        self.store.clear()
+
+
+cache = Cache()
@@ -0,0 +1,199 @@
+# Flask
+from flask import current_app
+from flask import has_app_context
+
+# SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# Extensions
+from app.extensions.database import db
+
+# Utils
+from app.utils.counters import CounterDeltas
+from app.utils.counters import CounterBuffer
+from app.utils.counters import counter_updates
+
+
+class Counters:
+    '''
+    Applies the changes to the stats counters. By default each change is
+    written right away. With COUNTERS_WRITE_BEHIND enabled the changes are
+    summed per row in the session, handed to a process-wide buffer when
+    the session commits, and written in batches at the end of a transaction
+    once COUNTERS_FLUSH_INTERVAL seconds have passed since the last flush.
+    '''
+
+    def __init__(self, app=None):
+        self.derived = {}
+        self.watchers = {}
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        buffer = None
+
+        if app.config.get('COUNTERS_WRITE_BEHIND', False):
+            buffer = CounterBuffer(interval=app.config.get('COUNTERS_FLUSH_INTERVAL', 0))
+
+        app.extensions['counters'] = buffer
+
+    @property
+    def buffer(self):
+        if not has_app_context():
+            return None
+
+        return current_app.extensions.get('counters')
+
+    def add(self, connection, table, key_column, key, **deltas):
+        '''
+        Change the counters of a stats row.
+
+        :param connection: The connection or session running the flush.
+        :param table: The stats table.
+        :param key_column: The name of the column identifying the row.
+        :param key: The value of the key column.
+        :param deltas: The amount to add to each counter column.
+        '''
+
+        # The row is not known yet, e.g. a vote direction set before its post
+        if key is None:
+            return
+
+        for function in self.watchers.get(table, ()):
+            function(key)
+
+        if self.buffer is None:
+            update_query = table.update().where(
+                table.c[key_column] == key
+            ).values(
+                self.values(table, deltas)
+            )
+
+            connection.execute(update_query)
+
+            return
+
+        pending = db.session.info.setdefault('counter_deltas', CounterDeltas())
+        pending.add(table, key_column, key, deltas)
+
+    def add_all(self, connection, table, key_column, rows):
+        '''
+        Change the counters of several stats rows at once, writing them
+        with one UPDATE per set of changed columns.
+
+        :param connection: The connection or session running the writes.
+        :param table: The stats table.
+        :param key_column: The name of the column identifying the rows.
+        :param rows: Dictionary of the deltas of each row, keyed by the
+            value of the key column.
+        '''
+
+        deltas = CounterDeltas()
+
+        for key, row in rows.items():
+            if key is None:
+                continue
+
+            for function in self.watchers.get(table, ()):
+                function(key)
+
+            deltas.add(table, key_column, key, row)
+
+        if self.buffer is None:
+            for update_query, parameters in counter_updates(deltas.drain(), self.values):
+                connection.execute(update_query, parameters)
+
+            return
+
+        pending = db.session.info.setdefault('counter_deltas', CounterDeltas())
+        pending.merge(deltas)
+
+    def derive(self, table, function):
+        '''
+        Register columns of a stats table that are computed from its
+        counters, so they are updated in the same statement.
+
+        :param table: The stats table.
+        :param function: Callable taking the table and the SET clause of
+            the counters, and returning the SET clause of the derived
+            columns. The row's columns still hold the old values in it.
+        '''
+
+        self.derived.setdefault(table, []).append(function)
+
+    def watch(self, table, function):
+        '''
+        Register a function called with the key of every row of a stats
+        table whose counters change, e.g. to drop cached copies of it.
+
+        :param table: The stats table.
+        :param function: Callable taking the value of the key column.
+        '''
+
+        self.watchers.setdefault(table, []).append(function)
+
+    def values(self, table, deltas):
+        '''
+        Build the SET clause adding the deltas to the counters of a table,
+        along with its derived columns.
+
+        :param table: The stats table.
+        :param deltas: The amount, or bound parameter, to add to each
+            counter column.
+
+        :return: Dictionary of column names to SQL expressions.
+        '''
+
+        values = {column: table.c[column] + delta for column, delta in deltas.items()}
+
+        for function in self.derived.get(table, ()):
+            values.update(function(table, values))
+
+        return values
+
+    def flush(self, session=None):
+        '''
+        Write the buffered changes of every session that has committed.
+
+        :param session: The session to write them in, the current one by
+            default. The caller commits it.
+        '''
+
+        buffer = self.buffer
+
+        if buffer is None:
+            return
+
+        session = session or db.session
+
+        for update_query, parameters in counter_updates(buffer.drain(), self.values):
+            session.execute(update_query, parameters)
+
+
+counters = Counters()
+
+
+@event.listens_for(Session, 'before_commit')
+def flush_counter_deltas(session):
+    buffer = counters.buffer
+
+    if buffer is None:
+        return
+
+    # Run the remaining flush so its listeners add their changes first
+    session.flush()
+
+    pending = session.info.pop('counter_deltas', None)
+
+    if pending:
+        buffer.merge(pending)
+
+    if buffer and buffer.due():
+        counters.flush(session)
+
+
+@event.listens_for(Session, 'after_rollback')
+def discard_counter_deltas(session):
+    session.info.pop('counter_deltas', None)
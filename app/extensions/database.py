@@ -1,4 +1,7 @@
 # Flask-SQLAlchemy
 from flask_sqlalchemy import SQLAlchemy
 
-db = SQLAlchemy()
\ No newline at end of file
+# Utils
+from app.utils.session import RoutingSession
+
+db = SQLAlchemy(session_options={'class_': RoutingSession})
\ No newline at end of file
@@ -0,0 +1,131 @@
+# Datetime
+from datetime import timedelta
+
+# Flask
+from flask import current_app
+
+# Flask-Mail
+from flask_mail import Message
+
+# Extensions
+from app.extensions.email import mail
+
+# Models
+from app.models.email import OutboxEmail
+from app.models.email import utcnow
+
+# Utils
+from app.utils.outbox import OutboxMetrics
+from app.utils.outbox import retry_delay
+
+
+class Outbox:
+    '''
+    Sends the emails of the outbox table. Each batch of up to
+    MAIL_OUTBOX_BATCH_SIZE emails goes through a single SMTP connection.
+    A failed email is retried with an exponential backoff starting at
+    MAIL_OUTBOX_RETRY_BACKOFF seconds, and given up on after
+    MAIL_OUTBOX_MAX_ATTEMPTS attempts.
+    '''
+
+    sender = ('Discussify', 'discussify1@gmail.com')
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.extensions['outbox'] = OutboxMetrics()
+
+    @property
+    def metrics(self):
+        return current_app.extensions['outbox']
+
+    def enqueue(self, to, subject, html):
+        return OutboxEmail.enqueue(to, subject, html)
+
+    def deliver(self):
+        '''
+        Send a batch of due emails.
+
+        :return: The number of emails claimed.
+        '''
+
+        config = current_app.config
+
+        emails = OutboxEmail.claim(config.get('MAIL_OUTBOX_BATCH_SIZE'), config.get('MAIL_OUTBOX_LEASE'))
+
+        if not emails:
+            return 0
+
+        sent, errors = [], {}
+
+        try:
+            with mail.connect() as connection:
+                for email in emails:
+                    message = Message(email.subject, recipients=[email.recipient], html=email.html, sender=self.sender)
+
+                    try:
+                        connection.send(message)
+                    except Exception as error:
+                        errors[email.id] = error
+                    else:
+                        sent.append(email.id)
+        except Exception as error:
+            # The connection failed, every email not sent yet is retried
+            self.metrics.add(connection_errors=1)
+
+            for email in emails:
+                if email.id not in sent:
+                    errors.setdefault(email.id, error)
+
+        OutboxEmail.mark_sent(sent)
+        OutboxEmail.mark_failed(self.failures(emails, errors))
+
+        given_up = sum(1 for email in emails if email.id in errors and email.attempts >= config.get('MAIL_OUTBOX_MAX_ATTEMPTS'))
+
+        self.metrics.add(batches=1, sent=len(sent), retried=len(errors) - given_up, failed=given_up)
+
+        return len(emails)
+
+    def failures(self, emails, errors):
+        config = current_app.config
+
+        now = utcnow()
+
+        failures = []
+
+        for email in emails:
+            if email.id not in errors:
+                continue
+
+            delay = retry_delay(email.attempts, config.get('MAIL_OUTBOX_RETRY_BACKOFF'), config.get('MAIL_OUTBOX_RETRY_BACKOFF_MAX'))
+
+            failures.append({
+                'email_id': email.id,
+                'error': repr(errors[email.id]),
+                'retry_at': now + timedelta(seconds=delay),
+                'given_up_at': now if email.attempts >= config.get('MAIL_OUTBOX_MAX_ATTEMPTS') else None,
+            })
+
+        return failures
+
+    def drain(self):
+        '''
+        Send every due email.
+
+        :return: The number of emails claimed.
+        '''
+
+        total = 0
+
+        while True:
+            claimed = self.deliver()
+
+            if not claimed:
+                return total
+
+            total += claimed
+
+
+outbox = Outbox()
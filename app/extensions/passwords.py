@@ -0,0 +1,48 @@
+# Flask
+from flask import current_app
+
+# Utils
+from app.utils.password import HashingPool
+from app.utils.password import hash_password
+from app.utils.password import check_password
+from app.utils.password import needs_rehash
+
+
+class Passwords:
+    '''
+    Hashes and checks the passwords in a HashingPool of
+    PASSWORD_HASH_WORKERS processes, turning away the calls past
+    PASSWORD_HASH_MAX_PENDING. New hashes use PASSWORD_HASH_ROUNDS
+    rounds, and the hashes made with other rounds are reported as
+    needing a rehash.
+    '''
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.extensions['passwords'] = HashingPool(
+            workers=app.config.get('PASSWORD_HASH_WORKERS', 0),
+            max_pending=app.config.get('PASSWORD_HASH_MAX_PENDING', 0)
+        )
+
+    @property
+    def pool(self):
+        return current_app.extensions['passwords']
+
+    @property
+    def rounds(self):
+        return current_app.config.get('PASSWORD_HASH_ROUNDS')
+
+    def hash(self, password):
+        return self.pool.run(hash_password, password, self.rounds)
+
+    def verify(self, password, hashed_password):
+        return self.pool.run(check_password, password, hashed_password)
+
+    def needs_rehash(self, hashed_password):
+        return self.rounds is not None and needs_rehash(hashed_password, self.rounds)
+
+
+passwords = Passwords()
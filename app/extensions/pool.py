@@ -0,0 +1,60 @@
+# SQLAlchemy
+from sqlalchemy.engine import URL
+
+# Extensions
+from app.extensions.database import db
+
+# Utils
+from app.utils.pool import InstrumentedQueuePool
+from app.utils.pool import engine_options
+
+
+class ConnectionPools:
+    '''
+    Sizes the connection pools of the database and of its binds from the
+    DATABASE_POOL_* settings, PgBouncer compatible if DATABASE_PGBOUNCER is
+    set, with pools recording their checkouts and connections. Options set
+    in SQLALCHEMY_ENGINE_OPTIONS or in a bind's dictionary take precedence.
+
+    Must be initialized before the database, which creates the engines.
+    '''
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        config = app.config
+
+        if config.get('SQLALCHEMY_DATABASE_URI') is not None:
+            config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+                **engine_options(config['SQLALCHEMY_DATABASE_URI'], config),
+                **config.get('SQLALCHEMY_ENGINE_OPTIONS', {})
+            }
+
+        binds = {}
+
+        for key, bind in config.get('SQLALCHEMY_BINDS', {}).items():
+            if isinstance(bind, (str, URL)):
+                bind = {'url': bind}
+
+            binds[key] = {**engine_options(bind['url'], config), **bind}
+
+        config['SQLALCHEMY_BINDS'] = binds
+
+    def stats(self):
+        '''
+        Get the metrics of the pools of the app.
+
+        :return: The stats of each instrumented pool by bind key, None
+                 being the database's.
+        '''
+
+        return {
+            key: engine.pool.stats()
+            for key, engine in db.engines.items()
+            if isinstance(engine.pool, InstrumentedQueuePool)
+        }
+
+
+pools = ConnectionPools()
@@ -0,0 +1,164 @@
+# Random
+import random
+
+# contextlib
+from contextlib import contextmanager
+
+# Flask
+from flask import current_app
+from flask import request
+from flask import g
+
+# Flask-JWT-Extended
+from flask_jwt_extended import get_jwt_identity
+
+# Extensions
+from app.extensions.database import db
+
+# Utils
+from app.utils.token import generate_verification_token
+from app.utils.token import confirm_verification_token
+
+
+# Methods of the requests expected to only read
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+# Salt of the signed cookie pinning a user to the primary
+PIN_SALT = 'primary_pin'
+
+
+class Replicas:
+    '''
+    Sends the reads of the GET requests to a read replica, one of the binds
+    of SQLALCHEMY_BINDS named by SQLALCHEMY_REPLICA_BINDS. The writes go
+    to the primary, and so do the reads following a write in the same
+    request and, for REPLICA_PIN_SECONDS after a request of theirs changed
+    something, the reads of the same user, so they read their own writes.
+
+    The pin travels with the client in a signed cookie, so it holds
+    whichever worker answers the next request.
+    '''
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.extensions['replicas'] = tuple(app.config.get('SQLALCHEMY_REPLICA_BINDS') or ())
+
+    @property
+    def bind_keys(self):
+        return current_app.extensions.get('replicas', ())
+
+    def route_reads(self):
+        '''
+        Send the reads of the current request to a replica if it is a
+        GET request.
+        '''
+
+        if self.bind_keys and request.method in SAFE_METHODS:
+            db.session.info['read_bind'] = self.read_bind
+
+    def read_bind(self, engine):
+        '''
+        Get the replica for a read that would go to an engine, the same
+        one for the whole request.
+
+        :param engine: The engine of the tables read.
+
+        :return: The replica engine, or None to read from the primary.
+        '''
+
+        # Tables of other binds are not replicated
+        if engine is not db.engine:
+            return None
+
+        if self.is_pinned():
+            return None
+
+        if 'replica_bind' not in g:
+            g.replica_bind = random.choice(self.bind_keys)
+
+        return db.engines[g.replica_bind]
+
+    def pin(self, response):
+        '''
+        Send the reads of the current user to the primary for a while if
+        the request changed something.
+
+        :param response: The response of the request.
+        '''
+
+        if not self.bind_keys or request.method in SAFE_METHODS or response.status_code >= 400:
+            return
+
+        identity = current_identity()
+
+        if identity is None:
+            return
+
+        response.set_cookie(
+            current_app.config.get('REPLICA_PIN_COOKIE_NAME'),
+            generate_verification_token(str(identity), salt=PIN_SALT),
+            max_age=current_app.config.get('REPLICA_PIN_SECONDS'),
+            secure=request.is_secure,
+            httponly=True,
+            samesite='Lax'
+        )
+
+    def is_pinned(self):
+        '''
+        Whether the request carries a pin of its user that has not expired.
+        '''
+
+        if 'primary_pinned' in g:
+            return g.primary_pinned
+
+        identity = current_identity()
+
+        # Not known until the request is authenticated
+        if identity is None:
+            return False
+
+        token = request.cookies.get(current_app.config.get('REPLICA_PIN_COOKIE_NAME'))
+
+        g.primary_pinned = token is not None and confirm_verification_token(
+            token,
+            max_age=current_app.config.get('REPLICA_PIN_SECONDS'),
+            salt=PIN_SALT
+        ) == str(identity)
+
+        return g.primary_pinned
+
+    @contextmanager
+    def primary(self):
+        '''
+        Send the reads made inside the block to the primary, e.g. the ones
+        authenticating the request.
+        '''
+
+        session = db.session
+
+        read_bind = session.info.pop('read_bind', None)
+
+        try:
+            yield session
+        finally:
+            if read_bind is not None:
+                session.info['read_bind'] = read_bind
+
+    def release(self):
+        db.session.info.pop('read_bind', None)
+        g.pop('replica_bind', None)
+        g.pop('primary_pinned', None)
+
+
+def current_identity():
+    try:
+        return get_jwt_identity()
+    except RuntimeError:
+        # The request is not authenticated yet
+        return None
+
+
+replicas = Replicas()
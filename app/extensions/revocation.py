@@ -0,0 +1,53 @@
+# Flask
+from flask import current_app
+
+# Utils
+from app.utils.revocation import MemoryRevocationStore
+from app.utils.revocation import DatabaseRevocationStore
+
+
+class Revocations:
+    '''
+    Keeps the IDs of the logged out tokens until they expire. The store is
+    chosen with REVOCATION_STORE: 'memory' keeps them in the process and
+    'database' in a table shared by every worker.
+    '''
+
+    stores = {
+        'memory': MemoryRevocationStore,
+        'database': DatabaseRevocationStore,
+    }
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        store = app.config.get('REVOCATION_STORE', 'memory')
+
+        if store not in self.stores:
+            raise ValueError(f'Unknown revocation store: {store}.')
+
+        app.extensions['revocations'] = self.stores[store]()
+
+    @property
+    def store(self):
+        return current_app.extensions['revocations']
+
+    def revoke(self, jwt_payload):
+        '''
+        Revoke a token until it expires.
+
+        :param jwt_payload: The decoded token.
+        '''
+
+        self.store.revoke(jwt_payload['jti'], jwt_payload['exp'])
+
+    def is_revoked(self, jwt_payload):
+        return self.store.is_revoked(jwt_payload['jti'])
+
+    def purge(self):
+        return self.store.purge()
+
+
+revocations = Revocations()
@@ -51,4 +51,8 @@ def handler_ownership_error(error):
 
 
 def handler_unauthorized_error(error):
-    return {'message': str(error)}, HTTPStatus.UNAUTHORIZED
\ No newline at end of file
+    return {'message': str(error)}, HTTPStatus.UNAUTHORIZED
+
+
+def handler_overloaded_error(error):
+    return {'message': str(error)}, HTTPStatus.SERVICE_UNAVAILABLE, {'Retry-After': '1'}
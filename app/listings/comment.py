@@ -0,0 +1,133 @@
+# Extensions
+from app.extensions.database import db
+
+# Models
+from app.models.comment import Comment
+from app.models.comment import CommentStats
+from app.models.comment import CommentVote
+from app.models.comment import CommentBookmark
+from app.models.user import User
+from app.models.user import UserStats
+from app.models.post import Post
+
+# Listings
+from app.listings.user import user_sort_columns
+from app.listings.user import user_load_options
+from app.listings.post import post_relationship_options
+
+# Utils
+from app.utils.listing import Listing
+
+
+def comment_sort_columns():
+    return {
+        'created_at': Comment.created_at,
+        'upvotes': CommentStats.upvotes_count,
+    }
+
+
+def comment_load_options():
+    '''
+    Loader options of the relationships dumped by CommentSchema: the owner
+    and the post, with the relationships of the post. The stats of the
+    comments are read from the join of the listing query and the replies
+    are loaded by the comment tree loader.
+    '''
+
+    return (
+        db.contains_eager(Comment.stats),
+        db.selectinload(Comment.owner).joinedload(User.stats),
+        db.selectinload(Comment.post).options(
+            db.joinedload(Post.stats),
+            *post_relationship_options()
+        ),
+    )
+
+
+all_comments = Listing(
+    query=db.select(Comment).join(CommentStats, Comment.id == CommentStats.comment_id),
+    sort_columns=comment_sort_columns(),
+    time_column=Comment.created_at,
+    id_column=Comment.id,
+    blocked_column=Comment.user_id,
+    options=comment_load_options()
+)
+
+user_comments = Listing(
+    query=(
+        db.select(Comment)
+        .join(CommentStats, Comment.id == CommentStats.comment_id)
+        .where(Comment.user_id == db.bindparam('user_id'))
+    ),
+    sort_columns=comment_sort_columns(),
+    time_column=Comment.created_at,
+    id_column=Comment.id,
+    blocked_column=Comment.user_id,
+    options=comment_load_options()
+)
+
+root_comments = Listing(
+    query=(
+        db.select(Comment)
+        .join(CommentStats, Comment.id == CommentStats.comment_id)
+        .where(Comment.comment_id == None, Comment.post_id == db.bindparam('post_id'))
+    ),
+    sort_columns=comment_sort_columns(),
+    time_column=Comment.created_at,
+    id_column=Comment.id,
+    blocked_column=Comment.user_id,
+    options=comment_load_options()
+)
+
+bookmarked_comments = Listing(
+    query=(
+        db.select(Comment)
+        .join(CommentBookmark, CommentBookmark.comment_id == Comment.id)
+        .join(CommentStats, Comment.id == CommentStats.comment_id)
+        .where(CommentBookmark.user_id == db.bindparam('user_id'))
+    ),
+    sort_columns=comment_sort_columns(),
+    time_column=CommentBookmark.created_at,
+    id_column=Comment.id,
+    blocked_column=Comment.user_id,
+    options=comment_load_options()
+)
+
+
+def voted_comments(direction):
+    return Listing(
+        query=(
+            db.select(Comment)
+            .join(CommentVote, CommentVote.comment_id == Comment.id)
+            .join(CommentStats, Comment.id == CommentStats.comment_id)
+            .where(CommentVote.user_id == db.bindparam('user_id'), CommentVote.direction == direction)
+        ),
+        sort_columns=comment_sort_columns(),
+        time_column=CommentVote.created_at,
+        id_column=Comment.id,
+        blocked_column=Comment.user_id,
+        options=comment_load_options()
+    )
+
+
+def comment_voters(direction):
+    return Listing(
+        query=(
+            db.select(User)
+            .join(CommentVote, User.id == CommentVote.user_id)
+            .join(UserStats, User.id == UserStats.user_id)
+            .where(CommentVote.comment_id == db.bindparam('comment_id'), CommentVote.direction == direction)
+        ),
+        sort_columns=user_sort_columns(CommentVote.created_at),
+        time_column=CommentVote.created_at,
+        id_column=User.id,
+        blocked_column=User.id,
+        options=user_load_options()
+    )
+
+
+upvoted_comments = voted_comments(1)
+downvoted_comments = voted_comments(-1)
+
+comment_upvoters = comment_voters(1)
+comment_downvoters = comment_voters(-1)
@@ -0,0 +1,108 @@
+# Extensions
+from app.extensions.database import db
+
+# Models
+from app.models.community import Community
+from app.models.community import CommunityStats
+from app.models.community import CommunitySubscriber
+from app.models.community import CommunityModerator
+from app.models.community import CommunityBan
+from app.models.user import User
+from app.models.user import UserStats
+
+# Listings
+from app.listings.user import user_sort_columns
+from app.listings.user import user_load_options
+
+# Utils
+from app.utils.listing import Listing
+
+
+def community_sort_columns(created_at):
+    return {
+        'created_at': created_at,
+        'subscribers': CommunityStats.subscribers_count,
+        'posts': CommunityStats.posts_count,
+        'comments': CommunityStats.comments_count,
+    }
+
+
+def community_relationship_options():
+    return (
+        db.selectinload(Community.owner).joinedload(User.stats),
+    )
+
+
+def community_load_options():
+    '''
+    Loader options of the relationships dumped by CommunitySchema: the owner
+    and its stats. The stats of the communities are read from the join of
+    the listing query.
+    '''
+
+    return (
+        db.contains_eager(Community.stats),
+        *community_relationship_options()
+    )
+
+
+all_communities = Listing(
+    query=db.select(Community).join(CommunityStats, Community.id == CommunityStats.community_id),
+    sort_columns=community_sort_columns(Community.created_at),
+    time_column=Community.created_at,
+    id_column=Community.id,
+    options=community_load_options()
+)
+
+subscribed_communities = Listing(
+    query=(
+        db.select(Community)
+        .join(CommunitySubscriber, CommunitySubscriber.community_id == Community.id)
+        .join(CommunityStats, Community.id == CommunityStats.community_id)
+        .where(CommunitySubscriber.user_id == db.bindparam('user_id'))
+    ),
+    sort_columns=community_sort_columns(CommunitySubscriber.created_at),
+    time_column=CommunitySubscriber.created_at,
+    id_column=Community.id,
+    options=community_load_options()
+)
+
+community_subscribers = Listing(
+    query=(
+        db.select(User)
+        .join(CommunitySubscriber, User.id == CommunitySubscriber.user_id)
+        .join(UserStats, User.id == UserStats.user_id)
+        .where(CommunitySubscriber.community_id == db.bindparam('community_id'))
+    ),
+    sort_columns=user_sort_columns(CommunitySubscriber.created_at),
+    time_column=CommunitySubscriber.created_at,
+    id_column=User.id,
+    blocked_column=User.id,
+    options=user_load_options()
+)
+
+community_moderators = Listing(
+    query=(
+        db.select(User)
+        .join(CommunityModerator, User.id == CommunityModerator.user_id)
+        .join(UserStats, User.id == UserStats.user_id)
+        .where(CommunityModerator.community_id == db.bindparam('community_id'))
+    ),
+    sort_columns=user_sort_columns(CommunityModerator.created_at),
+    time_column=CommunityModerator.created_at,
+    id_column=User.id,
+    options=user_load_options()
+)
+
+banned_users = Listing(
+    query=(
+        db.select(User)
+        .join(CommunityBan, User.id == CommunityBan.user_id)
+        .join(UserStats, User.id == UserStats.user_id)
+        .where(CommunityBan.community_id == db.bindparam('community_id'))
+    ),
+    sort_columns=user_sort_columns(CommunityBan.created_at),
+    time_column=CommunityBan.created_at,
+    id_column=User.id,
+    options=user_load_options()
+)
@@ -0,0 +1,48 @@
+# Extensions
+from app.extensions.database import db
+
+# Models
+from app.models.post import Post
+from app.models.post import PostStats
+from app.models.feed import FeedItem
+
+# Listings
+from app.listings.post import post_sort_columns
+from app.listings.post import post_load_options
+
+# Utils
+from app.utils.listing import Listing
+
+
+feed_posts = Listing(
+    query=(
+        db.select(Post)
+        .join(FeedItem, FeedItem.post_id == Post.id)
+        .join(PostStats, Post.id == PostStats.post_id)
+        .where(FeedItem.user_id == db.bindparam('user_id'))
+    ),
+    sort_columns=dict(post_sort_columns(), created_at=FeedItem.created_at),
+    time_column=FeedItem.created_at,
+    id_column=FeedItem.post_id,
+    blocked_column=Post.user_id,
+    options=post_load_options()
+)
+
+# Feeds that also read the posts of the communities too large to fan out
+mixed_feed_posts = Listing(
+    query=(
+        db.select(Post)
+        .join(PostStats, Post.id == PostStats.post_id)
+        .where(
+            db.or_(
+                Post.id.in_(db.select(FeedItem.post_id).where(FeedItem.user_id == db.bindparam('user_id'))),
+                Post.community_id.in_(FeedItem.on_demand_communities(db.bindparam('user_id')))
+            )
+        )
+    ),
+    sort_columns=post_sort_columns(),
+    time_column=Post.created_at,
+    id_column=Post.id,
+    blocked_column=Post.user_id,
+    options=post_load_options()
+)
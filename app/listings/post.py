@@ -0,0 +1,141 @@
+# Extensions
+from app.extensions.database import db
+
+# Models
+from app.models.post import Post
+from app.models.post import PostStats
+from app.models.post import PostVote
+from app.models.post import PostBookmark
+from app.models.user import User
+from app.models.user import UserStats
+from app.models.community import Community
+
+# Listings
+from app.listings.user import user_sort_columns
+from app.listings.user import user_load_options
+from app.listings.community import community_relationship_options
+
+# Utils
+from app.utils.listing import Listing
+
+
+def post_sort_columns():
+    return {
+        'created_at': Post.created_at,
+        'upvotes': PostStats.upvotes_count,
+        'comments': PostStats.comments_count,
+        'hot': PostStats.hot_score,
+        'best': PostStats.best_score,
+    }
+
+
+def post_relationship_options():
+    return (
+        db.selectinload(Post.owner).joinedload(User.stats),
+        db.selectinload(Post.community).options(
+            db.joinedload(Community.stats),
+            *community_relationship_options()
+        ),
+    )
+
+
+def post_load_options():
+    '''
+    Loader options of the relationships dumped by PostSchema: the owner and
+    the community, with their stats and the owner of the community. The
+    stats of the posts are read from the join of the listing query.
+    '''
+
+    return (
+        db.contains_eager(Post.stats),
+        *post_relationship_options()
+    )
+
+
+all_posts = Listing(
+    query=db.select(Post).join(PostStats, Post.id == PostStats.post_id),
+    sort_columns=post_sort_columns(),
+    time_column=Post.created_at,
+    id_column=Post.id,
+    blocked_column=Post.user_id,
+    options=post_load_options()
+)
+
+community_posts = Listing(
+    query=(
+        db.select(Post)
+        .join(PostStats, Post.id == PostStats.post_id)
+        .where(Post.community_id == db.bindparam('community_id'))
+    ),
+    sort_columns=post_sort_columns(),
+    time_column=Post.created_at,
+    id_column=Post.id,
+    blocked_column=Post.user_id,
+    options=post_load_options()
+)
+
+user_posts = Listing(
+    query=(
+        db.select(Post)
+        .join(PostStats, Post.id == PostStats.post_id)
+        .where(Post.user_id == db.bindparam('user_id'))
+    ),
+    sort_columns=post_sort_columns(),
+    time_column=Post.created_at,
+    id_column=Post.id,
+    blocked_column=Post.user_id,
+    options=post_load_options()
+)
+
+bookmarked_posts = Listing(
+    query=(
+        db.select(Post)
+        .join(PostBookmark, Post.id == PostBookmark.post_id)
+        .join(PostStats, Post.id == PostStats.post_id)
+        .where(PostBookmark.user_id == db.bindparam('user_id'))
+    ),
+    sort_columns=post_sort_columns(),
+    time_column=PostBookmark.created_at,
+    id_column=Post.id,
+    blocked_column=Post.user_id,
+    options=post_load_options()
+)
+
+
+def voted_posts(direction):
+    return Listing(
+        query=(
+            db.select(Post)
+            .join(PostVote, Post.id == PostVote.post_id)
+            .join(PostStats, Post.id == PostStats.post_id)
+            .where(PostVote.user_id == db.bindparam('user_id'), PostVote.direction == direction)
+        ),
+        sort_columns=post_sort_columns(),
+        time_column=PostVote.created_at,
+        id_column=Post.id,
+        blocked_column=Post.user_id,
+        options=post_load_options()
+    )
+
+
+def post_voters(direction):
+    return Listing(
+        query=(
+            db.select(User)
+            .join(PostVote, User.id == PostVote.user_id)
+            .join(UserStats, User.id == UserStats.user_id)
+            .where(PostVote.post_id == db.bindparam('post_id'), PostVote.direction == direction)
+        ),
+        sort_columns=user_sort_columns(PostVote.created_at),
+        time_column=PostVote.created_at,
+        id_column=User.id,
+        blocked_column=User.id,
+        options=user_load_options()
+    )
+
+
+upvoted_posts = voted_posts(1)
+downvoted_posts = voted_posts(-1)
+
+post_upvoters = post_voters(1)
+post_downvoters = post_voters(-1)
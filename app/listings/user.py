@@ -0,0 +1,83 @@
+# Extensions
+from app.extensions.database import db
+
+# Models
+from app.models.user import User
+from app.models.user import UserStats
+from app.models.user import Follow
+from app.models.user import Block
+
+# Utils
+from app.utils.listing import Listing
+
+
+def user_sort_columns(created_at):
+    return {
+        'created_at': created_at,
+        'followers': UserStats.followers_count,
+        'communities': UserStats.communities_count,
+        'posts': UserStats.posts_count,
+        'comments': UserStats.comments_count,
+    }
+
+
+def user_load_options():
+    '''
+    Loader options of the relationships dumped by UserSchema. The stats are
+    read from the join of the listing query.
+    '''
+
+    return (
+        db.contains_eager(User.stats),
+    )
+
+
+all_users = Listing(
+    query=db.select(User).join(UserStats, User.id == UserStats.user_id),
+    sort_columns=user_sort_columns(User.created_at),
+    time_column=User.created_at,
+    id_column=User.id,
+    blocked_column=User.id,
+    options=user_load_options()
+)
+
+followed_users = Listing(
+    query=(
+        db.select(User)
+        .join(Follow, Follow.followed_id == User.id)
+        .join(UserStats, User.id == UserStats.user_id)
+        .where(Follow.follower_id == db.bindparam('user_id'))
+    ),
+    sort_columns=user_sort_columns(Follow.created_at),
+    time_column=Follow.created_at,
+    id_column=User.id,
+    blocked_column=User.id,
+    options=user_load_options()
+)
+
+followers = Listing(
+    query=(
+        db.select(User)
+        .join(Follow, Follow.follower_id == User.id)
+        .join(UserStats, User.id == UserStats.user_id)
+        .where(Follow.followed_id == db.bindparam('user_id'))
+    ),
+    sort_columns=user_sort_columns(Follow.created_at),
+    time_column=Follow.created_at,
+    id_column=User.id,
+    blocked_column=User.id,
+    options=user_load_options()
+)
+
+blocked_users = Listing(
+    query=(
+        db.select(User)
+        .join(Block, Block.blocked_id == User.id)
+        .join(UserStats, User.id == UserStats.user_id)
+        .where(Block.blocker_id == db.bindparam('user_id'))
+    ),
+    sort_columns=user_sort_columns(Block.created_at),
+    time_column=Block.created_at,
+    id_column=User.id,
+    options=user_load_options()
+)
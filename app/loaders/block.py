@@ -0,0 +1,82 @@
+# Flask
+from flask import current_app
+from flask import g
+
+# Extensions
+from app.extensions.database import db
+from app.extensions.cache import cache
+
+
+class BlockGraph:
+    def __init__(self, blocked_ids=(), blocker_ids=()):
+        self.blocked_ids = frozenset(blocked_ids)
+        self.blocker_ids = frozenset(blocker_ids)
+
+    def is_empty(self):
+        return not self.blocked_ids and not self.blocker_ids
+
+    def is_blocking(self, user_id):
+        return user_id in self.blocked_ids
+
+    def is_blocked_by(self, user_id):
+        return user_id in self.blocker_ids
+
+
+class BlockGraphLoader:
+    @staticmethod
+    def load(user):
+        '''
+        Get the IDs of the users blocked by and blocking a user. The result
+        is memoized for the request and cached for the process.
+
+        :param user: The user object.
+
+        :return: The block graph of the user.
+        '''
+
+        graphs = g.setdefault('block_graphs', {})
+
+        graph = graphs.get(user.id)
+
+        if graph is not None:
+            return graph
+
+        key = ('block_graph', user.id)
+
+        graph = cache.get(key)
+
+        if graph is None:
+            graph = BlockGraphLoader.query(user.id)
+
+            cache.set(key, graph, ttl=current_app.config.get('BLOCK_GRAPH_CACHE_TTL'))
+
+        graphs[user.id] = graph
+
+        return graph
+
+    @staticmethod
+    def query(user_id):
+        from app.models.user import Block
+
+        rows = db.session.execute(
+            db.select(Block.blocker_id, Block.blocked_id)
+            .where(db.or_(Block.blocker_id == user_id, Block.blocked_id == user_id))
+        ).all()
+
+        blocked_ids = [blocked_id for blocker_id, blocked_id in rows if blocker_id == user_id]
+        blocker_ids = [blocker_id for blocker_id, blocked_id in rows if blocked_id == user_id]
+
+        return BlockGraph(blocked_ids, blocker_ids)
+
+    @staticmethod
+    def invalidate(*user_ids):
+        graphs = g.get('block_graphs', {})
+
+        for user_id in user_ids:
+            graphs.pop(user_id, None)
+
+            cache.delete(('block_graph', user_id))
+
+    @staticmethod
+    def clear():
+        g.pop('block_graphs', None)
@@ -0,0 +1,109 @@
+# Flask
+from flask import g
+
+# Extensions
+from app.extensions.database import db
+
+
+class CommentTreeLoader:
+    @staticmethod
+    def load(comments, max_depth=None, max_breadth=None):
+        '''
+        Load the reply subtrees of the given comments with a single
+        recursive query and build the nested structure in memory.
+
+        :param comments: The comments whose replies are loaded.
+        :param max_depth: Maximum number of reply levels below each comment.
+        :param max_breadth: Maximum number of replies kept per comment.
+
+        :return: Dictionary of replies keyed by parent comment ID.
+        '''
+
+        from app.models.comment import Comment
+        from app.models.user import User
+
+        tree = g.setdefault('comment_tree', {})
+
+        root_ids = {comment.id for comment in comments if comment.id not in tree}
+
+        if not root_ids:
+            return tree
+
+        if max_depth is not None and max_depth < 1:
+            tree.update({root_id: [] for root_id in root_ids})
+
+            return tree
+
+        # Walk down the thread from the requested comments
+        subtree = (
+            db.select(Comment.id, db.literal(1).label('depth'))
+            .where(Comment.comment_id.in_(root_ids))
+            .cte('subtree', recursive=True)
+        )
+
+        replies = db.select(Comment.id, (subtree.c.depth + 1).label('depth')).where(Comment.comment_id == subtree.c.id)
+
+        if max_depth is not None:
+            replies = replies.where(subtree.c.depth < max_depth)
+
+        subtree = subtree.union_all(replies)
+
+        query = (
+            db.select(Comment, subtree.c.depth)
+            .join(subtree, Comment.id == subtree.c.id)
+            .options(
+                db.selectinload(Comment.stats),
+                db.selectinload(Comment.owner).selectinload(User.stats)
+            )
+            .order_by(Comment.id)
+        )
+
+        rows = db.session.execute(query).all()
+
+        children = {root_id: [] for root_id in root_ids}
+
+        for comment, depth in rows:
+            children.setdefault(comment.comment_id, []).append(comment)
+
+            if max_depth is None or depth < max_depth:
+                children.setdefault(comment.id, [])
+
+        # Attach only the replies reachable within the breadth limit
+        pending = list(root_ids)
+
+        while pending:
+            parent_id = pending.pop()
+
+            if parent_id not in children:
+                tree[parent_id] = []
+
+                continue
+
+            kept = children[parent_id][:max_breadth] if max_breadth is not None else children[parent_id]
+
+            tree[parent_id] = kept
+
+            pending.extend(reply.id for reply in kept)
+
+        return tree
+
+    @staticmethod
+    def get(comment):
+        '''
+        Get the preloaded replies of a comment.
+
+        :param comment: The comment object.
+
+        :return: List of replies, or None if they were not preloaded.
+        '''
+
+        tree = g.get('comment_tree')
+
+        if tree is None:
+            return None
+
+        return tree.get(comment.id)
+
+    @staticmethod
+    def clear():
+        g.pop('comment_tree', None)
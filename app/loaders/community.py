@@ -0,0 +1,83 @@
+# Flask
+from flask import g
+
+# Extensions
+from app.extensions.database import db
+
+
+class CommunityMembership:
+    def __init__(self, owned_by=False, subscriber=False, moderator=False, ban=False):
+        self.owned_by = owned_by
+        self.subscriber = subscriber
+        self.moderator = moderator
+        self.ban = ban
+
+
+class CommunityMembershipLoader:
+    @staticmethod
+    def load(user, communities):
+        '''
+        Load the subscriptions, moderations and bans of the viewer in a page
+        of communities with a single query, whatever the number of
+        communities and of the memberships of the viewer elsewhere.
+
+        :param user: The viewer.
+        :param communities: The communities of the page.
+
+        :return: Dictionary of memberships keyed by community ID.
+        '''
+
+        from app.models.community import CommunitySubscriber
+        from app.models.community import CommunityModerator
+        from app.models.community import CommunityBan
+
+        memberships = {
+            community.id: CommunityMembership(owned_by=community.user_id == user.id)
+            for community in communities
+        }
+
+        if memberships:
+            community_ids = list(memberships)
+
+            rows = db.union_all(
+                db.select(CommunitySubscriber.community_id, db.literal('subscriber'))
+                .where(CommunitySubscriber.user_id == user.id, CommunitySubscriber.community_id.in_(community_ids)),
+                db.select(CommunityModerator.community_id, db.literal('moderator'))
+                .where(CommunityModerator.user_id == user.id, CommunityModerator.community_id.in_(community_ids)),
+                db.select(CommunityBan.community_id, db.literal('ban'))
+                .where(CommunityBan.user_id == user.id, CommunityBan.community_id.in_(community_ids)),
+            )
+
+            for community_id, kind in db.session.execute(rows):
+                setattr(memberships[community_id], kind, True)
+
+        g.community_memberships = (user.id, memberships)
+
+        return memberships
+
+    @staticmethod
+    def get(user, community):
+        '''
+        Get the preloaded membership of the viewer in a community.
+
+        :param user: The viewer.
+        :param community: The community object.
+
+        :return: The membership, or None if it was not preloaded.
+        '''
+
+        loaded = g.get('community_memberships')
+
+        if loaded is None:
+            return None
+
+        user_id, memberships = loaded
+
+        if user_id != user.id:
+            return None
+
+        return memberships.get(community.id)
+
+    @staticmethod
+    def clear():
+        g.pop('community_memberships', None)
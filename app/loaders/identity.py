@@ -0,0 +1,93 @@
+# Flask
+from flask import current_app
+
+# SQLAlchemy
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+# Extensions
+from app.extensions.database import db
+from app.extensions.cache import cache
+
+
+class IdentityLoader:
+    @staticmethod
+    def load(jwt_data):
+        '''
+        Get the user of an access token. The user already in the session is
+        used as is. Otherwise it is built from a copy of its row and stats
+        cached for USER_IDENTITY_CACHE_TTL seconds, or queried.
+
+        :param jwt_data: The decoded access token.
+
+        :return: The user object, or None if the user does not exist.
+        '''
+
+        from app.models.user import User
+        from app.models.user import UserStats
+
+        user_id = int(jwt_data['sub'])
+
+        user = db.session.identity_map.get(db.inspect(User).identity_key_from_primary_key((user_id,)))
+
+        if user is not None:
+            return user
+
+        key = ('user_identity', user_id)
+
+        identity = cache.get(key)
+
+        if identity is not None:
+            user = IdentityLoader.restore(User, identity['user'])
+
+            if identity['stats'] is not None:
+                set_committed_value(user, 'stats', IdentityLoader.restore(UserStats, identity['stats']))
+
+            return user
+
+        user_query = db.select(User).options(joinedload(User.stats)).where(User.id == user_id)
+
+        user = db.session.scalar(user_query)
+
+        if user is None:
+            return None
+
+        identity = {
+            'user': IdentityLoader.snapshot(user),
+            'stats': IdentityLoader.snapshot(user.stats) if user.stats else None
+        }
+
+        cache.set(key, identity, ttl=current_app.config.get('USER_IDENTITY_CACHE_TTL'))
+
+        return user
+
+    @staticmethod
+    def snapshot(instance):
+        return {column.key: getattr(instance, column.key) for column in db.inspect(instance).mapper.column_attrs}
+
+    @staticmethod
+    def restore(model, values):
+        '''
+        Put a row back in the session from its values, without querying.
+        The columns missing from the values are loaded when first read.
+
+        :param model: The model class.
+        :param values: The values of the columns of the row.
+
+        :return: The persistent instance.
+        '''
+
+        instance = db.inspect(model).class_manager.new_instance()
+
+        for key, value in values.items():
+            set_committed_value(instance, key, value)
+
+        make_transient_to_detached(instance)
+
+        return db.session.merge(instance, load=False)
+
+    @staticmethod
+    def invalidate(*user_ids):
+        for user_id in user_ids:
+            cache.delete(('user_identity', user_id))
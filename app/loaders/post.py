@@ -0,0 +1,87 @@
+# Flask
+from flask import g
+
+# Extensions
+from app.extensions.database import db
+
+
+class PostFlags:
+    def __init__(self, bookmarked=False, direction=None):
+        self.bookmarked = bookmarked
+        self.direction = direction
+
+    @property
+    def upvoted(self):
+        return self.direction == 1
+
+    @property
+    def downvoted(self):
+        return self.direction == -1
+
+
+class PostFlagsLoader:
+    @staticmethod
+    def load(user, posts):
+        '''
+        Load the viewer flags of a page of posts with two set-based queries.
+
+        :param user: The viewer.
+        :param posts: The posts of the page.
+
+        :return: Dictionary of flags keyed by post ID.
+        '''
+
+        from app.models.post import PostBookmark
+        from app.models.post import PostVote
+
+        post_ids = {post.id for post in posts}
+
+        flags = {post_id: PostFlags() for post_id in post_ids}
+
+        if post_ids:
+            bookmarked_ids = db.session.scalars(
+                db.select(PostBookmark.post_id)
+                .where(PostBookmark.user_id == user.id, PostBookmark.post_id.in_(post_ids))
+            ).all()
+
+            for post_id in bookmarked_ids:
+                flags[post_id].bookmarked = True
+
+            votes = db.session.execute(
+                db.select(PostVote.post_id, PostVote.direction)
+                .where(PostVote.user_id == user.id, PostVote.post_id.in_(post_ids))
+            ).all()
+
+            for post_id, direction in votes:
+                flags[post_id].direction = direction
+
+        g.post_flags = (user.id, flags)
+
+        return flags
+
+    @staticmethod
+    def get(user, post):
+        '''
+        Get the preloaded flags of a post for the viewer.
+
+        :param user: The viewer.
+        :param post: The post object.
+
+        :return: The flags, or None if they were not preloaded.
+        '''
+
+        loaded = g.get('post_flags')
+
+        if loaded is None:
+            return None
+
+        user_id, flags = loaded
+
+        if user_id != user.id:
+            return None
+
+        return flags.get(post.id)
+
+    @staticmethod
+    def clear():
+        g.pop('post_flags', None)
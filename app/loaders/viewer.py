@@ -0,0 +1,100 @@
+# Flask
+from flask import g
+
+# Extensions
+from app.extensions.database import db
+
+
+class ViewerContext:
+    def __init__(self, blocked_ids=(), blocker_ids=(), subscribed_ids=(), moderated_ids=(), banned_ids=()):
+        self.blocked_ids = frozenset(blocked_ids)
+        self.blocker_ids = frozenset(blocker_ids)
+        self.subscribed_ids = frozenset(subscribed_ids)
+        self.moderated_ids = frozenset(moderated_ids)
+        self.banned_ids = frozenset(banned_ids)
+
+    def is_blocking(self, user_id):
+        return user_id in self.blocked_ids
+
+    def is_blocked_by(self, user_id):
+        return user_id in self.blocker_ids
+
+    def is_subscribed_to(self, community_id):
+        return community_id in self.subscribed_ids
+
+    def is_moderator_of(self, community_id):
+        return community_id in self.moderated_ids
+
+    def is_banned_from(self, community_id):
+        return community_id in self.banned_ids
+
+
+class ViewerContextLoader:
+    @staticmethod
+    def load(user):
+        '''
+        Get the users blocked by and blocking a user and the communities
+        they subscribe to, moderate and are banned from. The result is
+        memoized for the request and dropped when any of them changes.
+
+        The permission checks of the writes are answered from it, so it is
+        always read from the database, never from the process-wide block
+        graph cache, which other workers do not invalidate.
+
+        :param user: The user object.
+
+        :return: The viewer context of the user.
+        '''
+
+        contexts = g.setdefault('viewer_contexts', {})
+
+        context = contexts.get(user.id)
+
+        if context is None:
+            context = contexts[user.id] = ViewerContextLoader.query(user)
+
+        return context
+
+    @staticmethod
+    def query(user):
+        from app.models.user import Block
+        from app.models.community import CommunitySubscriber
+        from app.models.community import CommunityModerator
+        from app.models.community import CommunityBan
+
+        relations = db.union_all(
+            db.select(Block.blocked_id, db.literal('blocked'))
+            .where(Block.blocker_id == user.id),
+            db.select(Block.blocker_id, db.literal('blocker'))
+            .where(Block.blocked_id == user.id),
+            db.select(CommunitySubscriber.community_id, db.literal('subscribed'))
+            .where(CommunitySubscriber.user_id == user.id),
+            db.select(CommunityModerator.community_id, db.literal('moderated'))
+            .where(CommunityModerator.user_id == user.id),
+            db.select(CommunityBan.community_id, db.literal('banned'))
+            .where(CommunityBan.user_id == user.id),
+        )
+
+        ids = {'blocked': [], 'blocker': [], 'subscribed': [], 'moderated': [], 'banned': []}
+
+        for id, kind in db.session.execute(relations):
+            ids[kind].append(id)
+
+        return ViewerContext(
+            blocked_ids=ids['blocked'],
+            blocker_ids=ids['blocker'],
+            subscribed_ids=ids['subscribed'],
+            moderated_ids=ids['moderated'],
+            banned_ids=ids['banned']
+        )
+
+    @staticmethod
+    def invalidate(*user_ids):
+        contexts = g.get('viewer_contexts', {})
+
+        for user_id in user_ids:
+            contexts.pop(user_id, None)
+
+    @staticmethod
+    def clear():
+        g.pop('viewer_contexts', None)
@@ -12,6 +12,12 @@ from app.errors.errors import BookmarkError
 from app.errors.errors import VoteError
 from app.errors.errors import BlockError
 
+# Loaders
+from app.loaders.viewer import ViewerContextLoader
+
+# Utils
+from app.utils.transaction import unit_of_work
+
 
 class CommentManager:
     @staticmethod
@@ -126,52 +132,71 @@ class CommentBookmarkManager:
 
 class CommentVoteManager:
     @staticmethod
+    @unit_of_work()
     def create(user, comment, direction):
         owner = comment.owner
 
         if user.is_blocking(owner) or user.is_blocked_by(owner):
             raise BlockError('You cannot vote on this comment.')
-    
-        if direction == 1:
-            community = comment.post.community
-
-            if user.is_banned_from(community):
-                raise BanError('You are banned from this community.')
-
-            if not user.is_subscribed_to(community):
-                raise SubscriptionError('You are not subscribed to this community.')
-
-            vote = CommentVote.get_by_user_and_comment(user=user, comment=comment)
-
-            if vote:
-                if vote.is_downvote():
-                    vote.direction = 1
-                    vote.save()
-                else:
-                    raise VoteError('Comment already upvoted.')
-            else:
-                new_vote = CommentVote(user=user, comment=comment, direction=1)
-                new_vote.save()
-        elif direction == -1:
-            community = comment.post.community
-
-            if user.is_banned_from(community):
-                raise BanError('You are banned from this community.')
-
-            if not user.is_subscribed_to(community):
-                raise SubscriptionError('You are not subscribed to this community.')
-
-            vote = CommentVote.get_by_user_and_comment(user=user, comment=comment)
-
-            if vote:
-                if vote.is_upvote():
-                    vote.direction = -1
-                    vote.save()
-                else:
-                    raise VoteError('You have already downvoted this post.')
-            else:
-                new_vote = CommentVote(user=user, comment=comment, direction=-1)
-                new_vote.save()
+
+        community = comment.post.community
+
+        if user.is_banned_from(community):
+            raise BanError('You are banned from this community.')
+
+        if not user.is_subscribed_to(community):
+            raise SubscriptionError('You are not subscribed to this community.')
+
+        previous = CommentVote.upsert(user, comment, direction)
+
+        if previous == direction:
+            raise VoteError('Comment already upvoted.' if direction == 1 else 'You have already downvoted this post.')
+
+    @staticmethod
+    @unit_of_work()
+    def create_all(user, votes):
+        '''
+        Apply a batch of votes of a user, e.g. the ones made offline. The
+        permissions of all the votes are checked against a few set-based
+        queries and the allowed votes are written together. A vote already
+        in its direction is accepted as is, so a batch can be sent again.
+
+        :param user: The user object.
+        :param votes: List of dictionaries with the comment ID and the
+            direction, the last vote on a comment winning.
+
+        :return: List of the votes with the reason each one was rejected,
+            or None if it was applied.
+        '''
+
+        directions = {vote['id']: vote['direction'] for vote in votes}
+
+        comments = Comment.get_owners_and_communities(list(directions))
+
+        context = ViewerContextLoader.load(user)
+
+        errors = {}
+
+        for comment_id in directions:
+            comment = comments.get(comment_id)
+
+            if comment is None:
+                errors[comment_id] = 'Comment not found.'
+            elif context.is_blocking(comment.user_id) or context.is_blocked_by(comment.user_id):
+                errors[comment_id] = 'You cannot vote on this comment.'
+            elif context.is_banned_from(comment.community_id):
+                errors[comment_id] = 'You are banned from this community.'
+            elif not context.is_subscribed_to(comment.community_id):
+                errors[comment_id] = 'You are not subscribed to this community.'
+
+        CommentVote.upsert_all(user, {
+            comment_id: direction for comment_id, direction in directions.items() if comment_id not in errors
+        })
+
+        return [
+            {'id': comment_id, 'direction': direction, 'error': errors.get(comment_id)}
+            for comment_id, direction in directions.items()
+        ]
 
 
     @staticmethod
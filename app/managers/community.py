@@ -3,6 +3,8 @@ from app.models.community import Community
 from app.models.community import CommunitySubscriber
 from app.models.community import CommunityModerator
 from app.models.community import CommunityBan
+from app.models.post import Post
+from app.models.feed import FeedItem
 
 # Errors
 from app.errors.errors import NameError
@@ -12,9 +14,13 @@ from app.errors.errors import SubscriptionError
 from app.errors.errors import ModeratorError
 from app.errors.errors import UnauthorizedError
 
+# Utils
+from app.utils.transaction import unit_of_work
+
 
 class CommunityManager:
     @staticmethod
+    @unit_of_work()
     def create(user, data):
         # Get the data
         name = data.get('name')
@@ -75,6 +81,7 @@ class CommunityManager:
 
 class SubscriptionManager:
     @staticmethod
+    @unit_of_work()
     def create(user, community):
         if user.is_banned_from(community):
             raise BanError('You are banned from this community.')
@@ -84,6 +91,9 @@ class SubscriptionManager:
 
         CommunitySubscriber(user=user, community=community).save()
 
+        if not FeedItem.is_read_on_demand(community):
+            FeedItem.backfill(user, Post.community_id == community.id)
+
     @staticmethod
     def read_subscriptions_by_user(user, args):
         paginated_subscriptions = CommunitySubscriber.get_subscriptions_by_user(user, args)
@@ -97,6 +107,7 @@ class SubscriptionManager:
         return paginated_subscribers
 
     @staticmethod
+    @unit_of_work()
     def delete(user, community):
         if community.belongs_to(user):
             raise OwnershipError('You are the owner of this community and cannot unsubscribe.')
@@ -109,6 +120,8 @@ class SubscriptionManager:
 
         CommunitySubscriber.get_by_user_and_community(user, community).delete()
 
+        FeedItem.prune(user, Post.community_id == community.id)
+
 
 class ModerationManager:
     @staticmethod
@@ -149,6 +162,7 @@ class ModerationManager:
 
 class BanManager:
     @staticmethod
+    @unit_of_work()
     def create(moderator, community, user):
         if not moderator.is_moderator_of(community):
             raise UnauthorizedError('You are not a moderator of this community.')
@@ -188,6 +202,7 @@ class BanManager:
 
 class TransferManager:
     @staticmethod
+    @unit_of_work()
     def create(owner, community, user):
         if not community.belongs_to(owner):
             raise OwnershipError('You are not the owner of this community.')
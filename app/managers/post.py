@@ -2,6 +2,7 @@
 from app.models.post import Post
 from app.models.post import PostBookmark
 from app.models.post import PostVote
+from app.models.feed import FeedItem
 
 # Errors
 from app.errors.errors import BanError
@@ -11,19 +12,29 @@ from app.errors.errors import BookmarkError
 from app.errors.errors import VoteError
 from app.errors.errors import BlockError
 
+# Loaders
+from app.loaders.viewer import ViewerContextLoader
+
+# Utils
+from app.utils.transaction import unit_of_work
+
 
 class PostManager:
     @staticmethod
+    @unit_of_work()
     def create(user, community, data):
         if user.is_banned_from(community):
             raise BanError('You are banned from this community.')
         
         if not user.is_subscribed_to(community):
             raise SubscriptionError('You are not subscribed to this community.')
-        
+
         post = Post(**data, community=community, owner=user)
         post.save()
 
+        # Deliver the post to the feeds of the subscribers and followers
+        FeedItem.fan_out(post)
+
         return post
     
     @staticmethod
@@ -52,6 +63,12 @@ class PostManager:
         paginated_posts = Post.get_all(args)
 
         return paginated_posts
+
+    @staticmethod
+    def read_feed(user, args):
+        paginated_posts = FeedItem.get_feed(user, args)
+
+        return paginated_posts
     
     @staticmethod
     def update(user, post, data):
@@ -116,52 +133,71 @@ class PostBookmarkManager:
 
 class PostVoteManager:
     @staticmethod
+    @unit_of_work()
     def create(user, post, direction):
         owner = post.owner
 
         if user.is_blocking(owner) or user.is_blocked_by(owner):
             raise BlockError('You cannot vote on this post.')
 
-        if direction == 1:
-            community = post.community
-
-            if user.is_banned_from(community):
-                raise BanError('You are banned from this community.')
-
-            if not user.is_subscribed_to(community):
-                raise SubscriptionError('You are not subscribed to this community.')
-            
-            vote = PostVote.get_by_user_and_post(user=user, post=post)
-
-            if vote:
-                if vote.is_downvote():
-                    vote.direction = 1
-                    vote.save()
-                else:
-                    raise VoteError('Post already upvoted.')
-            else:
-                new_vote = PostVote(user=user, post=post, direction=1)
-                new_vote.save()
-        elif direction == -1:
-            community = post.community
-
-            if user.is_banned_from(community):
-                raise BanError('You are banned from this community.')
-
-            if not user.is_subscribed_to(community):
-                raise SubscriptionError('You are not subscribed to this community.')
-
-            vote = PostVote.get_by_user_and_post(user=user, post=post)
-
-            if vote:
-                if vote.is_upvote():
-                    vote.direction = -1
-                    vote.save()
-                else:
-                    raise VoteError('Post already downvoted.')
-            else:
-                new_vote = PostVote(user=user, post=post, direction=-1)
-                new_vote.save()
+        community = post.community
+
+        if user.is_banned_from(community):
+            raise BanError('You are banned from this community.')
+
+        if not user.is_subscribed_to(community):
+            raise SubscriptionError('You are not subscribed to this community.')
+
+        previous = PostVote.upsert(user, post, direction)
+
+        if previous == direction:
+            raise VoteError('Post already upvoted.' if direction == 1 else 'Post already downvoted.')
+
+    @staticmethod
+    @unit_of_work()
+    def create_all(user, votes):
+        '''
+        Apply a batch of votes of a user, e.g. the ones made offline. The
+        permissions of all the votes are checked against a few set-based
+        queries and the allowed votes are written together. A vote already
+        in its direction is accepted as is, so a batch can be sent again.
+
+        :param user: The user object.
+        :param votes: List of dictionaries with the post ID and the
+            direction, the last vote on a post winning.
+
+        :return: List of the votes with the reason each one was rejected,
+            or None if it was applied.
+        '''
+
+        directions = {vote['id']: vote['direction'] for vote in votes}
+
+        posts = Post.get_owners_and_communities(list(directions))
+
+        context = ViewerContextLoader.load(user)
+
+        errors = {}
+
+        for post_id in directions:
+            post = posts.get(post_id)
+
+            if post is None:
+                errors[post_id] = 'Post not found.'
+            elif context.is_blocking(post.user_id) or context.is_blocked_by(post.user_id):
+                errors[post_id] = 'You cannot vote on this post.'
+            elif context.is_banned_from(post.community_id):
+                errors[post_id] = 'You are banned from this community.'
+            elif not context.is_subscribed_to(post.community_id):
+                errors[post_id] = 'You are not subscribed to this community.'
+
+        PostVote.upsert_all(user, {
+            post_id: direction for post_id, direction in directions.items() if post_id not in errors
+        })
+
+        return [
+            {'id': post_id, 'direction': direction, 'error': errors.get(post_id)}
+            for post_id, direction in directions.items()
+        ]
 
     @staticmethod
     def read_upvoted_posts_by_user(user, args):
@@ -1,7 +1,12 @@
+# Extensions
+from app.extensions.passwords import passwords
+
 # Models
 from app.models.user import User
 from app.models.user import Follow
 from app.models.user import Block
+from app.models.post import Post
+from app.models.feed import FeedItem
 
 # Errors
 from app.errors.errors import NameError
@@ -9,7 +14,7 @@ from app.errors.errors import FollowError
 from app.errors.errors import BlockError
 
 # Utils
-from app.utils.password import hash_password
+from app.utils.transaction import unit_of_work
 
 class UserManager:
     @staticmethod
@@ -26,7 +31,7 @@ class UserManager:
         
         password = data.get('password')
         
-        user = User(username=username, email=email, password=hash_password(password))
+        user = User(username=username, email=email, password=passwords.hash(password))
         user.save()
 
         return user
@@ -47,6 +52,7 @@ class UserManager:
 
 class FollowManager:
     @staticmethod
+    @unit_of_work()
     def create(user, target):    
         if user.is_blocking(target) or user.is_blocked_by(target):
             raise BlockError('You cannot follow this user.')
@@ -62,6 +68,8 @@ class FollowManager:
             followed=target
         ).save()
 
+        FeedItem.backfill(user, Post.user_id == target.id)
+
     @staticmethod
     def read_followed(user, args):
         paginated_following = Follow.get_followed(user, args)
@@ -75,6 +83,7 @@ class FollowManager:
         return paginated_followers
 
     @staticmethod
+    @unit_of_work()
     def delete(user, target):
         if target == user:
             raise FollowError('You cannot unfollow yourself.')
@@ -87,9 +96,12 @@ class FollowManager:
             followed=target
         ).delete()
 
+        FeedItem.prune(user, Post.user_id == target.id)
+
 
 class BlockManager:
     @staticmethod
+    @unit_of_work()
     def create(user, target):
         if target == user:
             raise BlockError('You cannot block yourself.')
@@ -103,11 +115,15 @@ class BlockManager:
                 followed=target
             ).delete()
 
+            FeedItem.prune(user, Post.user_id == target.id)
+
         if user.is_followed_by(target):
             Follow.get_by_follower_and_followed(
                 follower=target, 
                 followed=user
             ).delete()
+
+            FeedItem.prune(target, Post.user_id == user.id)
         
         Block(
             blocker=user, 
@@ -1,17 +1,17 @@
-# Datetime
-from datetime import datetime
-from datetime import timedelta
-from datetime import timezone
-
 # Flask-JWT-Extended
 from flask_jwt_extended import current_user
 
 # Extensions
 from app.extensions.database import db
+from app.extensions.counters import counters
+
+# Utils
+from app.utils.transaction import commit
+from app.utils.votes import upsert_votes
+from app.utils.votes import vote_deltas
 
-# Decorators
-from app.decorators.filters import filtered_users
-from app.decorators.filters import filtered_comments
+# Loaders
+from app.loaders.comment import CommentTreeLoader
 
 # Errors
 from app.errors.errors import NotFoundError
@@ -19,6 +19,10 @@ from app.errors.errors import NotFoundError
 
 class CommentBookmark(db.Model):
     __tablename__ = 'comment_bookmarks'
+    __table_args__ = (
+        db.Index('ix_comment_bookmarks_user_id_created_at', 'user_id', 'created_at'),
+        db.Index('ix_comment_bookmarks_comment_id', 'comment_id'),
+    )
 
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
     comment_id = db.Column(db.Integer, db.ForeignKey('comments.id'), primary_key=True)
@@ -32,11 +36,11 @@ class CommentBookmark(db.Model):
 
     def save(self):
         db.session.add(self)
-        db.session.commit()
+        commit()
 
     def delete(self):
         db.session.delete(self)
-        db.session.commit()
+        commit()
 
     @classmethod
     def get_by_user_and_comment(cls, user, comment):
@@ -46,68 +50,22 @@ class CommentBookmark(db.Model):
     
     @classmethod
     def get_bookmarks_by_user(cls, user, args):
-        page = args.get('page')
-        per_page = args.get('per_page')
-        time_filter = args.get('time_filter')
-        sort_by = args.get('sort_by')
-        sort_order = args.get('sort_order')
-              
-        @filtered_comments
-        def get_query():
-            query = (
-                db.select(Comment)
-                .join(cls, cls.comment_id == Comment.id)
-                .join(CommentStats, Comment.id == CommentStats.comment_id)
-                .where(cls.user_id == user.id)
-            )
-
-            if time_filter != 'all':
-                now = datetime.now(timezone.utc)
-
-                if time_filter == 'day':
-                    start_date = now - timedelta(days=1)
-                elif time_filter == 'week':
-                    start_date = now - timedelta(weeks=1)
-                elif time_filter == 'month':
-                    start_date = now - timedelta(days=30)
-                elif time_filter == 'year':
-                    start_date = now - timedelta(days=365)
-                else:
-                    start_date = None
-
-                if start_date:
-                    query = query.filter(cls.created_at >= start_date)
-
-            if sort_by == 'upvotes':
-                order_column = CommentStats.upvotes_count
-            else:
-                order_column = Comment.created_at
-
-            if sort_order == 'asc':
-                query = query.order_by(order_column.asc())
-            else:
-                query = query.order_by(order_column.desc())
-
-            return query
-        
-        query = get_query()
+        from app.listings.comment import bookmarked_comments
 
-        bookmarks = db.paginate(
-            query,
-            page=page,
-            per_page=per_page,
-            error_out=False
-        )
-
-        return bookmarks
+        return bookmarked_comments.paginate(args, {'user_id': user.id})
 
 
 class CommentVote(db.Model):
     __tablename__ = 'comment_votes'
+    __table_args__ = (
+        db.Index('ix_comment_votes_user_id_direction_created_at', 'user_id', 'direction', 'created_at'),
+        db.Index('ix_comment_votes_comment_id_direction_created_at', 'comment_id', 'direction', 'created_at'),
+    )
 
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
     comment_id = db.Column(db.Integer, db.ForeignKey('comments.id'), primary_key=True)
-    direction = db.Column(db.Integer, nullable=False)
+    # The previous direction is loaded when it is set, for the stats listener
+    direction = db.column_property(db.Column(db.Integer, nullable=False), active_history=True)
     created_at = db.Column(db.DateTime, default=db.func.now())
 
     # User
@@ -118,263 +76,76 @@ class CommentVote(db.Model):
 
     def save(self):
         db.session.add(self)
-        db.session.commit()
+        commit()
 
     def delete(self):
         db.session.delete(self)
-        db.session.commit()
+        commit()
 
     @classmethod
     def get_by_user_and_comment(cls, user, comment):
         vote = db.session.get(cls, (user.id, comment.id))
 
         return vote
+
+    @classmethod
+    def upsert(cls, user, comment, direction):
+        '''
+        Set the direction of the vote of a user on a comment, creating the
+        vote if needed, without reading it first.
+
+        :param user: The user object.
+        :param comment: The comment object.
+        :param direction: The direction of the vote.
+
+        :return: The previous direction, None if the user had not voted.
+        '''
+
+        previous = cls.upsert_all(user, {comment.id: direction})
+
+        return previous.get(comment.id, direction)
+
+    @classmethod
+    def upsert_all(cls, user, directions):
+        '''
+        Set the direction of the votes of a user on several comments, with
+        the changes to the stats of the comments summed per comment.
+
+        :param user: The user object.
+        :param directions: Dictionary of the directions keyed by comment ID.
+
+        :return: Dictionary of the previous direction of the changed votes.
+        '''
+
+        previous = upsert_votes(cls, 'comment_id', user.id, directions)
+
+        counters.add_all(db.session, CommentStats.__table__, 'comment_id', vote_deltas(directions, previous))
+
+        return previous
     
     @classmethod
     def get_upvoted_comments_by_user(cls, user, args):
-        page = args.get('page')
-        per_page = args.get('per_page')
-        time_filter = args.get('time_filter')
-        sort_by = args.get('sort_by')
-        sort_order = args.get('sort_order')
-                            
-        @filtered_comments
-        def get_query():
-            query = (
-                db.select(Comment)
-                .join(cls, cls.comment_id == Comment.id)
-                .join(CommentStats, Comment.id == CommentStats.comment_id)
-                .where(cls.user_id == user.id, cls.direction == 1)
-            )
-
-            if time_filter != 'all':
-                now = datetime.now(timezone.utc)
-
-                if time_filter == 'day':
-                    start_date = now - timedelta(days=1)
-                elif time_filter == 'week':
-                    start_date = now - timedelta(weeks=1)
-                elif time_filter == 'month':
-                    start_date = now - timedelta(days=30)
-                elif time_filter == 'year':
-                    start_date = now - timedelta(days=365)
-                else:
-                    start_date = None
-
-                if start_date:
-                    query = query.filter(cls.created_at >= start_date)
-
-            if sort_by == 'upvotes':
-                order_column = CommentStats.upvotes_count
-            else:
-                order_column = Comment.created_at
-
-            if sort_order == 'asc':
-                query = query.order_by(order_column.asc())
-            else:
-                query = query.order_by(order_column.desc())
-
-            return query
-        
-        query = get_query()
-
-        upvoted_comments = db.paginate(
-            query,
-            page=page,
-            per_page=per_page,
-            error_out=False
-        )
+        from app.listings.comment import upvoted_comments
 
-        return upvoted_comments
+        return upvoted_comments.paginate(args, {'user_id': user.id})
     
     @classmethod
     def get_downvoted_comments_by_user(cls, user, args):
-        page = args.get('page')
-        per_page = args.get('per_page')
-        time_filter = args.get('time_filter')
-        sort_by = args.get('sort_by')
-        sort_order = args.get('sort_order')
-                            
-        @filtered_comments
-        def get_query():
-            query = (
-                db.select(Comment)
-                .join(cls, cls.comment_id == Comment.id)
-                .join(CommentStats, Comment.id == CommentStats.comment_id)
-                .where(cls.user_id == user.id, cls.direction == -1)
-            )
-
-            if time_filter != 'all':
-                now = datetime.now(timezone.utc)
-
-                if time_filter == 'day':
-                    start_date = now - timedelta(days=1)
-                elif time_filter == 'week':
-                    start_date = now - timedelta(weeks=1)
-                elif time_filter == 'month':
-                    start_date = now - timedelta(days=30)
-                elif time_filter == 'year':
-                    start_date = now - timedelta(days=365)
-                else:
-                    start_date = None
-
-                if start_date:
-                    query = query.filter(cls.created_at >= start_date)
-
-            if sort_by == 'upvotes':
-                order_column = CommentStats.upvotes_count
-            else:
-                order_column = Comment.created_at
-
-            if sort_order == 'asc':
-                query = query.order_by(order_column.asc())
-            else:
-                query = query.order_by(order_column.desc())
-
-            return query
-        
-        query = get_query()
+        from app.listings.comment import downvoted_comments
 
-        downvoted_comments = db.paginate(
-            query,
-            page=page,
-            per_page=per_page,
-            error_out=False
-        )
-
-        return downvoted_comments
+        return downvoted_comments.paginate(args, {'user_id': user.id})
     
     @classmethod
     def get_upvoters_by_comment(cls, comment, args):
-        from app.models.user import User
-        from app.models.user import UserStats
-
-        page = args.get('page')
-        per_page = args.get('per_page')
-        time_filter = args.get('time_filter')
-        sort_by = args.get('sort_by')
-        sort_order = args.get('sort_order')
-
-        @filtered_users
-        def get_query():
-            query = (
-                db.select(User)
-                .join(cls, User.id == cls.user_id)
-                .join(UserStats, User.id == UserStats.user_id)
-                .where(cls.comment_id == comment.id, cls.direction == 1)
-            )
-
-            if time_filter != 'all':
-                now = datetime.now(timezone.utc)
-
-                if time_filter == 'day':
-                    start_date = now - timedelta(days=1)
-                elif time_filter == 'week':
-                    start_date = now - timedelta(weeks=1)
-                elif time_filter == 'month':
-                    start_date = now - timedelta(days=30)
-                elif time_filter == 'year':
-                    start_date = now - timedelta(days=365)
-                else:
-                    start_date = None
-
-                if start_date:
-                    query = query.filter(cls.created_at >= start_date)
-
-            if sort_by == 'followers':
-                order_column = UserStats.followers_count
-            elif sort_by == 'communities':
-                order_column = UserStats.communities_count
-            elif sort_by == 'posts':
-                order_column = UserStats.posts_count
-            elif sort_by == 'comments':
-                order_column = UserStats.comments_count
-            else:
-                order_column = cls.created_at
-
-            if sort_order == 'asc':
-                query = query.order_by(order_column.asc())
-            else:
-                query = query.order_by(order_column.desc())
-
-            return query
-        
-        query = get_query()
+        from app.listings.comment import comment_upvoters
 
-        paginated_upvoters = db.paginate(
-            query,
-            page=page,
-            per_page=per_page,
-            error_out=False
-        )
-
-        return paginated_upvoters
+        return comment_upvoters.paginate(args, {'comment_id': comment.id})
     
     @classmethod
     def get_downvoters_by_comment(cls, comment, args):
-        from app.models.user import User
-        from app.models.user import UserStats
-
-        page = args.get('page')
-        per_page = args.get('per_page')
-        time_filter = args.get('time_filter')
-        sort_by = args.get('sort_by')
-        sort_order = args.get('sort_order')
-
-        @filtered_users
-        def get_query():
-            query = (
-                db.select(User)
-                .join(cls, User.id == cls.user_id)
-                .join(UserStats, User.id == UserStats.user_id)
-                .where(cls.comment_id == comment.id, cls.direction == -1)
-            )
-
-            if time_filter != 'all':
-                now = datetime.now(timezone.utc)
-
-                if time_filter == 'day':
-                    start_date = now - timedelta(days=1)
-                elif time_filter == 'week':
-                    start_date = now - timedelta(weeks=1)
-                elif time_filter == 'month':
-                    start_date = now - timedelta(days=30)
-                elif time_filter == 'year':
-                    start_date = now - timedelta(days=365)
-                else:
-                    start_date = None
-
-                if start_date:
-                    query = query.filter(cls.created_at >= start_date)
-
-            if sort_by == 'followers':
-                order_column = UserStats.followers_count
-            elif sort_by == 'communities':
-                order_column = UserStats.communities_count
-            elif sort_by == 'posts':
-                order_column = UserStats.posts_count
-            elif sort_by == 'comments':
-                order_column = UserStats.comments_count
-            else:
-                order_column = cls.created_at
-
-            if sort_order == 'asc':
-                query = query.order_by(order_column.asc())
-            else:
-                query = query.order_by(order_column.desc())
-
-            return query
-        
-        query = get_query()
+        from app.listings.comment import comment_downvoters
 
-        paginated_downvoters = db.paginate(
-            query,
-            page=page,
-            per_page=per_page,
-            error_out=False
-        )
-
-        return paginated_downvoters
+        return comment_downvoters.paginate(args, {'comment_id': comment.id})
     
     def is_upvote(self):
         return self.direction == 1
@@ -385,6 +156,9 @@ class CommentVote(db.Model):
 
 class CommentStats(db.Model):
     __tablename__ = 'comment_stats'
+    __table_args__ = (
+        db.Index('ix_comment_stats_upvotes_count', 'upvotes_count'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     comment_id = db.Column(db.Integer, db.ForeignKey('comments.id'), unique=True)
@@ -397,11 +171,42 @@ class CommentStats(db.Model):
 
     def save(self):
         db.session.add(self)
-        db.session.commit()
+        commit()
+
+    @staticmethod
+    def reconcile():
+        '''
+        Recompute the counters of every comment from the rows they count,
+        correcting any drift left by lost or duplicated updates.
+        '''
+
+        comment_stats_table = CommentStats.__table__
+
+        def count(column, *conditions):
+            return db.select(db.func.count()).where(column == comment_stats_table.c.comment_id, *conditions).scalar_subquery()
+
+        update_query = comment_stats_table.update().values(
+            bookmarks_count=count(CommentBookmark.comment_id),
+            upvotes_count=count(CommentVote.comment_id, CommentVote.direction == 1),
+            downvotes_count=count(CommentVote.comment_id, CommentVote.direction == -1)
+        )
+
+        db.session.execute(update_query)
+        commit()
 
 
 class Comment(db.Model):
     __tablename__ = 'comments'
+    __table_args__ = (
+        db.Index('ix_comments_created_at', 'created_at'),
+        db.Index('ix_comments_user_id_created_at', 'user_id', 'created_at'),
+        db.Index('ix_comments_comment_id', 'comment_id'),
+        db.Index(
+            'ix_comments_post_id_created_at_root', 'post_id', 'created_at',
+            postgresql_where=db.text('comment_id IS NULL'),
+            sqlite_where=db.text('comment_id IS NULL')
+        ),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     content = db.Column(db.Text, nullable=False)
@@ -441,15 +246,14 @@ class Comment(db.Model):
         super().__init__(*args, **kwargs)
         
         self.stats = CommentStats(comment=self)
-        self.stats.save()
 
     def save(self):
         db.session.add(self)
-        db.session.commit()
+        commit()
 
     def delete(self):
         db.session.delete(self)
-        db.session.commit()
+        commit()
 
     @classmethod
     def get_by_id(cls, id):
@@ -467,6 +271,27 @@ class Comment(db.Model):
             raise NotFoundError('Comment not found.')
         
         return comment
+
+    @classmethod
+    def get_owners_and_communities(cls, ids):
+        '''
+        Get the owner and the community of several comments.
+
+        :param ids: The comment IDs.
+
+        :return: Dictionary of rows of id, user_id and community_id keyed
+            by comment ID, without the comments that do not exist.
+        '''
+
+        from app.models.post import Post
+
+        rows = db.session.execute(
+            db.select(cls.id, cls.user_id, Post.community_id)
+            .join(Post, cls.post_id == Post.id)
+            .where(cls.id.in_(ids))
+        )
+
+        return {row.id: row for row in rows}
     
     @classmethod
     def get_all(cls, args):
@@ -478,55 +303,9 @@ class Comment(db.Model):
         :return: Paginated list of comments
         '''
 
-        page = args.get('page')
-        per_page = args.get('per_page')
-        time_filter = args.get('time_filter')
-        sort_by = args.get('sort_by')
-        sort_order = args.get('sort_order')
-
-        @filtered_comments
-        def get_query():
-            query = db.select(cls).join(CommentStats, cls.id == CommentStats.comment_id)
-
-            if time_filter != 'all':
-                now = datetime.now(timezone.utc)
-
-                if time_filter == 'day':
-                    start_date = now - timedelta(days=1)
-                elif time_filter == 'week':
-                    start_date = now - timedelta(weeks=1)
-                elif time_filter == 'month':
-                    start_date = now - timedelta(days=30)
-                elif time_filter == 'year':
-                    start_date = now - timedelta(days=365)
-                else:
-                    start_date = None
-
-                if start_date:
-                    query = query.filter(cls.created_at >= start_date)
-            
-            if sort_by == 'upvotes':
-                order_column = CommentStats.upvotes_count
-            else:
-                order_column = cls.created_at
-
-            if sort_order == 'asc':
-                query = query.order_by(order_column.asc())
-            else:
-                query = query.order_by(order_column.desc())
-
-            return query
-
-        query = get_query()
-
-        paginated_comments = db.paginate(
-            query,
-            page=page,
-            per_page=per_page,
-            error_out=False
-        )
+        from app.listings.comment import all_comments
 
-        return paginated_comments
+        return all_comments.paginate(args)
     
     @classmethod
     def get_all_by_user(cls, user, args):
@@ -539,55 +318,13 @@ class Comment(db.Model):
         :return: Paginated list of comments
         '''
 
-        page = args.get('page')
-        per_page = args.get('per_page')
-        time_filter = args.get('time_filter')
-        sort_by = args.get('sort_by')
-        sort_order = args.get('sort_order')
-
-        @filtered_comments
-        def get_query():
-            query = db.select(cls).join(CommentStats, cls.id == CommentStats.comment_id).where(cls.user_id == user.id)
-
-            if time_filter != 'all':
-                now = datetime.now(timezone.utc)
-
-                if time_filter == 'day':
-                    start_date = now - timedelta(days=1)
-                elif time_filter == 'week':
-                    start_date = now - timedelta(weeks=1)
-                elif time_filter == 'month':
-                    start_date = now - timedelta(days=30)
-                elif time_filter == 'year':
-                    start_date = now - timedelta(days=365)
-                else:
-                    start_date = None
-
-                if start_date:
-                    query = query.filter(cls.created_at >= start_date)
-
-            if sort_by == 'upvotes':
-                order_column = CommentStats.upvotes_count
-            else:
-                order_column = cls.created_at
-
-            if sort_order == 'asc':
-                query = query.order_by(order_column.asc())
-            else:
-                query = query.order_by(order_column.desc())
-
-            return query
-        
-        query = get_query()
+        from app.listings.comment import user_comments
 
-        paginated_comments = db.paginate(
-            query,
-            page=page,
-            per_page=per_page,
-            error_out=False
+        return user_comments.paginate(
+            args,
+            {'user_id': user.id},
+            total=lambda: user.stats.comments_count
         )
-
-        return paginated_comments
     
     @classmethod
     def get_all_root_comments_by_post(cls, post, args):
@@ -599,61 +336,24 @@ class Comment(db.Model):
 
         :return: Paginated list of root comments
         """
-        
-        page = args.get('page')
-        per_page = args.get('per_page')
-        time_filter = args.get('time_filter')
-        sort_by = args.get('sort_by')
-        sort_order = args.get('sort_order')
-
-        @filtered_comments
-        def get_query(post):
-            query = (
-                db.select(cls)
-                .join(CommentStats, cls.id == CommentStats.comment_id)
-                .where(cls.comment_id == None, cls.post_id == post.id)
-            )
-
-            if time_filter != 'all':
-                now = datetime.now(timezone.utc)
-
-                if time_filter == 'day':
-                    start_date = now - timedelta(days=1)
-                elif time_filter == 'week':
-                    start_date = now - timedelta(weeks=1)
-                elif time_filter == 'month':
-                    start_date = now - timedelta(days=30)
-                elif time_filter == 'year':
-                    start_date = now - timedelta(days=365)
-                else:
-                    start_date = None
-
-                if start_date:
-                    query = query.filter(cls.created_at >= start_date)
-
-            if sort_by == 'upvotes':
-                order_column = CommentStats.upvotes_count
-            else:
-                order_column = cls.created_at
-
-            if sort_order == 'asc':
-                query = query.order_by(order_column.asc())
-            else:
-                query = query.order_by(order_column.desc())
-            
-            return query
-        
-        query = get_query(post)
 
-        root_comments = db.paginate(
-            query,
-            page=page,
-            per_page=per_page,
-            error_out=False
-        )
+        from app.listings.comment import root_comments
 
-        return root_comments
+        return root_comments.paginate(
+            args,
+            {'post_id': post.id},
+            community=post.community
+        )
     
+    @property
+    def loaded_replies(self):
+        replies = CommentTreeLoader.get(self)
+
+        if replies is None:
+            return self.replies.all()
+
+        return replies
+
     @property
     def bookmarked(self):
         if current_user:
@@ -730,183 +430,83 @@ class Comment(db.Model):
 def increment_comments_count_on_user_stats(mapper, connection, target):
     from app.models.user import UserStats
 
-    user_stats_table = UserStats.__table__
-
-    update_query = user_stats_table.update().where(
-        user_stats_table.c.user_id == target.user_id
-    ).values(
-        comments_count=user_stats_table.c.comments_count + 1
-    )
-
-    connection.execute(update_query)
+    counters.add(connection, UserStats.__table__, 'user_id', target.user_id, comments_count=1)
 
 
 @db.event.listens_for(Comment, 'after_delete')
 def decrement_comments_count_on_user_stats(mapper, connection, target):
     from app.models.user import UserStats
 
-    user_stats_table = UserStats.__table__
-
-    update_query = user_stats_table.update().where(
-        user_stats_table.c.user_id == target.user_id
-    ).values(
-        comments_count=user_stats_table.c.comments_count - 1
-    )
-
-    connection.execute(update_query)
+    counters.add(connection, UserStats.__table__, 'user_id', target.user_id, comments_count=-1)
 
 
 @db.event.listens_for(Comment, 'after_insert')
 def increment_comments_count_on_community_stats(mapper, connection, target):
     from app.models.community import CommunityStats
 
-    community_stats_table = CommunityStats.__table__
-
-    update_query = community_stats_table.update().where(
-        community_stats_table.c.community_id == target.post.community_id
-    ).values(
-        comments_count=community_stats_table.c.comments_count + 1
-    )
-
-    connection.execute(update_query)
+    counters.add(connection, CommunityStats.__table__, 'community_id', target.post.community_id, comments_count=1)
 
 
 @db.event.listens_for(Comment, 'after_delete')
 def decrement_comments_count_on_community_stats(mapper, connection, target):
     from app.models.community import CommunityStats
 
-    community_stats_table = CommunityStats.__table__
-
-    update_query = community_stats_table.update().where(
-        community_stats_table.c.community_id == target.post.community_id
-    ).values(
-        comments_count=community_stats_table.c.comments_count - 1
-    )
-
-    connection.execute(update_query)
+    counters.add(connection, CommunityStats.__table__, 'community_id', target.post.community_id, comments_count=-1)
 
 
 @db.event.listens_for(Comment, 'after_insert')
 def increment_comments_count_on_post_stats(mapper, connection, target):
     from app.models.post import PostStats
 
-    post_stats_table = PostStats.__table__
-
-    update_query = post_stats_table.update().where(
-        post_stats_table.c.post_id == target.post_id
-    ).values(
-        comments_count=post_stats_table.c.comments_count + 1
-    )
-
-    connection.execute(update_query)
+    counters.add(connection, PostStats.__table__, 'post_id', target.post_id, comments_count=1)
 
 
 @db.event.listens_for(Comment, 'after_delete')
 def decrement_comments_count_on_post_stats(mapper, connection, target):
     from app.models.post import PostStats
 
-    post_stats_table = PostStats.__table__
-
-    update_query = post_stats_table.update().where(
-        post_stats_table.c.post_id == target.post_id
-    ).values(
-        comments_count=post_stats_table.c.comments_count - 1
-    )
-
-    connection.execute(update_query)
+    counters.add(connection, PostStats.__table__, 'post_id', target.post_id, comments_count=-1)
 
 
 @db.event.listens_for(CommentVote, 'after_insert')
 def increment_votes_count_on_comment_stats(mapper, connection, target):
     from app.models.comment import CommentStats
 
-    comment_stats_table = CommentStats.__table__
-
     if target.direction == 1:  # upvote
-        update_query = comment_stats_table.update().where(
-            comment_stats_table.c.comment_id == target.comment_id
-        ).values(
-            upvotes_count=comment_stats_table.c.upvotes_count + 1
-        )
+        counters.add(connection, CommentStats.__table__, 'comment_id', target.comment_id, upvotes_count=1)
     elif target.direction == -1:  # downvote
-        update_query = comment_stats_table.update().where(
-            comment_stats_table.c.comment_id == target.comment_id
-        ).values(
-            downvotes_count=comment_stats_table.c.downvotes_count + 1
-        )
-
-    connection.execute(update_query)
+        counters.add(connection, CommentStats.__table__, 'comment_id', target.comment_id, downvotes_count=1)
 
 
 @db.event.listens_for(CommentVote, 'after_delete')
 def decrement_votes_count_on_comment_stats(mapper, connection, target):
     from app.models.comment import CommentStats
 
-    comment_stats_table = CommentStats.__table__
-
     if target.direction == 1:  # upvote
-        update_query = comment_stats_table.update().where(
-            comment_stats_table.c.comment_id == target.comment_id
-        ).values(
-            upvotes_count=comment_stats_table.c.upvotes_count - 1
-        )
+        counters.add(connection, CommentStats.__table__, 'comment_id', target.comment_id, upvotes_count=-1)
     elif target.direction == -1:  # downvote
-        update_query = comment_stats_table.update().where(
-            comment_stats_table.c.comment_id == target.comment_id
-        ).values(
-            downvotes_count=comment_stats_table.c.downvotes_count - 1
-        )
-
-    connection.execute(update_query)
+        counters.add(connection, CommentStats.__table__, 'comment_id', target.comment_id, downvotes_count=-1)
 
 
-@db.event.listens_for(CommentVote.direction, 'set')
-def update_votes_count_on_comment_stats(target, value, oldvalue, initiator):
+@db.event.listens_for(CommentVote, 'after_update')
+def update_votes_count_on_comment_stats(mapper, connection, target):
     from app.models.comment import CommentStats
 
-    comment_stats_table = CommentStats.__table__
-
-    if oldvalue is not None and oldvalue != value:  # the vote direction has changed
-        if value == 1:  # changed to upvote
-            update_query = comment_stats_table.update().where(
-                comment_stats_table.c.comment_id == target.comment_id
-            ).values(
-                upvotes_count=comment_stats_table.c.upvotes_count + 1,
-                downvotes_count=comment_stats_table.c.downvotes_count - 1
-            )
-        elif value == -1:  # changed to downvote
-            update_query = comment_stats_table.update().where(
-                comment_stats_table.c.comment_id == target.comment_id
-            ).values(
-                upvotes_count=comment_stats_table.c.upvotes_count - 1,
-                downvotes_count=comment_stats_table.c.downvotes_count + 1
-            )
+    history = db.inspect(target).attrs.direction.history
 
-        db.session.execute(update_query)
+    if history.deleted and history.deleted[0] != target.direction:  # the vote direction has changed
+        if target.direction == 1:  # changed to upvote
+            counters.add(connection, CommentStats.__table__, 'comment_id', target.comment_id, upvotes_count=1, downvotes_count=-1)
+        elif target.direction == -1:  # changed to downvote
+            counters.add(connection, CommentStats.__table__, 'comment_id', target.comment_id, upvotes_count=-1, downvotes_count=1)
 
 
 
 @db.event.listens_for(CommentBookmark, 'after_insert')
 def increment_bookmarks_count_on_comment_stats(mapper, connection, target):
-    comment_stats_table = CommentStats.__table__
-
-    update_query = comment_stats_table.update().where(
-        comment_stats_table.c.comment_id == target.comment_id
-    ).values(
-        bookmarks_count=comment_stats_table.c.bookmarks_count + 1
-    )
-
-    connection.execute(update_query)
+    counters.add(connection, CommentStats.__table__, 'comment_id', target.comment_id, bookmarks_count=1)
 
 
 @db.event.listens_for(CommentBookmark, 'after_delete')
 def decrement_bookmarks_count_on_comment_stats(mapper, connection, target):
-    comment_stats_table = CommentStats.__table__
-
-    update_query = comment_stats_table.update().where(
-        comment_stats_table.c.comment_id == target.comment_id
-    ).values(
-        bookmarks_count=comment_stats_table.c.bookmarks_count - 1
-    )
-
-    connection.execute(update_query)
+    counters.add(connection, CommentStats.__table__, 'comment_id', target.comment_id, bookmarks_count=-1)
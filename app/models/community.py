@@ -1,16 +1,18 @@
-# Datetime
-from datetime import datetime
-from datetime import timedelta
-from datetime import timezone
-
 # Flask-JWT-Extended
 from flask_jwt_extended import current_user
 
 # Extensions
 from app.extensions.database import db
+from app.extensions.counters import counters
+
+# Utils
+from app.utils.transaction import commit
+from app.utils.responses import version_of
+from app.utils.responses import invalidate_responses
 
-# Decorators
-from app.decorators.filters import filtered_users
+# Loaders
+from app.loaders.viewer import ViewerContextLoader
+from app.loaders.community import CommunityMembershipLoader
 
 # Errors
 from app.errors.errors import NotFoundError
@@ -18,6 +20,10 @@ from app.errors.errors import NotFoundError
 
 class CommunitySubscriber(db.Model):
     __tablename__ = 'community_subscribers'
+    __table_args__ = (
+        db.Index('ix_community_subscribers_community_id_created_at', 'community_id', 'created_at'),
+        db.Index('ix_community_subscribers_user_id_created_at', 'user_id', 'created_at'),
+    )
 
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
     community_id = db.Column(db.Integer, db.ForeignKey('communities.id'), primary_key=True)
@@ -28,11 +34,11 @@ class CommunitySubscriber(db.Model):
 
     def save(self):
         db.session.add(self)
-        db.session.commit()
+        commit()
 
     def delete(self):
         db.session.delete(self)
-        db.session.commit()
+        commit()
 
     @classmethod
     def get_by_user_and_community(cls, user, community):
@@ -58,59 +64,10 @@ class CommunitySubscriber(db.Model):
 
         :return: List of community objects.
         """
-        
-        page = args.get('page')
-        per_page = args.get('per_page')
-        time_filter = args.get('time_filter')
-        sort_by = args.get('sort_by')
-        sort_order = args.get('sort_order')
-
-        query = (
-            db.select(Community)
-            .join(cls, cls.community_id == Community.id)
-            .join(CommunityStats, Community.id == CommunityStats.community_id)
-            .where(cls.user_id == user.id)
-        )
 
-        if time_filter != 'all':
-            now = datetime.now(timezone.utc)
-
-            if time_filter == 'day':
-                start_date = now - timedelta(days=1)
-            elif time_filter == 'week':
-                start_date = now - timedelta(weeks=1)
-            elif time_filter == 'month':
-                start_date = now - timedelta(days=30)
-            elif time_filter == 'year':
-                start_date = now - timedelta(days=365)
-            else:
-                start_date = None
-
-            if start_date:
-                query = query.filter(cls.created_at >= start_date)
-
-        if sort_by == 'subscribers':
-            order_column = CommunityStats.subscribers_count
-        elif sort_by == 'posts':
-            order_column = CommunityStats.posts_count
-        elif sort_by == 'comments':
-            order_column = CommunityStats.comments_count
-        else:
-            order_column = cls.created_at
-
-        if sort_order == 'asc':
-            query = query.order_by(order_column.asc())
-        else:
-            query = query.order_by(order_column.desc())
-
-        paginated_subscriptions = db.paginate(
-            query, 
-            page=page, 
-            per_page=per_page, 
-            error_out=False
-        )
+        from app.listings.community import subscribed_communities
 
-        return paginated_subscriptions
+        return subscribed_communities.paginate(args, {'user_id': user.id})
     
     @classmethod
     def get_subscribers_by_community(cls, community, args):
@@ -123,73 +80,21 @@ class CommunitySubscriber(db.Model):
         :return: List of user objects
         """
 
-        from app.models.user import User
-        from app.models.user import UserStats
-
-        page = args.get('page')
-        per_page = args.get('per_page')
-        time_filter = args.get('time_filter')
-        sort_by = args.get('sort_by')
-        sort_order = args.get('sort_order')
-
-        @filtered_users
-        def get_query(community):
-            query = (
-                db.select(User)
-                .join(cls, User.id == cls.user_id)
-                .join(UserStats, User.id == UserStats.user_id)
-                .where(cls.community_id == community.id)
-            )
-
-            if time_filter != 'all':
-                now = datetime.now(timezone.utc)
-
-                if time_filter == 'day':
-                    start_date = now - timedelta(days=1)
-                elif time_filter == 'week':
-                    start_date = now - timedelta(weeks=1)
-                elif time_filter == 'month':
-                    start_date = now - timedelta(days=30)
-                elif time_filter == 'year':
-                    start_date = now - timedelta(days=365)
-                else:
-                    start_date = None
-
-                if start_date:
-                    query = query.filter(cls.created_at >= start_date)
-
-            if sort_by == 'followers':
-                order_column = UserStats.followers_count
-            elif sort_by == 'communities':
-                order_column = UserStats.communities_count
-            elif sort_by == 'posts':
-                order_column = UserStats.posts_count
-            elif sort_by == 'comments':
-                order_column = UserStats.comments_count
-            else:
-                order_column = cls.created_at
-
-            if sort_order == 'asc':
-                query = query.order_by(order_column.asc())
-            else:
-                query = query.order_by(order_column.desc())
-        
-            return query
-        
-        query = get_query(community)
+        from app.listings.community import community_subscribers
 
-        paginated_subscribers = db.paginate(
-            query, 
-            page=page, 
-            per_page=per_page, 
-            error_out=False
+        return community_subscribers.paginate(
+            args,
+            {'community_id': community.id},
+            community=community,
+            total=lambda: community.stats.subscribers_count
         )
 
-        return paginated_subscribers
-
 
 class CommunityModerator(db.Model):
     __tablename__ = 'community_moderators'
+    __table_args__ = (
+        db.Index('ix_community_moderators_community_id_created_at', 'community_id', 'created_at'),
+    )
 
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True, nullable=False)
     community_id = db.Column(db.Integer, db.ForeignKey('communities.id'), primary_key=True, nullable=False)
@@ -200,11 +105,11 @@ class CommunityModerator(db.Model):
 
     def save(self):
         db.session.add(self)
-        db.session.commit()
+        commit()
 
     def delete(self):
         db.session.delete(self)
-        db.session.commit()
+        commit()
 
     @classmethod
     def get_by_user_and_community(cls, user, community):
@@ -248,67 +153,20 @@ class CommunityModerator(db.Model):
         :return: List of user objects.
         """
 
-        from app.models.user import User
-        from app.models.user import UserStats
+        from app.listings.community import community_moderators
 
-        page = args.get('page')
-        per_page = args.get('per_page')
-        time_filter = args.get('time_filter')
-        sort_by = args.get('sort_by')
-        sort_order = args.get('sort_order')
-        
-        query = (
-            db.select(User)
-            .join(cls, User.id == cls.user_id)
-            .join(UserStats, User.id == UserStats.user_id)
-            .where(cls.community_id == community.id)
+        return community_moderators.paginate(
+            args,
+            {'community_id': community.id},
+            total=lambda: community.stats.moderators_count
         )
 
-        if time_filter != 'all':
-            now = datetime.now(timezone.utc)
-
-            if time_filter == 'day':
-                start_date = now - timedelta(days=1)
-            elif time_filter == 'week':
-                start_date = now - timedelta(weeks=1)
-            elif time_filter == 'month':
-                start_date = now - timedelta(days=30)
-            elif time_filter == 'year':
-                start_date = now - timedelta(days=365)
-            else:
-                start_date = None
-
-            if start_date:
-                query = query.filter(cls.created_at >= start_date)
-
-        if sort_by == 'followers':
-            order_column = UserStats.followers_count
-        elif sort_by == 'communities':
-            order_column = UserStats.communities_count
-        elif sort_by == 'posts':
-            order_column = UserStats.posts_count
-        elif sort_by == 'comments':
-            order_column = UserStats.comments_count
-        else:
-            order_column = cls.created_at
-
-        if sort_order == 'asc':
-            query = query.order_by(order_column.asc())
-        else:
-            query = query.order_by(order_column.desc())
-
-        paginated_moderators = db.paginate(
-            query, 
-            page=page, 
-            per_page=per_page, 
-            error_out=False
-        )
-
-        return paginated_moderators
-
 
 class CommunityBan(db.Model):
     __tablename__ = 'community_bans'
+    __table_args__ = (
+        db.Index('ix_community_bans_community_id_created_at', 'community_id', 'created_at'),
+    )
 
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True, nullable=False)
     community_id = db.Column(db.Integer, db.ForeignKey('communities.id'), primary_key=True, nullable=False)
@@ -319,11 +177,11 @@ class CommunityBan(db.Model):
 
     def save(self):
         db.session.add(self)
-        db.session.commit()
+        commit()
 
     def delete(self):
         db.session.delete(self)
-        db.session.commit()
+        commit()
 
     @classmethod
     def get_by_user_and_community(cls, user, community):
@@ -367,67 +225,23 @@ class CommunityBan(db.Model):
         
         :return: List of user objects.
         """
-        from app.models.user import User
-        from app.models.user import UserStats
-
-        page = args.get('page')
-        per_page = args.get('per_page')
-        time_filter = args.get('time_filter')
-        sort_by = args.get('sort_by')
-        sort_order = args.get('sort_order')
-
-        query = (
-            db.select(User)
-            .join(cls, User.id == cls.user_id)
-            .join(UserStats, User.id == UserStats.user_id)
-            .where(cls.community_id == community.id)
-        )
 
-        if time_filter != 'all':
-            now = datetime.now(timezone.utc)
-
-            if time_filter == 'day':
-                start_date = now - timedelta(days=1)
-            elif time_filter == 'week':
-                start_date = now - timedelta(weeks=1)
-            elif time_filter == 'month':
-                start_date = now - timedelta(days=30)
-            elif time_filter == 'year':
-                start_date = now - timedelta(days=365)
-            else:
-                start_date = None
-
-            if start_date:
-                query = query.filter(cls.created_at >= start_date)
-
-        if sort_by == 'followers':
-                order_column = UserStats.followers_count
-        elif sort_by == 'communities':
-            order_column = UserStats.communities_count
-        elif sort_by == 'posts':
-            order_column = UserStats.posts_count
-        elif sort_by == 'comments':
-            order_column = UserStats.comments_count
-        else:
-            order_column = cls.created_at
-
-        if sort_order == 'asc':
-            query = query.order_by(order_column.asc())
-        else:
-            query = query.order_by(order_column.desc())
-
-        banned_users = db.paginate(
-            query, 
-            page=page, 
-            per_page=per_page,
-            error_out=False
-        )
+        from app.listings.community import banned_users
 
-        return banned_users
+        return banned_users.paginate(
+            args,
+            {'community_id': community.id},
+            total=lambda: community.stats.banned_count
+        )
 
 
 class CommunityStats(db.Model):
     __tablename__ = 'community_stats'
+    __table_args__ = (
+        db.Index('ix_community_stats_subscribers_count', 'subscribers_count'),
+        db.Index('ix_community_stats_posts_count', 'posts_count'),
+        db.Index('ix_community_stats_comments_count', 'comments_count'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     community_id = db.Column(db.Integer, db.ForeignKey('communities.id'), unique=True)
@@ -442,11 +256,40 @@ class CommunityStats(db.Model):
 
     def save(self):
         db.session.add(self)
-        db.session.commit()
+        commit()
+
+    @staticmethod
+    def reconcile():
+        '''
+        Recompute the counters of every community from the rows they count,
+        correcting any drift left by lost or duplicated updates.
+        '''
+
+        from app.models.post import Post
+        from app.models.comment import Comment
+
+        community_stats_table = CommunityStats.__table__
+
+        def count(column, *conditions):
+            return db.select(db.func.count()).where(column == community_stats_table.c.community_id, *conditions).scalar_subquery()
+
+        update_query = community_stats_table.update().values(
+            posts_count=count(Post.community_id),
+            comments_count=count(Post.community_id, Comment.post_id == Post.id),
+            subscribers_count=count(CommunitySubscriber.community_id),
+            moderators_count=count(CommunityModerator.community_id),
+            banned_count=count(CommunityBan.community_id)
+        )
+
+        db.session.execute(update_query)
+        commit()
 
 
 class Community(db.Model):
     __tablename__ = 'communities'
+    __table_args__ = (
+        db.Index('ix_communities_created_at', 'created_at'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(255), nullable=False, unique=True)
@@ -470,15 +313,14 @@ class Community(db.Model):
         super().__init__(*args, **kwargs)
         
         self.stats = CommunityStats(community=self)
-        self.stats.save()
 
     def save(self):
         db.session.add(self)
-        db.session.commit()
+        commit()
 
     def delete(self):
         db.session.delete(self)
-        db.session.commit()
+        commit()
 
     @staticmethod
     def is_name_available(name):
@@ -510,57 +352,18 @@ class Community(db.Model):
     
     @classmethod
     def get_all(cls, args):
-        page = args.get('page')
-        per_page = args.get('per_page')
-        time_filter = args.get('time_filter')
-        sort_by = args.get('sort_by')
-        sort_order = args.get('sort_order')
-        
-        query = db.select(cls).join(CommunityStats, cls.id == CommunityStats.community_id)
-
-        if time_filter != 'all':
-            now = datetime.now(timezone.utc)
-
-            if time_filter == 'day':
-                start_date = now - timedelta(days=1)
-            elif time_filter == 'week':
-                start_date = now - timedelta(weeks=1)
-            elif time_filter == 'month':
-                start_date = now - timedelta(days=30)
-            elif time_filter == 'year':
-                start_date = now - timedelta(days=365)
-            else:
-                start_date = None
-
-            if start_date:
-                query = query.filter(cls.created_at >= start_date)
-
-        if sort_by == 'subscribers':
-            order_column = CommunityStats.subscribers_count
-        elif sort_by == 'posts':
-            order_column = CommunityStats.posts_count
-        elif sort_by == 'comments':
-            order_column = CommunityStats.comments_count
-        else:
-            order_column = cls.created_at
-
-        if sort_order == 'asc':
-            query = query.order_by(order_column.asc())
-        else:
-            query = query.order_by(order_column.desc())
-
-        paginated_communities = db.paginate(
-            query, 
-            page=page, 
-            per_page=per_page, 
-            error_out=False
-        )
+        from app.listings.community import all_communities
 
-        return paginated_communities
+        return all_communities.paginate(args)
     
     @property
     def subscriber(self):
         if current_user:
+            membership = CommunityMembershipLoader.get(current_user, self)
+
+            if membership is not None:
+                return membership.subscriber
+
             return current_user.is_subscribed_to(self)
         
         return None
@@ -568,6 +371,11 @@ class Community(db.Model):
     @property
     def moderator(self):
         if current_user:
+            membership = CommunityMembershipLoader.get(current_user, self)
+
+            if membership is not None:
+                return membership.moderator
+
             return current_user.is_moderator_of(self)
         
         return None
@@ -575,6 +383,11 @@ class Community(db.Model):
     @property
     def owned_by(self):
         if current_user:
+            membership = CommunityMembershipLoader.get(current_user, self)
+
+            if membership is not None:
+                return membership.owned_by
+
             return current_user.is_owner_of(self)
         
         return None
@@ -582,217 +395,139 @@ class Community(db.Model):
     @property
     def ban(self):
         if current_user:
+            membership = CommunityMembershipLoader.get(current_user, self)
+
+            if membership is not None:
+                return membership.ban
+
             return current_user.is_banned_from(self)
         
         return None
     
     def belongs_to(self, user):
         return self.owner.id == user.id
+
+    def etag_parts(self):
+        return (
+            version_of(self),
+            self.owned_by, self.subscriber, self.moderator, self.ban,
+            self.owner.etag_parts()
+        )
+
+    def cache_tags(self):
+        return {('community', self.id)} | self.owner.cache_tags()
     
     def change_ownership_to(self, user):
         self.owner = user
 
-        db.session.commit()
+        commit()
 
 
 @db.event.listens_for(Community, 'after_insert')
 def increment_communities_count_on_user_stats(mapper, connection, target):
     from app.models.user import UserStats
 
-    user_stats_table = UserStats.__table__
-
-    update_query = user_stats_table.update().where(
-        user_stats_table.c.user_id == target.user_id
-    ).values(
-        communities_count=user_stats_table.c.communities_count + 1
-    )
-
-    connection.execute(update_query)
+    counters.add(connection, UserStats.__table__, 'user_id', target.user_id, communities_count=1)
 
 
 @db.event.listens_for(Community, 'after_delete')
 def decrement_community_count_on_user_stats(mapper, connection, target):
     from app.models.user import UserStats
 
-    user_stats_table = UserStats.__table__
-
-    update_query = user_stats_table.update().where(
-        user_stats_table.c.user_id == target.user_id
-    ).values(
-        communities_count=user_stats_table.c.communities_count - 1
-    )
-
-    connection.execute(update_query)
+    counters.add(connection, UserStats.__table__, 'user_id', target.user_id, communities_count=-1)
 
 
 @db.event.listens_for(Community, 'before_delete')
 def decrement_subscriptions_count_on_user_stats(mapper, connection, target):
     from app.models.user import UserStats
 
-    user_stats_table = UserStats.__table__
-
     for subscriber in target.subscribers:
-        update_query = user_stats_table.update().where(
-            user_stats_table.c.user_id == subscriber.user_id
-        ).values(
-            subscriptions_count=user_stats_table.c.subscriptions_count - 1
-        )
-        connection.execute(update_query)
+        counters.add(connection, UserStats.__table__, 'user_id', subscriber.user_id, subscriptions_count=-1)
 
 
 @db.event.listens_for(Community, 'before_delete')
 def decrement_moderations_count_on_user_stats(mapper, connection, target):
     from app.models.user import UserStats
 
-    user_stats_table = UserStats.__table__
-
     for moderator in target.moderators:
-        update_query = user_stats_table.update().where(
-            user_stats_table.c.user_id == moderator.user_id
-        ).values(
-            moderations_count=user_stats_table.c.moderations_count - 1
-        )
-        connection.execute(update_query)
+        counters.add(connection, UserStats.__table__, 'user_id', moderator.user_id, moderations_count=-1)
 
 
 @db.event.listens_for(CommunitySubscriber, 'after_insert')
 def increment_subscribers_count_on_community_stats(mapper, connection, target):
-
-    community_stats_table = CommunityStats.__table__
-
-    
-    update_query = community_stats_table.update().where(
-        community_stats_table.c.community_id == target.community_id
-    ).values(
-        subscribers_count=community_stats_table.c.subscribers_count + 1
-    )
-
-    connection.execute(update_query)
+    counters.add(connection, CommunityStats.__table__, 'community_id', target.community_id, subscribers_count=1)
 
 
 @db.event.listens_for(CommunitySubscriber, 'after_delete')
 def decrement_subscribers_count_on_community_stats(mapper, connection, target):
-
-    community_stats_table = CommunityStats.__table__
-    
-    update_query = community_stats_table.update().where(
-        community_stats_table.c.community_id == target.community_id
-    ).values(
-        subscribers_count=community_stats_table.c.subscribers_count - 1
-    )
-
-    connection.execute(update_query)
+    counters.add(connection, CommunityStats.__table__, 'community_id', target.community_id, subscribers_count=-1)
 
 
 @db.event.listens_for(CommunitySubscriber, 'after_insert')
 def increment_subscriptions_count_on_user_stats(mapper, connection, target):
     from app.models.user import UserStats
 
-    user_stats_table = UserStats.__table__
-
-    update_query = user_stats_table.update().where(
-        user_stats_table.c.user_id == target.user_id
-    ).values(
-        subscriptions_count=user_stats_table.c.subscriptions_count + 1
-    )
-
-    connection.execute(update_query)
+    counters.add(connection, UserStats.__table__, 'user_id', target.user_id, subscriptions_count=1)
 
 @db.event.listens_for(CommunitySubscriber, 'after_delete')
 def decrement_subscriptions_count_on_user_stats(mapper, connection, target):
     from app.models.user import UserStats
-    
-    user_stats_table = UserStats.__table__
-
-    update_query = user_stats_table.update().where(
-        user_stats_table.c.user_id == target.user_id
-    ).values(
-        subscriptions_count=user_stats_table.c.subscriptions_count - 1
-    )
 
-    connection.execute(update_query)
+    counters.add(connection, UserStats.__table__, 'user_id', target.user_id, subscriptions_count=-1)
 
 
 @db.event.listens_for(CommunityModerator, 'after_insert')
 def increment_moderators_count_on_community_stats(mapper, connection, target):
-
-    community_stats_table = CommunityStats.__table__
-
-    update_query = community_stats_table.update().where(
-        community_stats_table.c.community_id == target.community_id
-    ).values(
-        moderators_count=community_stats_table.c.moderators_count + 1
-    )
-
-    connection.execute(update_query)
+    counters.add(connection, CommunityStats.__table__, 'community_id', target.community_id, moderators_count=1)
 
 
 @db.event.listens_for(CommunityModerator, 'after_delete')
 def decrement_moderators_count_on_community_stats(mapper, connection, target):
-
-    community_stats_table = CommunityStats.__table__
-
-    update_query = community_stats_table.update().where(
-        community_stats_table.c.community_id == target.community_id
-    ).values(
-        moderators_count=community_stats_table.c.moderators_count - 1
-    )
-
-    connection.execute(update_query)
+    counters.add(connection, CommunityStats.__table__, 'community_id', target.community_id, moderators_count=-1)
 
 
 @db.event.listens_for(CommunityModerator, 'after_insert')
 def increment_moderations_count_on_user_stats(mapper, connection, target):
     from app.models.user import UserStats
 
-    user_stats_table = UserStats.__table__
-
-    update_query = user_stats_table.update().where(
-        user_stats_table.c.user_id == target.user_id
-    ).values(
-        moderations_count=user_stats_table.c.moderations_count + 1
-    )
-
-    connection.execute(update_query)
+    counters.add(connection, UserStats.__table__, 'user_id', target.user_id, moderations_count=1)
 
 @db.event.listens_for(CommunityModerator, 'after_delete')
 def decrement_moderations_count_on_user_stats(mapper, connection, target):
     from app.models.user import UserStats
-    
-    user_stats_table = UserStats.__table__
 
-    update_query = user_stats_table.update().where(
-        user_stats_table.c.user_id == target.user_id
-    ).values(
-        moderations_count=user_stats_table.c.moderations_count - 1
-    )
-
-    connection.execute(update_query)
+    counters.add(connection, UserStats.__table__, 'user_id', target.user_id, moderations_count=-1)
 
 
 @db.event.listens_for(CommunityBan, 'after_insert')
 def increment_banned_users_count_on_community_stats(mapper, connection, target):
+    counters.add(connection, CommunityStats.__table__, 'community_id', target.community_id, banned_count=1)
 
-    community_stats_table = CommunityStats.__table__
-
-    update_query = community_stats_table.update().where(
-        community_stats_table.c.community_id == target.community_id
-    ).values(
-        banned_count=community_stats_table.c.banned_count + 1
-    )
 
-    connection.execute(update_query)
+@db.event.listens_for(CommunityBan, 'after_delete')
+def decrement_banned_users_count_on_community_stats(mapper, connection, target):
+    counters.add(connection, CommunityStats.__table__, 'community_id', target.community_id, banned_count=-1)
 
 
+@db.event.listens_for(CommunitySubscriber, 'after_insert')
+@db.event.listens_for(CommunitySubscriber, 'after_delete')
+@db.event.listens_for(CommunityModerator, 'after_insert')
+@db.event.listens_for(CommunityModerator, 'after_delete')
+@db.event.listens_for(CommunityBan, 'after_insert')
 @db.event.listens_for(CommunityBan, 'after_delete')
-def decrement_banned_users_count_on_community_stats(mapper, connection, target):
+def invalidate_viewer_contexts(mapper, connection, target):
+    ViewerContextLoader.invalidate(target.user_id)
+    CommunityMembershipLoader.clear()
 
-    community_stats_table = CommunityStats.__table__
 
-    update_query = community_stats_table.update().where(
-        community_stats_table.c.community_id == target.community_id
-    ).values(
-        banned_count=community_stats_table.c.banned_count - 1
-    )
+@db.event.listens_for(Community, 'after_update')
+@db.event.listens_for(Community, 'after_delete')
+def invalidate_community_responses(mapper, connection, target):
+    invalidate_responses(('community', target.id))
+
+
+def invalidate_community_stats_responses(community_id):
+    invalidate_responses(('community', community_id))
+
 
-    connection.execute(update_query)
\ No newline at end of file
+counters.watch(CommunityStats.__table__, invalidate_community_stats_responses)
@@ -0,0 +1,160 @@
+# Datetime
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
+# Extensions
+from app.extensions.database import db
+
+# Utils
+from app.utils.transaction import commit
+
+
+def utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class OutboxEmail(db.Model):
+    '''
+    An email waiting to be sent by the mail workers. An email is due once
+    its next attempt date has passed. Claiming it pushes that date by the
+    lease, so an email whose worker died is picked up again afterwards.
+    '''
+
+    __tablename__ = 'outbox_emails'
+    __table_args__ = (
+        db.Index('ix_outbox_emails_next_attempt_at', 'next_attempt_at'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    recipient = db.Column(db.String(255), nullable=False)
+    subject = db.Column(db.String(255), nullable=False)
+    html = db.Column(db.Text, nullable=False)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    last_error = db.Column(db.Text)
+    next_attempt_at = db.Column(db.DateTime, nullable=False, default=utcnow)
+    sent_at = db.Column(db.DateTime)
+    failed_at = db.Column(db.DateTime)
+    created_at = db.Column(db.DateTime, default=db.func.now())
+
+    @staticmethod
+    def enqueue(recipient, subject, html):
+        '''
+        Put an email in the outbox.
+
+        :param recipient: The email address of the recipient.
+        :param subject: The subject of the email.
+        :param html: The HTML body of the email.
+
+        :return: The email object.
+        '''
+
+        email = OutboxEmail(recipient=recipient, subject=subject, html=html)
+
+        db.session.add(email)
+        commit()
+
+        return email
+
+    @staticmethod
+    def is_due(now):
+        return db.and_(
+            OutboxEmail.sent_at.is_(None),
+            OutboxEmail.failed_at.is_(None),
+            OutboxEmail.next_attempt_at <= now
+        )
+
+    @staticmethod
+    def claim(size, lease):
+        '''
+        Claim a batch of due emails, oldest attempt first. The claim is a
+        single UPDATE, so concurrent workers never get the same email.
+
+        :param size: The maximum number of emails.
+        :param lease: Seconds before a claimed email is due again.
+
+        :return: List of rows with the id, recipient, subject, html and
+            attempts of the emails.
+        '''
+
+        now = utcnow()
+
+        batch = (
+            db.select(OutboxEmail.id)
+            .where(OutboxEmail.is_due(now))
+            .order_by(OutboxEmail.next_attempt_at)
+            .limit(size)
+            .scalar_subquery()
+        )
+
+        claim_query = (
+            db.update(OutboxEmail)
+            .where(OutboxEmail.id.in_(batch), OutboxEmail.is_due(now))
+            .values(attempts=OutboxEmail.attempts + 1, next_attempt_at=now + timedelta(seconds=lease))
+            .returning(OutboxEmail.id, OutboxEmail.recipient, OutboxEmail.subject, OutboxEmail.html, OutboxEmail.attempts)
+            .execution_options(synchronize_session=False)
+        )
+
+        emails = db.session.execute(claim_query).all()
+        commit()
+
+        return emails
+
+    @staticmethod
+    def mark_sent(ids):
+        if not ids:
+            return
+
+        outbox_emails_table = OutboxEmail.__table__
+
+        db.session.execute(
+            outbox_emails_table.update()
+            .where(outbox_emails_table.c.id.in_(ids))
+            .values(sent_at=utcnow(), last_error=None)
+        )
+        commit()
+
+    @staticmethod
+    def mark_failed(failures):
+        '''
+        Record failed attempts, each retried after its own delay or given
+        up on.
+
+        :param failures: List of dictionaries with the email_id, the error,
+            the retry_at date, and failed_at when it is given up on.
+        '''
+
+        if not failures:
+            return
+
+        outbox_emails_table = OutboxEmail.__table__
+
+        db.session.execute(
+            outbox_emails_table.update()
+            .where(outbox_emails_table.c.id == db.bindparam('email_id'))
+            .values(
+                last_error=db.bindparam('error'),
+                next_attempt_at=db.bindparam('retry_at'),
+                failed_at=db.bindparam('given_up_at')
+            ),
+            failures
+        )
+        commit()
+
+    @staticmethod
+    def stats():
+        '''
+        Count the emails of the outbox by state.
+
+        :return: Dictionary with the pending, sent and failed counts.
+        '''
+
+        state = db.case(
+            (OutboxEmail.sent_at.is_not(None), 'sent'),
+            (OutboxEmail.failed_at.is_not(None), 'failed'),
+            else_='pending'
+        )
+
+        counts = dict(db.session.execute(db.select(state, db.func.count()).group_by(state)).all())
+
+        return {key: counts.get(key, 0) for key in ('pending', 'sent', 'failed')}
@@ -0,0 +1,204 @@
+# Flask
+from flask import current_app
+
+# Extensions
+from app.extensions.database import db
+
+# Utils
+from app.utils.transaction import commit
+
+# Models
+from app.models.post import Post
+from app.models.community import CommunityStats
+from app.models.community import CommunitySubscriber
+from app.models.user import Follow
+
+
+class FeedItem(db.Model):
+    '''
+    A post delivered to the home feed of a user, written when the post is
+    created so a feed page is a single read of the user's items. Posts of
+    communities with more than FEED_FANOUT_MAX_SUBSCRIBERS subscribers are
+    not delivered and are read from the community when the feed is read.
+    '''
+
+    __tablename__ = 'feed_items'
+    __table_args__ = (
+        db.Index('ix_feed_items_user_id_created_at', 'user_id', 'created_at'),
+        db.Index('ix_feed_items_post_id', 'post_id'),
+    )
+
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
+    post_id = db.Column(db.Integer, db.ForeignKey('posts.id'), primary_key=True)
+    created_at = db.Column(db.DateTime, nullable=False)
+
+    @staticmethod
+    def fanout_limit():
+        return current_app.config.get('FEED_FANOUT_MAX_SUBSCRIBERS')
+
+    @staticmethod
+    def is_read_on_demand(community):
+        '''
+        Check if the posts of a community are read when the feeds are read
+        instead of being delivered to its subscribers.
+
+        :param community: The community object.
+
+        :return: True if the community has too many subscribers to fan out.
+        '''
+
+        limit = FeedItem.fanout_limit()
+
+        return limit is not None and community.stats.subscribers_count > limit
+
+    @staticmethod
+    def on_demand_communities(user_id):
+        '''
+        Query the IDs of the communities subscribed by a user whose posts
+        are read on demand.
+
+        :param user_id: The ID of the user, or a bound parameter.
+
+        :return: The select statement.
+        '''
+
+        return (
+            db.select(CommunitySubscriber.community_id)
+            .join(CommunityStats, CommunityStats.community_id == CommunitySubscriber.community_id)
+            .where(
+                CommunitySubscriber.user_id == user_id,
+                CommunityStats.subscribers_count > db.bindparam('fanout_limit')
+            )
+        )
+
+    @staticmethod
+    def fan_out(post):
+        '''
+        Deliver a new post to the followers of its owner and, unless its
+        community is read on demand, to the subscribers of the community.
+
+        :param post: The flushed post object.
+        '''
+
+        recipients = db.select(Follow.follower_id.label('user_id')).where(Follow.followed_id == post.user_id)
+
+        if not FeedItem.is_read_on_demand(post.community):
+            subscribers = db.select(CommunitySubscriber.user_id).where(CommunitySubscriber.community_id == post.community_id)
+
+            recipients = db.union(recipients, subscribers)
+
+        recipients = recipients.subquery()
+
+        items = db.select(
+            recipients.c.user_id,
+            db.literal(post.id),
+            db.literal(post.created_at, FeedItem.created_at.type)
+        )
+
+        db.session.execute(
+            db.insert(FeedItem).from_select(['user_id', 'post_id', 'created_at'], items)
+        )
+        commit()
+
+    @staticmethod
+    def backfill(user, condition):
+        '''
+        Deliver to a user the latest posts matching a condition, e.g. the
+        posts of a community they just subscribed to.
+
+        :param user: The user object.
+        :param condition: SQL condition on the posts.
+        '''
+
+        delivered = db.exists().where(FeedItem.user_id == user.id, FeedItem.post_id == Post.id)
+
+        items = (
+            db.select(db.literal(user.id), Post.id, Post.created_at)
+            .where(condition, ~delivered)
+            .order_by(Post.created_at.desc())
+            .limit(current_app.config.get('FEED_BACKFILL_SIZE'))
+        )
+
+        db.session.execute(
+            db.insert(FeedItem).from_select(['user_id', 'post_id', 'created_at'], items)
+        )
+        commit()
+
+    @staticmethod
+    def prune(user, condition):
+        '''
+        Remove from the feed of a user the posts matching a condition that
+        they no longer get through a subscription or a follow.
+
+        :param user: The user object.
+        :param condition: SQL condition on the posts.
+        '''
+
+        subscribed = db.select(CommunitySubscriber.community_id).where(CommunitySubscriber.user_id == user.id)
+        followed = db.select(Follow.followed_id).where(Follow.follower_id == user.id)
+
+        stale = db.select(Post.id).where(
+            condition,
+            Post.community_id.not_in(subscribed),
+            Post.user_id.not_in(followed)
+        )
+
+        feed_items_table = FeedItem.__table__
+
+        db.session.execute(
+            feed_items_table.delete().where(
+                feed_items_table.c.user_id == user.id,
+                feed_items_table.c.post_id.in_(stale)
+            )
+        )
+        commit()
+
+    @staticmethod
+    def rebuild(user):
+        '''
+        Deliver to a user the latest posts of their subscriptions and
+        follows, e.g. for users that existed before the feeds.
+
+        :param user: The user object.
+        '''
+
+        subscribed = db.select(CommunitySubscriber.community_id).where(CommunitySubscriber.user_id == user.id)
+        followed = db.select(Follow.followed_id).where(Follow.follower_id == user.id)
+
+        FeedItem.backfill(user, db.or_(Post.community_id.in_(subscribed), Post.user_id.in_(followed)))
+
+    @classmethod
+    def get_feed(cls, user, args):
+        '''
+        Get the home feed of a user.
+
+        :param user: The user object.
+        :param args: The pagination arguments.
+
+        :return: The paginated posts.
+        '''
+
+        from app.listings.feed import feed_posts
+        from app.listings.feed import mixed_feed_posts
+
+        limit = cls.fanout_limit()
+
+        if limit is not None:
+            on_demand = db.session.scalar(
+                db.select(cls.on_demand_communities(user.id).exists()),
+                {'fanout_limit': limit}
+            )
+
+            if on_demand:
+                return mixed_feed_posts.paginate(args, {'user_id': user.id, 'fanout_limit': limit})
+
+        return feed_posts.paginate(args, {'user_id': user.id})
+
+
+@db.event.listens_for(Post, 'before_delete')
+def delete_feed_items(mapper, connection, target):
+    feed_items_table = FeedItem.__table__
+
+    connection.execute(
+        feed_items_table.delete().where(feed_items_table.c.post_id == target.id)
+    )
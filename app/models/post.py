@@ -1,13 +1,23 @@
-# Datetime
-from datetime import datetime
-from datetime import timedelta
-from datetime import timezone
-
 # Flask-JWT-Extended
 from flask_jwt_extended import current_user
 
 # Extensions
 from app.extensions.database import db
+from app.extensions.counters import counters
+
+# Datetime
+from datetime import datetime
+from datetime import timezone
+
+# Utils
+from app.utils.transaction import commit
+from app.utils.votes import upsert_votes
+from app.utils.votes import vote_deltas
+from app.utils.ranking import hot_score
+from app.utils.ranking import best_score
+from app.utils.ranking import score_values
+from app.utils.responses import version_of
+from app.utils.responses import invalidate_responses
 
 # Errors
 from app.errors.errors import NotFoundError
@@ -15,13 +25,16 @@ from app.errors.errors import NotFoundError
 # Models
 from app.models.comment import Comment
 
-# Decorators
-from app.decorators.filters import filtered_users
-from app.decorators.filters import filtered_posts
+# Loaders
+from app.loaders.post import PostFlagsLoader
 
 
 class PostBookmark(db.Model):
     __tablename__ = 'post_bookmarks'
+    __table_args__ = (
+        db.Index('ix_post_bookmarks_user_id_created_at', 'user_id', 'created_at'),
+        db.Index('ix_post_bookmarks_post_id', 'post_id'),
+    )
 
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
     post_id = db.Column(db.Integer, db.ForeignKey('posts.id'), primary_key=True)
@@ -35,11 +48,11 @@ class PostBookmark(db.Model):
 
     def save(self):
         db.session.add(self)
-        db.session.commit()
+        commit()
 
     def delete(self):
         db.session.delete(self)
-        db.session.commit()
+        commit()
 
     @classmethod
     def get_by_user_and_post(cls, user, post):
@@ -49,77 +62,23 @@ class PostBookmark(db.Model):
     
     @classmethod
     def get_bookmarks_by_user(cls, user, args):
-        from app.models.post import Post
-        from app.models.post import PostStats
-
-        page = args.get('page')
-        per_page = args.get('per_page')
-        time_filter = args.get('time_filter')
-        sort_by = args.get('sort_by')
-        sort_order = args.get('sort_order')
-
-        @filtered_posts
-        def get_query():
-            # Get the posts marked as bookmarks and join with PostStats
-            query = (
-                db.select(Post)
-                .join(cls, Post.id == cls.post_id)
-                .join(PostStats, Post.id == PostStats.post_id)
-                .where(cls.user_id == user.id)
-            )
+        from app.listings.post import bookmarked_posts
 
-            if time_filter != 'all':
-                now = datetime.now(timezone.utc)
-
-                if time_filter == 'day':
-                    start_date = now - timedelta(days=1)
-                elif time_filter == 'week':
-                    start_date = now - timedelta(weeks=1)
-                elif time_filter == 'month':
-                    start_date = now - timedelta(days=30)
-                elif time_filter == 'year':
-                    start_date = now - timedelta(days=365)
-                else:
-                    start_date = None
-
-                if start_date:
-                    query = query.filter(cls.created_at >= start_date)
-
-            # Determine the order column
-            if sort_by == 'upvotes':
-                order_column = PostStats.upvotes_count
-            elif sort_by == 'comments':
-                order_column = PostStats.comments_count
-            else:  # Default to 'created_at'
-                order_column = Post.created_at
-
-            # Apply sorting
-            if sort_order == 'asc':
-                query = query.order_by(order_column.asc())
-            else:
-                query = query.order_by(order_column.desc())
-
-            return query
-        
-        query = get_query()
-
-        paginated_bookmarks = db.paginate(
-            query,
-            page=page,
-            per_page=per_page,
-            error_out=False
-        )
-
-        return paginated_bookmarks
+        return bookmarked_posts.paginate(args, {'user_id': user.id})
 
 
 
 class PostVote(db.Model):
     __tablename__ = 'post_votes'
+    __table_args__ = (
+        db.Index('ix_post_votes_user_id_direction_created_at', 'user_id', 'direction', 'created_at'),
+        db.Index('ix_post_votes_post_id_direction_created_at', 'post_id', 'direction', 'created_at'),
+    )
 
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
     post_id = db.Column(db.Integer, db.ForeignKey('posts.id'), primary_key=True)
-    direction = db.Column(db.Integer, nullable=False)
+    # The previous direction is loaded when it is set, for the stats listener
+    direction = db.column_property(db.Column(db.Integer, nullable=False), active_history=True)
     created_at = db.Column(db.DateTime, default=db.func.now())
 
     # User
@@ -130,273 +89,76 @@ class PostVote(db.Model):
 
     def save(self):
         db.session.add(self)
-        db.session.commit()
+        commit()
 
     def delete(self):
         db.session.delete(self)
-        db.session.commit()
+        commit()
 
     @classmethod
     def get_by_user_and_post(cls, user, post):
         vote = db.session.get(cls, (user.id, post.id))
 
         return vote
-    
+
     @classmethod
-    def get_upvoters_by_post(cls, post, args):
-        from app.models.user import User
-        from app.models.user import UserStats
+    def upsert(cls, user, post, direction):
+        '''
+        Set the direction of the vote of a user on a post, creating the
+        vote if needed, without reading it first.
 
-        page = args.get('page')
-        per_page = args.get('per_page')
-        time_filter = args.get('time_filter')
-        sort_by = args.get('sort_by')
-        sort_order = args.get('sort_order')
+        :param user: The user object.
+        :param post: The post object.
+        :param direction: The direction of the vote.
 
-        @filtered_users
-        def get_query():
-            query = (
-                db.select(User)
-                .join(cls, User.id == cls.user_id)
-                .join(UserStats, User.id == UserStats.user_id)
-                .where(cls.post_id == post.id, cls.direction == 1)
-            )
+        :return: The previous direction, None if the user had not voted.
+        '''
 
-            if time_filter != 'all':
-                now = datetime.now(timezone.utc)
-
-                if time_filter == 'day':
-                    start_date = now - timedelta(days=1)
-                elif time_filter == 'week':
-                    start_date = now - timedelta(weeks=1)
-                elif time_filter == 'month':
-                    start_date = now - timedelta(days=30)
-                elif time_filter == 'year':
-                    start_date = now - timedelta(days=365)
-                else:
-                    start_date = None
-
-                if start_date:
-                    query = query.filter(cls.created_at >= start_date)
-
-            if sort_by == 'followers':
-                order_column = UserStats.followers_count
-            elif sort_by == 'communities':
-                order_column = UserStats.communities_count
-            elif sort_by == 'posts':
-                order_column = UserStats.posts_count
-            elif sort_by == 'comments':
-                order_column = UserStats.comments_count
-            else:
-                order_column = cls.created_at
-
-            if sort_order == 'asc':
-                query = query.order_by(order_column.asc())
-            else:
-                query = query.order_by(order_column.desc())
-
-            return query
-        
-        query = get_query()
+        previous = cls.upsert_all(user, {post.id: direction})
 
-        upvoters = db.paginate(
-            query,
-            page=page,
-            per_page=per_page,
-            error_out=False
-        )
+        return previous.get(post.id, direction)
 
-        return upvoters
-    
     @classmethod
-    def get_downvoters_by_post(cls, post, args):
-        from app.models.user import User
-        from app.models.user import UserStats
+    def upsert_all(cls, user, directions):
+        '''
+        Set the direction of the votes of a user on several posts, with the
+        changes to the stats of the posts summed per post.
 
-        page = args.get('page')
-        per_page = args.get('per_page')
-        time_filter = args.get('time_filter')
-        sort_by = args.get('sort_by')
-        sort_order = args.get('sort_order')
+        :param user: The user object.
+        :param directions: Dictionary of the directions keyed by post ID.
 
-        @filtered_users
-        def get_query():
-            query = (
-                db.select(User)
-                .join(cls, User.id == cls.user_id)
-                .join(UserStats, User.id == UserStats.user_id)
-                .where(cls.post_id == post.id, cls.direction == -1)
-            )
+        :return: Dictionary of the previous direction of the changed votes.
+        '''
 
-            if time_filter != 'all':
-                now = datetime.now(timezone.utc)
-
-                if time_filter == 'day':
-                    start_date = now - timedelta(days=1)
-                elif time_filter == 'week':
-                    start_date = now - timedelta(weeks=1)
-                elif time_filter == 'month':
-                    start_date = now - timedelta(days=30)
-                elif time_filter == 'year':
-                    start_date = now - timedelta(days=365)
-                else:
-                    start_date = None
-
-                if start_date:
-                    query = query.filter(cls.created_at >= start_date)
-
-            if sort_by == 'followers':
-                order_column = UserStats.followers_count
-            elif sort_by == 'communities':
-                order_column = UserStats.communities_count
-            elif sort_by == 'posts':
-                order_column = UserStats.posts_count
-            elif sort_by == 'comments':
-                order_column = UserStats.comments_count
-            else:
-                order_column = cls.created_at
-
-            if sort_order == 'asc':
-                query = query.order_by(order_column.asc())
-            else:
-                query = query.order_by(order_column.desc())
-
-            return query
-        
-        query = get_query()
+        previous = upsert_votes(cls, 'post_id', user.id, directions)
 
-        downvoters = db.paginate(
-            query,
-            page=page,
-            per_page=per_page,
-            error_out=False
-        )
+        counters.add_all(db.session, PostStats.__table__, 'post_id', vote_deltas(directions, previous))
 
-        return downvoters
+        return previous
     
     @classmethod
-    def get_upvoted_posts_by_user(cls, user, args):
-        from app.models.post import Post
-        from app.models.post import PostStats
-
-        page = args.get('page')
-        per_page = args.get('per_page')
-        time_filter = args.get('time_filter')
-        sort_by = args.get('sort_by')
-        sort_order = args.get('sort_order')
-
-        @filtered_posts
-        def get_query():
-            query = (
-                db.select(Post)
-                .join(cls, Post.id == cls.post_id)
-                .join(PostStats, Post.id == PostStats.post_id)
-                .where(cls.user_id == user.id, cls.direction == 1)
-            )
+    def get_upvoters_by_post(cls, post, args):
+        from app.listings.post import post_upvoters
 
-            if time_filter != 'all':
-                now = datetime.now(timezone.utc)
-
-                if time_filter == 'day':
-                    start_date = now - timedelta(days=1)
-                elif time_filter == 'week':
-                    start_date = now - timedelta(weeks=1)
-                elif time_filter == 'month':
-                    start_date = now - timedelta(days=30)
-                elif time_filter == 'year':
-                    start_date = now - timedelta(days=365)
-                else:
-                    start_date = None
-
-                if start_date:
-                    query = query.filter(cls.created_at >= start_date)
-
-            if sort_by == 'upvotes':
-                order_column = PostStats.upvotes_count
-            elif sort_by == 'comments':
-                order_column = PostStats.comments_count
-            else:
-                order_column = Post.created_at
-
-            if sort_order == 'asc':
-                query = query.order_by(order_column.asc())
-            else:
-                query = query.order_by(order_column.desc())
-
-            return query
-        
-        query = get_query()
+        return post_upvoters.paginate(args, {'post_id': post.id})
+    
+    @classmethod
+    def get_downvoters_by_post(cls, post, args):
+        from app.listings.post import post_downvoters
 
-        paginated_upvoted_posts = db.paginate(
-            query,
-            page=page,
-            per_page=per_page,
-            error_out=False
-        )
+        return post_downvoters.paginate(args, {'post_id': post.id})
+    
+    @classmethod
+    def get_upvoted_posts_by_user(cls, user, args):
+        from app.listings.post import upvoted_posts
 
-        return paginated_upvoted_posts
+        return upvoted_posts.paginate(args, {'user_id': user.id})
     
     @classmethod
     def get_downvoted_posts_by_user(cls, user, args):
-        from app.models.post import Post
-        from app.models.post import PostStats
-
-        page = args.get('page')
-        per_page = args.get('per_page')
-        time_filter = args.get('time_filter')
-        sort_by = args.get('sort_by')
-        sort_order = args.get('sort_order')
-
-        @filtered_posts
-        def get_query():
-            query = (
-                db.select(Post)
-                .join(cls, Post.id == cls.post_id)
-                .join(PostStats, Post.id == PostStats.post_id)
-                .where(cls.user_id == user.id, cls.direction == -1)
-            )
-
-            if time_filter != 'all':
-                now = datetime.now(timezone.utc)
-
-                if time_filter == 'day':
-                    start_date = now - timedelta(days=1)
-                elif time_filter == 'week':
-                    start_date = now - timedelta(weeks=1)
-                elif time_filter == 'month':
-                    start_date = now - timedelta(days=30)
-                elif time_filter == 'year':
-                    start_date = now - timedelta(days=365)
-                else:
-                    start_date = None
-
-                if start_date:
-                    query = query.filter(Post.created_at >= start_date)
-
-            if sort_by == 'upvotes':
-                order_column = PostStats.upvotes_count
-            elif sort_by == 'comments':
-                order_column = PostStats.comments_count
-            else:
-                order_column = Post.created_at
-
-            if sort_order == 'asc':
-                query = query.order_by(order_column.asc())
-            else:
-                query = query.order_by(order_column.desc())
-
-            return query
-        
-        query = get_query()
-
-        paginated_downvoted_posts = db.paginate(
-            query,
-            page=page,
-            per_page=per_page,
-            error_out=False
-        )
+        from app.listings.post import downvoted_posts
 
-        return paginated_downvoted_posts
+        return downvoted_posts.paginate(args, {'user_id': user.id})
     
     def is_upvote(self):
         return self.direction == 1
@@ -407,6 +169,12 @@ class PostVote(db.Model):
 
 class PostStats(db.Model):
     __tablename__ = 'post_stats'
+    __table_args__ = (
+        db.Index('ix_post_stats_upvotes_count', 'upvotes_count'),
+        db.Index('ix_post_stats_comments_count', 'comments_count'),
+        db.Index('ix_post_stats_hot_score', 'hot_score'),
+        db.Index('ix_post_stats_best_score', 'best_score'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     post_id = db.Column(db.Integer, db.ForeignKey('posts.id'), unique=True)
@@ -414,16 +182,94 @@ class PostStats(db.Model):
     bookmarks_count = db.Column(db.Integer, default=0)
     upvotes_count = db.Column(db.Integer, default=0)
     downvotes_count = db.Column(db.Integer, default=0)
+    hot_score = db.Column(db.Float, default=0)
+    best_score = db.Column(db.Float, default=0)
 
     # Post
     post = db.relationship('Post', back_populates='stats', uselist=False)
 
     def save(self):
         db.session.add(self)
-        db.session.commit()
+        commit()
+
+    @staticmethod
+    def reconcile():
+        '''
+        Recompute the counters of every post from the rows they count,
+        correcting any drift left by lost or duplicated updates.
+        '''
+
+        post_stats_table = PostStats.__table__
+
+        def count(column, *conditions):
+            return db.select(db.func.count()).where(column == post_stats_table.c.post_id, *conditions).scalar_subquery()
+
+        update_query = post_stats_table.update().values(
+            comments_count=count(Comment.post_id),
+            bookmarks_count=count(PostBookmark.post_id),
+            upvotes_count=count(PostVote.post_id, PostVote.direction == 1),
+            downvotes_count=count(PostVote.post_id, PostVote.direction == -1)
+        )
+
+        db.session.execute(update_query)
+        commit()
+
+        PostStats.rescore()
+
+    @staticmethod
+    def rescore(batch_size=1000):
+        '''
+        Recompute the ranking scores of every post from its vote counters
+        and creation date, in batches of posts.
+
+        :param batch_size: Number of posts updated per transaction.
+        '''
+
+        post_stats_table = PostStats.__table__
+
+        update_query = post_stats_table.update().where(
+            post_stats_table.c.post_id == db.bindparam('row_key')
+        ).values(
+            hot_score=db.bindparam('new_hot_score'),
+            best_score=db.bindparam('new_best_score')
+        )
+
+        last_id = 0
+
+        while True:
+            query = (
+                db.select(Post.id, Post.created_at, PostStats.upvotes_count, PostStats.downvotes_count)
+                .join(PostStats, Post.id == PostStats.post_id)
+                .where(Post.id > last_id)
+                .order_by(Post.id)
+                .limit(batch_size)
+            )
+
+            rows = db.session.execute(query).all()
+
+            if not rows:
+                break
+
+            db.session.execute(update_query, [
+                {
+                    'row_key': row.id,
+                    'new_hot_score': hot_score(row.upvotes_count, row.downvotes_count, row.created_at),
+                    'new_best_score': best_score(row.upvotes_count, row.downvotes_count),
+                }
+                for row in rows
+            ])
+            commit()
+
+            last_id = rows[-1].id
+
 
 class Post(db.Model):
     __tablename__ = 'posts'
+    __table_args__ = (
+        db.Index('ix_posts_created_at', 'created_at'),
+        db.Index('ix_posts_community_id_created_at', 'community_id', 'created_at'),
+        db.Index('ix_posts_user_id_created_at', 'user_id', 'created_at'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(255), nullable=False)
@@ -462,16 +308,17 @@ class Post(db.Model):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         
-        self.stats = PostStats(post=self)
-        self.stats.save()
+        created_at = self.created_at or datetime.now(timezone.utc)
+
+        self.stats = PostStats(post=self, hot_score=hot_score(0, 0, created_at), best_score=0.0)
 
     def save(self):
         db.session.add(self)
-        db.session.commit()
+        commit()
 
     def delete(self):
         db.session.delete(self)
-        db.session.commit()
+        commit()
 
     @classmethod
     def get_by_id(cls, id):
@@ -481,172 +328,50 @@ class Post(db.Model):
             raise NotFoundError('Post not found.')
         
         return post
+
+    @classmethod
+    def get_owners_and_communities(cls, ids):
+        rows = db.session.execute(
+            db.select(cls.id, cls.user_id, cls.community_id).where(cls.id.in_(ids))
+        )
+
+        return {row.id: row for row in rows}
     
     @classmethod
     def get_all(cls, args):
-        page = args.get('page')
-        per_page = args.get('per_page')
-        time_filter = args.get('time_filter', 'all')
-        sort_by = args.get('sort_by', 'created_at')
-        sort_order = args.get('sort_order', 'desc')
-
-        @filtered_posts
-        def get_query():
-            query = db.select(cls).join(PostStats, cls.id == PostStats.post_id)
-
-            if time_filter != 'all':
-                now = datetime.now(timezone.utc)
-
-                if time_filter == 'day':
-                    start_date = now - timedelta(days=1)
-                elif time_filter == 'week':
-                    start_date = now - timedelta(weeks=1)
-                elif time_filter == 'month':
-                    start_date = now - timedelta(days=30)
-                elif time_filter == 'year':
-                    start_date = now - timedelta(days=365)
-                else:
-                    start_date = None
-
-                if start_date:
-                    query = query.filter(cls.created_at >= start_date)
-
-            if sort_by == 'upvotes':
-                order_column = PostStats.upvotes_count
-            elif sort_by == 'comments':
-                order_column = PostStats.comments_count
-            else:
-                order_column = cls.created_at
-
-            if sort_order == 'asc':
-                query = query.order_by(order_column.asc())
-            else:
-                query = query.order_by(order_column.desc())
-
-            return query
-
-        query = get_query()
-
-        paginated_posts = db.paginate(
-            query, 
-            page=page, 
-            per_page=per_page, 
-            error_out=False
-        )
+        from app.listings.post import all_posts
 
-        return paginated_posts
+        return all_posts.paginate(args)
 
     @classmethod
     def get_all_by_community(cls, community, args):
-        page = args.get('page')
-        per_page = args.get('per_page')
-        time_filter = args.get('time_filter')
-        sort_by = args.get('sort_by')
-        sort_order = args.get('sort_order') 
-
-        @filtered_posts
-        def get_query(community):
-            query = db.select(cls).join(PostStats, cls.id == PostStats.post_id).where(cls.community_id == community.id)
-
-            if time_filter != 'all':
-                now = datetime.now(timezone.utc)
-
-                if time_filter == 'day':
-                    start_date = now - timedelta(days=1)
-                elif time_filter == 'week':
-                    start_date = now - timedelta(weeks=1)
-                elif time_filter == 'month':
-                    start_date = now - timedelta(days=30)
-                elif time_filter == 'year':
-                    start_date = now - timedelta(days=365)
-                else:
-                    start_date = None
-
-                if start_date:
-                    query = query.filter(cls.created_at >= start_date)
-
-            if sort_by == 'upvotes':
-                order_column = PostStats.upvotes_count
-            elif sort_by == 'comments':
-                order_column = PostStats.comments_count
-            else:
-                order_column = cls.created_at
-
-            if sort_order == 'asc':
-                query = query.order_by(order_column.asc())
-            else:
-                query = query.order_by(order_column.desc())
-
-            return query
-
-        query = get_query(community=community)
-
-        paginated_posts = db.paginate(
-            query,
-            page=page,
-            per_page=per_page,
-            error_out=False
-        )
+        from app.listings.post import community_posts
 
-        return paginated_posts
+        return community_posts.paginate(
+            args,
+            {'community_id': community.id},
+            community=community,
+            total=lambda: community.stats.posts_count
+        )
     
     @classmethod
     def get_all_by_user(cls, user, args):
-        page = args.get('page')
-        per_page = args.get('per_page')
-        time_filter = args.get('time_filter')
-        sort_by = args.get('sort_by')
-        sort_order = args.get('sort_order')
-
-        @filtered_posts
-        def get_query(user):
-            query = db.select(cls).join(PostStats, cls.id == PostStats.post_id).where(cls.user_id == user.id)
-
-            if time_filter != 'all':
-                now = datetime.now(timezone.utc)
-
-                if time_filter == 'day':
-                    start_date = now - timedelta(days=1)
-                elif time_filter == 'week':
-                    start_date = now - timedelta(weeks=1)
-                elif time_filter == 'month':
-                    start_date = now - timedelta(days=30)
-                elif time_filter == 'year':
-                    start_date = now - timedelta(days=365)
-                else:
-                    start_date = None
-
-                if start_date:
-                    query = query.filter(cls.created_at >= start_date)
-
-            if sort_by == 'upvotes':
-                order_column = PostStats.upvotes_count
-            elif sort_by == 'comments':
-                order_column = PostStats.comments_count
-            else:
-                order_column = cls.created_at
-
-            if sort_order == 'asc':
-                query = query.order_by(order_column.asc())
-            else:
-                query = query.order_by(order_column.desc())
-
-            return query
-
-        query = get_query(user=user)
-
-        paginated_posts = db.paginate(
-            query,
-            page=page,
-            per_page=per_page,
-            error_out=False
-        )
+        from app.listings.post import user_posts
 
-        return paginated_posts
+        return user_posts.paginate(
+            args,
+            {'user_id': user.id},
+            total=lambda: user.stats.posts_count
+        )
     
     @property
     def bookmarked(self):
         if current_user:
+            flags = PostFlagsLoader.get(current_user, self)
+
+            if flags is not None:
+                return flags.bookmarked
+
             return self.is_bookmarked_by(current_user)
 
         return None
@@ -654,6 +379,11 @@ class Post(db.Model):
     @property
     def upvoted(self):
         if current_user:
+            flags = PostFlagsLoader.get(current_user, self)
+
+            if flags is not None:
+                return flags.upvoted
+
             return self.is_upvoted_by(current_user)
 
         return None
@@ -661,12 +391,28 @@ class Post(db.Model):
     @property
     def downvoted(self):
         if current_user:
+            flags = PostFlagsLoader.get(current_user, self)
+
+            if flags is not None:
+                return flags.downvoted
+
             return self.is_downvoted_by(current_user)
 
         return None
     
     def belongs_to(self, user):
         return self.owner.id == user.id
+
+    def etag_parts(self):
+        return (
+            version_of(self),
+            self.bookmarked, self.upvoted, self.downvoted,
+            self.owner.etag_parts(),
+            self.community.etag_parts()
+        )
+
+    def cache_tags(self):
+        return {('post', self.id)} | self.owner.cache_tags() | self.community.cache_tags()
     
     def is_bookmarked_by(self, user):
         bookmark = PostBookmark.get_by_user_and_post(user, self)
@@ -691,156 +437,88 @@ class Post(db.Model):
         return root_comments
 
 
+counters.derive(PostStats.__table__, score_values)
+
+
 @db.event.listens_for(Post, 'after_insert')
 def increment_posts_count_on_user_stats(mapper, connection, target):
     from app.models.user import UserStats
 
-    user_stats_table = UserStats.__table__
-
-    update_query = user_stats_table.update().where(
-        user_stats_table.c.user_id == target.user_id
-    ).values(
-        posts_count=user_stats_table.c.posts_count + 1
-    )
-
-    connection.execute(update_query)
+    counters.add(connection, UserStats.__table__, 'user_id', target.user_id, posts_count=1)
 
 
 @db.event.listens_for(Post, 'after_delete')
 def decrement_posts_count_on_user_stats(mapper, connection, target):
     from app.models.user import UserStats
 
-    user_stats_table = UserStats.__table__
-
-    update_query = user_stats_table.update().where(
-        user_stats_table.c.user_id == target.user_id
-    ).values(
-        posts_count=user_stats_table.c.posts_count - 1
-    )
-
-    connection.execute(update_query)
+    counters.add(connection, UserStats.__table__, 'user_id', target.user_id, posts_count=-1)
 
 
 @db.event.listens_for(Post, 'after_insert')
 def increment_posts_count_on_community_stats(mapper, connection, target):
     from app.models.community import CommunityStats
 
-    community_stats_table = CommunityStats.__table__
-
-    update_query = community_stats_table.update().where(
-        community_stats_table.c.community_id == target.community_id
-    ).values(
-        posts_count=community_stats_table.c.posts_count + 1
-    )
-
-    connection.execute(update_query)
+    counters.add(connection, CommunityStats.__table__, 'community_id', target.community_id, posts_count=1)
 
 
 @db.event.listens_for(Post, 'after_delete')
 def decrement_posts_count_on_community_stats(mapper, connection, target):
     from app.models.community import CommunityStats
 
-    community_stats_table = CommunityStats.__table__
-
-    update_query = community_stats_table.update().where(
-        community_stats_table.c.community_id == target.community_id
-    ).values(
-        posts_count=community_stats_table.c.posts_count - 1
-    )
-
-    connection.execute(update_query)
+    counters.add(connection, CommunityStats.__table__, 'community_id', target.community_id, posts_count=-1)
 
 
 @db.event.listens_for(PostVote, 'after_insert')
 def increment_votes_count_on_post_stats(mapper, connection, target):
     from app.models.post import PostStats
 
-    post_stats_table = PostStats.__table__
-
     if target.direction == 1:  # upvote
-        update_query = post_stats_table.update().where(
-            post_stats_table.c.post_id == target.post_id
-        ).values(
-            upvotes_count=post_stats_table.c.upvotes_count + 1
-        )
+        counters.add(connection, PostStats.__table__, 'post_id', target.post_id, upvotes_count=1)
     elif target.direction == -1:  # downvote
-        update_query = post_stats_table.update().where(
-            post_stats_table.c.post_id == target.post_id
-        ).values(
-            downvotes_count=post_stats_table.c.downvotes_count + 1
-        )
-
-    connection.execute(update_query)
+        counters.add(connection, PostStats.__table__, 'post_id', target.post_id, downvotes_count=1)
 
 
 @db.event.listens_for(PostVote, 'after_delete')
 def decrement_votes_count_on_post_stats(mapper, connection, target):
     from app.models.post import PostStats
 
-    post_stats_table = PostStats.__table__
-
     if target.direction == 1:  # upvote
-        update_query = post_stats_table.update().where(
-            post_stats_table.c.post_id == target.post_id
-        ).values(
-            upvotes_count=post_stats_table.c.upvotes_count - 1
-        )
+        counters.add(connection, PostStats.__table__, 'post_id', target.post_id, upvotes_count=-1)
     elif target.direction == -1:  # downvote
-        update_query = post_stats_table.update().where(
-            post_stats_table.c.post_id == target.post_id
-        ).values(
-            downvotes_count=post_stats_table.c.downvotes_count - 1
-        )
-
-    connection.execute(update_query)
+        counters.add(connection, PostStats.__table__, 'post_id', target.post_id, downvotes_count=-1)
 
 
-@db.event.listens_for(PostVote.direction, 'set')
-def update_votes_count_on_post_stats(target, value, oldvalue, initiator):
+@db.event.listens_for(PostVote, 'after_update')
+def update_votes_count_on_post_stats(mapper, connection, target):
     from app.models.post import PostStats
 
-    post_stats_table = PostStats.__table__
+    history = db.inspect(target).attrs.direction.history
 
-    if oldvalue is not None and oldvalue != value:  # the vote direction has changed
-        if value == 1:  # changed to upvote
-            update_query = post_stats_table.update().where(
-                post_stats_table.c.post_id == target.post_id
-            ).values(
-                upvotes_count=post_stats_table.c.upvotes_count + 1,
-                downvotes_count=post_stats_table.c.downvotes_count - 1
-            )
-        elif value == -1:  # changed to downvote
-            update_query = post_stats_table.update().where(
-                post_stats_table.c.post_id == target.post_id
-            ).values(
-                upvotes_count=post_stats_table.c.upvotes_count - 1,
-                downvotes_count=post_stats_table.c.downvotes_count + 1
-            )
-
-        db.session.execute(update_query)
+    if history.deleted and history.deleted[0] != target.direction:  # the vote direction has changed
+        if target.direction == 1:  # changed to upvote
+            counters.add(connection, PostStats.__table__, 'post_id', target.post_id, upvotes_count=1, downvotes_count=-1)
+        elif target.direction == -1:  # changed to downvote
+            counters.add(connection, PostStats.__table__, 'post_id', target.post_id, upvotes_count=-1, downvotes_count=1)
 
 
 @db.event.listens_for(PostBookmark, 'after_insert')
 def increment_bookmarks_count_on_post_stats(mapper, connection, target):
-    post_stats_table = PostStats.__table__
-
-    update_query = post_stats_table.update().where(
-        post_stats_table.c.post_id == target.post_id
-    ).values(
-        bookmarks_count=post_stats_table.c.bookmarks_count + 1
-    )
-
-    connection.execute(update_query)
+    counters.add(connection, PostStats.__table__, 'post_id', target.post_id, bookmarks_count=1)
 
 
 @db.event.listens_for(PostBookmark, 'after_delete')
 def decrement_bookmarks_count_on_post_stats(mapper, connection, target):
-    post_stats_table = PostStats.__table__
+    counters.add(connection, PostStats.__table__, 'post_id', target.post_id, bookmarks_count=-1)
+
+
+@db.event.listens_for(Post, 'after_update')
+@db.event.listens_for(Post, 'after_delete')
+def invalidate_post_responses(mapper, connection, target):
+    invalidate_responses(('post', target.id))
+
+
+def invalidate_post_stats_responses(post_id):
+    invalidate_responses(('post', post_id))
 
-    update_query = post_stats_table.update().where(
-        post_stats_table.c.post_id == target.post_id
-    ).values(
-        bookmarks_count=post_stats_table.c.bookmarks_count - 1
-    )
 
-    connection.execute(update_query)
+counters.watch(PostStats.__table__, invalidate_post_stats_responses)
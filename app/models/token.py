@@ -0,0 +1,78 @@
+# Datetime
+from datetime import datetime
+from datetime import timezone
+
+# Extensions
+from app.extensions.database import db
+
+# Utils
+from app.utils.transaction import commit
+from app.utils.votes import DIALECT_INSERTS
+
+
+class RevokedToken(db.Model):
+    '''
+    A logged out token, kept until it expires on its own. Backs the shared
+    revocation store so every worker sees the same logouts.
+    '''
+
+    __tablename__ = 'revoked_tokens'
+    __table_args__ = (
+        db.Index('ix_revoked_tokens_expires_at', 'expires_at'),
+    )
+
+    jti = db.Column(db.String(36), primary_key=True)
+    expires_at = db.Column(db.DateTime, nullable=False)
+
+    @staticmethod
+    def revoke(jti, expires_at):
+        '''
+        Revoke a token until it expires. The token is inserted with ON
+        CONFLICT DO NOTHING, so concurrent logouts with the same token do
+        not collide on its ID.
+
+        :param jti: The ID of the token.
+        :param expires_at: The expiration date of the token.
+        '''
+
+        dialect = db.session.get_bind(mapper=db.inspect(RevokedToken)).dialect.name
+
+        db.session.execute(
+            DIALECT_INSERTS[dialect](RevokedToken).values(jti=jti, expires_at=expires_at).on_conflict_do_nothing()
+        )
+        commit()
+
+    @staticmethod
+    def is_revoked(jti):
+        '''
+        Check if a token was revoked.
+
+        :param jti: The ID of the token.
+
+        :return: True if the token was revoked.
+        '''
+
+        revoked_token_query = db.select(RevokedToken.expires_at).where(RevokedToken.jti == jti)
+
+        expires_at = db.session.scalar(revoked_token_query)
+
+        return expires_at is not None and expires_at > datetime.now(timezone.utc).replace(tzinfo=None)
+
+    @staticmethod
+    def purge():
+        '''
+        Delete the revoked tokens that have expired.
+
+        :return: The number of deleted tokens.
+        '''
+
+        revoked_tokens_table = RevokedToken.__table__
+
+        result = db.session.execute(
+            revoked_tokens_table.delete().where(
+                revoked_tokens_table.c.expires_at <= datetime.now(timezone.utc).replace(tzinfo=None)
+            )
+        )
+        commit()
+
+        return result.rowcount
@@ -1,20 +1,24 @@
-# Datetime
-from datetime import datetime, timedelta, timezone
-
 # Flask-JWT-Extended
 from flask_jwt_extended import current_user
 
 
 # Extensions
 from app.extensions.database import db
+from app.extensions.counters import counters
+
+# Utils
+from app.utils.transaction import commit
+from app.utils.responses import version_of
+from app.utils.responses import invalidate_responses
 
 # Models
 from app.models.community import CommunitySubscriber
 from app.models.community import CommunityModerator
-from app.models.community import CommunityBan
 
-# Decorators
-from app.decorators.filters import filtered_users
+# Loaders
+from app.loaders.block import BlockGraphLoader
+from app.loaders.viewer import ViewerContextLoader
+from app.loaders.identity import IdentityLoader
 
 # Errors
 from app.errors.errors import NotFoundError
@@ -22,6 +26,10 @@ from app.errors.errors import NotFoundError
 
 class Follow(db.Model):
     __tablename__ = 'follows'
+    __table_args__ = (
+        db.Index('ix_follows_follower_id_created_at', 'follower_id', 'created_at'),
+        db.Index('ix_follows_followed_id_created_at', 'followed_id', 'created_at'),
+    )
 
     follower_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True, nullable=False)
     followed_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True, nullable=False)
@@ -33,11 +41,11 @@ class Follow(db.Model):
 
     def save(self):
         db.session.add(self)
-        db.session.commit()
+        commit()
 
     def delete(self):
         db.session.delete(self)
-        db.session.commit()
+        commit()
 
     @classmethod
     def get_by_follower_and_followed(cls, follower, followed):
@@ -47,132 +55,29 @@ class Follow(db.Model):
     
     @classmethod
     def get_followed(cls, user, args):
-        page = args.get('page')
-        per_page = args.get('per_page')
-        time_filter = args.get('time_filter')
-        sort_by = args.get('sort_by')
-        sort_order = args.get('sort_order')
-
-        @filtered_users
-        def get_query():
-            query = (
-                db.select(User)
-                .join(cls, cls.followed_id == User.id)
-                .join(UserStats, User.id == UserStats.user_id)
-                .where(cls.follower_id == user.id)
-            )
-
-            if time_filter != 'all':
-                now = datetime.now(timezone.utc)
-
-                if time_filter == 'day':
-                    start_date = now - timedelta(days=1)
-                elif time_filter == 'week':
-                    start_date = now - timedelta(weeks=1)
-                elif time_filter == 'month':
-                    start_date = now - timedelta(days=30)
-                elif time_filter == 'year':
-                    start_date = now - timedelta(days=365)
-                else:
-                    start_date = None
-
-                if start_date:
-                    query = query.filter(cls.created_at >= start_date)
-            
-            if sort_by == 'followers':
-                order_column = UserStats.followers_count
-            elif sort_by == 'communities':
-                order_column = UserStats.communities_count
-            elif sort_by == 'posts':
-                order_column = UserStats.posts_count
-            elif sort_by == 'comments':
-                order_column = UserStats.comments_count
-            else:
-                order_column = cls.created_at
-
-            if sort_order == 'asc':
-                query = query.order_by(order_column.asc())
-            else:
-                query = query.order_by(order_column.desc())
-
-            return query
-        
-        query = get_query()
+        from app.listings.user import followed_users
 
-        paginated_followed = db.paginate(
-            query, 
-            page=page, 
-            per_page=per_page, 
-            error_out=False
+        return followed_users.paginate(
+            args,
+            {'user_id': user.id},
+            total=lambda: user.stats.following_count
         )
-
-        return paginated_followed
     
     @classmethod
     def get_followers(cls, user, args):
-        page = args.get('page')
-        per_page = args.get('per_page')
-        time_filter = args.get('time_filter')
-        sort_by = args.get('sort_by')
-        sort_order = args.get('sort_order')
-
-        @filtered_users
-        def get_query():
-            query = (
-                db.select(User)
-                .join(cls, cls.follower_id == User.id)
-                .join(UserStats, User.id == UserStats.user_id)
-                .where(cls.followed_id == user.id)
-            )
-
-            if time_filter != 'all':
-                now = datetime.now(timezone.utc)
-
-                if time_filter == 'day':
-                    start_date = now - timedelta(days=1)
-                elif time_filter == 'week':
-                    start_date = now - timedelta(weeks=1)
-                elif time_filter == 'month':
-                    start_date = now - timedelta(days=30)
-                elif time_filter == 'year':
-                    start_date = now - timedelta(days=365)
-                else:
-                    start_date = None
-
-                if start_date:
-                    query = query.filter(cls.created_at >= start_date)
-            
-            if sort_by == 'followers':
-                order_column = UserStats.followers_count
-            elif sort_by == 'communities':
-                order_column = UserStats.communities_count
-            elif sort_by == 'posts':
-                order_column = UserStats.posts_count
-            elif sort_by == 'comments':
-                order_column = UserStats.comments_count
-            else:
-                order_column = cls.created_at
-
-            if sort_order == 'asc':
-                query = query.order_by(order_column.asc())
-            else:
-                query = query.order_by(order_column.desc())
-
-            return query
-        
-        query = get_query()
+        from app.listings.user import followers
 
-        paginated_followers = db.paginate(
-            query, 
-            page=page, 
-            per_page=per_page, 
-            error_out=False
+        return followers.paginate(
+            args,
+            {'user_id': user.id},
+            total=lambda: user.stats.followers_count
         )
 
-        return paginated_followers
-
 class Block(db.Model):
     __tablename__ = 'blocks'
+    __table_args__ = (
+        db.Index('ix_blocks_blocked_id_blocker_id', 'blocked_id', 'blocker_id'),
+    )
 
     blocker_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True, nullable=False)
     blocked_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True, nullable=False)
@@ -184,11 +89,11 @@ class Block(db.Model):
 
     def save(self):
         db.session.add(self)
-        db.session.commit()
+        commit()
 
     def delete(self):
         db.session.delete(self)
-        db.session.commit()
+        commit()
 
     @classmethod
     def get_by_blocker_and_blocked(cls, blocker, blocked):
@@ -210,73 +115,31 @@ class Block(db.Model):
     
     @classmethod
     def get_blocked_with_args(cls, user, args):
-        page = args.get('page')
-        per_page = args.get('per_page')
-        time_filter = args.get('time_filter')
-        sort_by = args.get('sort_by')
-        sort_order = args.get('sort_order')
-
-        query = (
-            db.select(User)
-            .join(cls, cls.blocked_id == User.id)
-            .where(cls.blocker_id == user.id)
-        )
-
-        if time_filter != 'all':
-            now = datetime.now(timezone.utc)
-
-            if time_filter == 'day':
-                start_date = now - timedelta(days=1)
-            elif time_filter == 'week':
-                start_date = now - timedelta(weeks=1)
-            elif time_filter == 'month':
-                start_date = now - timedelta(days=30)
-            elif time_filter == 'year':
-                start_date = now - timedelta(days=365)
-            else:
-                start_date = None
-
-            if start_date:
-                query = query.filter(cls.created_at >= start_date)
-
-        if sort_by == 'followers':
-            order_column = UserStats.followers_count
-        elif sort_by == 'communities':
-            order_column = UserStats.communities_count
-        elif sort_by == 'posts':
-            order_column = UserStats.posts_count
-        elif sort_by == 'comments':
-            order_column = UserStats.comments_count
-        else:
-            order_column = cls.created_at
-
-        if sort_order == 'asc':
-            query = query.order_by(order_column.asc())
-        else:
-            query = query.order_by(order_column.desc())
-
-        paginated_blocked = db.paginate(
-            query, 
-            page=page, 
-            per_page=per_page, 
-            error_out=False
-        )
+        from app.listings.user import blocked_users
 
-        return paginated_blocked
+        return blocked_users.paginate(args, {'user_id': user.id})
     
     @classmethod
     def get_blockers(cls, user):
-        query = db.select(cls).where(cls.blocked_id == user.id)
+        query = (
+            db.select(User)
+            .join(cls, cls.blocker_id == User.id)
+            .where(cls.blocked_id == user.id)
+        )
         
         blockers = db.session.scalars(query).all()
 
-        blockers = [block.blocker for block in blockers]
-
         return blockers
 
 
 class UserStats(db.Model):
     __tablename__ = 'user_stats'
+    __table_args__ = (
+        db.Index('ix_user_stats_followers_count', 'followers_count'),
+        db.Index('ix_user_stats_communities_count', 'communities_count'),
+        db.Index('ix_user_stats_posts_count', 'posts_count'),
+        db.Index('ix_user_stats_comments_count', 'comments_count'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), unique=True)
@@ -293,11 +156,43 @@ class UserStats(db.Model):
 
     def save(self):
         db.session.add(self)
-        db.session.commit()
+        commit()
+
+    @staticmethod
+    def reconcile():
+        '''
+        Recompute the counters of every user from the rows they count,
+        correcting any drift left by lost or duplicated updates.
+        '''
+
+        from app.models.community import Community
+        from app.models.post import Post
+        from app.models.comment import Comment
+
+        user_stats_table = UserStats.__table__
+
+        def count(column, *conditions):
+            return db.select(db.func.count()).where(column == user_stats_table.c.user_id, *conditions).scalar_subquery()
+
+        update_query = user_stats_table.update().values(
+            followers_count=count(Follow.followed_id),
+            following_count=count(Follow.follower_id),
+            communities_count=count(Community.user_id),
+            posts_count=count(Post.user_id),
+            comments_count=count(Comment.user_id),
+            subscriptions_count=count(CommunitySubscriber.user_id),
+            moderations_count=count(CommunityModerator.user_id)
+        )
+
+        db.session.execute(update_query)
+        commit()
 
 
 class User(db.Model):
     __tablename__ = 'users'
+    __table_args__ = (
+        db.Index('ix_users_created_at', 'created_at'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(255), nullable=False, unique=True)
@@ -336,11 +231,10 @@ class User(db.Model):
         super().__init__(*args, **kwargs)
 
         self.stats = UserStats(user=self)
-        self.stats.save()
 
     def save(self):
         db.session.add(self)
-        db.session.commit()
+        commit()
 
     @staticmethod
     def is_username_available(username):
@@ -380,61 +274,9 @@ class User(db.Model):
     
     @classmethod
     def get_all(cls, args):
-        page = args.get('page')
-        per_page = args.get('per_page')
-        time_filter = args.get('time_filter')
-        sort_by = args.get('sort_by')
-        sort_order = args.get('sort_order')
-
-        @filtered_users
-        def get_query():
-            query = db.select(cls).join(UserStats, cls.id == UserStats.user_id)
-        
-            if time_filter != 'all':
-                now = datetime.now(timezone.utc)
-
-                if time_filter == 'day':
-                    start_date = now - timedelta(days=1)
-                elif time_filter == 'week':
-                    start_date = now - timedelta(weeks=1)
-                elif time_filter == 'month':
-                    start_date = now - timedelta(days=30)
-                elif time_filter == 'year':
-                    start_date = now - timedelta(days=365)
-                else:
-                    start_date = None
-
-                if start_date:
-                    query = query.filter(cls.created_at >= start_date)
-            
-            if sort_by == 'followers':
-                order_column = UserStats.followers_count
-            elif sort_by == 'communities':
-                order_column = UserStats.communities_count
-            elif sort_by == 'posts':
-                order_column = UserStats.posts_count
-            elif sort_by == 'comments':
-                order_column = UserStats.comments_count
-            else:
-                order_column = cls.created_at
-
-            if sort_order == 'asc':
-                query = query.order_by(order_column.asc())
-            else:
-                query = query.order_by(order_column.desc())
-
-            return query
-        
-        query = get_query()
-
-        paginated_users = db.paginate(
-            query, 
-            page=page, 
-            per_page=per_page, 
-            error_out=False
-        )
+        from app.listings.user import all_users
 
-        return paginated_users
+        return all_users.paginate(args)
     
     @property
     def following(self):
@@ -475,75 +317,68 @@ class User(db.Model):
         return follow is not None
     
     def is_blocking(self, other):
-        block = Block.get_by_blocker_and_blocked(blocker=self, blocked=other)
-
-        return block is not None
+        return ViewerContextLoader.load(self).is_blocking(other.id)
     
     def is_blocked_by(self, other):
-        block = Block.get_by_blocker_and_blocked(blocker=other, blocked=self)
-
-        return block is not None
+        return ViewerContextLoader.load(self).is_blocked_by(other.id)
 
     def is_owner_of(self, community):
         return self is community.owner
 
     def is_subscribed_to(self, community):
-        subscription = CommunitySubscriber.get_by_user_and_community(self, community)
-
-        return subscription is not None
+        return ViewerContextLoader.load(self).is_subscribed_to(community.id)
 
     def is_moderator_of(self, community):
-        moderation = CommunityModerator.get_by_user_and_community(self, community)
-
-        return moderation is not None
+        return ViewerContextLoader.load(self).is_moderator_of(community.id)
         
     def is_banned_from(self, community):
-        ban = CommunityBan.get_by_user_and_community(self, community)
+        return ViewerContextLoader.load(self).is_banned_from(community.id)
+
+    def etag_parts(self):
+        return (version_of(self, exclude=('password',)), self.following, self.follower)
 
-        return ban is not None
+    def cache_tags(self):
+        return {('user', self.id)}
 
 
 @db.event.listens_for(Follow, 'after_insert')
 def increment_following_count_on_user_stats(mapper, connection, target):
     from app.models.user import UserStats
 
-    user_stats_table = UserStats.__table__
+    counters.add(connection, UserStats.__table__, 'user_id', target.follower_id, following_count=1)
+    counters.add(connection, UserStats.__table__, 'user_id', target.followed_id, followers_count=1)
 
-    update_query = user_stats_table.update().where(
-        user_stats_table.c.user_id == target.follower_id
-    ).values(
-        following_count=user_stats_table.c.following_count + 1
-    )
 
-    connection.execute(update_query)
+@db.event.listens_for(Follow, 'after_delete')
+def decrement_following_count_on_user_stats(mapper, connection, target):
+    from app.models.user import UserStats
 
-    update_query = user_stats_table.update().where(
-        user_stats_table.c.user_id == target.followed_id
-    ).values(
-        followers_count=user_stats_table.c.followers_count + 1
-    )
+    counters.add(connection, UserStats.__table__, 'user_id', target.follower_id, following_count=-1)
+    counters.add(connection, UserStats.__table__, 'user_id', target.followed_id, followers_count=-1)
 
-    connection.execute(update_query)
 
+@db.event.listens_for(Block, 'after_insert')
+@db.event.listens_for(Block, 'after_delete')
+def invalidate_block_graphs(mapper, connection, target):
+    BlockGraphLoader.invalidate(target.blocker_id, target.blocked_id)
+    ViewerContextLoader.invalidate(target.blocker_id, target.blocked_id)
 
-@db.event.listens_for(Follow, 'after_delete')
-def decrement_following_count_on_user_stats(mapper, connection, target):
-    from app.models.user import UserStats
 
-    user_stats_table = UserStats.__table__
+@db.event.listens_for(User, 'after_update')
+@db.event.listens_for(User, 'after_delete')
+def invalidate_user_identity(mapper, connection, target):
+    IdentityLoader.invalidate(target.id)
 
-    update_query = user_stats_table.update().where(
-        user_stats_table.c.user_id == target.follower_id
-    ).values(
-        following_count=user_stats_table.c.following_count - 1
-    )
 
-    connection.execute(update_query)
+@db.event.listens_for(User, 'after_update')
+@db.event.listens_for(User, 'after_delete')
+def invalidate_user_responses(mapper, connection, target):
+    invalidate_responses(('user', target.id))
+
+
+def invalidate_user_stats_responses(user_id):
+    invalidate_responses(('user', user_id))
 
-    update_query = user_stats_table.update().where(
-        user_stats_table.c.user_id == target.followed_id
-    ).values(
-        followers_count=user_stats_table.c.followers_count - 1
-    )
 
-    connection.execute(update_query)
\ No newline at end of file
+counters.watch(UserStats.__table__, IdentityLoader.invalidate)
+counters.watch(UserStats.__table__, invalidate_user_stats_responses)
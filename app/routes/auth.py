@@ -20,6 +20,8 @@ from flask_jwt_extended import unset_jwt_cookies
 
 # Extensions
 from app.extensions.database import db
+from app.extensions.revocation import revocations
+from app.extensions.passwords import passwords
 
 # Schemas
 from app.schemas.user import user_schema
@@ -32,15 +34,12 @@ from app.models.user import User
 from app.managers.user import UserManager
 
 # Utils
-from app.utils.password import check_password
 from app.utils.email import send_email
 from app.utils.token import generate_verification_token
 from app.utils.token import confirm_verification_token
 
 auth_routes = Blueprint('auth_routes', __name__)
 
-black_list = set()
-
 
 @auth_routes.post('/signup')
 def sign_up():
@@ -77,8 +76,13 @@ def log_in():
 
     user = User.get_by_username(username)
     
-    if not check_password(password, user.password):
+    if not passwords.verify(password, user.password):
         return {'message': 'Incorrect password.'}, HTTPStatus.UNAUTHORIZED
+
+    # Move the password to the current hashing cost
+    if passwords.needs_rehash(user.password):
+        user.password = passwords.hash(password)
+        user.save()
     
     access_token = create_access_token(identity=str(user.id))
     refresh_token = create_refresh_token(identity=str(user.id))
@@ -93,8 +97,7 @@ def log_in():
 @auth_routes.post('/logout')
 @jwt_required()
 def log_out():
-    jti = get_jwt()["jti"]
-    black_list.add(jti)
+    revocations.revoke(get_jwt())
 
     response = make_response({'message': 'Successfully logged out.'}, HTTPStatus.OK)
 
@@ -106,9 +109,13 @@ def log_out():
 @auth_routes.post('/refresh')
 @jwt_required(refresh=True, locations=['cookies'])
 def get_new_access_token():
-    current_user = get_jwt_identity()
+    # The user may have been deleted since the refresh token was issued
+    user = db.session.get(User, int(get_jwt_identity()))
+
+    if user is None:
+        return {'message': 'User not found.'}, HTTPStatus.UNAUTHORIZED
 
-    token = create_access_token(identity=str(current_user))
+    token = create_access_token(identity=str(user.id))
 
     return {'access_token': token}, HTTPStatus.OK
 
@@ -14,11 +14,12 @@ from webargs.flaskparser import use_args
 
 # Schemas
 from app.schemas.user import user_pagination_request_schema
-from app.schemas.user import user_pagination_response_schema
+from app.schemas.user import user_pagination_response_serializer
 from app.schemas.comment import comment_schema
 from app.schemas.comment import comment_update_schema
 from app.schemas.comment import comment_pagination_request_schema
-from app.schemas.comment import comment_pagination_response_schema
+from app.schemas.comment import comment_pagination_response_serializer
+from app.schemas.vote import vote_batch_schema
 
 # Models
 from app.models.post import Post
@@ -72,7 +73,7 @@ def read_comment(id):
 def read_comments(args):
     paginated_comments = CommentManager.read_all(args)
 
-    return comment_pagination_response_schema.dump(paginated_comments), HTTPStatus.OK
+    return comment_pagination_response_serializer.select(args.get('fieldset')).jsonify(paginated_comments), HTTPStatus.OK
 
 
 @comment_routes.patch('/<string:id>')
@@ -139,6 +140,18 @@ def downvote_comment(id):
     return {}, HTTPStatus.NO_CONTENT
 
 
+@comment_routes.post('/votes:batch')
+@jwt_required()
+def vote_comments():
+    json_data = request.get_json()
+
+    data = vote_batch_schema.load(json_data)
+
+    votes = CommentVoteManager.create_all(current_user, data['votes'])
+
+    return vote_batch_schema.dump({'votes': votes}), HTTPStatus.OK
+
+
 @comment_routes.post('/<int:id>/vote/cancel')
 @jwt_required()
 def cancel_vote_on_comment(id):
@@ -157,7 +170,7 @@ def read_comment_upvoters(args, id):
     
     paginated_upvoters = CommentVoteManager.read_upvoters_by_comment(comment, args)
 
-    return user_pagination_response_schema.dump(paginated_upvoters), HTTPStatus.OK
+    return user_pagination_response_serializer.select(args.get('fieldset')).jsonify(paginated_upvoters), HTTPStatus.OK
 
 
 @comment_routes.get('/<int:id>/downvoters')
@@ -168,4 +181,4 @@ def read_comment_downvoters(args, id):
 
     paginated_downvoters = CommentVoteManager.read_downvoters_by_comment(comment, args)
 
-    return user_pagination_response_schema.dump(paginated_downvoters), HTTPStatus.OK
+    return user_pagination_response_serializer.select(args.get('fieldset')).jsonify(paginated_downvoters), HTTPStatus.OK
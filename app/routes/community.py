@@ -26,12 +26,20 @@ from app.managers.post import PostManager
 
 # Schemas
 from app.schemas.community import community_pagination_request_schema
-from app.schemas.community import community_pagination_response_schema
+from app.schemas.community import community_pagination_response_serializer
 from app.schemas.user import user_pagination_request_schema
-from app.schemas.user import user_pagination_response_schema
+from app.schemas.user import user_pagination_response_serializer
 from app.schemas.community import community_schema
 from app.schemas.post import post_pagination_request_schema
-from app.schemas.post import post_pagination_response_schema
+from app.schemas.post import post_pagination_response_serializer
+
+# Loaders
+from app.loaders.post import PostFlagsLoader
+
+# Utils
+from app.utils.responses import conditional_response
+from app.utils.responses import cached_for_anonymous
+from app.utils.responses import pagination_etag_parts
 
 community_routes = Blueprint('community_routes', __name__)
 
@@ -50,12 +58,18 @@ def create_community():
 
 @community_routes.get('/<string:name>')
 @jwt_required(optional=True)
+@cached_for_anonymous
 def read_community(name):
     community = Community.get_by_name(name)
     
     CommunityManager.read(name)
 
-    return community_schema.dump(community), HTTPStatus.OK
+    return conditional_response(
+        lambda: community_schema.dump(community),
+        community.etag_parts(),
+        tags=community.cache_tags(),
+        last_modified=community.updated_at
+    )
 
 
 @community_routes.get('/')
@@ -64,7 +78,7 @@ def read_community(name):
 def read_communities(args):
     paginated_communities = CommunityManager.read_all(args)
 
-    return community_pagination_response_schema.dump(paginated_communities), HTTPStatus.OK
+    return community_pagination_response_serializer.select(args.get('fieldset')).jsonify(paginated_communities), HTTPStatus.OK
 
 
 @community_routes.patch('/<string:name>')
@@ -179,7 +193,7 @@ def read_subscribers(args, name):
 
     paginated_subscribers = SubscriptionManager.read_subscribers_by_community(community, args)
 
-    return user_pagination_response_schema.dump(paginated_subscribers), HTTPStatus.OK
+    return user_pagination_response_serializer.select(args.get('fieldset')).jsonify(paginated_subscribers), HTTPStatus.OK
 
 
 @community_routes.get('/<string:name>/moderators')
@@ -190,7 +204,7 @@ def read_moderators(args, name):
 
     paginated_moderators = ModerationManager.read_moderators_by_community(community, args)
 
-    return user_pagination_response_schema.dump(paginated_moderators), HTTPStatus.OK
+    return user_pagination_response_serializer.select(args.get('fieldset')).jsonify(paginated_moderators), HTTPStatus.OK
 
 
 @community_routes.get('/<string:name>/banned')
@@ -201,15 +215,27 @@ def read_banned(args, name):
 
     paginated_banned = BanManager.read_bans_by_community(community, args)
 
-    return user_pagination_response_schema.dump(paginated_banned), HTTPStatus.OK
+    return user_pagination_response_serializer.select(args.get('fieldset')).jsonify(paginated_banned), HTTPStatus.OK
 
 
 @community_routes.get('/<string:name>/posts')
 @use_args(post_pagination_request_schema, location='query')
 @jwt_required(optional=True)
+@cached_for_anonymous
 def read_community_posts(args, name):
     community = Community.get_by_name(name)
 
     paginated_posts = PostManager.read_all_by_community(community, args)
+
+    if current_user:
+        PostFlagsLoader.load(current_user, paginated_posts.items)
+
+    tags = community.cache_tags().union(*(post.cache_tags() for post in paginated_posts.items))
+
+    fieldset = args.get('fieldset')
     
-    return post_pagination_response_schema.dump(paginated_posts), HTTPStatus.OK
\ No newline at end of file
+    return conditional_response(
+        lambda: post_pagination_response_serializer.select(fieldset).jsonify(paginated_posts),
+        (pagination_etag_parts(paginated_posts), fieldset.paths if fieldset else None),
+        tags=tags
+    )
\ No newline at end of file
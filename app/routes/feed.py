@@ -0,0 +1,30 @@
+# HTTP
+from http import HTTPStatus
+
+# Flask
+from flask import Blueprint
+
+# Flask-JWT-Extended
+from flask_jwt_extended import jwt_required
+from flask_jwt_extended import current_user
+
+# Webargs
+from webargs.flaskparser import use_args
+
+# Schemas
+from app.schemas.post import post_pagination_request_schema
+from app.schemas.post import post_pagination_response_serializer
+
+# Managers
+from app.managers.post import PostManager
+
+feed_routes = Blueprint('feed_routes', __name__)
+
+
+@feed_routes.get('/')
+@use_args(post_pagination_request_schema, location='query')
+@jwt_required()
+def read_feed(args):
+    paginated_posts = PostManager.read_feed(current_user, args)
+
+    return post_pagination_response_serializer.select(args.get('fieldset')).jsonify(paginated_posts), HTTPStatus.OK
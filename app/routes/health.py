@@ -0,0 +1,50 @@
+# HTTP
+from http import HTTPStatus
+
+# OS
+import os
+
+# HMAC
+import hmac
+
+# Flask
+from flask import Blueprint
+from flask import current_app
+from flask import request
+
+# Extensions
+from app.extensions.pool import pools
+
+health_routes = Blueprint('health_routes', __name__)
+
+
+def is_authorized():
+    '''
+    Whether the request carries the HEALTH_TOKEN of the config as a bearer
+    token.
+    '''
+
+    token = current_app.config.get('HEALTH_TOKEN')
+
+    authorization = request.headers.get('Authorization', '')
+
+    return bool(token) and hmac.compare_digest(authorization.encode(), f'Bearer {token}'.encode())
+
+
+@health_routes.get('/pools')
+def read_pools():
+    '''
+    Metrics of the connection pools of the process answering the request.
+    Each worker has its own pools, so a scraper must read every worker,
+    e.g. by the pid returned, and add them up.
+    '''
+
+    if not current_app.config.get('HEALTH_TOKEN'):
+        return {'message': 'Not found.'}, HTTPStatus.NOT_FOUND
+
+    if not is_authorized():
+        return {'message': 'Invalid health token.'}, HTTPStatus.UNAUTHORIZED
+
+    stats = {key or 'default': values for key, values in pools.stats().items()}
+
+    return {'pid': os.getpid(), 'pools': stats}, HTTPStatus.OK
@@ -14,13 +14,14 @@ from webargs.flaskparser import use_args
 
 # Schemas
 from app.schemas.user import user_pagination_request_schema
-from app.schemas.user import user_pagination_response_schema
+from app.schemas.user import user_pagination_response_serializer
 from app.schemas.post import post_pagination_request_schema
-from app.schemas.post import post_pagination_response_schema
+from app.schemas.post import post_pagination_response_serializer
 from app.schemas.post import post_schema
 from app.schemas.post import posts_schema
 from app.schemas.comment import comment_pagination_request_schema
-from app.schemas.comment import comment_pagination_response_schema
+from app.schemas.comment import comment_pagination_response_serializer
+from app.schemas.vote import vote_batch_schema
 
 # Models
 from app.models.community import Community
@@ -32,6 +33,10 @@ from app.managers.post import PostBookmarkManager
 from app.managers.post import PostVoteManager
 from app.managers.comment import CommentManager
 
+# Utils
+from app.utils.responses import conditional_response
+from app.utils.responses import cached_for_anonymous
+
 post_routes = Blueprint('post_routes', __name__)
 
 
@@ -52,12 +57,18 @@ def create_post():
 
 @post_routes.get('/<int:id>')
 @jwt_required(optional=True)
+@cached_for_anonymous
 def read_post(id):
     post = Post.get_by_id(id)
 
     PostManager.read(current_user, post)
 
-    return post_schema.dump(post), HTTPStatus.OK
+    return conditional_response(
+        lambda: post_schema.dump(post),
+        post.etag_parts(),
+        tags=post.cache_tags(),
+        last_modified=post.updated_at
+    )
 
 
 @post_routes.get('/')
@@ -66,7 +77,7 @@ def read_post(id):
 def read_users(args):
     paginated_posts = PostManager.read_all(args)
 
-    return post_pagination_response_schema.dump(paginated_posts), HTTPStatus.OK
+    return post_pagination_response_serializer.select(args.get('fieldset')).jsonify(paginated_posts), HTTPStatus.OK
 
 @post_routes.patch('/<int:id>')
 @jwt_required()
@@ -132,6 +143,18 @@ def downvote(id):
     return {}, HTTPStatus.NO_CONTENT
 
 
+@post_routes.post('/votes:batch')
+@jwt_required()
+def vote_posts():
+    json_data = request.get_json()
+
+    data = vote_batch_schema.load(json_data)
+
+    votes = PostVoteManager.create_all(current_user, data['votes'])
+
+    return vote_batch_schema.dump({'votes': votes}), HTTPStatus.OK
+
+
 @post_routes.post('/<int:id>/vote/cancel')
 @jwt_required()
 def cancel(id):
@@ -150,7 +173,7 @@ def read_upvoters(args, id):
     
     paginated_upvoters = PostVoteManager.read_upvoters_by_post(post, args)
 
-    return user_pagination_response_schema.dump(paginated_upvoters), HTTPStatus.OK
+    return user_pagination_response_serializer.select(args.get('fieldset')).jsonify(paginated_upvoters), HTTPStatus.OK
 
 
 @post_routes.get('/<int:id>/downvoters')
@@ -161,7 +184,7 @@ def read_downvoters(args, id):
     
     paginated_downvoters = PostVoteManager.read_downvoters_by_post(post, args)
 
-    return user_pagination_response_schema.dump(paginated_downvoters), HTTPStatus.OK
+    return user_pagination_response_serializer.select(args.get('fieldset')).jsonify(paginated_downvoters), HTTPStatus.OK
 
 
 @post_routes.get('/<int:id>/comments')
@@ -172,4 +195,4 @@ def read_post_comments(args, id):
 
     paginated_comments = CommentManager.read_all_root_comments_by_post(post, args)
     
-    return comment_pagination_response_schema.dump(paginated_comments), HTTPStatus.OK
\ No newline at end of file
+    return comment_pagination_response_serializer.select(args.get('fieldset')).jsonify(paginated_comments), HTTPStatus.OK
\ No newline at end of file
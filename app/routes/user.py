@@ -30,25 +30,35 @@ from app.managers.comment import CommentVoteManager
 from app.schemas.user import user_schema
 from app.schemas.user import me_schema
 from app.schemas.user import user_pagination_request_schema
-from app.schemas.user import user_pagination_response_schema
+from app.schemas.user import user_pagination_response_serializer
 from app.schemas.community import community_pagination_request_schema
-from app.schemas.community import community_pagination_response_schema
+from app.schemas.community import community_pagination_response_serializer
 from app.schemas.post import post_pagination_request_schema
-from app.schemas.post import post_pagination_response_schema
+from app.schemas.post import post_pagination_response_serializer
 from app.schemas.comment import comment_pagination_request_schema
-from app.schemas.comment import comment_pagination_response_schema
+from app.schemas.comment import comment_pagination_response_serializer
+
+# Utils
+from app.utils.responses import conditional_response
+from app.utils.responses import cached_for_anonymous
 
 user_routes = Blueprint('user_routes', __name__)
 
 
 @user_routes.get('/<string:username>')
 @jwt_required(optional=True)
+@cached_for_anonymous
 def read_user(username):
     user = User.get_by_username(username=username)
 
     UserManager.read(current_user, user)
 
-    return user_schema.dump(user), HTTPStatus.OK
+    return conditional_response(
+        lambda: user_schema.dump(user),
+        user.etag_parts(),
+        tags=user.cache_tags(),
+        last_modified=user.updated_at
+    )
 
 
 @user_routes.get('/')
@@ -57,7 +67,7 @@ def read_user(username):
 def read_users(args):
     paginated_users = UserManager.read_all(current_user, args)
 
-    return user_pagination_response_schema.dump(paginated_users), HTTPStatus.OK
+    return user_pagination_response_serializer.select(args.get('fieldset')).jsonify(paginated_users), HTTPStatus.OK
 
 
 @user_routes.post('/<string:username>/follow')
@@ -108,7 +118,7 @@ def read_following(args, username):
 
     paginated_following = FollowManager.read_followed(user, args)
     
-    return user_pagination_response_schema.dump(paginated_following), HTTPStatus.OK
+    return user_pagination_response_serializer.select(args.get('fieldset')).jsonify(paginated_following), HTTPStatus.OK
 
 
 @user_routes.get('/<string:username>/followers')
@@ -119,7 +129,7 @@ def read_followers(args, username):
 
     paginated_followers = FollowManager.read_followers(user, args)
     
-    return user_pagination_response_schema.dump(paginated_followers), HTTPStatus.OK
+    return user_pagination_response_serializer.select(args.get('fieldset')).jsonify(paginated_followers), HTTPStatus.OK
 
 
 @user_routes.get('/blocked')
@@ -128,7 +138,7 @@ def read_followers(args, username):
 def read_blocked(args):
     paginated_blocked = BlockManager.read_blocked(current_user, args)
     
-    return user_pagination_response_schema.dump(paginated_blocked), HTTPStatus.OK
+    return user_pagination_response_serializer.select(args.get('fieldset')).jsonify(paginated_blocked), HTTPStatus.OK
 
 
 @user_routes.get('/<string:username>/subscriptions')
@@ -139,7 +149,7 @@ def read_subscriptions(args, username):
 
     paginated_subscriptions = SubscriptionManager.read_subscriptions_by_user(user, args)
 
-    return community_pagination_response_schema.dump(paginated_subscriptions),   HTTPStatus.OK
+    return community_pagination_response_serializer.select(args.get('fieldset')).jsonify(paginated_subscriptions), HTTPStatus.OK
 
 
 @user_routes.get('/<string:username>/posts')
@@ -150,7 +160,7 @@ def read_user_posts(args, username):
 
     paginated_posts = PostManager.read_all_by_user(user, args)
     
-    return post_pagination_response_schema.dump(paginated_posts), HTTPStatus.OK
+    return post_pagination_response_serializer.select(args.get('fieldset')).jsonify(paginated_posts), HTTPStatus.OK
 
 
 @user_routes.get('/<string:username>/comments')
@@ -161,7 +171,7 @@ def read_user_comments(args, username):
 
     paginated_comments = CommentManager.read_all_by_user(user, args)
     
-    return comment_pagination_response_schema.dump(paginated_comments), HTTPStatus.OK
+    return comment_pagination_response_serializer.select(args.get('fieldset')).jsonify(paginated_comments), HTTPStatus.OK
 
 
 @user_routes.get('/me')
@@ -176,7 +186,7 @@ def me():
 def read_user_bookmarked_posts(args):
     paginated_bookmarks = PostBookmarkManager.read_bookmarked_posts_by_user(current_user, args)
 
-    return post_pagination_response_schema.dump(paginated_bookmarks), HTTPStatus.OK
+    return post_pagination_response_serializer.select(args.get('fieldset')).jsonify(paginated_bookmarks), HTTPStatus.OK
 
 
 @user_routes.get('/posts/upvoted')
@@ -185,7 +195,7 @@ def read_user_bookmarked_posts(args):
 def read_user_upvoted_posts(args):
     paginated_upvotes = PostVoteManager.read_upvoted_posts_by_user(current_user, args)
 
-    return post_pagination_response_schema.dump(paginated_upvotes), HTTPStatus.OK
+    return post_pagination_response_serializer.select(args.get('fieldset')).jsonify(paginated_upvotes), HTTPStatus.OK
 
 
 @user_routes.get('/posts/downvoted')
@@ -194,7 +204,7 @@ def read_user_upvoted_posts(args):
 def read_user_downvoted_posts(args):
     paginated_downvotes = PostVoteManager.read_downvoted_posts_by_user(current_user, args)
 
-    return post_pagination_response_schema.dump(paginated_downvotes), HTTPStatus.OK
+    return post_pagination_response_serializer.select(args.get('fieldset')).jsonify(paginated_downvotes), HTTPStatus.OK
 
 
 @user_routes.get('/comments/bookmarked')
@@ -203,7 +213,7 @@ def read_user_downvoted_posts(args):
 def read_user_bookmarked_comments(args):
     paginated_bookmarks = CommentBookmarkManager.read_bookmarked_comments_by_user(current_user, args)
     
-    return comment_pagination_response_schema.dump(paginated_bookmarks), HTTPStatus.OK
+    return comment_pagination_response_serializer.select(args.get('fieldset')).jsonify(paginated_bookmarks), HTTPStatus.OK
 
 
 @user_routes.get('/comments/upvoted')
@@ -212,7 +222,7 @@ def read_user_bookmarked_comments(args):
 def read_user_upvoted_comments(args):
     paginated_upvotes = CommentVoteManager.read_upvoted_comments_by_user(current_user, args)
 
-    return comment_pagination_response_schema.dump(paginated_upvotes), HTTPStatus.OK
+    return comment_pagination_response_serializer.select(args.get('fieldset')).jsonify(paginated_upvotes), HTTPStatus.OK
 
 @user_routes.get('/comments/downvoted')
 @use_args(comment_pagination_request_schema, location='query')
@@ -220,4 +230,4 @@ def read_user_upvoted_comments(args):
 def read_user_downvoted_comments(args):
     paginated_downvotes = CommentVoteManager.read_downvoted_comments_by_user(current_user, args)
 
-    return comment_pagination_response_schema.dump(paginated_downvotes), HTTPStatus.OK
+    return comment_pagination_response_serializer.select(args.get('fieldset')).jsonify(paginated_downvotes), HTTPStatus.OK
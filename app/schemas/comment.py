@@ -2,19 +2,35 @@
 from marshmallow import Schema
 from marshmallow import fields
 from marshmallow import validate
+from marshmallow import pre_dump
+
+# Flask
+from flask import current_app
+
+# Utils
+from app.utils.serializer import compile_schema
+
+# Loaders
+from app.loaders.comment import CommentTreeLoader
 
 # Schemas
 from app.schemas.user import UserSchema
 from app.schemas.post import PostSchema
 from app.schemas.pagination import PaginationSchema
+from app.schemas.pagination import FieldsetRequestSchema
+from app.schemas.pagination import Cursor
 
 
-class CommentPaginationRequestSchema(Schema):
+class CommentPaginationRequestSchema(FieldsetRequestSchema):
     class Meta:
         ordered = True
 
+    item_schema = 'CommentSchema'
+
     page = fields.Integer(load_default=1)
     per_page = fields.Integer(load_default=10)
+    cursor = Cursor()
+    include_total = fields.Boolean(load_default=False)
 
 
 class CommentStatsSchema(Schema):
@@ -46,11 +62,26 @@ class CommentSchema(Schema):
     bookmarked = fields.Boolean(dump_only=True)
     upvoted = fields.Boolean(dump_only=True)
     downvoted = fields.Boolean(dump_only=True)
-    replies = fields.List(fields.Nested(lambda: CommentSchema()))
+    replies = fields.List(fields.Nested(lambda: CommentSchema()), attribute='loaded_replies')
     stats = fields.Nested(CommentStatsSchema, dump_only=True)
     created_at = fields.DateTime(dump_only=True)
     updated_at = fields.DateTime(dump_only=True)
 
+    @pre_dump(pass_collection=True)
+    def load_reply_tree(self, data, many, **kwargs):
+        if 'replies' not in self.dump_fields:
+            return data
+
+        comments = data if many else [data]
+
+        CommentTreeLoader.load(
+            comments,
+            max_depth=current_app.config.get('COMMENT_TREE_MAX_DEPTH'),
+            max_breadth=current_app.config.get('COMMENT_TREE_MAX_BREADTH')
+        )
+
+        return data
+
 
 class CommentPaginationResponseSchema(PaginationSchema):
     class Meta:
@@ -64,3 +95,5 @@ comment_pagination_response_schema = CommentPaginationResponseSchema()
 comment_schema = CommentSchema()
 comment_update_schema = CommentSchema(only=('content',))
 comments_schema = CommentSchema(many=True)
+
+comment_pagination_response_serializer = compile_schema(comment_pagination_response_schema)
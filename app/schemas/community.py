@@ -2,18 +2,35 @@
 from marshmallow import Schema
 from marshmallow import fields
 from marshmallow import validate
+from marshmallow import pre_dump
+from marshmallow import post_dump
+
+# Flask-JWT-Extended
+from flask_jwt_extended import current_user
+
+# Utils
+from app.utils.serializer import compile_schema
+
+# Loaders
+from app.loaders.community import CommunityMembershipLoader
 
 # Schemas
 from app.schemas.user import UserSchema
 from app.schemas.pagination import PaginationSchema
+from app.schemas.pagination import FieldsetRequestSchema
+from app.schemas.pagination import Cursor
 
 
-class CommunityPaginationRequestSchema(Schema):
+class CommunityPaginationRequestSchema(FieldsetRequestSchema):
     class Meta:
         ordered = True
 
+    item_schema = 'CommunitySchema'
+
     page = fields.Integer(load_default=1)
     per_page = fields.Integer(load_default=10)
+    cursor = Cursor()
+    include_total = fields.Boolean(load_default=False)
 
 
 class CommunityStatsSchema(Schema):
@@ -28,6 +45,10 @@ class CommunityStatsSchema(Schema):
     banned_count = fields.Integer()
 
 
+def dumps_memberships(schema):
+    return any(name in schema.dump_fields for name in ('owned_by', 'subscriber', 'moderator', 'ban'))
+
+
 class CommunitySchema(Schema):
     class Meta:
         ordered = True
@@ -54,6 +75,20 @@ class CommunitySchema(Schema):
     created_at = fields.DateTime(dump_only=True)
     updated_at = fields.DateTime(dump_only=True)
 
+    @pre_dump(pass_collection=True)
+    def load_viewer_memberships(self, data, many, **kwargs):
+        if many and dumps_memberships(self) and current_user:
+            CommunityMembershipLoader.load(current_user, data)
+
+        return data
+
+    @post_dump(pass_collection=True)
+    def clear_viewer_memberships(self, data, many, **kwargs):
+        if many:
+            CommunityMembershipLoader.clear()
+
+        return data
+
 
 class CommunityPaginationResponseSchema(PaginationSchema):
     class Meta:
@@ -66,3 +101,5 @@ community_pagination_request_schema = CommunityPaginationRequestSchema()
 community_pagination_response_schema = CommunityPaginationResponseSchema()
 community_schema = CommunitySchema()
 communities_schema = CommunitySchema(many=True)
+
+community_pagination_response_serializer = compile_schema(community_pagination_response_schema)
@@ -7,6 +7,65 @@ from flask import request
 # Marshmallow
 from marshmallow import Schema
 from marshmallow import fields
+from marshmallow import ValidationError
+from marshmallow import post_load
+from marshmallow import class_registry
+
+# Utils
+from app.utils.pagination import CursorPagination
+from app.utils.pagination import decode_cursor
+from app.utils.fieldset import Fieldset
+
+
+class Cursor(fields.Field):
+    '''
+    Opaque pagination cursor. An empty cursor requests the first page in
+    cursor mode.
+    '''
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        if not value:
+            return {}
+
+        try:
+            return decode_cursor(value)
+        except ValueError as error:
+            raise ValidationError(str(error)) from error
+
+
+class FieldNames(fields.Field):
+    '''
+    Comma separated list of field names, e.g. id,title,owner.username.
+    '''
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        if not isinstance(value, str):
+            raise ValidationError('Not a valid list of field names.')
+
+        names = (name.strip() for name in value.split(','))
+
+        return tuple(dict.fromkeys(name for name in names if name))
+
+
+class FieldsetRequestSchema(Schema):
+    '''
+    Pagination request taking fields= and include= to choose the fields of
+    the items, loaded into args['fieldset']. item_schema is the name of the
+    schema of the items.
+    '''
+
+    item_schema = None
+
+    only = FieldNames(data_key='fields')
+    include = FieldNames()
+
+    @post_load
+    def load_fieldset(self, data, **kwargs):
+        schema = class_registry.get_class(self.item_schema)()
+
+        data['fieldset'] = Fieldset.parse(schema, data.pop('only', None), data.pop('include', None))
+
+        return data
 
 
 class PaginationSchema(Schema):
@@ -26,7 +85,18 @@ class PaginationSchema(Schema):
 
         return "{}?{}".format(request.base_url, urlencode(query_args))
 
+    @staticmethod
+    def get_cursor_url(cursor):
+        query_args = request.args.to_dict()
+        query_args.pop("page", None)
+        query_args["cursor"] = cursor
+
+        return "{}?{}".format(request.base_url, urlencode(query_args))
+
     def get_pagination_links(self, paginated_objects):
+        if isinstance(paginated_objects, CursorPagination):
+            return self.get_cursor_links(paginated_objects)
+
         pagination_links = {
             "first": self.get_url(page=1),
             "last": self.get_url(page=paginated_objects.pages),
@@ -38,4 +108,17 @@ class PaginationSchema(Schema):
         if paginated_objects.has_next:
             pagination_links["next"] = self.get_url(page=paginated_objects.next_num)
 
-        return pagination_links
\ No newline at end of file
+        return pagination_links
+
+    def get_cursor_links(self, paginated_objects):
+        pagination_links = {
+            "first": self.get_cursor_url(cursor=""),
+        }
+
+        if paginated_objects.has_prev:
+            pagination_links["prev"] = self.get_cursor_url(cursor=paginated_objects.prev_cursor)
+
+        if paginated_objects.has_next:
+            pagination_links["next"] = self.get_cursor_url(cursor=paginated_objects.next_cursor)
+
+        return pagination_links
@@ -2,19 +2,38 @@
 from marshmallow import Schema
 from marshmallow import fields
 from marshmallow import validate
+from marshmallow import pre_dump
+from marshmallow import post_dump
+
+# Flask-JWT-Extended
+from flask_jwt_extended import current_user
+
+# Utils
+from app.utils.serializer import compile_schema
+
+# Loaders
+from app.loaders.post import PostFlagsLoader
+from app.loaders.community import CommunityMembershipLoader
 
 # Schemas
 from app.schemas.user import UserSchema
 from app.schemas.community import CommunitySchema
+from app.schemas.community import dumps_memberships
 from app.schemas.pagination import PaginationSchema
+from app.schemas.pagination import FieldsetRequestSchema
+from app.schemas.pagination import Cursor
 
 
-class PostPaginationRequestSchema(Schema):
+class PostPaginationRequestSchema(FieldsetRequestSchema):
     class Meta:
         ordered = True
 
+    item_schema = 'PostSchema'
+
     page = fields.Integer(load_default=1)
     per_page = fields.Integer(load_default=10)
+    cursor = Cursor()
+    include_total = fields.Boolean(load_default=False)
     time_filter = fields.Str(load_default='all')
     sort_by = fields.Str(load_default='created_at')
     sort_order = fields.Str(load_default='desc')
@@ -70,6 +89,28 @@ class PostSchema(Schema):
     created_at = fields.DateTime(dump_only=True)
     updated_at = fields.DateTime(dump_only=True)
 
+    @pre_dump(pass_collection=True)
+    def load_viewer_flags(self, data, many, **kwargs):
+        flagged = any(name in self.dump_fields for name in ('bookmarked', 'upvoted', 'downvoted'))
+
+        if many and flagged and current_user:
+            PostFlagsLoader.load(current_user, data)
+
+        community = self.dump_fields.get('community')
+
+        if many and community is not None and dumps_memberships(community.schema) and current_user:
+            CommunityMembershipLoader.load(current_user, {post.community for post in data})
+
+        return data
+
+    @post_dump(pass_collection=True)
+    def clear_viewer_flags(self, data, many, **kwargs):
+        if many:
+            PostFlagsLoader.clear()
+            CommunityMembershipLoader.clear()
+
+        return data
+
 
 class PostPaginationResponseSchema(PaginationSchema):
     class Meta:
@@ -81,4 +122,6 @@ class PostPaginationResponseSchema(PaginationSchema):
 post_pagination_request_schema = PostPaginationRequestSchema()
 post_pagination_response_schema = PostPaginationResponseSchema()
 post_schema = PostSchema()
-posts_schema = PostSchema(many=True)
\ No newline at end of file
+posts_schema = PostSchema(many=True)
+
+post_pagination_response_serializer = compile_schema(post_pagination_response_schema)
@@ -3,16 +3,25 @@ from marshmallow import Schema
 from marshmallow import fields
 from marshmallow import validate
 
+# Utils
+from app.utils.serializer import compile_schema
+
 # Schemas 
 from app.schemas.pagination import PaginationSchema
+from app.schemas.pagination import FieldsetRequestSchema
+from app.schemas.pagination import Cursor
 
 
-class UserPaginatationRequestSchema(Schema):
+class UserPaginatationRequestSchema(FieldsetRequestSchema):
     class Meta:
         ordered = True
 
+    item_schema = 'UserSchema'
+
     page = fields.Integer(load_default=1)
     per_page = fields.Integer(load_default=10)
+    cursor = Cursor()
+    include_total = fields.Boolean(load_default=False)
 
 
 class UserStatsSchema(Schema):
@@ -77,4 +86,6 @@ user_pagination_response_schema = UserPaginatationResponseSchema()
 me_schema = UserSchema(exclude=('email',))
 user_schema = UserSchema()
 users_schema = UserSchema(many=True)
-login_schema = UserSchema(only=('username', 'password'))
\ No newline at end of file
+login_schema = UserSchema(only=('username', 'password'))
+
+user_pagination_response_serializer = compile_schema(user_pagination_response_schema)
@@ -0,0 +1,44 @@
+# Flask
+from flask import current_app
+
+# Marshmallow
+from marshmallow import Schema
+from marshmallow import fields
+from marshmallow import validate
+from marshmallow import ValidationError
+
+
+def validate_batch_size(votes):
+    max_size = current_app.config.get('VOTES_BATCH_MAX_SIZE')
+
+    if not votes:
+        raise ValidationError('Send at least one vote.')
+
+    if max_size is not None and len(votes) > max_size:
+        raise ValidationError(f'Send at most {max_size} votes.')
+
+
+class VoteSchema(Schema):
+    class Meta:
+        ordered = True
+
+    id = fields.Integer(required=True)
+    direction = fields.Integer(
+        required=True,
+        validate=validate.OneOf([1, -1], error='Direction must be 1 or -1.')
+    )
+    error = fields.Str(
+        dump_only=True,
+        allow_none=True
+    )
+
+
+class VoteBatchSchema(Schema):
+    votes = fields.List(
+        fields.Nested(VoteSchema),
+        required=True,
+        validate=validate_batch_size
+    )
+
+
+vote_batch_schema = VoteBatchSchema()
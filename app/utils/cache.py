@@ -0,0 +1,88 @@
+# collections
+from collections import OrderedDict
+
+# threading
+from threading import Lock
+
+# time
+from time import monotonic
+
+
+# Marks the TTL left to the default of the cache
+DEFAULT_TTL = object()
+
+
+class TTLCache:
+    '''
+    Bounded in-process cache whose entries expire after a time to live.
+    The least recently used entries are evicted once the cache is full.
+    '''
+
+    def __init__(self, max_entries=10000, default_ttl=300):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return default
+
+            value, expires_at = entry
+
+            if expires_at is not None and expires_at <= monotonic():
+                del self._entries[key]
+
+                return default
+
+            self._entries.move_to_end(key)
+
+            return value
+
+    def set(self, key, value, ttl=DEFAULT_TTL):
+        '''
+        Store a value.
+
+        :param key: The key of the value.
+        :param value: The value.
+        :param ttl: Seconds to keep the value, None to keep it until it is
+                    evicted, or 0 or less not to store it. Defaults to the
+                    default TTL of the cache.
+        '''
+
+        ttl = self.default_ttl if ttl is DEFAULT_TTL else ttl
+
+        if ttl is not None and ttl <= 0:
+            self.delete(key)
+
+            return
+
+        expires_at = monotonic() + ttl if ttl is not None else None
+
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, key):
+        return self.get(key, _missing) is not _missing
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_missing = object()
@@ -0,0 +1,106 @@
+# threading
+from threading import Lock
+
+# time
+from time import monotonic
+
+# SQLAlchemy
+from sqlalchemy import bindparam
+
+
+class CounterDeltas:
+    '''
+    Pending changes to stats counters, summed per row and column. Rows are
+    keyed by the stats table, the name of its key column and the key.
+    '''
+
+    def __init__(self):
+        self.rows = {}
+
+    def __bool__(self):
+        return bool(self.rows)
+
+    def add(self, table, key_column, key, deltas):
+        row = self.rows.setdefault((table, key_column, key), {})
+
+        for column, delta in deltas.items():
+            row[column] = row.get(column, 0) + delta
+
+    def merge(self, other):
+        for (table, key_column, key), deltas in other.rows.items():
+            self.add(table, key_column, key, deltas)
+
+    def drain(self):
+        rows, self.rows = self.rows, {}
+
+        return rows
+
+
+class CounterBuffer(CounterDeltas):
+    '''
+    Process-wide deltas waiting to be written, shared by every session.
+    The buffer is due for a flush once the interval has passed since the
+    last one, or on every transaction when the interval is 0.
+    '''
+
+    def __init__(self, interval=0):
+        super().__init__()
+
+        self.interval = interval
+
+        self._lock = Lock()
+        self._flushed_at = monotonic()
+
+    def merge(self, other):
+        with self._lock:
+            super().merge(other)
+
+    def due(self):
+        return monotonic() - self._flushed_at >= self.interval
+
+    def drain(self):
+        with self._lock:
+            self._flushed_at = monotonic()
+
+            return super().drain()
+
+
+def counter_updates(rows, values):
+    '''
+    Group the pending rows into one UPDATE per stats table, key column and
+    set of changed columns, each executed once for all its rows.
+
+    :param rows: The drained rows of a CounterDeltas.
+    :param values: Callable building the SET clause of a table from the
+        delta of each changed column.
+
+    :return: List of (statement, parameters) pairs.
+    '''
+
+    groups = {}
+
+    for (table, key_column, key), deltas in rows.items():
+        deltas = {column: delta for column, delta in deltas.items() if delta}
+
+        if not deltas:
+            continue
+
+        columns = tuple(sorted(deltas))
+
+        parameters = {f'delta_{column}': deltas[column] for column in columns}
+        parameters['row_key'] = key
+
+        groups.setdefault((table, key_column, columns), []).append(parameters)
+
+    updates = []
+
+    for (table, key_column, columns), parameters in groups.items():
+        statement = table.update().where(
+            table.c[key_column] == bindparam('row_key')
+        ).values(
+            values(table, {column: bindparam(f'delta_{column}') for column in columns})
+        )
+
+        updates.append((statement, parameters))
+
+    return updates
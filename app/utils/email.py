@@ -1,29 +1,14 @@
-# threading
-from threading import Thread
-
-# Flask
-from flask import current_app
-
-# Flask-Mail
-from flask_mail import Message
-
 # Extensions
-from app.extensions.email import mail
-
-
-def send_async_email(app, msg):
-    with app.app_context():
-        mail.send(msg)
+from app.extensions.outbox import outbox
 
 
 def send_email(to, subject, template):
-    app = current_app._get_current_object()
-    
-    msg = Message(
-        subject, 
-        recipients=[to], 
-        html=template, 
-        sender=('Discussify', 'discussify1@gmail.com')
-    )
+    '''
+    Queue an email, sent by the mail workers (`flask mail work`).
+
+    :param to: The email address of the recipient.
+    :param subject: The subject of the email.
+    :param template: The rendered HTML body.
+    '''
 
-    Thread(target=send_async_email, args=(app, msg)).start()
\ No newline at end of file
+    outbox.enqueue(to, subject, template)
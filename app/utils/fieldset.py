@@ -0,0 +1,173 @@
+# Marshmallow
+from marshmallow import fields
+from marshmallow import ValidationError
+
+# Extensions
+from app.extensions.database import db
+
+
+def nested_schema(field):
+    '''
+    Get the schema of a Nested or List(Nested) field.
+
+    :param field: The field object.
+
+    :return: The nested schema, or None for any other field.
+    '''
+
+    if isinstance(field, fields.List):
+        field = field.inner
+
+    if isinstance(field, fields.Nested):
+        return field.schema
+
+    return None
+
+
+class Fieldset:
+    '''
+    The fields of the items of a listing asked for by a client. fields=
+    lists the fields to dump, with dotted names for the fields of nested
+    objects, e.g. fields=id,title,owner.username. include= names nested
+    objects to dump in full, on top of fields= or, without it, of the plain
+    fields of the items.
+
+    The fieldset prunes the response schema and decides which relationships
+    the listing query eager-loads, so the unused ones are never read.
+    '''
+
+    def __init__(self, schema, paths):
+        self.schema = schema
+        self.paths = paths
+
+        # Prune a copy of the schema, which also validates the paths
+        self.item_schema = type(schema)(only=paths)
+
+    @classmethod
+    def parse(cls, schema, only=None, include=None):
+        '''
+        Build a fieldset from the fields= and include= query parameters.
+
+        :param schema: The schema of the items.
+        :param only: The names given to fields=, or None.
+        :param include: The names given to include=, or None.
+
+        :return: The fieldset, or None if neither parameter was given.
+
+        :raises ValidationError: If a name is not a field of the items.
+        '''
+
+        if only is None and include is None:
+            return None
+
+        if only is not None and not only:
+            raise ValidationError('Select at least one field.', field_name='fields')
+
+        relationships = [name for name, field in schema.dump_fields.items() if nested_schema(field) is not None]
+
+        for name in include or ():
+            if name not in relationships:
+                raise ValidationError(f'Unknown relationship: {name}.', field_name='include')
+
+        if only is None:
+            only = [name for name in schema.dump_fields if name not in relationships]
+
+        for path in only:
+            if not cls.is_valid_path(schema, path):
+                raise ValidationError(f'Unknown field: {path}.', field_name='fields')
+
+        paths = set(only).union(include or ())
+
+        # A nested object dumped in full covers the fields asked for in it
+        paths = {
+            path for path in paths
+            if not any(path.startswith(f'{other}.') for other in paths)
+        }
+
+        # The pruned schema dumps the fields in the order of the paths
+        return cls(schema, tuple(sorted(paths, key=lambda path: cls.position(schema, path))))
+
+    @staticmethod
+    def is_valid_path(schema, path):
+        *parents, name = path.split('.')
+
+        for parent in parents:
+            field = schema.dump_fields.get(parent)
+
+            schema = nested_schema(field) if field is not None else None
+
+            if schema is None:
+                return False
+
+        return name in schema.dump_fields
+
+    @staticmethod
+    def position(schema, path):
+        '''
+        Get the position of the field of a valid path in the declaration
+        order of the schemas, e.g. the one of owner then of username in the
+        owner schema for owner.username.
+        '''
+
+        position = []
+
+        for name in path.split('.'):
+            names = list(schema.dump_fields)
+
+            position.append(names.index(name))
+
+            schema = nested_schema(schema.dump_fields[name])
+
+        return tuple(position)
+
+    def response_only(self, response_schema):
+        '''
+        Get the fields of a pagination response schema dumping the items of
+        the fieldset, for its only option.
+
+        :param response_schema: The pagination response schema.
+
+        :return: Tuple of the field names.
+        '''
+
+        names = []
+
+        for name, field in response_schema.fields.items():
+            if field.attribute == 'items':
+                names.extend(f'{name}.{path}' for path in self.paths)
+            else:
+                names.append(name)
+
+        return tuple(names)
+
+    def loader_options(self, model):
+        '''
+        Get the options eager-loading the relationships the fieldset dumps.
+
+        :param model: The model class of the items.
+
+        :return: Tuple of the loader options.
+        '''
+
+        return tuple(eager_loads(self.item_schema, db.inspect(model)))
+
+
+def eager_loads(schema, mapper, parent=None):
+    for name, field in schema.dump_fields.items():
+        nested = nested_schema(field)
+
+        if nested is None:
+            continue
+
+        relationship = mapper.relationships.get(field.attribute or name)
+
+        if relationship is None or relationship.lazy == 'dynamic':
+            continue
+
+        attribute = getattr(mapper.class_, relationship.key)
+
+        option = db.selectinload(attribute) if parent is None else parent.selectinload(attribute)
+
+        yield option
+
+        yield from eager_loads(nested, relationship.mapper, option)
@@ -0,0 +1,352 @@
+# Datetime
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
+# HTTP
+from http import HTTPStatus
+
+# Flask
+from flask import current_app
+
+# Flask-JWT-Extended
+from flask_jwt_extended import current_user
+
+# Flask-SQLAlchemy
+from flask_sqlalchemy.pagination import Pagination
+
+# Marshmallow
+from marshmallow import ValidationError
+
+# Webargs
+from webargs.flaskparser import abort
+
+# Extensions
+from app.extensions.database import db
+from app.extensions.cache import cache
+
+# Decorators
+from app.decorators.filters import exclude_blocked
+from app.decorators.filters import hides_blocked_users
+
+# Utils
+from app.utils.pagination import CursorPagination
+from app.utils.pagination import encode_cursor
+
+
+TIME_FILTERS = {
+    'day': timedelta(days=1),
+    'week': timedelta(weeks=1),
+    'month': timedelta(days=30),
+    'year': timedelta(days=365),
+}
+
+
+def cursor_key(column, key):
+    '''
+    Convert the key of a cursor to the type of the sort column.
+
+    :param column: The sort column.
+    :param key: The key decoded from the cursor.
+
+    :return: The key.
+
+    :raises TypeError: If the key is not of the type of the column.
+    :raises ValueError: If the key is not a valid date.
+    '''
+
+    if isinstance(column.type, db.DateTime):
+        return datetime.fromisoformat(key)
+
+    if isinstance(key, bool) or not isinstance(key, (int, float)):
+        raise TypeError('Not a number.')
+
+    return key
+
+
+def reject_cursor():
+    '''
+    Answer like the parser does for a malformed cursor.
+    '''
+
+    error = ValidationError('Invalid cursor.', field_name='cursor')
+
+    abort(HTTPStatus.UNPROCESSABLE_ENTITY, exc=error, messages={'query': error.normalized_messages()})
+
+
+class ListingPagination(Pagination):
+    '''
+    Page-number pagination over a prebuilt listing statement whose limit,
+    offset and filter values are bound at execution time.
+    '''
+
+    def _query_items(self):
+        params = dict(self._query_args['params'], page_limit=self.per_page, page_offset=self._query_offset)
+
+        statement = self._query_args['statement'].options(*self._query_args['options'])
+
+        return db.session.scalars(statement, params).all()
+
+    def _query_count(self):
+        return self._query_args['total']()
+
+
+class Listing:
+    '''
+    Declarative description of a paginated listing: its base query, the
+    columns it can be sorted by, the column the time filter applies to and
+    the column whose owners are hidden from viewers who blocked them.
+
+    The base query takes its values through bound parameters, so the
+    statement for each shape of the request (sort, order, filters and page
+    mode) is built once and reused, which lets SQLAlchemy skip recompiling
+    it on steady-state requests.
+
+    The loader options eager-load the relationships the response schema
+    dumps, so a page is read with the same number of queries whatever its
+    size. A fieldset in the arguments replaces them with the options of
+    the relationships it dumps.
+    '''
+
+    def __init__(self, query, sort_columns, time_column, id_column, blocked_column=None, options=()):
+        self.query = query
+        self.sort_columns = sort_columns
+        self.time_column = time_column
+        self.id_column = id_column
+        self.blocked_column = blocked_column
+        self.options = tuple(options)
+        self.statements = {}
+
+    def paginate(self, args, params=None, community=None, total=None):
+        '''
+        Get a page of the listing.
+
+        :param args: The pagination arguments.
+        :param params: The values of the bound parameters of the base query.
+        :param community: The community whose moderators see blocked users.
+        :param total: Callable returning the number of rows of the listing
+            when nothing is filtered out, e.g. from a stats table.
+
+        :return: The paginated objects.
+        '''
+
+        params = dict(params or {})
+
+        sort_by = args.get('sort_by') if args.get('sort_by') in self.sort_columns else 'created_at'
+        ascending = args.get('sort_order') == 'asc'
+
+        time_filtered = args.get('time_filter') in TIME_FILTERS
+        viewer_filtered = self.blocked_column is not None and hides_blocked_users(community)
+
+        if time_filtered:
+            # Truncate the start so requests within the same minute share the count cache
+            start_date = datetime.now(timezone.utc) - TIME_FILTERS[args['time_filter']]
+
+            params['start_date'] = start_date.replace(second=0, microsecond=0)
+
+        if viewer_filtered:
+            params['viewer_id'] = current_user.id
+
+        filters = (time_filtered, viewer_filtered)
+
+        # Eager-load the relationships the response will dump
+        fieldset = args.get('fieldset')
+
+        options = fieldset.loader_options(self.query.column_descriptions[0]['entity']) if fieldset else self.options
+
+        if total is None or any(filters):
+            total = lambda: self.count(filters, params)
+
+        cursor = args.get('cursor')
+
+        if cursor is None:
+            return ListingPagination(
+                page=args.get('page'),
+                per_page=args.get('per_page'),
+                error_out=False,
+                statement=self.page_statement(filters, sort_by, ascending),
+                params=params,
+                options=options,
+                total=total
+            )
+
+        # Like page mode, fall back to the default page size for a size below 1
+        per_page = args.get('per_page')
+
+        if per_page is None or per_page < 1:
+            per_page = 20
+
+        return self.seek(
+            filters,
+            sort_by,
+            ascending,
+            cursor,
+            params,
+            per_page=per_page,
+            options=options,
+            total=total() if args.get('include_total', False) else None
+        )
+
+    def seek(self, filters, sort_by, ascending, cursor, params, per_page, options=(), total=None):
+        '''
+        Get the page after (or before) the cursor row, ordered by the sort
+        column and the ID of the rows.
+
+        :param filters: The time and viewer filters applied to the listing.
+        :param sort_by: The sort column key.
+        :param ascending: Whether the listing is sorted in ascending order.
+        :param cursor: The decoded cursor, empty for the first page.
+        :param params: The values of the bound parameters.
+        :param per_page: Number of objects per page.
+        :param options: Loader options of the objects.
+        :param total: The number of rows, if requested.
+
+        :return: The cursor pagination object.
+        '''
+
+        backwards = cursor.get('direction') == 'prev'
+        anchored = 'id' in cursor
+
+        # Walk the index in the direction of the requested page
+        forward = ascending != backwards
+
+        params = dict(params, page_limit=per_page + 1)
+
+        if anchored:
+            # A cursor of another sort would seek on a key of another column
+            if cursor['sort'] != sort_by:
+                reject_cursor()
+
+            try:
+                key = cursor_key(self.sort_columns[sort_by], cursor['key'])
+            except (TypeError, ValueError):
+                reject_cursor()
+
+            params.update(cursor_id=cursor['id'], cursor_key=key)
+
+        statement = self.seek_statement(filters, sort_by, forward, anchored).options(*options)
+
+        rows = db.session.execute(statement, params).all()
+
+        has_more = len(rows) > per_page
+
+        rows = rows[:per_page]
+
+        if backwards:
+            rows.reverse()
+
+        items = [row[0] for row in rows]
+
+        next_cursor = None
+        prev_cursor = None
+
+        if rows:
+            first, last = rows[0], rows[-1]
+
+            if backwards:
+                next_cursor = encode_cursor(sort_by, last[1], last[2], 'next')
+                prev_cursor = encode_cursor(sort_by, first[1], first[2], 'prev') if has_more else None
+            else:
+                next_cursor = encode_cursor(sort_by, last[1], last[2], 'next') if has_more else None
+                prev_cursor = encode_cursor(sort_by, first[1], first[2], 'prev') if anchored else None
+
+        return CursorPagination(items, per_page, next_cursor, prev_cursor, total)
+
+    def count(self, filters, params):
+        '''
+        Count the rows of the listing. The result is cached for a short time
+        under the listing, its filters and the parameter values.
+
+        :param filters: The time and viewer filters applied to the listing.
+        :param params: The values of the bound parameters.
+
+        :return: The number of rows.
+        '''
+
+        key = ('count', self, filters, repr(sorted(params.items())))
+
+        total = cache.get(key)
+
+        if total is None:
+            total = db.session.scalar(self.count_statement(filters), params)
+
+            cache.set(key, total, ttl=current_app.config.get('PAGINATION_COUNT_CACHE_TTL'))
+
+        return total
+
+    def statement(self, key, build):
+        statement = self.statements.get(key)
+
+        if statement is None:
+            statement = self.statements[key] = build()
+
+        return statement
+
+    def filtered_statement(self, filters):
+        time_filtered, viewer_filtered = filters
+
+        def build():
+            query = self.query
+
+            if time_filtered:
+                query = query.where(self.time_column >= db.bindparam('start_date', type_=self.time_column.type))
+
+            if viewer_filtered:
+                query = query.where(exclude_blocked(db.bindparam('viewer_id'), self.blocked_column))
+
+            return query
+
+        return self.statement(('filtered', filters), build)
+
+    def page_statement(self, filters, sort_by, ascending):
+        order_column = self.sort_columns[sort_by]
+
+        def build():
+            # Ties are broken by ID so their order does not depend on how
+            # the index is scanned
+            return (
+                self.filtered_statement(filters)
+                .order_by(order_column.asc() if ascending else order_column.desc(), self.id_column.asc())
+                .limit(db.bindparam('page_limit'))
+                .offset(db.bindparam('page_offset'))
+            )
+
+        return self.statement(('page', filters, sort_by, ascending), build)
+
+    def seek_statement(self, filters, sort_by, forward, anchored):
+        order_column = self.sort_columns[sort_by]
+
+        def build():
+            query = self.filtered_statement(filters)
+
+            if anchored:
+                # Compare against the stored value of the cursor row so the seek
+                # does not depend on how the key round-trips through the cursor
+                anchor = (
+                    query.with_only_columns(order_column)
+                    .where(self.id_column == db.bindparam('cursor_id'))
+                    .limit(1)
+                    .scalar_subquery()
+                )
+
+                anchor = db.func.coalesce(anchor, db.bindparam('cursor_key', type_=order_column.type))
+
+                row = db.tuple_(order_column, self.id_column)
+                position = db.tuple_(anchor, db.bindparam('cursor_id'))
+
+                query = query.where(row > position if forward else row < position)
+
+            if forward:
+                query = query.order_by(order_column.asc(), self.id_column.asc())
+            else:
+                query = query.order_by(order_column.desc(), self.id_column.desc())
+
+            return query.add_columns(order_column, self.id_column).limit(db.bindparam('page_limit'))
+
+        return self.statement(('seek', filters, sort_by, forward, anchored), build)
+
+    def count_statement(self, filters):
+        def build():
+            return db.select(db.func.count()).select_from(self.filtered_statement(filters).subquery())
+
+        return self.statement(('count', filters), build)
@@ -0,0 +1,81 @@
+# threading
+from threading import Event
+from threading import Lock
+from threading import Thread
+
+
+def retry_delay(attempts, backoff, max_backoff):
+    '''
+    Exponential delay before retrying an email.
+
+    :param attempts: The number of attempts made so far.
+    :param backoff: Seconds to wait after the first attempt.
+    :param max_backoff: Maximum number of seconds to wait.
+
+    :return: The delay in seconds.
+    '''
+
+    return min(backoff * 2 ** (attempts - 1), max_backoff)
+
+
+class OutboxMetrics:
+    '''
+    Counters of the deliveries made by the process, shared by its workers.
+    '''
+
+    fields = ('batches', 'sent', 'retried', 'failed', 'connection_errors')
+
+    def __init__(self):
+        self._counts = dict.fromkeys(self.fields, 0)
+        self._lock = Lock()
+
+    def add(self, **counts):
+        with self._lock:
+            for field, count in counts.items():
+                self._counts[field] += count
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self._counts)
+
+
+class OutboxWorkers:
+    '''
+    A fixed number of threads delivering the outbox in batches, each
+    waiting poll_interval seconds whenever the outbox has nothing due.
+    '''
+
+    def __init__(self, app, deliver, workers=1, poll_interval=5):
+        self.app = app
+        self.deliver = deliver
+        self.workers = workers
+        self.poll_interval = poll_interval
+
+        self._stopped = Event()
+        self._threads = []
+
+    def start(self):
+        for index in range(self.workers):
+            thread = Thread(target=self.run, name=f'outbox-worker-{index}', daemon=True)
+            thread.start()
+
+            self._threads.append(thread)
+
+    def run(self):
+        while not self._stopped.is_set():
+            with self.app.app_context():
+                delivered = self.deliver()
+
+            if not delivered:
+                self._stopped.wait(self.poll_interval)
+
+    def wait(self):
+        self._stopped.wait()
+
+    def stop(self):
+        self._stopped.set()
+
+        for thread in self._threads:
+            thread.join()
+
+        self._threads = []
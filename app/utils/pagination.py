@@ -0,0 +1,81 @@
+# Base64
+import base64
+
+# JSON
+import json
+
+# Datetime
+from datetime import datetime
+
+
+class CursorPagination:
+    '''
+    A page of results fetched by seeking past a cursor instead of using an
+    offset. It mirrors the attributes of the Flask-SQLAlchemy pagination
+    object used by the response schemas.
+    '''
+
+    def __init__(self, items, per_page, next_cursor=None, prev_cursor=None, total=None):
+        self.items = items
+        self.per_page = per_page
+        self.next_cursor = next_cursor
+        self.prev_cursor = prev_cursor
+        self.total = total
+        self.page = None
+        self.pages = None
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    @property
+    def has_prev(self):
+        return self.prev_cursor is not None
+
+
+def encode_cursor(sort, key, id, direction):
+    '''
+    Encode the position of a row into an opaque cursor.
+
+    :param sort: The name of the sort column.
+    :param key: The value of the sort column of the row.
+    :param id: The ID of the row.
+    :param direction: 'next' to seek past the row, 'prev' to seek before it.
+
+    :return: The URL-safe cursor string.
+    '''
+
+    if isinstance(key, datetime):
+        key = key.isoformat()
+
+    data = json.dumps({'sort': sort, 'key': key, 'id': id, 'direction': direction}, separators=(',', ':'))
+
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    '''
+    Decode a cursor created by encode_cursor.
+
+    :param cursor: The cursor string.
+
+    :return: Dictionary with the sort, key, id and direction of the cursor.
+
+    :raises ValueError: If the cursor is malformed.
+    '''
+
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    except (ValueError, TypeError):
+        raise ValueError('Invalid cursor.')
+
+    if (
+        not isinstance(data, dict)
+        or not isinstance(data.get('sort'), str)
+        or data.get('key') is None
+        or not isinstance(data.get('id'), int)
+        or data.get('direction') not in ('next', 'prev')
+    ):
+        raise ValueError('Invalid cursor.')
+
+    return data
@@ -1,10 +1,77 @@
+# os
+import os
+
+# concurrent
+from concurrent.futures import ProcessPoolExecutor
+
+# threading
+from threading import BoundedSemaphore
+from threading import Lock
+
 # passlib
 from passlib.hash import pbkdf2_sha256
 
+# Errors
+from app.errors.errors import OverloadedError
+
+
+def hash_password(password, rounds=None):
+    hasher = pbkdf2_sha256.using(rounds=rounds) if rounds else pbkdf2_sha256
 
-def hash_password(password):
-    return pbkdf2_sha256.hash(password)
+    return hasher.hash(password)
 
 
 def check_password(password, hashed_password):
-    return pbkdf2_sha256.verify(password, hashed_password)
\ No newline at end of file
+    return pbkdf2_sha256.verify(password, hashed_password)
+
+
+def needs_rehash(hashed_password, rounds):
+    return pbkdf2_sha256.using(rounds=rounds).needs_update(hashed_password)
+
+
+class HashingPool:
+    '''
+    Runs the password hashing in a pool of worker processes, so the request
+    threads wait on it instead of holding the interpreter. At most
+    max_pending hashes run or wait at once in a process; past that the
+    calls fail right away with an OverloadedError. With no workers the
+    hashing runs on the calling thread, still within the limit.
+    '''
+
+    def __init__(self, workers=0, max_pending=0):
+        self.workers = workers
+
+        self._slots = BoundedSemaphore(max_pending) if max_pending else None
+        self._executor = None
+        self._pid = None
+        self._lock = Lock()
+
+    @property
+    def executor(self):
+        with self._lock:
+            # Forked workers start their own pool
+            if self._executor is None or self._pid != os.getpid():
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+                self._pid = os.getpid()
+
+            return self._executor
+
+    def run(self, function, *args):
+        if self._slots is not None and not self._slots.acquire(blocking=False):
+            raise OverloadedError('Too many requests are being processed, try again later.')
+
+        try:
+            if not self.workers:
+                return function(*args)
+
+            return self.executor.submit(function, *args).result()
+        finally:
+            if self._slots is not None:
+                self._slots.release()
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+
+            self._executor = None
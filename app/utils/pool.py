@@ -0,0 +1,151 @@
+# threading
+from threading import Lock
+
+# time
+from time import perf_counter
+
+# SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy import exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import QueuePool
+
+
+# Connection arguments disabling the server-side prepared statements of a
+# driver, which PgBouncer in transaction mode would send to a server
+# connection that did not prepare them. psycopg2 binds the parameters on
+# the client, so it needs none.
+PGBOUNCER_CONNECT_ARGS = {
+    'psycopg': {'prepare_threshold': None},
+}
+
+
+class PoolMetrics:
+    '''
+    Counters of a connection pool: the checkouts and the time spent waiting
+    for them, the checkouts given up after the pool timeout, the most
+    connections checked out at once, and the connections opened, closed
+    and invalidated.
+    '''
+
+    fields = (
+        'checkouts',
+        'checkout_wait',
+        'checkout_wait_max',
+        'timeouts',
+        'peak_checked_out',
+        'connects',
+        'closes',
+        'invalidations'
+    )
+
+    def __init__(self):
+        self._counts = dict.fromkeys(self.fields, 0)
+        self._lock = Lock()
+
+    def add(self, **counts):
+        with self._lock:
+            for field, count in counts.items():
+                self._counts[field] += count
+
+    def checkout(self, wait, checked_out):
+        with self._lock:
+            self._counts['checkouts'] += 1
+            self._counts['checkout_wait'] += wait
+            self._counts['checkout_wait_max'] = max(self._counts['checkout_wait_max'], wait)
+            self._counts['peak_checked_out'] = max(self._counts['peak_checked_out'], checked_out)
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self._counts)
+
+
+class InstrumentedQueuePool(QueuePool):
+    '''
+    Queue pool recording its PoolMetrics, kept when the pool is recreated,
+    e.g. when the engine is disposed.
+    '''
+
+    def __init__(self, creator, *args, _dispatch=None, **kwargs):
+        super().__init__(creator, *args, _dispatch=_dispatch, **kwargs)
+
+        self.metrics = PoolMetrics()
+
+        # A recreated pool gets the listeners of the pool it replaces
+        if _dispatch is None:
+            self.listen(self.metrics)
+
+    def listen(self, metrics):
+        event.listen(self, 'connect', lambda *args: metrics.add(connects=1))
+        event.listen(self, 'close', lambda *args: metrics.add(closes=1))
+        event.listen(self, 'invalidate', lambda *args: metrics.add(invalidations=1))
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+
+        return pool
+
+    def connect(self):
+        start = perf_counter()
+
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.metrics.add(timeouts=1)
+            raise
+
+        self.metrics.checkout(perf_counter() - start, self.checkedout())
+
+        return connection
+
+    def stats(self):
+        '''
+        Get the metrics of the pool along with its current state.
+
+        :return: The counters of the metrics, the size of the pool, the
+                 connections checked out and in overflow, and the fraction
+                 of the capacity (size plus max overflow) checked out.
+        '''
+
+        capacity = self.size() + self._max_overflow if self._max_overflow > -1 else None
+        checked_out = self.checkedout()
+
+        return {
+            **self.metrics.snapshot(),
+            'size': self.size(),
+            'checked_out': checked_out,
+            'overflow': max(self.overflow(), 0),
+            'saturation': checked_out / capacity if capacity else None
+        }
+
+
+def engine_options(url, config):
+    '''
+    Pool options of an engine from the DATABASE_POOL_* settings.
+
+    :param url: The URL of the database.
+    :param config: The app's config.
+
+    :return: The engine options.
+    '''
+
+    url = make_url(url)
+
+    # In-memory SQLite databases live in a single connection
+    if url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:'):
+        return {}
+
+    options = {
+        'poolclass': InstrumentedQueuePool,
+        'pool_size': config.get('DATABASE_POOL_SIZE'),
+        'max_overflow': config.get('DATABASE_POOL_MAX_OVERFLOW'),
+        'pool_timeout': config.get('DATABASE_POOL_TIMEOUT'),
+        'pool_recycle': config.get('DATABASE_POOL_RECYCLE'),
+        'pool_pre_ping': config.get('DATABASE_POOL_PRE_PING')
+    }
+
+    if config.get('DATABASE_PGBOUNCER') and url.get_driver_name() in PGBOUNCER_CONNECT_ARGS:
+        options['connect_args'] = dict(PGBOUNCER_CONNECT_ARGS[url.get_driver_name()])
+
+    return options
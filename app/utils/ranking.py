@@ -0,0 +1,141 @@
+# Math
+import math
+
+# Datetime
+from datetime import timezone
+
+# Extensions
+from app.extensions.database import db
+
+
+# Seconds since the Unix epoch the hot scores are measured from
+HOT_EPOCH = 1134028003
+
+# Seconds of age worth a tenfold score
+HOT_DECAY = 45000
+
+# Normal quantile of the confidence of the best scores (95%)
+BEST_Z = 1.96
+
+
+def vote_weight(score):
+    '''
+    Logarithmic weight of the net score of a post in its hot score.
+
+    :param score: The upvotes minus the downvotes.
+
+    :return: The signed base 10 logarithm of the score.
+    '''
+
+    if score == 0:
+        return 0.0
+
+    return math.copysign(math.log10(abs(score)), score)
+
+
+def hot_score(upvotes, downvotes, created_at):
+    '''
+    Hot score of a post: the weight of its net score plus its creation time
+    in units of HOT_DECAY. Newer posts start higher, so older posts sink
+    without the scores having to be decayed over time.
+
+    :param upvotes: The number of upvotes.
+    :param downvotes: The number of downvotes.
+    :param created_at: The creation date of the post, UTC if naive.
+
+    :return: The hot score.
+    '''
+
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+
+    age = created_at.timestamp() - HOT_EPOCH
+
+    return vote_weight(upvotes - downvotes) + age / HOT_DECAY
+
+
+def best_score(upvotes, downvotes):
+    '''
+    Best score of a post: the lower bound of the Wilson score interval of
+    its share of upvotes.
+
+    :param upvotes: The number of upvotes.
+    :param downvotes: The number of downvotes.
+
+    :return: The best score, between 0 and 1.
+    '''
+
+    n = upvotes + downvotes
+
+    if n == 0:
+        return 0.0
+
+    p = upvotes / n
+    z = BEST_Z
+
+    return (p + z * z / (2 * n) - z * math.sqrt((p * (1 - p) + z * z / (4 * n)) / n)) / (1 + z * z / n)
+
+
+def vote_weight_expression(score):
+    '''
+    SQL version of vote_weight.
+
+    :param score: SQL expression of the net score.
+
+    :return: SQL expression of its weight.
+    '''
+
+    score = db.cast(score, db.Float)
+
+    return db.case(
+        (score > 0, db.func.log10(score)),
+        (score < 0, -db.func.log10(-score)),
+        else_=0.0
+    )
+
+
+def best_score_expression(upvotes, downvotes):
+    '''
+    SQL version of best_score.
+
+    :param upvotes: SQL expression of the number of upvotes.
+    :param downvotes: SQL expression of the number of downvotes.
+
+    :return: SQL expression of the best score.
+    '''
+
+    n = db.cast(upvotes + downvotes, db.Float)
+    p = db.cast(upvotes, db.Float) / n
+    z = BEST_Z
+
+    return db.case(
+        (n == 0, 0.0),
+        else_=(p + z * z / (2 * n) - z * db.func.sqrt((p * (1 - p) + z * z / (4 * n)) / n)) / (1 + z * z / n)
+    )
+
+
+def score_values(table, values):
+    '''
+    Update the hot and best scores of a post stats row along with its vote
+    counters. The hot score moves by the change in the weight of the net
+    score, which keeps the creation time part it was created with.
+
+    :param table: The post stats table.
+    :param values: The SET clause of the counters being changed.
+
+    :return: The SET clause of the scores.
+    '''
+
+    if 'upvotes_count' not in values and 'downvotes_count' not in values:
+        return {}
+
+    upvotes = values.get('upvotes_count', table.c.upvotes_count)
+    downvotes = values.get('downvotes_count', table.c.downvotes_count)
+
+    old_weight = vote_weight_expression(table.c.upvotes_count - table.c.downvotes_count)
+    new_weight = vote_weight_expression(upvotes - downvotes)
+
+    return {
+        'hot_score': table.c.hot_score + new_weight - old_weight,
+        'best_score': best_score_expression(upvotes, downvotes),
+    }
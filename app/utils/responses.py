@@ -0,0 +1,183 @@
+# hashlib
+import hashlib
+
+# HTTP
+from http import HTTPStatus
+
+# functools
+from functools import wraps
+
+# Flask
+from flask import current_app
+from flask import request
+from flask import jsonify
+from flask import make_response
+
+# Flask-JWT-Extended
+from flask_jwt_extended import current_user
+
+# Extensions
+from app.extensions.database import db
+from app.extensions.cache import cache
+
+
+def version_of(instance, exclude=()):
+    '''
+    Values identifying the state of a row and of its stats row, e.g. to
+    build an ETag.
+
+    :param instance: The model object.
+    :param exclude: Names of the columns to leave out.
+
+    :return: Tuple of the column values.
+    '''
+
+    parts = [instance.__tablename__]
+
+    for row in (instance, getattr(instance, 'stats', None)):
+        if row is None:
+            continue
+
+        parts.extend(
+            getattr(row, column.key)
+            for column in db.inspect(row).mapper.column_attrs
+            if column.key not in exclude
+        )
+
+    return tuple(parts)
+
+
+def pagination_etag_parts(paginated_objects):
+    '''
+    Values identifying a page of objects having an etag_parts method.
+
+    :param paginated_objects: The paginated objects.
+
+    :return: Tuple of the page numbers and the parts of the objects.
+    '''
+
+    numbers = tuple(
+        getattr(paginated_objects, name, None)
+        for name in ('page', 'pages', 'per_page', 'total', 'prev_cursor', 'next_cursor')
+    )
+
+    return numbers + tuple(item.etag_parts() for item in paginated_objects.items)
+
+
+def make_etag(parts):
+    return hashlib.sha1(repr(parts).encode()).hexdigest()
+
+
+def tag_token(tag):
+    key = ('response_tag', tag)
+
+    token = cache.get(key)
+
+    if token is None:
+        token = object()
+
+        cache.set(key, token, ttl=None)
+
+    return token
+
+
+def invalidate_responses(*tags):
+    '''
+    Drop the cached responses built from the given objects.
+
+    :param tags: The tags of the objects, e.g. ('post', 1).
+    '''
+
+    for tag in tags:
+        cache.delete(('response_tag', tag))
+
+
+def not_modified(etag):
+    response = make_response('', HTTPStatus.NOT_MODIFIED)
+    response.set_etag(etag)
+
+    return response
+
+
+def with_validators(response, etag, last_modified=None):
+    response.set_etag(etag)
+
+    if last_modified is not None:
+        response.last_modified = last_modified
+
+    response.cache_control.no_cache = True
+    response.vary.add('Authorization')
+
+    return response
+
+
+def conditional_response(dump, etag_parts, tags=(), last_modified=None):
+    '''
+    Answer a read with 304 Not Modified when the client has the current
+    version, without dumping it. The responses of the anonymous viewers
+    are also cached for RESPONSE_CACHE_TTL seconds, until one of the
+    objects they were built from changes.
+
+    :param dump: Callable returning the data of the response, or the
+        response itself.
+    :param etag_parts: Values identifying the version of the data.
+    :param tags: Tags of the objects the data is built from.
+    :param last_modified: The last update date of the main object.
+
+    :return: The response.
+    '''
+
+    anonymous = not current_user
+
+    # Build the tokens first, so a change during the dump drops the entry
+    tokens = {tag: tag_token(tag) for tag in tags} if anonymous else None
+
+    etag = make_etag((None if anonymous else current_user.id, etag_parts))
+
+    if request.if_none_match.contains(etag):
+        return not_modified(etag)
+
+    data = dump()
+
+    response = data if isinstance(data, current_app.response_class) else jsonify(data)
+
+    response = with_validators(response, etag, last_modified)
+
+    if anonymous:
+        entry = (response.get_data(), etag, last_modified, tokens)
+
+        cache.set(('response', request.full_path), entry, ttl=current_app.config.get('RESPONSE_CACHE_TTL'))
+
+    return response
+
+
+def cached_for_anonymous(view):
+    '''
+    Serve the cached response of a read to the anonymous viewers, while
+    none of the objects it was built from has changed. Goes under
+    jwt_required(optional=True).
+    '''
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if current_user:
+            return view(*args, **kwargs)
+
+        entry = cache.get(('response', request.full_path))
+
+        if entry is None:
+            return view(*args, **kwargs)
+
+        data, etag, last_modified, tokens = entry
+
+        if any(tag_token(tag) is not token for tag, token in tokens.items()):
+            return view(*args, **kwargs)
+
+        if request.if_none_match.contains(etag):
+            return not_modified(etag)
+
+        response = current_app.response_class(data, mimetype='application/json')
+
+        return with_validators(response, etag, last_modified)
+
+    return wrapper
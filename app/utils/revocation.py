@@ -0,0 +1,79 @@
+# heapq
+import heapq
+
+# Datetime
+from datetime import datetime
+from datetime import timezone
+
+# threading
+from threading import Lock
+
+# time
+from time import time
+
+# Models
+from app.models.token import RevokedToken
+
+
+class MemoryRevocationStore:
+    '''
+    Revoked token IDs held in the process until their expiration time, in
+    seconds since the Unix epoch. The IDs are kept in a dictionary for the
+    lookups and in a heap ordered by expiration, from which the expired
+    ones are dropped on every write, so the store only ever holds the
+    tokens that could still be used.
+    '''
+
+    def __init__(self):
+        self._expirations = {}
+        self._heap = []
+        self._lock = Lock()
+
+    def revoke(self, jti, expires_at):
+        with self._lock:
+            self._purge(time())
+
+            if jti not in self._expirations:
+                self._expirations[jti] = expires_at
+                heapq.heappush(self._heap, (expires_at, jti))
+
+    def is_revoked(self, jti):
+        expires_at = self._expirations.get(jti)
+
+        return expires_at is not None and expires_at > time()
+
+    def purge(self):
+        with self._lock:
+            return self._purge(time())
+
+    def _purge(self, now):
+        purged = 0
+
+        while self._heap and self._heap[0][0] <= now:
+            _, jti = heapq.heappop(self._heap)
+
+            del self._expirations[jti]
+
+            purged += 1
+
+        return purged
+
+    def __len__(self):
+        return len(self._expirations)
+
+
+class DatabaseRevocationStore:
+    '''
+    Revoked token IDs kept in the revoked_tokens table, shared by every
+    worker and kept across restarts. The expired rows are deleted by
+    `flask tokens purge`.
+    '''
+
+    def revoke(self, jti, expires_at):
+        RevokedToken.revoke(jti, datetime.fromtimestamp(expires_at, timezone.utc).replace(tzinfo=None))
+
+    def is_revoked(self, jti):
+        return RevokedToken.is_revoked(jti)
+
+    def purge(self):
+        return RevokedToken.purge()
@@ -0,0 +1,326 @@
+# Flask
+from flask import current_app
+
+# Marshmallow
+from marshmallow import Schema
+from marshmallow import fields
+from marshmallow import missing
+from marshmallow import utils
+from marshmallow.decorators import PRE_DUMP
+from marshmallow.decorators import POST_DUMP
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Field types whose output the compiled code builds itself
+TEXT_FIELDS = (fields.String,)
+INTEGER_FIELDS = (fields.Integer,)
+BOOLEAN_FIELDS = (fields.Boolean,)
+DATETIME_FIELDS = (fields.DateTime,)
+
+# Field types whose values orjson encodes like the json module, Method fields
+# being expected to return strings, integers and containers of them
+JSON_SAFE_FIELDS = (fields.String, fields.Integer, fields.Boolean, fields.DateTime, fields.Method)
+
+# Datetime formats serialized as numbers
+NUMERIC_DATETIME_FORMATS = ('timestamp', 'timestamp_ms')
+
+# Number of pruned variants kept per compiled schema
+MAX_VARIANTS = 128
+
+
+class CompiledSchema:
+    '''
+    Dumps like a schema, with a function generated from the schema's fields
+    instead of Marshmallow's per-field calls. The output is the same as
+    schema.dump: the hooks run as usual, the common fields are formatted by
+    the generated code and any other field falls back to its own serialize.
+
+    jsonify encodes the dump with orjson when it is installed and the
+    output would be the same bytes as Flask's, and with Flask otherwise.
+    '''
+
+    def __init__(self, schema):
+        self.schema = schema
+        self.many = schema.many
+
+        self.pre_dump = bool(schema._hooks[PRE_DUMP])
+        self.post_dump = bool(schema._hooks[POST_DUMP])
+
+        self.json_safe = is_json_safe(schema)
+        self.nested = {}
+        self.variants = {}
+
+        self.dump_one = self.compile()
+
+    def dump(self, obj, *, many=None):
+        many = self.many if many is None else bool(many)
+
+        schema = self.schema
+
+        processed = obj
+
+        if self.pre_dump:
+            processed = schema._invoke_dump_processors(PRE_DUMP, obj, many=many, original_data=obj)
+
+        if many and processed is not None:
+            result = [self.dump_one(item) for item in processed]
+        else:
+            result = self.dump_one(processed)
+
+        if self.post_dump:
+            result = schema._invoke_dump_processors(POST_DUMP, result, many=many, original_data=obj)
+
+        return result
+
+    def jsonify(self, obj, *, many=None):
+        '''
+        Dump an object into a JSON response.
+
+        :param obj: The object to serialize.
+        :param many: Whether to serialize obj as a collection.
+
+        :return: The response, byte for byte the one of jsonify(dump(obj)).
+        '''
+
+        data = self.dump(obj, many=many)
+
+        app = current_app._get_current_object()
+        provider = app.json
+
+        body = None
+
+        if orjson is not None and self.json_safe and is_compact(app, provider):
+            body = encode(data)
+
+        if body is None:
+            return provider.response(data)
+
+        return app.response_class(body, mimetype=provider.mimetype)
+
+    def select(self, fieldset):
+        '''
+        Get the serializer of a pagination response pruned to a fieldset.
+        The pruned schemas are compiled once and kept for the next requests
+        asking for the same fields.
+
+        :param fieldset: The fieldset of the items, or None for all fields.
+
+        :return: The compiled schema.
+        '''
+
+        if fieldset is None:
+            return self
+
+        only = fieldset.response_only(self.schema)
+
+        compiled = self.variants.get(only)
+
+        if compiled is None:
+            if len(self.variants) >= MAX_VARIANTS:
+                self.variants.pop(next(iter(self.variants)))
+
+            schema = type(self.schema)(only=only, many=self.many)
+
+            compiled = self.variants[only] = CompiledSchema(schema)
+
+        return compiled
+
+    def nested_dumper(self, field):
+        '''
+        Get the dump of the schema of a Nested field, compiled on first use
+        so self-referencing schemas are compiled one level at a time.
+        '''
+
+        def dump(value):
+            compiled = self.nested.get(field)
+
+            if compiled is None:
+                compiled = self.nested[field] = CompiledSchema(field.schema)
+
+            return compiled.dump(value, many=field.schema.many or field.many)
+
+        return dump
+
+    def compile(self):
+        schema = self.schema
+
+        # Objects read by key are left to Marshmallow
+        namespace = {
+            '_missing': missing,
+            '_text': utils.ensure_text_type,
+            '_get_value': utils.get_value,
+            '_get_attribute': schema.get_attribute,
+            '_serialize': schema._serialize,
+        }
+
+        lines = [
+            'def dump_one(obj):',
+            '    if hasattr(obj, "__getitem__"):',
+            '        return _serialize(obj, many=False)',
+            '    out = {}',
+        ]
+
+        custom_accessor = type(schema).get_attribute is not Schema.get_attribute
+
+        for index, (name, field) in enumerate(schema.dump_fields.items()):
+            key = field.data_key if field.data_key is not None else name
+            attribute = field.attribute or name
+
+            field_name = f'_f{index}'
+            namespace[field_name] = field
+
+            generic = (
+                custom_accessor
+                or not field._CHECK_ATTRIBUTE
+                or type(field).get_value is not fields.Field.get_value
+                or field.dump_default is not missing
+            )
+
+            if generic:
+                lines += [
+                    f'    v = {field_name}.serialize({name!r}, obj, accessor=_get_attribute)',
+                    '    if v is not _missing:',
+                    f'        out[{key!r}] = v',
+                ]
+
+                continue
+
+            if '.' in attribute:
+                lines.append(f'    v = _get_value(obj, {attribute!r}, _missing)')
+            else:
+                lines.append(f'    v = getattr(obj, {attribute!r}, _missing)')
+
+            lines += [
+                '    if v is not _missing:',
+                f'        out[{key!r}] = {self.expression(field, field_name, name, namespace)}',
+            ]
+
+        lines.append('    return out')
+
+        exec(compile('\n'.join(lines), f'<compiled {type(schema).__name__}>', 'exec'), namespace)
+
+        return namespace['dump_one']
+
+    def expression(self, field, field_name, name, namespace):
+        '''
+        Build the expression formatting the value v of a field.
+        '''
+
+        field_type = type(field)
+
+        if field_type in INTEGER_FIELDS and not field.as_string:
+            return 'None if v is None else int(v)'
+
+        if issubclass(field_type, TEXT_FIELDS) and field_type._serialize is fields.String._serialize:
+            return 'v if v.__class__ is str else (None if v is None else _text(v))'
+
+        if field_type in BOOLEAN_FIELDS:
+            return f'v if v is True or v is False or v is None else {field_name}._serialize(v, {name!r}, obj)'
+
+        if field_type in DATETIME_FIELDS:
+            data_format = field.format or field.DEFAULT_FORMAT
+
+            format_function = field.SERIALIZATION_FUNCS.get(data_format)
+
+            if format_function is not None:
+                namespace[f'{field_name}_format'] = format_function
+
+                return f'None if v is None else {field_name}_format(v)'
+
+            return f'None if v is None else v.strftime({data_format!r})'
+
+        if isinstance(field, fields.Nested):
+            namespace[f'{field_name}_dump'] = self.nested_dumper(field)
+
+            return f'None if v is None else {field_name}_dump(v)'
+
+        if isinstance(field, fields.List) and isinstance(field.inner, fields.Nested):
+            namespace[f'{field_name}_dump'] = self.nested_dumper(field.inner)
+
+            return f'None if v is None else [None if e is None else {field_name}_dump(e) for e in v]'
+
+        return f'{field_name}._serialize(v, {name!r}, obj)'
+
+
+def is_json_safe(schema, seen=None):
+    '''
+    Check if the dump of a schema and of the schemas nested in it only
+    holds values orjson encodes like the json module, e.g. no floats.
+
+    :param schema: The schema object.
+
+    :return: True if the dump can be encoded with orjson.
+    '''
+
+    seen = set() if seen is None else seen
+
+    if type(schema) in seen:
+        return True
+
+    seen.add(type(schema))
+
+    for field in schema.dump_fields.values():
+        if isinstance(field, fields.List):
+            field = field.inner
+
+        if isinstance(field, fields.Nested):
+            if not is_json_safe(field.schema, seen):
+                return False
+
+            continue
+
+        if not isinstance(field, JSON_SAFE_FIELDS):
+            return False
+
+        if isinstance(field, fields.DateTime) and (field.format or field.DEFAULT_FORMAT) in NUMERIC_DATETIME_FORMATS:
+            return False
+
+    return True
+
+
+def is_compact(app, provider):
+    '''
+    Whether Flask would encode the responses without indentation, with
+    its default encoding options.
+    '''
+
+    if (provider.compact is None and app.debug) or provider.compact is False:
+        return False
+
+    return provider.ensure_ascii and not provider.sort_keys
+
+
+def encode(data):
+    '''
+    Encode data with orjson, as Flask's jsonify would.
+
+    :param data: The dumped data.
+
+    :return: The body, or None if it would differ from Flask's.
+    '''
+
+    option = (
+        orjson.OPT_APPEND_NEWLINE
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+
+    try:
+        body = orjson.dumps(data, option=option)
+    except orjson.JSONEncodeError:
+        return None
+
+    # The json module escapes every character outside printable ASCII
+    if not body.isascii() or b'\x7f' in body:
+        return None
+
+    return body
+
+
+def compile_schema(schema):
+    return CompiledSchema(schema)
@@ -0,0 +1,54 @@
+# SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.sql import Select
+from sqlalchemy.sql import CompoundSelect
+
+# Flask-SQLAlchemy
+from flask_sqlalchemy.session import Session
+
+
+def is_read(clause):
+    '''
+    Whether a statement only reads, i.e. a SELECT not locking rows.
+    '''
+
+    if isinstance(clause, Select):
+        return clause._for_update_arg is None
+
+    return isinstance(clause, CompoundSelect)
+
+
+class RoutingSession(Session):
+    '''
+    Session sending its reads to the engine returned by the read_bind
+    function of its info, e.g. a read replica. The first write drops the
+    function, so the writes and the reads following them go to the primary.
+    '''
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        engine = super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+        read_bind = self.info.get('read_bind')
+
+        if read_bind is None or bind is not None:
+            return engine
+
+        # Flushes are writes only if they change something, see below
+        if self._flushing:
+            return engine
+
+        if not is_read(clause):
+            del self.info['read_bind']
+
+            return engine
+
+        return read_bind(engine) or engine
+
+
+@event.listens_for(RoutingSession, 'after_flush')
+def read_from_primary_after_write(session, flush_context):
+    if 'read_bind' not in session.info:
+        return
+
+    if session.new or session.deleted or any(session.is_modified(instance) for instance in session.dirty):
+        del session.info['read_bind']
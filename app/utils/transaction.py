@@ -0,0 +1,47 @@
+# contextlib
+from contextlib import contextmanager
+
+# Extensions
+from app.extensions.database import db
+
+
+@contextmanager
+def unit_of_work():
+    '''
+    Group the writes made inside the block into a single transaction. The
+    model saves and deletes only flush while it is open, and the session
+    is committed once when it closes, or rolled back if an error is raised.
+    Nested units of work join the outermost one.
+    '''
+
+    session = db.session
+
+    if session.info.get('unit_of_work'):
+        yield session
+        return
+
+    session.info['unit_of_work'] = True
+
+    try:
+        yield session
+
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.info.pop('unit_of_work', None)
+
+
+def commit():
+    '''
+    Commit the session, or only flush it inside a unit of work so the
+    writes are sent in order and committed together.
+    '''
+
+    session = db.session
+
+    if session.info.get('unit_of_work'):
+        session.flush()
+    else:
+        session.commit()
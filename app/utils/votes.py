@@ -0,0 +1,94 @@
+# SQLAlchemy
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects import sqlite
+
+# Extensions
+from app.extensions.database import db
+
+
+# Stats counter of each vote direction
+VOTE_COUNTERS = {1: 'upvotes_count', -1: 'downvotes_count'}
+
+# Inserts supporting ON CONFLICT, by dialect
+DIALECT_INSERTS = {'postgresql': postgresql.insert, 'sqlite': sqlite.insert}
+
+
+def upsert_votes(model, key, user_id, directions):
+    '''
+    Set the direction of votes of a user, creating the missing ones. Each
+    vote's previous direction is read from the statement changing it, so
+    concurrent votes are never lost nor counted twice: the new votes are
+    inserted with ON CONFLICT DO NOTHING, then the others are flipped by
+    an UPDATE matching the opposite direction, once per direction.
+
+    :param model: The vote model, e.g. PostVote.
+    :param key: The name of the column of the voted object, e.g. post_id.
+    :param user_id: The ID of the user.
+    :param directions: Dictionary of the directions keyed by the ID of
+        the voted object.
+
+    :return: Dictionary of the previous direction of the changed votes,
+        None for the new ones. Votes already in the direction are left out.
+    '''
+
+    if not directions:
+        return {}
+
+    dialect = db.session.get_bind(mapper=db.inspect(model)).dialect.name
+
+    key_column = getattr(model, key)
+
+    insert_query = DIALECT_INSERTS[dialect](model).values([
+        {'user_id': user_id, key: object_id, 'direction': direction}
+        for object_id, direction in directions.items()
+    ]).on_conflict_do_nothing().returning(key_column)
+
+    previous = {object_id: None for object_id in db.session.scalars(insert_query)}
+
+    for direction in VOTE_COUNTERS:
+        object_ids = [
+            object_id for object_id, value in directions.items()
+            if value == direction and object_id not in previous
+        ]
+
+        if not object_ids:
+            continue
+
+        # The commit expires the votes loaded in the session
+        update_query = db.update(model).where(
+            model.user_id == user_id,
+            key_column.in_(object_ids),
+            model.direction != direction
+        ).values(
+            direction=direction
+        ).returning(key_column).execution_options(synchronize_session=False)
+
+        previous.update((object_id, -direction) for object_id in db.session.scalars(update_query))
+
+    return previous
+
+
+def vote_deltas(directions, previous):
+    '''
+    Get the changes to the stats counters made by votes.
+
+    :param directions: Dictionary of the new directions keyed by the ID of
+        the voted object.
+    :param previous: Dictionary of the previous directions of the changed
+        votes, as returned by upsert_votes.
+
+    :return: Dictionary of the counter deltas keyed by the ID of the voted
+        object.
+    '''
+
+    deltas = {}
+
+    for object_id, direction in previous.items():
+        row = deltas[object_id] = {column: 0 for column in VOTE_COUNTERS.values()}
+
+        row[VOTE_COUNTERS[directions[object_id]]] += 1
+
+        if direction is not None:
+            row[VOTE_COUNTERS[direction]] -= 1
+
+    return deltas
@@ -0,0 +1,153 @@
+'''
+Cost of the viewer flags (owned_by, subscriber, moderator, ban) of a page
+of communities, for a viewer who is a member of many communities: the
+queries of a /community/ request by page size, and the membership rows
+read by the viewer context (every membership of the viewer) versus the
+membership loader (the memberships in the page).
+
+Run from the repository root:
+
+    python -m benchmarks.community_memberships [--memberships 5000] [--repeat 20]
+'''
+
+# Argparse
+import argparse
+
+# Statistics
+import statistics
+
+# Time
+import time
+
+# SQLAlchemy
+from sqlalchemy import event
+
+# Flask-JWT-Extended
+from flask_jwt_extended import create_access_token
+
+# App
+from app.app import create_app
+from app.config.testing import TestingConfig
+
+# Extensions
+from app.extensions.database import db
+
+# Models
+from app.models.user import User
+from app.models.user import UserStats
+from app.models.community import Community
+from app.models.community import CommunityStats
+from app.models.community import CommunitySubscriber
+from app.models.community import CommunityModerator
+
+# Loaders
+from app.loaders.viewer import ViewerContextLoader
+from app.loaders.community import CommunityMembershipLoader
+
+
+class BenchmarkConfig(TestingConfig):
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+
+
+def seed(n):
+    user_id = db.session.execute(
+        db.insert(User).values(username='benchmark', email='benchmark@example.com', password='x').returning(User.id)
+    ).scalar()
+
+    db.session.execute(db.insert(UserStats).values(user_id=user_id))
+
+    db.session.execute(
+        db.insert(Community),
+        [{'name': f'community_{i}', 'user_id': user_id} for i in range(n)]
+    )
+
+    db.session.execute(db.insert(CommunityStats).from_select(['community_id'], db.select(Community.id)))
+
+    db.session.execute(
+        db.insert(CommunitySubscriber).from_select(['user_id', 'community_id'], db.select(db.literal(user_id), Community.id))
+    )
+
+    db.session.execute(
+        db.insert(CommunityModerator).from_select(
+            ['user_id', 'community_id'],
+            db.select(db.literal(user_id), Community.id).where(Community.id % 10 == 0)
+        )
+    )
+
+    db.session.commit()
+
+    return db.session.get(User, user_id)
+
+
+def count_queries(func):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+    try:
+        func()
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+    return len(statements)
+
+
+def measure(func, repeat):
+    timings = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+
+        func()
+
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--memberships', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=20)
+    options = parser.parse_args()
+
+    app = create_app(BenchmarkConfig)
+
+    with app.app_context():
+        db.create_all()
+
+        user = seed(options.memberships)
+
+        headers = {'Authorization': f'Bearer {create_access_token(identity=str(user.id))}'}
+
+        client = app.test_client()
+
+        # Warm up the statement and count caches of the listing
+        client.get('/community/', headers=headers)
+
+        print(f'{"page size":>10}{"queries":>10}{"context rows":>14}{"loader rows":>13}{"context (ms)":>14}{"loader (ms)":>13}')
+
+        for per_page in (10, 50, 100):
+            queries = count_queries(lambda: client.get(f'/community/?per_page={per_page}', headers=headers))
+
+            communities = db.session.scalars(db.select(Community).limit(per_page)).all()
+
+            context = ViewerContextLoader.query(user)
+            memberships = CommunityMembershipLoader.load(user, communities)
+
+            context_rows = len(context.subscribed_ids) + len(context.moderated_ids) + len(context.banned_ids)
+            loader_rows = sum(membership.subscriber + membership.moderator + membership.ban for membership in memberships.values())
+
+            context_time = measure(lambda: ViewerContextLoader.query(user), options.repeat)
+            loader_time = measure(lambda: CommunityMembershipLoader.load(user, communities), options.repeat)
+
+            print(f'{per_page:>10}{queries:>10}{context_rows:>14}{loader_rows:>13}{context_time:>14.2f}{loader_time:>13.2f}')
+
+        db.drop_all()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+'''
+Login throughput under concurrent requests, hashing the passwords on the
+request threads (PASSWORD_HASH_WORKERS = 0) versus in the hashing pool.
+Requests turned away by PASSWORD_HASH_MAX_PENDING are counted apart.
+
+Run from the repository root:
+
+    python -m benchmarks.login [--threads 16] [--logins 200] [--workers 4] [--max-pending 64]
+'''
+
+# Argparse
+import argparse
+
+# OS
+import os
+
+# Statistics
+import statistics
+
+# Tempfile
+import tempfile
+
+# Time
+import time
+
+# Concurrent
+from concurrent.futures import ThreadPoolExecutor
+
+# App
+from app.app import create_app
+from app.config.testing import TestingConfig
+
+# Extensions
+from app.extensions.database import db
+
+# Models
+from app.models.user import User
+
+# Utils
+from app.utils.password import hash_password
+
+
+PASSWORD = 'Password1234.'
+
+
+def make_config(uri, workers, max_pending):
+    class BenchmarkConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = uri
+        PASSWORD_HASH_WORKERS = workers
+        PASSWORD_HASH_MAX_PENDING = max_pending
+
+    return BenchmarkConfig
+
+
+def run(app, threads, logins):
+    client = app.test_client()
+
+    def log_in(_):
+        start = time.perf_counter()
+
+        response = client.post('/auth/login', json={'username': 'benchmark', 'password': PASSWORD})
+
+        return response.status_code, (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        results = list(executor.map(log_in, range(logins)))
+
+    elapsed = time.perf_counter() - start
+
+    timings = sorted(timing for status, timing in results if status == 200)
+    rejected = sum(1 for status, _ in results if status == 503)
+
+    return {
+        'throughput': len(timings) / elapsed,
+        'p50': statistics.median(timings) if timings else 0,
+        'p99': timings[int(len(timings) * 0.99) - 1] if timings else 0,
+        'rejected': rejected,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--logins', type=int, default=200)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--max-pending', type=int, default=64)
+    options = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        uri = f'sqlite:///{os.path.join(directory, "benchmark.db")}'
+
+        print(f'{"hashing":<12}{"logins/s":>10}{"p50 (ms)":>10}{"p99 (ms)":>10}{"503s":>8}')
+
+        for name, workers in (('inline', 0), ('pool', options.workers)):
+            app = create_app(make_config(uri, workers, options.max_pending))
+
+            with app.app_context():
+                db.create_all()
+
+                if db.session.scalar(db.select(User).where(User.username == 'benchmark')) is None:
+                    User(username='benchmark', email='benchmark@example.com', password=hash_password(PASSWORD)).save()
+
+            result = run(app, options.threads, options.logins)
+
+            app.extensions['passwords'].shutdown()
+
+            print(f'{name:<12}{result["throughput"]:>10.1f}{result["p50"]:>10.1f}{result["p99"]:>10.1f}{result["rejected"]:>8}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+'''
+Per-page latency of the listing pagination, counting every page with
+COUNT(*) (db.paginate) versus serving the total from the stats tables or
+the count cache (the declarative listings of app.listings).
+
+Run from the repository root:
+
+    python -m benchmarks.pagination [--posts 100000] [--repeat 20]
+'''
+
+# Argparse
+import argparse
+
+# Datetime
+from datetime import datetime
+from datetime import timedelta
+
+# Statistics
+import statistics
+
+# Time
+import time
+
+# App
+from app.app import create_app
+from app.config.testing import TestingConfig
+
+# Extensions
+from app.extensions.database import db
+
+# Models
+from app.models.user import User
+from app.models.user import UserStats
+from app.models.community import Community
+from app.models.community import CommunityStats
+from app.models.post import Post
+from app.models.post import PostStats
+
+# Listings
+from app.listings.post import all_posts
+from app.listings.post import community_posts
+from app.listings.post import post_load_options
+
+
+class BenchmarkConfig(TestingConfig):
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+
+
+def seed(n):
+    user_id = db.session.execute(
+        db.insert(User).values(username='benchmark', email='benchmark@example.com', password='x').returning(User.id)
+    ).scalar()
+
+    db.session.execute(db.insert(UserStats).values(user_id=user_id, posts_count=n))
+
+    community_id = db.session.execute(
+        db.insert(Community).values(name='benchmark', user_id=user_id).returning(Community.id)
+    ).scalar()
+
+    db.session.execute(db.insert(CommunityStats).values(community_id=community_id, posts_count=n))
+
+    # Posts a second apart, as ties in the sort column are rare in practice
+    start = datetime.now() - timedelta(seconds=n)
+
+    db.session.execute(
+        db.insert(Post),
+        [
+            {
+                'title': f'Post {i}',
+                'content': 'Content',
+                'user_id': user_id,
+                'community_id': community_id,
+                'created_at': start + timedelta(seconds=i)
+            }
+            for i in range(n)
+        ]
+    )
+
+    db.session.execute(
+        db.insert(PostStats).from_select(['post_id'], db.select(Post.id))
+    )
+
+    db.session.commit()
+
+    return db.session.get(Community, community_id)
+
+
+def measure(func, repeat):
+    timings = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+
+        func()
+
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--posts', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=20)
+    options = parser.parse_args()
+
+    app = create_app(BenchmarkConfig)
+
+    with app.test_request_context():
+        db.create_all()
+
+        community = seed(options.posts)
+
+        listings = {
+            '/post/': (
+                db.select(Post).join(PostStats, Post.id == PostStats.post_id),
+                lambda args: all_posts.paginate(args)
+            ),
+            '/community/<name>/posts': (
+                db.select(Post).join(PostStats, Post.id == PostStats.post_id).where(Post.community_id == community.id),
+                lambda args: community_posts.paginate(
+                    args,
+                    {'community_id': community.id},
+                    community=community,
+                    total=lambda: community.stats.posts_count
+                )
+            ),
+        }
+
+        last_page = options.posts // 10
+
+        print(f'{"listing":<26}{"page":>8}{"count (ms)":>14}{"cached (ms)":>14}')
+
+        for name, (query, listing) in listings.items():
+            for page in (1, 10, 100, last_page):
+                args = {'page': page, 'per_page': 10}
+
+                before = measure(
+                    lambda: db.paginate(query.options(*post_load_options()).order_by(Post.created_at.desc()), page=page, per_page=10, error_out=False),
+                    options.repeat
+                )
+
+                after = measure(
+                    lambda: listing(args),
+                    options.repeat
+                )
+
+                print(f'{name:<26}{page:>8}{before:>14.2f}{after:>14.2f}')
+
+        db.drop_all()
+
+
+if __name__ == '__main__':
+    main()
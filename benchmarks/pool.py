@@ -0,0 +1,99 @@
+'''
+Connection pool under load: threads each holding a connection for a while,
+more of them than the pool has connections, and the checkout wait, peak
+saturation, timeouts and churn recorded by the pool for each pool size.
+
+Run from the repository root:
+
+    python -m benchmarks.pool [--threads 20] [--checkouts 10] [--hold 0.01]
+'''
+
+# Argparse
+import argparse
+
+# OS
+import os
+
+# Tempfile
+import tempfile
+
+# threading
+from threading import Thread
+
+# Time
+import time
+
+# App
+from app.app import create_app
+from app.config.testing import TestingConfig
+
+# Extensions
+from app.extensions.database import db
+from app.extensions.pool import pools
+
+
+def run(pool_size, options, path):
+    class BenchmarkConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{path}'
+        DATABASE_POOL_SIZE = pool_size
+        DATABASE_POOL_MAX_OVERFLOW = 0
+
+    app = create_app(BenchmarkConfig)
+
+    def work():
+        for _ in range(options.checkouts):
+            with app.app_context():
+                db.session.execute(db.select(1))
+
+                time.sleep(options.hold)
+
+                db.session.remove()
+
+    threads = [Thread(target=work) for _ in range(options.threads)]
+
+    start = time.perf_counter()
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    elapsed = time.perf_counter() - start
+
+    with app.app_context():
+        stats = pools.stats()[None]
+
+        db.engine.dispose()
+
+    return elapsed, stats
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--threads', type=int, default=20)
+    parser.add_argument('--checkouts', type=int, default=10)
+    parser.add_argument('--hold', type=float, default=0.01)
+    options = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'pool.db')
+
+    print(f'{"pool size":>10}{"total (s)":>11}{"avg wait (ms)":>15}{"max wait (ms)":>15}{"peak":>6}{"timeouts":>10}{"connects":>10}')
+
+    for pool_size in (2, 5, 10, 20):
+        elapsed, stats = run(pool_size, options, path)
+
+        average = stats['checkout_wait'] / stats['checkouts'] * 1000
+
+        print(
+            f'{pool_size:>10}{elapsed:>11.2f}{average:>15.2f}{stats["checkout_wait_max"] * 1000:>15.2f}'
+            f'{stats["peak_checked_out"]:>6}{stats["timeouts"]:>10}{stats["connects"]:>10}'
+        )
+
+    os.remove(path)
+    os.rmdir(directory)
+
+
+if __name__ == '__main__':
+    main()
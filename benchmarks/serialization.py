@@ -0,0 +1,138 @@
+'''
+Dump throughput of the list responses, serializing a page with the
+Marshmallow schema and Flask's JSON provider versus the compiled
+serializer, with orjson when it is installed.
+
+Run from the repository root:
+
+    python -m benchmarks.serialization [--per-page 50] [--repeat 200]
+'''
+
+# Argparse
+import argparse
+
+# Statistics
+import statistics
+
+# Time
+import time
+
+# Flask-JWT-Extended
+from flask_jwt_extended import verify_jwt_in_request
+
+# App
+from app.app import create_app
+from app.config.testing import TestingConfig
+
+# Extensions
+from app.extensions.database import db
+
+# Models
+from app.models.user import User
+from app.models.user import UserStats
+from app.models.community import Community
+from app.models.community import CommunityStats
+from app.models.post import Post
+from app.models.post import PostStats
+from app.models.comment import Comment
+from app.models.comment import CommentStats
+
+# Schemas
+from app.schemas.user import user_pagination_response_schema
+from app.schemas.user import user_pagination_response_serializer
+from app.schemas.community import community_pagination_response_schema
+from app.schemas.community import community_pagination_response_serializer
+from app.schemas.post import post_pagination_response_schema
+from app.schemas.post import post_pagination_response_serializer
+from app.schemas.comment import comment_pagination_response_schema
+from app.schemas.comment import comment_pagination_response_serializer
+
+# Utils
+from app.utils import serializer
+
+
+class BenchmarkConfig(TestingConfig):
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+
+
+def seed(n):
+    db.session.execute(
+        db.insert(User),
+        [{'username': f'user_{i}', 'email': f'user_{i}@example.com', 'password': 'x'} for i in range(n)]
+    )
+    db.session.execute(db.insert(UserStats).from_select(['user_id'], db.select(User.id)))
+
+    db.session.execute(
+        db.insert(Community),
+        [{'name': f'community_{i}', 'description': 'Description', 'user_id': i + 1} for i in range(n)]
+    )
+    db.session.execute(db.insert(CommunityStats).from_select(['community_id'], db.select(Community.id)))
+
+    db.session.execute(
+        db.insert(Post),
+        [{'title': f'Post {i}', 'content': 'Content ' * 20, 'user_id': i + 1, 'community_id': i + 1} for i in range(n)]
+    )
+    db.session.execute(db.insert(PostStats).from_select(['post_id'], db.select(Post.id)))
+
+    db.session.execute(
+        db.insert(Comment),
+        [{'content': 'Comment ' * 10, 'user_id': i + 1, 'post_id': 1} for i in range(n)]
+    )
+    db.session.execute(db.insert(CommentStats).from_select(['comment_id'], db.select(Comment.id)))
+
+    db.session.commit()
+
+
+def measure(func, repeat):
+    timings = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+
+        func()
+
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--per-page', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=200)
+    options = parser.parse_args()
+
+    app = create_app(BenchmarkConfig)
+
+    with app.test_request_context():
+        verify_jwt_in_request(optional=True)
+
+        db.create_all()
+
+        seed(options.per_page)
+
+        listings = {
+            'users': (User, user_pagination_response_schema, user_pagination_response_serializer),
+            'communities': (Community, community_pagination_response_schema, community_pagination_response_serializer),
+            'posts': (Post, post_pagination_response_schema, post_pagination_response_serializer),
+            'comments': (Comment, comment_pagination_response_schema, comment_pagination_response_serializer),
+        }
+
+        print(f'orjson: {"installed" if serializer.orjson is not None else "not installed"}')
+        print(f'{"listing":<14}{"marshmallow (ms)":>18}{"compiled (ms)":>16}{"speedup":>10}')
+
+        for name, (model, schema, compiled) in listings.items():
+            paginated_objects = db.paginate(db.select(model).order_by(model.id), page=1, per_page=options.per_page)
+
+            assert compiled.jsonify(paginated_objects).get_data() == app.json.response(schema.dump(paginated_objects)).get_data()
+
+            before = measure(lambda: app.json.response(schema.dump(paginated_objects)), options.repeat)
+            after = measure(lambda: compiled.jsonify(paginated_objects), options.repeat)
+
+            print(f'{name:<14}{before:>18.2f}{after:>16.2f}{before / after:>9.1f}x')
+
+        db.drop_all()
+
+
+if __name__ == '__main__':
+    main()
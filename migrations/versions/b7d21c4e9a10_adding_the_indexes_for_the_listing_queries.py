@@ -0,0 +1,162 @@
+"""Adding the indexes for the listing queries
+
+Revision ID: b7d21c4e9a10
+Revises: 32b90642b62f
+Create Date: 2026-10-18 10:12:41.503377
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7d21c4e9a10'
+down_revision = '32b90642b62f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('post_bookmarks', schema=None) as batch_op:
+        batch_op.create_index('ix_post_bookmarks_user_id_created_at', ['user_id', 'created_at'], unique=False)
+        batch_op.create_index('ix_post_bookmarks_post_id', ['post_id'], unique=False)
+
+    with op.batch_alter_table('post_votes', schema=None) as batch_op:
+        batch_op.create_index('ix_post_votes_user_id_direction_created_at', ['user_id', 'direction', 'created_at'], unique=False)
+        batch_op.create_index('ix_post_votes_post_id_direction_created_at', ['post_id', 'direction', 'created_at'], unique=False)
+
+    with op.batch_alter_table('post_stats', schema=None) as batch_op:
+        batch_op.create_index('ix_post_stats_upvotes_count', ['upvotes_count'], unique=False)
+        batch_op.create_index('ix_post_stats_comments_count', ['comments_count'], unique=False)
+
+    with op.batch_alter_table('posts', schema=None) as batch_op:
+        batch_op.create_index('ix_posts_created_at', ['created_at'], unique=False)
+        batch_op.create_index('ix_posts_community_id_created_at', ['community_id', 'created_at'], unique=False)
+        batch_op.create_index('ix_posts_user_id_created_at', ['user_id', 'created_at'], unique=False)
+
+    with op.batch_alter_table('comment_bookmarks', schema=None) as batch_op:
+        batch_op.create_index('ix_comment_bookmarks_user_id_created_at', ['user_id', 'created_at'], unique=False)
+        batch_op.create_index('ix_comment_bookmarks_comment_id', ['comment_id'], unique=False)
+
+    with op.batch_alter_table('comment_votes', schema=None) as batch_op:
+        batch_op.create_index('ix_comment_votes_user_id_direction_created_at', ['user_id', 'direction', 'created_at'], unique=False)
+        batch_op.create_index('ix_comment_votes_comment_id_direction_created_at', ['comment_id', 'direction', 'created_at'], unique=False)
+
+    with op.batch_alter_table('comment_stats', schema=None) as batch_op:
+        batch_op.create_index('ix_comment_stats_upvotes_count', ['upvotes_count'], unique=False)
+
+    with op.batch_alter_table('comments', schema=None) as batch_op:
+        batch_op.create_index('ix_comments_created_at', ['created_at'], unique=False)
+        batch_op.create_index('ix_comments_user_id_created_at', ['user_id', 'created_at'], unique=False)
+        batch_op.create_index('ix_comments_comment_id', ['comment_id'], unique=False)
+        batch_op.create_index(
+            'ix_comments_post_id_created_at_root',
+            ['post_id', 'created_at'],
+            unique=False,
+            postgresql_where=sa.text('comment_id IS NULL'),
+            sqlite_where=sa.text('comment_id IS NULL')
+        )
+
+    with op.batch_alter_table('community_subscribers', schema=None) as batch_op:
+        batch_op.create_index('ix_community_subscribers_community_id_created_at', ['community_id', 'created_at'], unique=False)
+        batch_op.create_index('ix_community_subscribers_user_id_created_at', ['user_id', 'created_at'], unique=False)
+
+    with op.batch_alter_table('community_moderators', schema=None) as batch_op:
+        batch_op.create_index('ix_community_moderators_community_id_created_at', ['community_id', 'created_at'], unique=False)
+
+    with op.batch_alter_table('community_bans', schema=None) as batch_op:
+        batch_op.create_index('ix_community_bans_community_id_created_at', ['community_id', 'created_at'], unique=False)
+
+    with op.batch_alter_table('community_stats', schema=None) as batch_op:
+        batch_op.create_index('ix_community_stats_subscribers_count', ['subscribers_count'], unique=False)
+        batch_op.create_index('ix_community_stats_posts_count', ['posts_count'], unique=False)
+        batch_op.create_index('ix_community_stats_comments_count', ['comments_count'], unique=False)
+
+    with op.batch_alter_table('communities', schema=None) as batch_op:
+        batch_op.create_index('ix_communities_created_at', ['created_at'], unique=False)
+
+    with op.batch_alter_table('follows', schema=None) as batch_op:
+        batch_op.create_index('ix_follows_follower_id_created_at', ['follower_id', 'created_at'], unique=False)
+        batch_op.create_index('ix_follows_followed_id_created_at', ['followed_id', 'created_at'], unique=False)
+
+    with op.batch_alter_table('blocks', schema=None) as batch_op:
+        batch_op.create_index('ix_blocks_blocked_id_blocker_id', ['blocked_id', 'blocker_id'], unique=False)
+
+    with op.batch_alter_table('user_stats', schema=None) as batch_op:
+        batch_op.create_index('ix_user_stats_followers_count', ['followers_count'], unique=False)
+        batch_op.create_index('ix_user_stats_communities_count', ['communities_count'], unique=False)
+        batch_op.create_index('ix_user_stats_posts_count', ['posts_count'], unique=False)
+        batch_op.create_index('ix_user_stats_comments_count', ['comments_count'], unique=False)
+
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.create_index('ix_users_created_at', ['created_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index('ix_users_created_at')
+
+    with op.batch_alter_table('user_stats', schema=None) as batch_op:
+        batch_op.drop_index('ix_user_stats_comments_count')
+        batch_op.drop_index('ix_user_stats_posts_count')
+        batch_op.drop_index('ix_user_stats_communities_count')
+        batch_op.drop_index('ix_user_stats_followers_count')
+
+    with op.batch_alter_table('blocks', schema=None) as batch_op:
+        batch_op.drop_index('ix_blocks_blocked_id_blocker_id')
+
+    with op.batch_alter_table('follows', schema=None) as batch_op:
+        batch_op.drop_index('ix_follows_followed_id_created_at')
+        batch_op.drop_index('ix_follows_follower_id_created_at')
+
+    with op.batch_alter_table('communities', schema=None) as batch_op:
+        batch_op.drop_index('ix_communities_created_at')
+
+    with op.batch_alter_table('community_stats', schema=None) as batch_op:
+        batch_op.drop_index('ix_community_stats_comments_count')
+        batch_op.drop_index('ix_community_stats_posts_count')
+        batch_op.drop_index('ix_community_stats_subscribers_count')
+
+    with op.batch_alter_table('community_bans', schema=None) as batch_op:
+        batch_op.drop_index('ix_community_bans_community_id_created_at')
+
+    with op.batch_alter_table('community_moderators', schema=None) as batch_op:
+        batch_op.drop_index('ix_community_moderators_community_id_created_at')
+
+    with op.batch_alter_table('community_subscribers', schema=None) as batch_op:
+        batch_op.drop_index('ix_community_subscribers_user_id_created_at')
+        batch_op.drop_index('ix_community_subscribers_community_id_created_at')
+
+    with op.batch_alter_table('comments', schema=None) as batch_op:
+        batch_op.drop_index('ix_comments_post_id_created_at_root')
+        batch_op.drop_index('ix_comments_comment_id')
+        batch_op.drop_index('ix_comments_user_id_created_at')
+        batch_op.drop_index('ix_comments_created_at')
+
+    with op.batch_alter_table('comment_stats', schema=None) as batch_op:
+        batch_op.drop_index('ix_comment_stats_upvotes_count')
+
+    with op.batch_alter_table('comment_votes', schema=None) as batch_op:
+        batch_op.drop_index('ix_comment_votes_comment_id_direction_created_at')
+        batch_op.drop_index('ix_comment_votes_user_id_direction_created_at')
+
+    with op.batch_alter_table('comment_bookmarks', schema=None) as batch_op:
+        batch_op.drop_index('ix_comment_bookmarks_comment_id')
+        batch_op.drop_index('ix_comment_bookmarks_user_id_created_at')
+
+    with op.batch_alter_table('posts', schema=None) as batch_op:
+        batch_op.drop_index('ix_posts_user_id_created_at')
+        batch_op.drop_index('ix_posts_community_id_created_at')
+        batch_op.drop_index('ix_posts_created_at')
+
+    with op.batch_alter_table('post_stats', schema=None) as batch_op:
+        batch_op.drop_index('ix_post_stats_comments_count')
+        batch_op.drop_index('ix_post_stats_upvotes_count')
+
+    with op.batch_alter_table('post_votes', schema=None) as batch_op:
+        batch_op.drop_index('ix_post_votes_post_id_direction_created_at')
+        batch_op.drop_index('ix_post_votes_user_id_direction_created_at')
+
+    with op.batch_alter_table('post_bookmarks', schema=None) as batch_op:
+        batch_op.drop_index('ix_post_bookmarks_post_id')
+        batch_op.drop_index('ix_post_bookmarks_user_id_created_at')
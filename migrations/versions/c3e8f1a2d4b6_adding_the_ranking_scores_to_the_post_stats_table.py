@@ -0,0 +1,33 @@
+"""Adding the ranking scores to the post stats table
+
+Revision ID: c3e8f1a2d4b6
+Revises: b7d21c4e9a10
+Create Date: 2026-10-18 16:41:09.218734
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3e8f1a2d4b6'
+down_revision = 'b7d21c4e9a10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The scores of the existing posts are filled in by `flask posts rerank`
+    with op.batch_alter_table('post_stats', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('hot_score', sa.Float(), nullable=True, server_default=sa.text('0')))
+        batch_op.add_column(sa.Column('best_score', sa.Float(), nullable=True, server_default=sa.text('0')))
+        batch_op.create_index('ix_post_stats_hot_score', ['hot_score'], unique=False)
+        batch_op.create_index('ix_post_stats_best_score', ['best_score'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('post_stats', schema=None) as batch_op:
+        batch_op.drop_index('ix_post_stats_best_score')
+        batch_op.drop_index('ix_post_stats_hot_score')
+        batch_op.drop_column('best_score')
+        batch_op.drop_column('hot_score')
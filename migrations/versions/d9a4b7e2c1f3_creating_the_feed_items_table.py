@@ -0,0 +1,39 @@
+"""Creating the feed items table
+
+Revision ID: d9a4b7e2c1f3
+Revises: c3e8f1a2d4b6
+Create Date: 2026-10-18 18:03:27.641095
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd9a4b7e2c1f3'
+down_revision = 'c3e8f1a2d4b6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The feeds of the existing users are filled in by `flask feed rebuild`
+    op.create_table('feed_items',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('post_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['post_id'], ['posts.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('user_id', 'post_id')
+    )
+    with op.batch_alter_table('feed_items', schema=None) as batch_op:
+        batch_op.create_index('ix_feed_items_user_id_created_at', ['user_id', 'created_at'], unique=False)
+        batch_op.create_index('ix_feed_items_post_id', ['post_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('feed_items', schema=None) as batch_op:
+        batch_op.drop_index('ix_feed_items_post_id')
+        batch_op.drop_index('ix_feed_items_user_id_created_at')
+
+    op.drop_table('feed_items')
@@ -0,0 +1,33 @@
+"""Creating the revoked tokens table
+
+Revision ID: e4b8c2d7f1a5
+Revises: d9a4b7e2c1f3
+Create Date: 2026-10-18 19:12:45.308214
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4b8c2d7f1a5'
+down_revision = 'd9a4b7e2c1f3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('revoked_tokens',
+    sa.Column('jti', sa.String(length=36), nullable=False),
+    sa.Column('expires_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('jti')
+    )
+    with op.batch_alter_table('revoked_tokens', schema=None) as batch_op:
+        batch_op.create_index('ix_revoked_tokens_expires_at', ['expires_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('revoked_tokens', schema=None) as batch_op:
+        batch_op.drop_index('ix_revoked_tokens_expires_at')
+
+    op.drop_table('revoked_tokens')
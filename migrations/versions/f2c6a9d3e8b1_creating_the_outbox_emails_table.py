@@ -0,0 +1,41 @@
+"""Creating the outbox emails table
+
+Revision ID: f2c6a9d3e8b1
+Revises: e4b8c2d7f1a5
+Create Date: 2026-10-18 19:48:03.517620
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2c6a9d3e8b1'
+down_revision = 'e4b8c2d7f1a5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('outbox_emails',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('recipient', sa.String(length=255), nullable=False),
+    sa.Column('subject', sa.String(length=255), nullable=False),
+    sa.Column('html', sa.Text(), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('next_attempt_at', sa.DateTime(), nullable=False),
+    sa.Column('sent_at', sa.DateTime(), nullable=True),
+    sa.Column('failed_at', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('outbox_emails', schema=None) as batch_op:
+        batch_op.create_index('ix_outbox_emails_next_attempt_at', ['next_attempt_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('outbox_emails', schema=None) as batch_op:
+        batch_op.drop_index('ix_outbox_emails_next_attempt_at')
+
+    op.drop_table('outbox_emails')
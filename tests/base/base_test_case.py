@@ -5,8 +5,10 @@ from app.config.testing import TestingConfig
 from app.extensions.database import db
 
 class BaseTestCase(unittest.TestCase):
+    config_class = TestingConfig
+
     def setUp(self) -> None:
-        self.app = create_app(TestingConfig)
+        self.app = create_app(self.config_class)
         self.app_context = self.app.app_context()
         self.app_context.push()
         
@@ -0,0 +1,123 @@
+# Base
+from tests.base.base_test_case import BaseTestCase
+
+# Factories
+from tests.factories.user_factory import UserFactory
+from tests.factories.post_factory import PostFactory
+from tests.factories.post_vote_factory import PostVoteFactory
+
+# Extensions
+from app.extensions.database import db
+from app.extensions.counters import counters
+
+# Models
+from app.models.post import PostVote
+
+# Utils
+from app.utils.counters import CounterBuffer
+from app.utils.transaction import unit_of_work
+from tests.utils.queries import capture_queries
+
+
+class TestWriteBehind(BaseTestCase):
+    def enable_write_behind(self, interval):
+        self.app.extensions['counters'] = CounterBuffer(interval=interval)
+
+    def test_write_behind_coalesces_updates(self):
+        # Flush at the end of every transaction
+        self.enable_write_behind(interval=0)
+
+        # Create a post and some voters
+        post = PostFactory()
+        users = UserFactory.create_batch(3)
+
+        # Vote in one transaction
+        with capture_queries() as statements:
+            with unit_of_work():
+                for user in users:
+                    PostVote(user=user, post=post, direction=1).save()
+
+        # Assert the three votes were written in a single update of the stats row
+        updates = [statement for statement in statements if statement.startswith('UPDATE post_stats')]
+
+        self.assertEqual(len(updates), 1)
+
+        # Assert the counters
+        self.assertEqual(post.stats.upvotes_count, 3)
+        self.assertEqual(post.stats.downvotes_count, 0)
+
+    def test_write_behind_waits_for_interval(self):
+        # Flush once an hour
+        self.enable_write_behind(interval=3600)
+
+        # Create a post
+        post = PostFactory()
+
+        # Upvote the post
+        PostVoteFactory(post=post, direction=1)
+
+        # Assert the change is still buffered
+        self.assertEqual(post.stats.upvotes_count, 0)
+
+        # Flush the buffer
+        counters.flush()
+        db.session.commit()
+
+        # Assert the change was written
+        self.assertEqual(post.stats.upvotes_count, 1)
+
+    def test_write_behind_direction_change(self):
+        # Flush at the end of every transaction
+        self.enable_write_behind(interval=0)
+
+        # Create a downvote
+        vote = PostVoteFactory(direction=-1)
+
+        # Change it to an upvote
+        vote.direction = 1
+        vote.save()
+
+        # Assert the counters
+        self.assertEqual(vote.post.stats.upvotes_count, 1)
+        self.assertEqual(vote.post.stats.downvotes_count, 0)
+
+    def test_write_behind_vote_batch(self):
+        # Flush once an hour
+        self.enable_write_behind(interval=3600)
+
+        # Create posts and a voter
+        posts = PostFactory.create_batch(2)
+        user = UserFactory()
+
+        # Vote on the posts at once
+        with unit_of_work():
+            PostVote.upsert_all(user, {post.id: 1 for post in posts})
+
+        # Assert the changes are still buffered
+        self.assertEqual([post.stats.upvotes_count for post in posts], [0, 0])
+
+        # Flush the buffer
+        counters.flush()
+        db.session.commit()
+
+        # Assert the changes were written
+        self.assertEqual([post.stats.upvotes_count for post in posts], [1, 1])
+
+    def test_write_behind_discards_rolled_back_changes(self):
+        # Flush at the end of every transaction
+        self.enable_write_behind(interval=0)
+
+        # Create a post and a voter
+        post = PostFactory()
+        user = UserFactory()
+
+        # Vote and roll back
+        db.session.add(PostVote(user=user, post=post, direction=1))
+        db.session.flush()
+        db.session.rollback()
+
+        # Commit an unrelated change
+        UserFactory()
+
+        # Assert the rolled back vote was not counted
+        self.assertEqual(post.stats.upvotes_count, 0)
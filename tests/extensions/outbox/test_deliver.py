@@ -0,0 +1,119 @@
+# time
+from time import monotonic
+from time import sleep
+
+# Base
+from tests.base.base_test_case import BaseTestCase
+
+# Extensions
+from app.extensions.database import db
+from app.extensions.email import mail
+from app.extensions.outbox import outbox
+
+# Models
+from app.models.email import OutboxEmail
+from app.models.email import utcnow
+
+# Utils
+from app.utils.email import send_email
+from app.utils.outbox import OutboxWorkers
+
+
+class TestDeliver(BaseTestCase):
+    def refuse_connections(self):
+        state = self.app.extensions['mail']
+
+        state.suppress = False
+        state.use_ssl = False
+        state.server = '127.0.0.1'
+        state.port = 1
+
+    def test_send_email_queues(self):
+        # Send an email
+        with mail.record_messages() as messages:
+            send_email('user@example.com', 'Subject', '<p>Body</p>')
+
+        # Assert the email was queued instead of sent
+        self.assertEqual(len(messages), 0)
+        self.assertEqual(OutboxEmail.stats(), {'pending': 1, 'sent': 0, 'failed': 0})
+
+    def test_deliver_batch(self):
+        # Queue some emails
+        for i in range(3):
+            send_email(f'user_{i}@example.com', 'Subject', '<p>Body</p>')
+
+        # Deliver the outbox
+        with mail.record_messages() as messages:
+            claimed = outbox.drain()
+
+        # Assert the emails were sent in a single batch
+        self.assertEqual(claimed, 3)
+        self.assertEqual(len(messages), 3)
+        self.assertEqual(outbox.metrics.snapshot()['batches'], 1)
+        self.assertEqual(OutboxEmail.stats(), {'pending': 0, 'sent': 3, 'failed': 0})
+
+    def test_deliver_retries_with_backoff(self):
+        # Queue an email
+        send_email('user@example.com', 'Subject', '<p>Body</p>')
+
+        # Fail to connect to the SMTP server
+        self.refuse_connections()
+
+        before = utcnow()
+
+        self.assertEqual(outbox.deliver(), 1)
+
+        # Assert the email was scheduled for a retry
+        email = db.session.scalar(db.select(OutboxEmail))
+
+        self.assertEqual(email.attempts, 1)
+        self.assertIsNotNone(email.last_error)
+        self.assertGreaterEqual((email.next_attempt_at - before).total_seconds(), 30)
+
+        metrics = outbox.metrics.snapshot()
+
+        self.assertEqual(metrics['connection_errors'], 1)
+        self.assertEqual(metrics['retried'], 1)
+
+        # Assert the email is not due yet
+        self.assertEqual(outbox.deliver(), 0)
+
+    def test_deliver_gives_up(self):
+        # Give up after the first attempt
+        self.app.config['MAIL_OUTBOX_MAX_ATTEMPTS'] = 1
+
+        # Queue an email
+        send_email('user@example.com', 'Subject', '<p>Body</p>')
+
+        # Fail to connect to the SMTP server
+        self.refuse_connections()
+
+        outbox.deliver()
+
+        # Assert the email was given up on
+        self.assertEqual(outbox.metrics.snapshot()['failed'], 1)
+        self.assertEqual(OutboxEmail.stats(), {'pending': 0, 'sent': 0, 'failed': 1})
+
+    def test_workers(self):
+        # Queue some emails
+        for i in range(5):
+            send_email(f'user_{i}@example.com', 'Subject', '<p>Body</p>')
+
+        # Start the workers with small batches
+        self.app.config['MAIL_OUTBOX_BATCH_SIZE'] = 2
+
+        workers = OutboxWorkers(self.app, outbox.deliver, workers=2, poll_interval=0.01)
+
+        with mail.record_messages() as messages:
+            workers.start()
+
+            deadline = monotonic() + 10
+
+            while len(messages) < 5 and monotonic() < deadline:
+                sleep(0.01)
+
+            workers.stop()
+
+        # Assert every email was sent once
+        self.assertEqual(sorted(message.recipients[0] for message in messages), [f'user_{i}@example.com' for i in range(5)])
+        self.assertEqual(OutboxEmail.stats()['sent'], 5)
@@ -0,0 +1,79 @@
+# Base
+from tests.base.base_test_case import BaseTestCase
+
+# Factories
+from tests.factories.user_factory import UserFactory
+
+# Extensions
+from app.extensions.passwords import passwords
+
+# Utils
+from app.utils.password import HashingPool
+from app.utils.password import hash_password
+from app.utils.password import check_password
+
+
+class TestHashing(BaseTestCase):
+    route = '/auth/login'
+
+    def log_in(self, user, password):
+        return self.client.post(
+            self.route,
+            json={'username': user.username, 'password': password}
+        )
+
+    def test_log_in_overloaded(self):
+        # Allow a single pending hash
+        pool = self.app.extensions['passwords'] = HashingPool(max_pending=1)
+
+        # Create a user
+        user = UserFactory(password=hash_password('Password1234.'))
+
+        # Take the only slot
+        pool._slots.acquire()
+
+        # Log in
+        response = self.log_in(user, 'Password1234.')
+
+        # Assert the request was turned away
+        self.assertEqual(response.status_code, 503)
+        self.assertIn('Retry-After', response.headers)
+
+        # Free the slot and log in again
+        pool._slots.release()
+
+        response = self.log_in(user, 'Password1234.')
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_log_in_rehashes_password(self):
+        # Create a user with a cheaper hash
+        user = UserFactory(password=hash_password('Password1234.', rounds=1000))
+
+        # Raise the cost
+        self.app.config['PASSWORD_HASH_ROUNDS'] = 2000
+
+        self.assertTrue(passwords.needs_rehash(user.password))
+
+        # Log in
+        response = self.log_in(user, 'Password1234.')
+
+        self.assertEqual(response.status_code, 200)
+
+        # Assert the password was rehashed with the new cost
+        self.assertTrue(user.password.startswith('$pbkdf2-sha256$2000$'))
+        self.assertFalse(passwords.needs_rehash(user.password))
+        self.assertTrue(check_password('Password1234.', user.password))
+
+    def test_pool_hashes_in_worker_process(self):
+        # Create a pool with a worker process
+        pool = HashingPool(workers=1, max_pending=4)
+
+        try:
+            # Hash and check a password in the worker
+            hashed_password = pool.run(hash_password, 'Password1234.', 1000)
+
+            self.assertTrue(pool.run(check_password, 'Password1234.', hashed_password))
+            self.assertFalse(pool.run(check_password, 'Wrong1234.', hashed_password))
+        finally:
+            pool.shutdown()
@@ -0,0 +1,110 @@
+# SQLAlchemy
+from sqlalchemy import exc
+
+# Base
+from tests.base.base_test_case import BaseTestCase
+
+# Config
+from app.config.testing import TestingConfig
+
+# Extensions
+from app.extensions.database import db
+from app.extensions.pool import pools
+
+# Utils
+from app.utils.pool import InstrumentedQueuePool
+from app.utils.pool import engine_options
+
+
+class SmallPoolTestingConfig(TestingConfig):
+    DATABASE_POOL_SIZE = 1
+    DATABASE_POOL_MAX_OVERFLOW = 0
+    DATABASE_POOL_TIMEOUT = 1
+
+
+class TestPool(BaseTestCase):
+    config_class = SmallPoolTestingConfig
+
+    def test_pool_options(self):
+        pool = db.engine.pool
+
+        # Assert the pool is sized from the config
+        self.assertIsInstance(pool, InstrumentedQueuePool)
+        self.assertEqual(pool.size(), 1)
+        self.assertEqual(pool._max_overflow, 0)
+        self.assertEqual(pool.timeout(), 1)
+        self.assertEqual(pool._recycle, TestingConfig.DATABASE_POOL_RECYCLE)
+        self.assertTrue(pool._pre_ping)
+
+    def test_pgbouncer_disables_prepared_statements(self):
+        config = {**self.app.config, 'DATABASE_PGBOUNCER': True}
+
+        # Assert psycopg does not prepare statements
+        options = engine_options('postgresql+psycopg://user@localhost/discussify', config)
+
+        self.assertEqual(options['connect_args'], {'prepare_threshold': None})
+
+        # Assert psycopg2, which never prepares statements, is left as is
+        options = engine_options('postgresql+psycopg2://user@localhost/discussify', config)
+
+        self.assertNotIn('connect_args', options)
+
+    def test_checkout_metrics(self):
+        db.session.remove()
+
+        stats = pools.stats()[None]
+
+        # Run a query
+        db.session.execute(db.select(1))
+
+        # Assert the checkout was recorded
+        self.assertEqual(pools.stats()[None]['checkouts'], stats['checkouts'] + 1)
+        self.assertEqual(pools.stats()[None]['checked_out'], 1)
+        self.assertEqual(pools.stats()[None]['saturation'], 1)
+
+        db.session.remove()
+
+        # Assert the connection was returned
+        self.assertEqual(pools.stats()[None]['checked_out'], 0)
+        self.assertEqual(pools.stats()[None]['peak_checked_out'], 1)
+
+    def test_checkout_timeout(self):
+        db.session.remove()
+
+        # Check out the only connection
+        with db.engine.connect():
+            # Assert the next checkout times out
+            with self.assertRaises(exc.TimeoutError):
+                db.engine.connect()
+
+        # Assert the timeout was recorded
+        self.assertEqual(pools.stats()[None]['timeouts'], 1)
+
+    def test_connection_churn(self):
+        db.session.remove()
+
+        stats = pools.stats()[None]
+
+        # Close the connections of the pool
+        db.engine.dispose()
+
+        # Open a new one
+        db.session.execute(db.select(1))
+        db.session.remove()
+
+        # Assert the metrics were kept and the churn recorded
+        churn = pools.stats()[None]
+
+        self.assertEqual(churn['closes'], stats['closes'] + 1)
+        self.assertEqual(churn['connects'], stats['connects'] + 1)
+        self.assertEqual(churn['checkouts'], stats['checkouts'] + 1)
+
+    def test_invalidated_connection(self):
+        db.session.remove()
+
+        # Invalidate a connection, e.g. after the database dropped it
+        with db.engine.connect() as connection:
+            connection.invalidate()
+
+        # Assert the invalidation was recorded
+        self.assertEqual(pools.stats()[None]['invalidations'], 1)
@@ -0,0 +1,201 @@
+# OS
+import os
+
+# Tempfile
+import tempfile
+
+# Base
+from tests.base.base_test_case import BaseTestCase
+
+# Factories
+from tests.factories.user_factory import UserFactory
+from tests.factories.post_factory import PostFactory
+from tests.factories.community_factory import CommunityFactory
+
+# Utils
+from tests.utils.tokens import get_access_token
+
+# Config
+from app.config.testing import TestingConfig
+
+# Extensions
+from app.extensions.database import db
+from app.extensions.cache import cache
+from app.extensions.replicas import replicas
+
+# Models
+from app.models.user import User
+
+
+class TestRouting(BaseTestCase):
+    '''
+    The replica is a second database with the same tables, left empty so
+    the rows found tell which database served a read.
+    '''
+
+    def setUp(self):
+        self.replica_directory = tempfile.TemporaryDirectory()
+
+        replica_path = os.path.join(self.replica_directory.name, 'replica.db')
+
+        class ReplicaTestingConfig(TestingConfig):
+            SQLALCHEMY_BINDS = {'replica': f'sqlite:///{replica_path}'}
+            SQLALCHEMY_REPLICA_BINDS = ('replica',)
+
+        self.config_class = ReplicaTestingConfig
+
+        super().setUp()
+
+        db.metadata.create_all(db.engines['replica'])
+
+    def tearDown(self):
+        db.session.remove()
+        db.engines['replica'].dispose()
+
+        super().tearDown()
+
+        self.replica_directory.cleanup()
+
+        # The bind's metadata is registered on the shared extension object
+        db.metadatas.pop('replica', None)
+
+    def create_community(self, access_token):
+        return self.client.post(
+            '/community/',
+            headers={'Authorization': f'Bearer {access_token}'},
+            json={'name': 'Videogames', 'about': 'Community for videogame lovers.'}
+        )
+
+    def read_community(self, access_token=None):
+        # Start from an empty session, as a new request would
+        db.session.remove()
+
+        headers = {'Authorization': f'Bearer {access_token}'} if access_token else {}
+
+        return self.client.get('/community/Videogames', headers=headers)
+
+    def test_get_reads_from_replica(self):
+        # Create a post on the primary
+        post_id = PostFactory().id
+
+        # Start from an empty session, as a new request would
+        db.session.remove()
+
+        # Read the post
+        response = self.client.get(f'/post/{post_id}')
+
+        # Assert the replica, which does not have it, was read
+        self.assertEqual(response.status_code, 404)
+
+    def test_post_writes_to_primary(self):
+        # Create a user
+        user = UserFactory()
+
+        # Create a community
+        response = self.create_community(get_access_token(user))
+
+        # Check status code
+        self.assertEqual(response.status_code, 201)
+
+        # Assert the community was written to the primary
+        self.assertEqual(user.communities[0].id, response.json['id'])
+
+    def test_read_your_own_writes(self):
+        # Create a user
+        access_token = get_access_token(UserFactory())
+
+        # Create a community
+        self.create_community(access_token)
+
+        # Read the community as its owner
+        response = self.read_community(access_token)
+
+        # Assert the primary was read
+        self.assertEqual(response.status_code, 200)
+
+        # Read the community as another user
+        response = self.read_community(get_access_token(UserFactory()))
+
+        # Assert the replica was read
+        self.assertEqual(response.status_code, 404)
+
+    def test_read_your_own_writes_expires(self):
+        # Create a user
+        access_token = get_access_token(UserFactory())
+
+        # Create a community
+        self.create_community(access_token)
+
+        # Let the pin expire
+        self.client.delete_cookie(self.app.config['REPLICA_PIN_COOKIE_NAME'])
+
+        # Read the community as its owner
+        response = self.read_community(access_token)
+
+        # Assert the replica was read, the account being read from the primary
+        self.assertEqual(response.status_code, 404)
+
+    def test_read_your_own_writes_on_another_worker(self):
+        # Create a user
+        access_token = get_access_token(UserFactory())
+
+        # Create a community
+        self.create_community(access_token)
+
+        # Answer the next request from a worker with its own cache
+        cache.clear()
+
+        # Read the community as its owner
+        response = self.read_community(access_token)
+
+        # Assert the primary was read
+        self.assertEqual(response.status_code, 200)
+
+    def test_pin_is_signed(self):
+        # Create a user
+        user = UserFactory()
+
+        # Create a community on the primary
+        CommunityFactory(name='Videogames')
+
+        # Forge a pin of the user
+        self.client.set_cookie(self.app.config['REPLICA_PIN_COOKIE_NAME'], str(user.id))
+
+        # Read the community as the user
+        response = self.read_community(get_access_token(user))
+
+        # Assert the replica was read
+        self.assertEqual(response.status_code, 404)
+
+    def test_write_pins_request_to_primary(self):
+        with self.app.test_request_context('/', method='GET'):
+            replicas.route_reads()
+
+            # Assert reads go to the replica
+            self.assertIs(db.session.get_bind(clause=db.select(User)), db.engines['replica'])
+
+            # Assert writes go to the primary
+            self.assertIs(db.session.get_bind(clause=db.insert(User)), db.engine)
+
+            # Assert the reads after the write go to the primary
+            self.assertIs(db.session.get_bind(clause=db.select(User)), db.engine)
+
+    def test_flush_pins_request_to_primary(self):
+        with self.app.test_request_context('/', method='GET'):
+            replicas.route_reads()
+
+            # Write a user
+            db.session.add(UserFactory.build())
+            db.session.flush()
+
+            # Assert the reads after the write go to the primary
+            self.assertIs(db.session.get_bind(clause=db.select(User)), db.engine)
+
+            db.session.rollback()
+
+    def test_locking_reads_go_to_primary(self):
+        with self.app.test_request_context('/', method='GET'):
+            replicas.route_reads()
+
+            # Assert reads locking rows go to the primary
+            self.assertIs(db.session.get_bind(clause=db.select(User).with_for_update()), db.engine)
@@ -0,0 +1,126 @@
+# time
+from time import time
+from time import sleep
+
+# Base
+from tests.base.base_test_case import BaseTestCase
+
+# Factories
+from tests.factories.user_factory import UserFactory
+
+# Extensions
+from app.extensions.database import db
+
+# Models
+from app.models.token import RevokedToken
+
+# Utils
+from app.utils.revocation import MemoryRevocationStore
+from app.utils.revocation import DatabaseRevocationStore
+from tests.utils.tokens import get_access_token
+
+
+class TestStores(BaseTestCase):
+    route = '/auth/logout'
+
+    def use_store(self, store):
+        self.app.extensions['revocations'] = store
+
+    def log_out(self, access_token):
+        return self.client.post(
+            self.route,
+            headers={'Authorization': f'Bearer {access_token}'},
+        )
+
+    def test_memory_store_drops_expired_tokens(self):
+        # Create a store
+        store = MemoryRevocationStore()
+
+        # Revoke an expired token and a live one
+        store.revoke('expired', time() - 1)
+        store.revoke('live', time() + 60)
+
+        # Assert only the live token is kept
+        self.assertFalse(store.is_revoked('expired'))
+        self.assertTrue(store.is_revoked('live'))
+        self.assertEqual(len(store), 1)
+
+    def test_memory_store_purge(self):
+        # Create a store
+        store = MemoryRevocationStore()
+
+        # Revoke a token about to expire
+        store.revoke('expiring', time() + 0.01)
+
+        # Wait for the token to expire
+        sleep(0.02)
+
+        # Assert the token was purged
+        self.assertEqual(store.purge(), 1)
+        self.assertEqual(len(store), 0)
+
+    def test_log_out_revokes_token(self):
+        # Create a user
+        user = UserFactory()
+
+        # Get the access token
+        access_token = get_access_token(user)
+
+        # Log out
+        response = self.log_out(access_token)
+
+        self.assertEqual(response.status_code, 200)
+
+        # Assert the token can no longer be used
+        response = self.log_out(access_token)
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_log_out_revokes_token_in_database(self):
+        # Use the database store
+        self.use_store(DatabaseRevocationStore())
+
+        # Create a user
+        user = UserFactory()
+
+        # Get the access token
+        access_token = get_access_token(user)
+
+        # Log out
+        self.log_out(access_token)
+
+        # Assert the token was stored
+        self.assertEqual(db.session.scalar(db.select(db.func.count()).select_from(RevokedToken)), 1)
+
+        # Assert the token can no longer be used
+        response = self.log_out(access_token)
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_database_store_purge(self):
+        # Use the database store
+        store = DatabaseRevocationStore()
+
+        # Revoke an expired token and a live one
+        store.revoke('expired', time() - 1)
+        store.revoke('live', time() + 60)
+
+        # Assert the expired token is not revoked anymore
+        self.assertFalse(store.is_revoked('expired'))
+        self.assertTrue(store.is_revoked('live'))
+
+        # Assert the purge deleted the expired token only
+        self.assertEqual(store.purge(), 1)
+        self.assertTrue(store.is_revoked('live'))
+
+    def test_database_store_revoke_twice(self):
+        # Use the database store
+        store = DatabaseRevocationStore()
+
+        # Revoke the same token twice, as concurrent logouts would
+        store.revoke('token', time() + 60)
+        store.revoke('token', time() + 60)
+
+        # Assert the token was stored once
+        self.assertEqual(db.session.scalar(db.select(db.func.count()).select_from(RevokedToken)), 1)
+        self.assertTrue(store.is_revoked('token'))
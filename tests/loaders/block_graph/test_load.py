@@ -0,0 +1,117 @@
+# Base
+from tests.base.base_test_case import BaseTestCase
+
+# Factories
+from tests.factories.user_factory import UserFactory
+
+# Models
+from app.models.user import Block
+
+# Managers
+from app.managers.user import BlockManager
+
+# Loaders
+from app.loaders.block import BlockGraphLoader
+
+# Utils
+from tests.utils.queries import capture_queries
+from tests.utils.queries import count_queries_on
+
+
+class TestLoad(BaseTestCase):
+    def test_load(self):
+        # Create users
+        user, blocked, blocker, stranger = UserFactory.create_batch(4)
+
+        # Block and get blocked
+        Block(blocker=user, blocked=blocked).save()
+        Block(blocker=blocker, blocked=user).save()
+
+        # Load the block graph
+        graph = BlockGraphLoader.load(user)
+
+        # Assert the block graph
+        self.assertEqual(graph.blocked_ids, {blocked.id})
+        self.assertEqual(graph.blocker_ids, {blocker.id})
+        self.assertTrue(graph.is_blocking(blocked.id))
+        self.assertTrue(graph.is_blocked_by(blocker.id))
+        self.assertFalse(graph.is_blocking(stranger.id))
+        self.assertFalse(graph.is_empty())
+
+    def test_load_empty(self):
+        # Create a user
+        user = UserFactory()
+
+        # Load the block graph
+        graph = BlockGraphLoader.load(user)
+
+        # Assert the block graph is empty
+        self.assertTrue(graph.is_empty())
+
+    def test_load_cached(self):
+        # Create a user
+        user = UserFactory()
+
+        # Load the block graph
+        BlockGraphLoader.load(user)
+
+        # Forget the request memo
+        BlockGraphLoader.clear()
+
+        # Load the block graph again
+        with capture_queries() as statements:
+            BlockGraphLoader.load(user)
+
+        # Assert the block graph was served from the cache
+        self.assertEqual(count_queries_on(statements, 'blocks'), 0)
+
+    def test_load_not_cached(self):
+        # Turn the cache off
+        self.app.config['BLOCK_GRAPH_CACHE_TTL'] = 0
+
+        # Create a user
+        user = UserFactory()
+
+        # Load the block graph
+        BlockGraphLoader.load(user)
+
+        # Forget the request memo
+        BlockGraphLoader.clear()
+
+        # Load the block graph again
+        with capture_queries() as statements:
+            BlockGraphLoader.load(user)
+
+        # Assert the block graph was read again
+        self.assertEqual(count_queries_on(statements, 'blocks'), 1)
+
+    def test_load_invalidated_by_block(self):
+        # Create users
+        user, target = UserFactory.create_batch(2)
+
+        # Load the block graphs
+        BlockGraphLoader.load(user)
+        BlockGraphLoader.load(target)
+
+        # Block the target
+        BlockManager.create(user, target)
+
+        # Assert both block graphs were refreshed
+        self.assertEqual(BlockGraphLoader.load(user).blocked_ids, {target.id})
+        self.assertEqual(BlockGraphLoader.load(target).blocker_ids, {user.id})
+
+    def test_load_invalidated_by_unblock(self):
+        # Create users
+        user, target = UserFactory.create_batch(2)
+
+        # Block the target
+        BlockManager.create(user, target)
+
+        # Load the block graph
+        self.assertFalse(BlockGraphLoader.load(user).is_empty())
+
+        # Unblock the target
+        BlockManager.delete(user, target)
+
+        # Assert the block graph was refreshed
+        self.assertTrue(BlockGraphLoader.load(user).is_empty())
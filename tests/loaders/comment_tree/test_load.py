@@ -0,0 +1,98 @@
+# Base
+from tests.base.base_test_case import BaseTestCase
+
+# Factories
+from tests.factories.post_factory import PostFactory
+from tests.factories.comment_factory import CommentFactory
+
+# Extensions
+from app.extensions.database import db
+
+# Loaders
+from app.loaders.comment import CommentTreeLoader
+
+# Utils
+from tests.utils.queries import capture_queries
+from tests.utils.queries import count_queries_on
+
+
+class TestLoad(BaseTestCase):
+    def setup_thread(self):
+        # Create a post
+        post = PostFactory()
+
+        # Create a thread of comments
+        root = CommentFactory(post=post)
+        first = CommentFactory(post=post, comment=root)
+        second = CommentFactory(post=post, comment=root)
+        nested = CommentFactory(post=post, comment=first)
+        deepest = CommentFactory(post=post, comment=nested)
+
+        return root, first, second, nested, deepest
+
+    def test_load(self):
+        # Create a thread
+        root, first, second, nested, deepest = self.setup_thread()
+
+        # Load the tree
+        tree = CommentTreeLoader.load([root])
+
+        # Assert the nested structure
+        self.assertEqual(tree[root.id], [first, second])
+        self.assertEqual(tree[first.id], [nested])
+        self.assertEqual(tree[second.id], [])
+        self.assertEqual(tree[nested.id], [deepest])
+        self.assertEqual(tree[deepest.id], [])
+
+        # Assert the replies are served from the tree
+        self.assertEqual(root.loaded_replies, [first, second])
+
+    def test_load_single_query(self):
+        # Create a thread
+        root, *_ = self.setup_thread()
+
+        # Refresh the root comment
+        db.session.refresh(root)
+
+        # Load the tree
+        with capture_queries() as statements:
+            CommentTreeLoader.load([root])
+
+        # Assert the whole subtree was read at once
+        self.assertEqual(count_queries_on(statements, 'comments'), 1)
+
+    def test_load_max_depth(self):
+        # Create a thread
+        root, first, second, nested, deepest = self.setup_thread()
+
+        # Load the tree
+        tree = CommentTreeLoader.load([root], max_depth=2)
+
+        # Assert the tree is cut below the second level
+        self.assertEqual(tree[root.id], [first, second])
+        self.assertEqual(tree[first.id], [nested])
+        self.assertEqual(tree[nested.id], [])
+        self.assertNotIn(deepest.id, tree)
+
+    def test_load_max_breadth(self):
+        # Create a thread
+        root, first, second, nested, deepest = self.setup_thread()
+
+        # Load the tree
+        tree = CommentTreeLoader.load([root], max_breadth=1)
+
+        # Assert only the first reply of each comment is kept
+        self.assertEqual(tree[root.id], [first])
+        self.assertEqual(tree[first.id], [nested])
+        self.assertEqual(tree[nested.id], [deepest])
+        self.assertNotIn(second.id, tree)
+
+    def test_get_not_loaded(self):
+        # Create a thread
+        root, first, second, *_ = self.setup_thread()
+
+        # Assert nothing is served before loading
+        self.assertIsNone(CommentTreeLoader.get(root))
+
+        # Assert the replies fall back to the relationship
+        self.assertEqual(root.loaded_replies, [first, second])
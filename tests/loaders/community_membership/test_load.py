@@ -0,0 +1,149 @@
+# Base
+from tests.base.base_test_case import BaseTestCase
+
+# Factories
+from tests.factories.user_factory import UserFactory
+from tests.factories.community_factory import CommunityFactory
+from tests.factories.post_factory import PostFactory
+
+# Extensions
+from app.extensions.database import db
+
+# Models
+from app.models.community import CommunitySubscriber
+from app.models.community import CommunityModerator
+from app.models.community import CommunityBan
+
+# Loaders
+from app.loaders.community import CommunityMembershipLoader
+
+# Utils
+from tests.utils.tokens import get_access_token
+from tests.utils.queries import capture_queries
+from tests.utils.queries import count_queries_on
+
+
+class TestLoad(BaseTestCase):
+    def test_load(self):
+        # Create a user
+        user = UserFactory()
+
+        # Create communities
+        subscribed, moderated, banned, untouched = CommunityFactory.create_batch(4)
+        owned = CommunityFactory(owner=user)
+
+        # Subscribe, moderate and ban the user
+        CommunitySubscriber(user=user, community=subscribed).save()
+        CommunityModerator(user=user, community=moderated).save()
+        CommunityBan(user=user, community=banned).save()
+
+        # Load the memberships
+        memberships = CommunityMembershipLoader.load(user, [subscribed, moderated, banned, untouched, owned])
+
+        # Assert the memberships
+        self.assertTrue(memberships[subscribed.id].subscriber)
+        self.assertFalse(memberships[subscribed.id].moderator)
+        self.assertTrue(memberships[moderated.id].moderator)
+        self.assertTrue(memberships[banned.id].ban)
+        self.assertTrue(memberships[owned.id].owned_by)
+        self.assertFalse(memberships[untouched.id].owned_by)
+        self.assertFalse(memberships[untouched.id].subscriber)
+        self.assertFalse(memberships[untouched.id].moderator)
+        self.assertFalse(memberships[untouched.id].ban)
+
+        # Assert the memberships are served to the viewer only
+        self.assertIs(CommunityMembershipLoader.get(user, subscribed), memberships[subscribed.id])
+        self.assertIsNone(CommunityMembershipLoader.get(UserFactory(), subscribed))
+
+    def test_load_invalidated(self):
+        # Create a user and a community
+        user = UserFactory()
+        community = CommunityFactory()
+
+        # Load the memberships
+        CommunityMembershipLoader.load(user, [community])
+
+        # Subscribe the user
+        CommunitySubscriber(user=user, community=community).save()
+
+        # Assert the memberships are no longer served
+        self.assertIsNone(CommunityMembershipLoader.get(user, community))
+
+    def test_load_query_count(self):
+        # Create a user
+        user = UserFactory()
+
+        for n in (1, 10, 50):
+            # Create communities the user is a member of
+            communities = CommunityFactory.create_batch(n)
+
+            for community in communities:
+                CommunitySubscriber(user=user, community=community).save()
+                CommunityModerator(user=user, community=community).save()
+
+            # Refresh the objects expired by the commits
+            for instance in (user, *communities):
+                db.session.refresh(instance)
+
+            # Load the memberships
+            with capture_queries() as statements:
+                CommunityMembershipLoader.load(user, communities)
+
+            # Assert a single query whatever the number of communities
+            self.assertEqual(len(statements), 1)
+
+    def test_read_communities(self):
+        # Create a user
+        user = UserFactory()
+        user_id = user.id
+
+        # Get the access token
+        access_token = get_access_token(user)
+
+        for n in (2, 8):
+            # Create communities the user subscribes to
+            for community in CommunityFactory.create_batch(n):
+                CommunitySubscriber(user=db.session.get(type(user), user_id), community=community).save()
+
+            # Read the communities, as a new request would
+            db.session.expunge_all()
+
+            with capture_queries() as statements:
+                response = self.client.get(
+                    '/community/?per_page=50',
+                    headers={'Authorization': f'Bearer {access_token}'}
+                )
+
+            # Assert the flags of every community
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(all(community['subscriber'] for community in response.json['communities']))
+            self.assertFalse(any(community['moderator'] for community in response.json['communities']))
+
+            # Assert the memberships were read with a single query
+            self.assertEqual(count_queries_on(statements, 'community_subscribers'), 1)
+            self.assertEqual(count_queries_on(statements, 'community_moderators'), 1)
+            self.assertEqual(count_queries_on(statements, 'community_bans'), 1)
+
+    def test_read_posts(self):
+        # Create a user and posts in communities they moderate
+        user = UserFactory()
+
+        for post in PostFactory.create_batch(3):
+            CommunityModerator(user=user, community=post.community).save()
+
+        # Get the access token
+        access_token = get_access_token(user)
+
+        # Read the posts, as a new request would
+        db.session.expunge_all()
+
+        with capture_queries() as statements:
+            response = self.client.get('/post/', headers={'Authorization': f'Bearer {access_token}'})
+
+        # Assert the flags of the communities of the posts
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(all(post['community']['moderator'] for post in response.json['posts']))
+        self.assertFalse(any(post['community']['owned_by'] for post in response.json['posts']))
+
+        # Assert the memberships were read with a single query
+        self.assertEqual(count_queries_on(statements, 'community_moderators'), 1)
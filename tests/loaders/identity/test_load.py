@@ -0,0 +1,110 @@
+# Base
+from tests.base.base_test_case import BaseTestCase
+
+# Factories
+from tests.factories.user_factory import UserFactory
+
+# Extensions
+from app.extensions.database import db
+from app.extensions.cache import cache
+
+# Models
+from app.models.user import User
+
+# Managers
+from app.managers.user import FollowManager
+
+# Loaders
+from app.loaders.identity import IdentityLoader
+
+# Utils
+from app.utils.password import hash_password
+from tests.utils.tokens import get_access_token
+from tests.utils.queries import capture_queries
+from tests.utils.queries import count_queries_on
+
+
+class TestLoad(BaseTestCase):
+    route = '/user/me'
+
+    def read_me(self, access_token):
+        # Start from an empty session, as a new request would
+        db.session.expunge_all()
+
+        return self.client.get(
+            self.route,
+            headers={'Authorization': f'Bearer {access_token}'}
+        )
+
+    def test_load_cached(self):
+        # Create a user
+        user = UserFactory()
+        username = user.username
+
+        # Get the access token
+        access_token = get_access_token(user)
+
+        # Read the user once to cache it
+        self.read_me(access_token)
+
+        # Read the user again
+        with capture_queries() as statements:
+            response = self.read_me(access_token)
+
+        # Assert the user and its stats were served from the cache
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json['username'], username)
+        self.assertEqual(count_queries_on(statements, 'users'), 0)
+        self.assertEqual(count_queries_on(statements, 'user_stats'), 0)
+
+    def test_load_invalidated_by_update(self):
+        # Create a user
+        user = UserFactory(is_verified=False)
+
+        # Load the user
+        IdentityLoader.load({'sub': str(user.id)})
+
+        # Verify the user
+        user.is_verified = True
+        db.session.commit()
+
+        # Assert the cached copy was dropped
+        self.assertIsNone(cache.get(('user_identity', user.id)))
+
+    def test_load_invalidated_by_stats(self):
+        # Create users
+        user, target = UserFactory.create_batch(2)
+
+        user_id, target_id = user.id, target.id
+
+        # Cache the target
+        self.read_me(get_access_token(target))
+
+        # Follow the target
+        FollowManager.create(db.session.get(User, user_id), db.session.get(User, target_id))
+
+        # Assert the followers count is fresh
+        response = self.read_me(get_access_token(db.session.get(User, target_id)))
+
+        self.assertEqual(response.json['stats']['followers_count'], 1)
+
+    def test_load_deleted_user(self):
+        # Create a user
+        user = UserFactory(password=hash_password('Password1234.'))
+
+        # Log in
+        response = self.client.post(
+            '/auth/login',
+            json={'username': user.username, 'password': 'Password1234.'}
+        )
+
+        access_token = response.json['access_token']
+
+        # Delete the user
+        db.session.delete(user)
+        db.session.commit()
+
+        # Assert the access token no longer authenticates
+        response = self.read_me(access_token)
+
+        self.assertEqual(response.status_code, 401)
@@ -0,0 +1,80 @@
+# Base
+from tests.base.base_test_case import BaseTestCase
+
+# Factories
+from tests.factories.user_factory import UserFactory
+from tests.factories.post_factory import PostFactory
+from tests.factories.post_vote_factory import PostVoteFactory
+from tests.factories.post_bookmark_factory import PostBookmarkFactory
+
+# Loaders
+from app.loaders.post import PostFlagsLoader
+
+# Utils
+from tests.utils.queries import capture_queries
+from tests.utils.queries import count_queries_on
+
+
+class TestLoad(BaseTestCase):
+    def test_load(self):
+        # Create a user
+        user = UserFactory()
+
+        # Create posts
+        bookmarked, upvoted, downvoted, untouched = PostFactory.create_batch(4)
+
+        # Bookmark and vote on the posts
+        PostBookmarkFactory(user=user, post=bookmarked)
+        PostVoteFactory(user=user, post=upvoted, direction=1)
+        PostVoteFactory(user=user, post=downvoted, direction=-1)
+
+        # Load the flags
+        flags = PostFlagsLoader.load(user, [bookmarked, upvoted, downvoted, untouched])
+
+        # Assert the flags
+        self.assertTrue(flags[bookmarked.id].bookmarked)
+        self.assertFalse(flags[bookmarked.id].upvoted)
+        self.assertTrue(flags[upvoted.id].upvoted)
+        self.assertFalse(flags[upvoted.id].downvoted)
+        self.assertTrue(flags[downvoted.id].downvoted)
+        self.assertFalse(flags[untouched.id].bookmarked)
+        self.assertFalse(flags[untouched.id].upvoted)
+        self.assertFalse(flags[untouched.id].downvoted)
+
+        # Assert the flags are served to the viewer only
+        self.assertIs(PostFlagsLoader.get(user, bookmarked), flags[bookmarked.id])
+        self.assertIsNone(PostFlagsLoader.get(UserFactory(), bookmarked))
+
+        # Clear the flags
+        PostFlagsLoader.clear()
+
+        # Assert the flags are no longer served
+        self.assertIsNone(PostFlagsLoader.get(user, bookmarked))
+
+    def test_load_query_count(self):
+        # Create a user
+        user = UserFactory()
+
+        for n in (1, 10, 50):
+            # Create posts
+            posts = PostFactory.create_batch(n)
+
+            # Load the flags
+            with capture_queries() as statements:
+                PostFlagsLoader.load(user, posts)
+
+            # Assert the queries do not depend on the number of posts
+            self.assertEqual(count_queries_on(statements, 'post_bookmarks'), 1)
+            self.assertEqual(count_queries_on(statements, 'post_votes'), 1)
+
+    def test_load_empty(self):
+        # Create a user
+        user = UserFactory()
+
+        # Load the flags
+        with capture_queries() as statements:
+            flags = PostFlagsLoader.load(user, [])
+
+        # Assert nothing was queried
+        self.assertEqual(flags, {})
+        self.assertEqual(len(statements), 0)
@@ -0,0 +1,166 @@
+# Base
+from tests.base.base_test_case import BaseTestCase
+
+# Factories
+from tests.factories.user_factory import UserFactory
+from tests.factories.community_factory import CommunityFactory
+
+# Models
+from app.models.user import Block
+from app.models.community import CommunitySubscriber
+from app.models.community import CommunityModerator
+from app.models.community import CommunityBan
+
+# Managers
+from app.managers.community import SubscriptionManager
+from app.managers.community import BanManager
+from app.managers.user import BlockManager
+
+# Extensions
+from app.extensions.database import db
+
+# Loaders
+from app.loaders.viewer import ViewerContextLoader
+from app.loaders.block import BlockGraphLoader
+
+# Utils
+from tests.utils.queries import capture_queries
+
+
+class TestLoad(BaseTestCase):
+    def test_load(self):
+        # Create users
+        user, blocked, blocker = UserFactory.create_batch(3)
+
+        # Create communities
+        subscribed, moderated, banned, stranger = CommunityFactory.create_batch(4)
+
+        # Block and get blocked
+        Block(blocker=user, blocked=blocked).save()
+        Block(blocker=blocker, blocked=user).save()
+
+        # Subscribe, moderate and get banned
+        CommunitySubscriber(user=user, community=subscribed).save()
+        CommunitySubscriber(user=user, community=moderated).save()
+        CommunityModerator(user=user, community=moderated).save()
+        CommunityBan(user=user, community=banned).save()
+
+        # Load the viewer context
+        context = ViewerContextLoader.load(user)
+
+        # Assert the viewer context
+        self.assertEqual(context.blocked_ids, {blocked.id})
+        self.assertEqual(context.blocker_ids, {blocker.id})
+        self.assertEqual(context.subscribed_ids, {subscribed.id, moderated.id})
+        self.assertEqual(context.moderated_ids, {moderated.id})
+        self.assertEqual(context.banned_ids, {banned.id})
+        self.assertFalse(context.is_subscribed_to(stranger.id))
+
+    def test_checks_answered_from_memory(self):
+        # Create users
+        user, other = UserFactory.create_batch(2)
+
+        # Create a community
+        community = CommunityFactory()
+
+        # Load the viewer context and the objects
+        ViewerContextLoader.load(user)
+        other.id, community.id
+
+        # Run the permission checks
+        with capture_queries() as statements:
+            user.is_blocking(other)
+            user.is_blocked_by(other)
+            user.is_subscribed_to(community)
+            user.is_moderator_of(community)
+            user.is_banned_from(community)
+
+        # Assert no query was run
+        self.assertEqual(len(statements), 0)
+
+    def test_load_single_query(self):
+        # Create a user
+        user = UserFactory()
+
+        # Load the viewer context
+        with capture_queries() as statements:
+            ViewerContextLoader.load(user)
+
+        # Assert the blocks and memberships were read in one query
+        self.assertEqual(len(statements), 1)
+
+    def test_load_ignores_block_graph_cache(self):
+        # Create users
+        user, blocker = UserFactory.create_batch(2)
+
+        # Cache the block graph of the user
+        self.assertTrue(BlockGraphLoader.load(user).is_empty())
+
+        # Block the user from another process, which leaves the cache as is
+        db.session.execute(db.insert(Block).values(blocker_id=blocker.id, blocked_id=user.id))
+
+        BlockGraphLoader.clear()
+
+        # Assert the block graph cache is stale
+        self.assertTrue(BlockGraphLoader.load(user).is_empty())
+
+        # Assert the permission checks see the block
+        self.assertTrue(user.is_blocked_by(blocker))
+
+    def test_load_invalidated_by_subscription(self):
+        # Create a user
+        user = UserFactory()
+
+        # Create a community
+        community = CommunityFactory()
+
+        # Load the viewer context
+        self.assertFalse(user.is_subscribed_to(community))
+
+        # Subscribe to the community
+        SubscriptionManager.create(user, community)
+
+        # Assert the viewer context was refreshed
+        self.assertTrue(user.is_subscribed_to(community))
+
+        # Unsubscribe from the community
+        SubscriptionManager.delete(user, community)
+
+        # Assert the viewer context was refreshed
+        self.assertFalse(user.is_subscribed_to(community))
+
+    def test_load_invalidated_by_ban(self):
+        # Create users
+        moderator, user = UserFactory.create_batch(2)
+
+        # Create a community
+        community = CommunityFactory()
+
+        # Subscribe and moderate
+        CommunitySubscriber(user=moderator, community=community).save()
+        CommunityModerator(user=moderator, community=community).save()
+        CommunitySubscriber(user=user, community=community).save()
+
+        # Load the viewer context
+        self.assertFalse(user.is_banned_from(community))
+
+        # Ban the user
+        BanManager.create(moderator, community, user)
+
+        # Assert the viewer context was refreshed
+        self.assertTrue(user.is_banned_from(community))
+
+    def test_load_invalidated_by_block(self):
+        # Create users
+        user, target = UserFactory.create_batch(2)
+
+        # Load the viewer contexts
+        self.assertFalse(user.is_blocking(target))
+        self.assertFalse(target.is_blocked_by(user))
+
+        # Block the target
+        BlockManager.create(user, target)
+
+        # Assert both viewer contexts were refreshed
+        self.assertTrue(user.is_blocking(target))
+        self.assertTrue(target.is_blocked_by(user))
@@ -0,0 +1,94 @@
+# Base
+from tests.base.base_test_case import BaseTestCase
+
+# Factories
+from tests.factories.user_factory import UserFactory
+from tests.factories.comment_factory import CommentFactory
+from tests.factories.comment_vote_factory import CommentVoteFactory
+
+# Extensions
+from app.extensions.database import db
+
+# Models
+from app.models.comment import CommentVote
+
+# Utils
+from app.utils.transaction import unit_of_work
+from tests.utils.queries import capture_queries
+
+
+class TestUpsert(BaseTestCase):
+    def upsert(self, user, comment, direction):
+        with unit_of_work():
+            previous = CommentVote.upsert(user, comment, direction)
+
+        db.session.refresh(comment.stats)
+
+        return previous
+
+    def test_upsert_new_vote(self):
+        # Create a user
+        user = UserFactory()
+
+        # Create a comment
+        comment = CommentFactory()
+
+        # Upvote the comment
+        previous = self.upsert(user, comment, 1)
+
+        # Assert the user had not voted
+        self.assertIsNone(previous)
+
+        # Assert the vote and the counters
+        self.assertTrue(CommentVote.get_by_user_and_comment(user, comment).is_upvote())
+        self.assertEqual((comment.stats.upvotes_count, comment.stats.downvotes_count), (1, 0))
+
+    def test_upsert_changed_vote(self):
+        # Create a downvote
+        vote = CommentVoteFactory(direction=-1)
+
+        # Get the user and the comment
+        user, comment = vote.user, vote.comment
+
+        # Upvote the comment
+        previous = self.upsert(user, comment, 1)
+
+        # Assert the previous direction
+        self.assertEqual(previous, -1)
+
+        # Assert the vote and the counters
+        self.assertTrue(CommentVote.get_by_user_and_comment(user, comment).is_upvote())
+        self.assertEqual((comment.stats.upvotes_count, comment.stats.downvotes_count), (1, 0))
+
+    def test_upsert_same_vote(self):
+        # Create an upvote
+        vote = CommentVoteFactory(direction=1)
+
+        # Get the user and the comment
+        user, comment = vote.user, vote.comment
+
+        # Upvote the comment again
+        previous = self.upsert(user, comment, 1)
+
+        # Assert the previous direction
+        self.assertEqual(previous, 1)
+
+        # Assert the counters did not change
+        self.assertEqual((comment.stats.upvotes_count, comment.stats.downvotes_count), (1, 0))
+
+    def test_upsert_does_not_read_the_vote(self):
+        # Create a downvote
+        vote = CommentVoteFactory(direction=-1)
+
+        # Get the user and the comment
+        user, comment = vote.user, vote.comment
+        # Load the IDs before capturing the queries
+        user.id, comment.id
+
+        # Upvote the comment
+        with capture_queries() as statements:
+            with unit_of_work():
+                CommentVote.upsert(user, comment, 1)
+
+        # Assert the vote was changed without being selected first
+        self.assertFalse(any(statement.startswith('SELECT') for statement in statements))
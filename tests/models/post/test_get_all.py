@@ -7,6 +7,9 @@ from tests.factories.post_factory import PostFactory
 # Models
 from app.models.post import Post
 
+# Listings
+from app.listings.post import all_posts
+
 # Flask-SQLAlchemy
 from flask_sqlalchemy.pagination import Pagination
 
@@ -52,4 +55,25 @@ class GetAllPosts(BaseTestCase):
         get_posts_items = get_posts.items
 
         # Assert that there are no posts
-        self.assertEqual(len(get_posts_items), 0)
\ No newline at end of file
+        self.assertEqual(len(get_posts_items), 0)
+
+    def test_get_posts_reuses_statement(self):
+        # Create some posts
+        posts = PostFactory.create_batch(3)
+
+        # Set the args
+        args = {'page': 1, 'per_page': 2, 'sort_by': 'upvotes', 'sort_order': 'asc'}
+
+        # Get the posts twice
+        Post.get_all(args)
+
+        statements = dict(all_posts.statements)
+
+        get_posts = Post.get_all(dict(args, page=2))
+
+        # Assert that the second page reused the statements of the first one
+        self.assertEqual(statements, all_posts.statements)
+
+        # Assert that the bound values were applied
+        self.assertEqual(len(get_posts.items), 1)
+        self.assertEqual(get_posts.total, len(posts))
@@ -0,0 +1,39 @@
+# Base
+from tests.base.base_test_case import BaseTestCase
+
+# Factories
+from tests.factories.post_factory import PostFactory
+from tests.factories.post_vote_factory import PostVoteFactory
+from tests.factories.post_bookmark_factory import PostBookmarkFactory
+from tests.factories.comment_factory import CommentFactory
+
+# Models
+from app.models.post import PostStats
+
+
+class TestReconcile(BaseTestCase):
+    def test_reconcile(self):
+        # Create a post
+        post = PostFactory()
+
+        # Count some rows on it
+        PostVoteFactory(post=post, direction=1)
+        PostVoteFactory(post=post, direction=-1)
+        PostBookmarkFactory(post=post)
+        CommentFactory(post=post)
+
+        # Make the counters drift
+        post.stats.upvotes_count = 10
+        post.stats.downvotes_count = 10
+        post.stats.bookmarks_count = 10
+        post.stats.comments_count = 10
+        post.stats.save()
+
+        # Reconcile the counters
+        PostStats.reconcile()
+
+        # Assert the counters match the rows
+        self.assertEqual(post.stats.upvotes_count, 1)
+        self.assertEqual(post.stats.downvotes_count, 1)
+        self.assertEqual(post.stats.bookmarks_count, 1)
+        self.assertEqual(post.stats.comments_count, 1)
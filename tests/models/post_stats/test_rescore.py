@@ -0,0 +1,62 @@
+# Base
+from tests.base.base_test_case import BaseTestCase
+
+# Factories
+from tests.factories.post_factory import PostFactory
+from tests.factories.post_vote_factory import PostVoteFactory
+
+# Models
+from app.models.post import PostStats
+
+# Utils
+from app.utils.ranking import hot_score
+from app.utils.ranking import best_score
+
+
+class TestRescore(BaseTestCase):
+    def test_scores_follow_votes(self):
+        # Create a post
+        post = PostFactory()
+
+        # Vote on it
+        PostVoteFactory.create_batch(3, post=post, direction=1)
+        vote = PostVoteFactory(post=post, direction=-1)
+
+        # Change the downvote to an upvote
+        vote.direction = 1
+        vote.save()
+
+        # Assert the scores were updated with the counters
+        self.assertEqual(post.stats.upvotes_count, 4)
+        self.assertAlmostEqual(post.stats.hot_score, hot_score(4, 0, post.created_at))
+        self.assertAlmostEqual(post.stats.best_score, best_score(4, 0))
+
+        # Cancel a vote
+        vote.delete()
+
+        # Assert the scores were updated with the counters
+        self.assertAlmostEqual(post.stats.hot_score, hot_score(3, 0, post.created_at))
+        self.assertAlmostEqual(post.stats.best_score, best_score(3, 0))
+
+    def test_rescore(self):
+        # Create some posts
+        posts = PostFactory.create_batch(3)
+
+        # Upvote one of them
+        PostVoteFactory.create_batch(2, post=posts[0], direction=1)
+
+        # Make the scores drift
+        for post in posts:
+            post.stats.hot_score = 0
+            post.stats.best_score = 0
+            post.stats.save()
+
+        # Recompute the scores in batches smaller than the number of posts
+        PostStats.rescore(batch_size=2)
+
+        # Assert the scores
+        for post in posts:
+            upvotes = post.stats.upvotes_count
+
+            self.assertAlmostEqual(post.stats.hot_score, hot_score(upvotes, 0, post.created_at))
+            self.assertAlmostEqual(post.stats.best_score, best_score(upvotes, 0))
@@ -0,0 +1,94 @@
+# Base
+from tests.base.base_test_case import BaseTestCase
+
+# Factories
+from tests.factories.user_factory import UserFactory
+from tests.factories.post_factory import PostFactory
+from tests.factories.post_vote_factory import PostVoteFactory
+
+# Extensions
+from app.extensions.database import db
+
+# Models
+from app.models.post import PostVote
+
+# Utils
+from app.utils.transaction import unit_of_work
+from tests.utils.queries import capture_queries
+
+
+class TestUpsert(BaseTestCase):
+    def upsert(self, user, post, direction):
+        with unit_of_work():
+            previous = PostVote.upsert(user, post, direction)
+
+        db.session.refresh(post.stats)
+
+        return previous
+
+    def test_upsert_new_vote(self):
+        # Create a user
+        user = UserFactory()
+
+        # Create a post
+        post = PostFactory()
+
+        # Upvote the post
+        previous = self.upsert(user, post, 1)
+
+        # Assert the user had not voted
+        self.assertIsNone(previous)
+
+        # Assert the vote and the counters
+        self.assertTrue(PostVote.get_by_user_and_post(user, post).is_upvote())
+        self.assertEqual((post.stats.upvotes_count, post.stats.downvotes_count), (1, 0))
+
+    def test_upsert_changed_vote(self):
+        # Create a downvote
+        vote = PostVoteFactory(direction=-1)
+
+        # Get the user and the post
+        user, post = vote.user, vote.post
+
+        # Upvote the post
+        previous = self.upsert(user, post, 1)
+
+        # Assert the previous direction
+        self.assertEqual(previous, -1)
+
+        # Assert the vote and the counters
+        self.assertTrue(PostVote.get_by_user_and_post(user, post).is_upvote())
+        self.assertEqual((post.stats.upvotes_count, post.stats.downvotes_count), (1, 0))
+
+    def test_upsert_same_vote(self):
+        # Create an upvote
+        vote = PostVoteFactory(direction=1)
+
+        # Get the user and the post
+        user, post = vote.user, vote.post
+
+        # Upvote the post again
+        previous = self.upsert(user, post, 1)
+
+        # Assert the previous direction
+        self.assertEqual(previous, 1)
+
+        # Assert the counters did not change
+        self.assertEqual((post.stats.upvotes_count, post.stats.downvotes_count), (1, 0))
+
+    def test_upsert_does_not_read_the_vote(self):
+        # Create a downvote
+        vote = PostVoteFactory(direction=-1)
+
+        # Get the user and the post
+        user, post = vote.user, vote.post
+        # Load the IDs before capturing the queries
+        user.id, post.id
+
+        # Upvote the post
+        with capture_queries() as statements:
+            with unit_of_work():
+                PostVote.upsert(user, post, 1)
+
+        # Assert the vote was changed without being selected first
+        self.assertFalse(any(statement.startswith('SELECT') for statement in statements))
@@ -0,0 +1,124 @@
+# Itertools
+from itertools import product
+
+# Base
+from tests.base.base_test_case import BaseTestCase
+
+# Factories
+from tests.factories.user_factory import UserFactory
+from tests.factories.community_factory import CommunityFactory
+from tests.factories.post_factory import PostFactory
+from tests.factories.comment_factory import CommentFactory
+
+# Models
+from app.models.post import Post
+from app.models.post import PostVote
+from app.models.post import PostBookmark
+from app.models.comment import Comment
+from app.models.comment import CommentVote
+from app.models.comment import CommentBookmark
+from app.models.community import Community
+from app.models.community import CommunitySubscriber
+from app.models.community import CommunityModerator
+from app.models.community import CommunityBan
+from app.models.user import User
+from app.models.user import Follow
+from app.models.user import Block
+from app.models.feed import FeedItem
+
+# Utils
+from tests.utils.query_plan import capture_executions
+from tests.utils.query_plan import full_scans
+
+
+class TestQueryPlans(BaseTestCase):
+    def assert_no_full_scans(self, listing, sorts):
+        for sort_by, sort_order, cursor in product(sorts, ('desc', 'asc'), (None, {}, 'next', 'prev')):
+            if cursor in ('next', 'prev'):
+                key = '2000-01-01T00:00:00' if sort_by == 'created_at' else 0
+
+                cursor = {'sort': sort_by, 'key': key, 'id': 1, 'direction': cursor}
+
+            args = {'page': 1, 'per_page': 10, 'time_filter': 'all', 'sort_by': sort_by, 'sort_order': sort_order, 'cursor': cursor}
+
+            # Run the listing
+            with capture_executions() as executions:
+                listing(args)
+
+            # Keep the page queries
+            pages = [(statement, parameters) for statement, parameters in executions if 'LIMIT' in statement]
+
+            self.assertTrue(pages)
+
+            # Assert the page queries do not scan whole tables
+            for statement, parameters in pages:
+                with self.subTest(sort_by=sort_by, sort_order=sort_order, cursor=cursor, statement=statement):
+                    self.assertEqual(full_scans(statement, parameters), [])
+
+    def test_post_listings(self):
+        # Create the objects
+        user = UserFactory()
+        community = CommunityFactory()
+        post = PostFactory()
+
+        sorts = ('created_at', 'upvotes', 'comments', 'hot', 'best')
+
+        self.assert_no_full_scans(Post.get_all, sorts)
+        self.assert_no_full_scans(lambda args: Post.get_all_by_community(community, args), sorts)
+        self.assert_no_full_scans(lambda args: Post.get_all_by_user(user, args), sorts)
+        self.assert_no_full_scans(lambda args: PostVote.get_upvoted_posts_by_user(user, args), sorts)
+        self.assert_no_full_scans(lambda args: PostVote.get_downvoted_posts_by_user(user, args), sorts)
+        self.assert_no_full_scans(lambda args: PostBookmark.get_bookmarks_by_user(user, args), sorts)
+        self.assert_no_full_scans(lambda args: FeedItem.get_feed(user, args), sorts)
+
+        sorts = ('created_at', 'followers', 'posts', 'comments')
+
+        self.assert_no_full_scans(lambda args: PostVote.get_upvoters_by_post(post, args), sorts)
+        self.assert_no_full_scans(lambda args: PostVote.get_downvoters_by_post(post, args), sorts)
+
+    def test_comment_listings(self):
+        # Create the objects
+        user = UserFactory()
+        post = PostFactory()
+        comment = CommentFactory()
+
+        sorts = ('created_at', 'upvotes')
+
+        self.assert_no_full_scans(Comment.get_all, sorts)
+        self.assert_no_full_scans(lambda args: Comment.get_all_by_user(user, args), sorts)
+        self.assert_no_full_scans(lambda args: Comment.get_all_root_comments_by_post(post, args), sorts)
+        self.assert_no_full_scans(lambda args: CommentVote.get_upvoted_comments_by_user(user, args), sorts)
+        self.assert_no_full_scans(lambda args: CommentVote.get_downvoted_comments_by_user(user, args), sorts)
+        self.assert_no_full_scans(lambda args: CommentBookmark.get_bookmarks_by_user(user, args), sorts)
+
+        sorts = ('created_at', 'followers', 'posts', 'comments')
+
+        self.assert_no_full_scans(lambda args: CommentVote.get_upvoters_by_comment(comment, args), sorts)
+        self.assert_no_full_scans(lambda args: CommentVote.get_downvoters_by_comment(comment, args), sorts)
+
+    def test_community_listings(self):
+        # Create the objects
+        user = UserFactory()
+        community = CommunityFactory()
+
+        sorts = ('created_at', 'subscribers', 'posts', 'comments')
+
+        self.assert_no_full_scans(Community.get_all, sorts)
+        self.assert_no_full_scans(lambda args: CommunitySubscriber.get_subscriptions_by_user(user, args), sorts)
+
+        sorts = ('created_at', 'followers', 'communities', 'posts', 'comments')
+
+        self.assert_no_full_scans(lambda args: CommunitySubscriber.get_subscribers_by_community(community, args), sorts)
+        self.assert_no_full_scans(lambda args: CommunityModerator.get_moderators_by_community(community, args), sorts)
+        self.assert_no_full_scans(lambda args: CommunityBan.get_banned_by_community(community, args), sorts)
+
+    def test_user_listings(self):
+        # Create a user
+        user = UserFactory()
+
+        sorts = ('created_at', 'followers', 'communities', 'posts', 'comments')
+
+        self.assert_no_full_scans(User.get_all, sorts)
+        self.assert_no_full_scans(lambda args: Follow.get_followed(user, args), sorts)
+        self.assert_no_full_scans(lambda args: Follow.get_followers(user, args), sorts)
+        self.assert_no_full_scans(lambda args: Block.get_blocked_with_args(user, args), sorts)
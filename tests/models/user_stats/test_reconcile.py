@@ -0,0 +1,50 @@
+# Base
+from tests.base.base_test_case import BaseTestCase
+
+# Factories
+from tests.factories.user_factory import UserFactory
+from tests.factories.follow_factory import FollowFactory
+from tests.factories.community_factory import CommunityFactory
+from tests.factories.post_factory import PostFactory
+from tests.factories.comment_factory import CommentFactory
+
+# Models
+from app.models.community import CommunitySubscriber
+from app.models.user import UserStats
+
+
+class TestReconcile(BaseTestCase):
+    def test_reconcile(self):
+        # Create a user
+        user = UserFactory()
+
+        # Count some rows on it
+        FollowFactory(follower=user)
+        FollowFactory(followed=user)
+        FollowFactory(followed=user)
+        community = CommunityFactory(owner=user)
+        CommunitySubscriber(user=user, community=community).save()
+        PostFactory(owner=user, community=community)
+        CommentFactory(owner=user)
+
+        # Make the counters drift
+        user.stats.followers_count = 0
+        user.stats.following_count = 0
+        user.stats.communities_count = 0
+        user.stats.posts_count = 0
+        user.stats.comments_count = 0
+        user.stats.subscriptions_count = 0
+        user.stats.moderations_count = 5
+        user.stats.save()
+
+        # Reconcile the counters
+        UserStats.reconcile()
+
+        # Assert the counters match the rows
+        self.assertEqual(user.stats.followers_count, 2)
+        self.assertEqual(user.stats.following_count, 1)
+        self.assertEqual(user.stats.communities_count, 1)
+        self.assertEqual(user.stats.posts_count, 1)
+        self.assertEqual(user.stats.comments_count, 1)
+        self.assertEqual(user.stats.subscriptions_count, 1)
+        self.assertEqual(user.stats.moderations_count, 0)
@@ -0,0 +1,64 @@
+# Flask-JWT-Extended
+from flask_jwt_extended import decode_token
+
+# utils
+from app.utils.password import hash_password
+
+# tests
+from tests.base.base_test_case import BaseTestCase
+
+# factories
+from tests.factories.user_factory import UserFactory
+
+# extensions
+from app.extensions.database import db
+
+
+class TestRefresh(BaseTestCase):
+    route = '/auth/refresh'
+
+    def log_in(self, user):
+        return self.client.post(
+            '/auth/login',
+            json={'username': user.username, 'password': 'Password1234.'}
+        )
+
+    def refresh(self):
+        csrf_token = self.client.get_cookie('csrf_refresh_token')
+
+        headers = {'X-CSRF-TOKEN': csrf_token.value} if csrf_token else {}
+
+        return self.client.post(self.route, headers=headers)
+
+    def test_refresh(self):
+        # Create a user
+        user = UserFactory(password=hash_password('Password1234.'))
+
+        # Log in
+        self.log_in(user)
+
+        # Refresh the access token
+        response = self.refresh()
+
+        # Assert the response status code
+        self.assertEqual(response.status_code, 200)
+
+        # Assert the token belongs to the user
+        self.assertEqual(decode_token(response.json['access_token'])['sub'], str(user.id))
+
+    def test_refresh_deleted_user(self):
+        # Create a user
+        user = UserFactory(password=hash_password('Password1234.'))
+
+        # Log in
+        self.log_in(user)
+
+        # Delete the user
+        db.session.delete(user)
+        db.session.commit()
+
+        # Refresh the access token
+        response = self.refresh()
+
+        # Assert the response status code
+        self.assertEqual(response.status_code, 401)
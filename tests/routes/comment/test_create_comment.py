@@ -7,6 +7,7 @@ from tests.factories.post_factory import PostFactory
 
 # Utils
 from tests.utils.tokens import get_access_token
+from tests.utils.queries import capture_commits
 
 # Models
 from app.models.community import CommunitySubscriber
@@ -384,4 +385,31 @@ class TestCreateComment(BaseTestCase):
         self.assertIn('message', data)
 
         # Assert the message
-        self.assertEqual(data['message'], 'You are banned from this community.')
\ No newline at end of file
+        self.assertEqual(data['message'], 'You are banned from this community.')
+
+    def test_create_comment_single_commit(self):
+        # Create a post
+        post = PostFactory()
+
+        # Create a user
+        user = UserFactory()
+
+        # Append the user to the post's community's subscribers
+        CommunitySubscriber(community=post.community, user=user).save()
+
+        # Get the access token
+        access_token = get_access_token(user)
+
+        # Create a comment
+        with capture_commits() as commits:
+            response = self.client.post(
+                self.route,
+                headers={'Authorization': f'Bearer {access_token}'},
+                json={'post_id': post.id, 'content': 'This is a comment.'}
+            )
+
+        # Check status code
+        self.assertEqual(response.status_code, 201)
+
+        # Assert that the comment and its stats were committed together
+        self.assertEqual(len(commits), 1)
@@ -0,0 +1,62 @@
+# Base
+from tests.base.base_test_case import BaseTestCase
+
+# Factories
+from tests.factories.comment_factory import CommentFactory
+
+# Extensions
+from app.extensions.database import db
+
+# utils
+from tests.utils.queries import capture_queries
+from tests.utils.queries import count_queries_on
+
+
+class TestReadCommentsFieldset(BaseTestCase):
+    route = '/comment/'
+
+    def read_comments(self, query):
+        # Start from an empty session, as a new request would
+        db.session.expunge_all()
+
+        with capture_queries() as statements:
+            response = self.client.get(f'{self.route}?{query}')
+
+        return response, statements
+
+    def test_read_comments_fields(self):
+        # Create a comment with a reply
+        comment = CommentFactory()
+        CommentFactory(post=comment.post, comment_id=comment.id)
+
+        # Get only the content of the comments
+        response, statements = self.read_comments('fields=id,content')
+
+        # Assert the comments only have the requested fields
+        self.assertEqual(response.status_code, 200)
+
+        for item in response.json['comments']:
+            self.assertEqual(list(item), ['id', 'content'])
+
+        # Assert neither the replies nor the posts and owners were read
+        self.assertFalse(any('subtree' in statement for statement in statements))
+        self.assertEqual(count_queries_on(statements, 'posts'), 0)
+        self.assertEqual(count_queries_on(statements, 'users'), 0)
+
+    def test_read_comments_include_post(self):
+        # Create comments
+        CommentFactory.create_batch(3)
+
+        # Get the comments with their post
+        response, statements = self.read_comments('include=post')
+
+        # Assert the posts are dumped in full
+        self.assertEqual(response.status_code, 200)
+
+        for item in response.json['comments']:
+            self.assertNotIn('owner', item)
+            self.assertIn('community', item['post'])
+
+        # Assert the posts and their relationships were eager-loaded
+        self.assertEqual(count_queries_on(statements, 'posts'), 1)
+        self.assertEqual(count_queries_on(statements, 'communities'), 1)
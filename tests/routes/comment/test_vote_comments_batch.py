@@ -0,0 +1,149 @@
+# Base
+from tests.base.base_test_case import BaseTestCase
+
+# Factories
+from tests.factories.user_factory import UserFactory
+from tests.factories.post_factory import PostFactory
+from tests.factories.comment_factory import CommentFactory
+from tests.factories.comment_vote_factory import CommentVoteFactory
+
+# Utils
+from tests.utils.tokens import get_access_token
+from tests.utils.queries import capture_queries
+
+# Extensions
+from app.extensions.database import db
+from app.extensions.cache import cache
+
+# Models
+from app.models.comment import CommentVote
+from app.models.community import CommunitySubscriber
+from app.models.community import CommunityBan
+from app.models.user import Block
+
+
+class TestVoteCommentsBatch(BaseTestCase):
+    route = '/comment/votes:batch'
+
+    def vote(self, user, votes):
+        return self.client.post(
+            self.route,
+            json={'votes': votes},
+            headers={'Authorization': f'Bearer {get_access_token(user)}'}
+        )
+
+    def test_vote_comments_batch(self):
+        # Create a post
+        post = PostFactory()
+
+        # Create comments on the post
+        comments = CommentFactory.create_batch(3, post=post)
+
+        # Create a user
+        user = UserFactory()
+
+        # Append the user to the post's community's subscribers
+        CommunitySubscriber(community=post.community, user=user).save()
+
+        # Downvote the last comment
+        CommentVoteFactory(user=user, comment=comments[2], direction=-1)
+
+        # Vote on the comments
+        response = self.vote(user, [
+            {'id': comments[0].id, 'direction': 1},
+            {'id': comments[1].id, 'direction': -1},
+            {'id': comments[2].id, 'direction': 1},
+        ])
+
+        # Check status code
+        self.assertEqual(response.status_code, 200)
+
+        # Assert every vote was applied
+        self.assertTrue(all(vote['error'] is None for vote in response.json['votes']))
+
+        # Assert the votes were written
+        for comment, direction in zip(comments, (1, -1, 1)):
+            self.assertEqual(CommentVote.get_by_user_and_comment(user, comment).direction, direction)
+
+        # Assert the stats of the comments were updated
+        for comment, counts in zip(comments, ((1, 0), (0, 1), (1, 0))):
+            db.session.refresh(comment.stats)
+
+            self.assertEqual((comment.stats.upvotes_count, comment.stats.downvotes_count), counts)
+
+    def test_vote_comments_batch_rejected(self):
+        # Create a user
+        user = UserFactory()
+
+        # Create a comment the user can vote on
+        comment = CommentFactory()
+        CommunitySubscriber(community=comment.post.community, user=user).save()
+
+        # Create a comment in a community the user is not subscribed to
+        unsubscribed_comment = CommentFactory()
+
+        # Create a comment in a community the user is banned from
+        banned_comment = CommentFactory()
+        CommunitySubscriber(community=banned_comment.post.community, user=user).save()
+        CommunityBan(community=banned_comment.post.community, user=user).save()
+
+        # Create a comment of a user blocking the user
+        blocked_comment = CommentFactory()
+        CommunitySubscriber(community=blocked_comment.post.community, user=user).save()
+        Block(blocker=blocked_comment.owner, blocked=user).save()
+
+        # Vote on the comments and on a comment that does not exist
+        response = self.vote(user, [
+            {'id': comment.id, 'direction': -1},
+            {'id': unsubscribed_comment.id, 'direction': -1},
+            {'id': banned_comment.id, 'direction': -1},
+            {'id': blocked_comment.id, 'direction': -1},
+            {'id': 0, 'direction': -1},
+        ])
+
+        # Assert each vote has its reason
+        self.assertEqual([vote['error'] for vote in response.json['votes']], [
+            None,
+            'You are not subscribed to this community.',
+            'You are banned from this community.',
+            'You cannot vote on this comment.',
+            'Comment not found.',
+        ])
+
+        # Assert only the allowed vote was written
+        self.assertIsNotNone(CommentVote.get_by_user_and_comment(user, comment))
+
+        for rejected_comment in (unsubscribed_comment, banned_comment, blocked_comment):
+            self.assertIsNone(CommentVote.get_by_user_and_comment(user, rejected_comment))
+
+    def test_vote_comments_batch_query_count(self):
+        # Create a post
+        post = PostFactory()
+
+        # Create a user
+        user = UserFactory()
+
+        # Append the user to the post's community's subscribers
+        CommunitySubscriber(community=post.community, user=user).save()
+
+        counts = []
+
+        for size in (2, 10):
+            # Create comments on the post, half of them upvoted
+            comments = CommentFactory.create_batch(size, post=post)
+
+            for comment in comments[::2]:
+                CommentVoteFactory(user=user, comment=comment, direction=1)
+
+            votes = [{'id': comment.id, 'direction': -1} for comment in comments]
+
+            cache.clear()
+
+            # Downvote the comments
+            with capture_queries() as statements:
+                self.vote(user, votes)
+
+            counts.append(len(statements))
+
+        # Assert the queries do not depend on the size of the batch
+        self.assertEqual(counts[0], counts[1])
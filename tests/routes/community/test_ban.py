@@ -184,3 +184,29 @@ class TestBan(BaseTestCase):
 
         # assert the error
         self.assertEqual(data['message'], 'The user is already banned from the community.')
+
+    def test_ban_not_subscribed_moderator_rolled_back(self):
+        # create a community
+        community = CommunityFactory()
+
+        CommunityModerator(community=community, user=community.owner).save()
+
+        # create a moderator that is not subscribed
+        user = UserFactory()
+
+        CommunityModerator(community=community, user=user).save()
+
+        # get user access token
+        access_token = get_access_token(community.owner)
+
+        # ban user from the community
+        response = self.client.post(
+            self.route.format(community.name, user.username),
+            headers={'Authorization': f'Bearer {access_token}'}
+        )
+
+        # assert response status code
+        self.assertEqual(response.status_code, 400)
+
+        # assert the user is still a moderator
+        self.assertTrue(user.is_moderator_of(community))
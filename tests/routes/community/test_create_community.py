@@ -7,6 +7,7 @@ from tests.factories.community_factory import CommunityFactory
 
 # Utils
 from tests.utils.tokens import get_access_token
+from tests.utils.queries import capture_commits
 
 
 class TestCreateCommunity(BaseTestCase):
@@ -219,4 +220,35 @@ class TestCreateCommunity(BaseTestCase):
         self.assertIn('message', data)
 
         # Assert response data values
-        self.assertEqual(data['message'], 'Name already taken.')
\ No newline at end of file
+        self.assertEqual(data['message'], 'Name already taken.')
+
+    def test_create_community_single_commit(self):
+        # Create a user
+        user = UserFactory()
+
+        # Get user access token
+        access_token = get_access_token(user)
+
+        # Data to be sent
+        json = {
+            'name': 'Videogames',
+            'about': 'Community for videogame lovers.',
+        }
+
+        # Create a community
+        with capture_commits() as commits:
+            response = self.client.post(
+                self.route,
+                headers={'Authorization': f'Bearer {access_token}'},
+                json=json
+            )
+
+        # Assert the response status code
+        self.assertEqual(response.status_code, 201)
+
+        # Assert that the community, its stats, subscriber and moderator were committed together
+        self.assertEqual(len(commits), 1)
+
+        # Assert the stats were updated within the transaction
+        self.assertEqual(response.json['stats']['subscribers_count'], 1)
+        self.assertEqual(response.json['stats']['moderators_count'], 1)
@@ -14,6 +14,7 @@ from app.models.community import CommunityModerator
 from tests.utils.tokens import get_access_token
 from tests.utils.assert_pagination import assert_pagination_structure_posts
 from tests.utils.assert_list import assert_post_list
+from tests.utils.queries import capture_queries
 
 
 class TestReadPosts(BaseTestCase):
@@ -1016,3 +1017,21 @@ class TestReadPosts(BaseTestCase):
 
         # Assert the message
         self.assertEqual(data['message'], 'Community not found.')
+
+    def test_read_posts_total_from_stats(self):
+        # Number of posts
+        n = 5
+
+        # Create a community
+        community = CommunityFactory()
+
+        # Create multiple posts
+        PostFactory.create_batch(n, community=community)
+
+        # Read the community posts
+        with capture_queries() as statements:
+            response = self.client.get(self.route.format(community.name))
+
+        # Assert the total comes from the community stats
+        self.assertEqual(response.json['total'], n)
+        self.assertFalse([statement for statement in statements if 'count(*)' in statement])
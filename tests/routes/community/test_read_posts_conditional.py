@@ -0,0 +1,83 @@
+# Base
+from tests.base.base_test_case import BaseTestCase
+
+# Factories
+from tests.factories.community_factory import CommunityFactory
+from tests.factories.post_factory import PostFactory
+from tests.factories.user_factory import UserFactory
+
+# Models
+from app.models.community import CommunitySubscriber
+
+# Managers
+from app.managers.post import PostVoteManager
+
+# Utils
+from tests.utils.queries import capture_queries
+
+
+class TestReadPostsConditional(BaseTestCase):
+    route = '/community/{}/posts'
+
+    def test_read_posts_not_modified(self):
+        # Create a community with posts
+        community = CommunityFactory()
+
+        PostFactory.create_batch(3, community=community)
+
+        # Read the posts
+        response = self.client.get(self.route.format(community.name))
+
+        etag, _ = response.get_etag()
+
+        # Read the posts again with the ETag
+        response = self.client.get(self.route.format(community.name), headers={'If-None-Match': f'"{etag}"'})
+
+        # Assert the posts were not sent again
+        self.assertEqual(response.status_code, 304)
+
+    def test_read_posts_cached_for_anonymous(self):
+        # Create a community with posts
+        community = CommunityFactory()
+
+        post, *_ = PostFactory.create_batch(3, community=community)
+
+        # Read the posts to cache them
+        self.client.get(self.route.format(community.name))
+
+        with capture_queries() as statements:
+            self.client.get(self.route.format(community.name))
+
+        # Assert the cached response was served without a query
+        self.assertEqual(len(statements), 0)
+
+        # Upvote a post of the page
+        user = UserFactory()
+
+        CommunitySubscriber(community=community, user=user).save()
+
+        PostVoteManager.create(user, post, direction=1)
+
+        # Assert the new version was sent
+        response = self.client.get(self.route.format(community.name))
+
+        upvotes = {data['id']: data['stats']['upvotes_count'] for data in response.json['posts']}
+
+        self.assertEqual(upvotes[post.id], 1)
+
+    def test_read_posts_cache_invalidated_by_new_post(self):
+        # Create a community with a post
+        community = CommunityFactory()
+
+        PostFactory(community=community)
+
+        # Read the posts to cache them
+        self.client.get(self.route.format(community.name))
+
+        # Create another post
+        PostFactory(community=community)
+
+        # Assert the new post is listed
+        response = self.client.get(self.route.format(community.name))
+
+        self.assertEqual(len(response.json['posts']), 2)
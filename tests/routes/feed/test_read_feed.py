@@ -0,0 +1,159 @@
+# Base
+from tests.base.base_test_case import BaseTestCase
+
+# Factories
+from tests.factories.user_factory import UserFactory
+from tests.factories.community_factory import CommunityFactory
+
+# Extensions
+from app.extensions.database import db
+
+# Models
+from app.models.community import CommunitySubscriber
+from app.models.feed import FeedItem
+
+# Managers
+from app.managers.post import PostManager
+from app.managers.community import SubscriptionManager
+from app.managers.user import FollowManager
+
+# Utils
+from tests.utils.tokens import get_access_token
+
+
+class TestReadFeed(BaseTestCase):
+    route = '/feed/'
+
+    def create_post(self, user, community):
+        # Subscribe the author so they can post
+        if not user.is_subscribed_to(community):
+            CommunitySubscriber(user=user, community=community).save()
+
+        return PostManager.create(user, community, {'title': 'Title', 'content': 'Content'})
+
+    def read_feed(self, user, **query_string):
+        access_token = get_access_token(user)
+
+        return self.client.get(
+            self.route,
+            headers={'Authorization': f'Bearer {access_token}'},
+            query_string=query_string
+        )
+
+    def test_read_feed(self):
+        # Create the users and communities
+        user, followed, stranger = UserFactory.create_batch(3)
+        subscribed, other = CommunityFactory.create_batch(2)
+
+        # Subscribe and follow
+        CommunitySubscriber(user=user, community=subscribed).save()
+        FollowManager.create(user, followed)
+
+        # Create the posts
+        community_post = self.create_post(stranger, subscribed)
+        followed_post = self.create_post(followed, other)
+        self.create_post(stranger, other)
+
+        # Read the feed
+        response = self.read_feed(user)
+
+        # Assert the response status code
+        self.assertEqual(response.status_code, 200)
+
+        # Assert the feed has the posts of the subscription and the follow
+        ids = [post['id'] for post in response.json['posts']]
+
+        self.assertCountEqual(ids, [community_post.id, followed_post.id])
+        self.assertEqual(response.json['total'], 2)
+
+    def test_read_feed_unauthenticated(self):
+        # Read the feed without a token
+        response = self.client.get(self.route)
+
+        # Assert the response status code
+        self.assertEqual(response.status_code, 401)
+
+    def test_read_feed_backfilled_on_subscribe(self):
+        # Create a user and a community with a post
+        user, author = UserFactory.create_batch(2)
+        community = CommunityFactory()
+
+        post = self.create_post(author, community)
+
+        # Subscribe after the post was created
+        SubscriptionManager.create(user, community)
+
+        # Assert the post is in the feed
+        response = self.read_feed(user)
+
+        self.assertEqual([item['id'] for item in response.json['posts']], [post.id])
+
+    def test_read_feed_pruned_on_unsubscribe(self):
+        # Create a user following an author of a community
+        user, author = UserFactory.create_batch(2)
+        community = CommunityFactory()
+
+        CommunitySubscriber(user=user, community=community).save()
+        FollowManager.create(user, author)
+
+        # Create the posts
+        followed_post = self.create_post(author, community)
+        self.create_post(UserFactory(), community)
+
+        # Unsubscribe
+        SubscriptionManager.delete(user, community)
+
+        # Assert only the post still delivered by the follow remains
+        response = self.read_feed(user)
+
+        self.assertEqual([item['id'] for item in response.json['posts']], [followed_post.id])
+
+    def test_read_feed_large_community_read_on_demand(self):
+        # Fan out only to communities with at most one subscriber
+        self.app.config['FEED_FANOUT_MAX_SUBSCRIBERS'] = 1
+
+        # Create a community with two subscribers
+        user, author = UserFactory.create_batch(2)
+        community = CommunityFactory()
+
+        CommunitySubscriber(user=user, community=community).save()
+        CommunitySubscriber(user=author, community=community).save()
+
+        # Create a post
+        post = self.create_post(author, community)
+
+        # Assert the post was not fanned out
+        items = db.session.scalars(db.select(FeedItem).where(FeedItem.post_id == post.id)).all()
+
+        self.assertEqual(items, [])
+
+        # Assert the post is still read into the feed
+        response = self.read_feed(user)
+
+        self.assertEqual([item['id'] for item in response.json['posts']], [post.id])
+
+    def test_read_feed_cursor(self):
+        # Create a user subscribed to a community
+        user = UserFactory()
+        community = CommunityFactory()
+
+        CommunitySubscriber(user=user, community=community).save()
+
+        # Create the posts
+        posts = [self.create_post(UserFactory(), community) for _ in range(5)]
+
+        # Follow the next links
+        response = self.read_feed(user, cursor='', per_page=2)
+
+        ids = [post['id'] for post in response.json['posts']]
+
+        while 'next' in response.json['links']:
+            response = self.client.get(
+                response.json['links']['next'],
+                headers={'Authorization': f'Bearer {get_access_token(user)}'}
+            )
+
+            ids.extend(post['id'] for post in response.json['posts'])
+
+        # Assert every post is read exactly once
+        self.assertCountEqual(ids, [post.id for post in posts])
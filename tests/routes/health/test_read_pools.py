@@ -0,0 +1,55 @@
+# Base
+from tests.base.base_test_case import BaseTestCase
+
+# Extensions
+from app.extensions.database import db
+
+
+class TestReadPools(BaseTestCase):
+    route = '/health/pools'
+
+    def read_pools(self, token):
+        return self.client.get(self.route, headers={'Authorization': f'Bearer {token}'})
+
+    def test_read_pools(self):
+        # Set the health token
+        self.app.config['HEALTH_TOKEN'] = 'health-token'
+
+        # Run a query
+        db.session.execute(db.select(1))
+        db.session.remove()
+
+        # Read the pools
+        response = self.read_pools('health-token')
+
+        # Assert the response status code
+        self.assertEqual(response.status_code, 200)
+
+        # Assert the metrics of the database's pool
+        pool = response.json['pools']['default']
+
+        self.assertGreaterEqual(pool['checkouts'], 1)
+        self.assertEqual(pool['checked_out'], 0)
+
+        for metric in ('checkout_wait', 'checkout_wait_max', 'timeouts', 'saturation', 'connects', 'closes'):
+            self.assertIn(metric, pool)
+
+        # Assert the process is named
+        self.assertIn('pid', response.json)
+
+    def test_read_pools_invalid_token(self):
+        # Set the health token
+        self.app.config['HEALTH_TOKEN'] = 'health-token'
+
+        # Read the pools with another token
+        response = self.read_pools('other-token')
+
+        # Assert the response status code
+        self.assertEqual(response.status_code, 401)
+
+    def test_read_pools_disabled(self):
+        # Read the pools without a health token configured
+        response = self.read_pools('None')
+
+        # Assert the response status code
+        self.assertEqual(response.status_code, 404)
@@ -7,6 +7,7 @@ from tests.factories.community_factory import CommunityFactory
 
 # Utils
 from tests.utils.tokens import get_access_token
+from tests.utils.queries import capture_commits
 
 # Models
 from app.models.community import CommunitySubscriber
@@ -403,3 +404,37 @@ class TestCreatePost(BaseTestCase):
 
         # Assert response data values
         self.assertEqual(data['message'], 'You are banned from this community.')
+
+    def test_create_post_single_commit(self):
+        # Create a user
+        user = UserFactory()
+
+        # Create a community
+        community = CommunityFactory()
+
+        # Append the user to the community subscribers
+        CommunitySubscriber(community=community, user=user).save()
+
+        # Get the user access token
+        access_token = get_access_token(user)
+
+        # Data to be sent
+        json = {
+            'community_id': community.id,
+            'title': 'New post',
+            'content': 'This is a new post'
+        }
+
+        # Create a post
+        with capture_commits() as commits:
+            response = self.client.post(
+                self.route,
+                headers={'Authorization': f'Bearer {access_token}'},
+                json=json
+            )
+
+        # Assert the response status code
+        self.assertEqual(response.status_code, 201)
+
+        # Assert that the post and its stats were committed together
+        self.assertEqual(len(commits), 1)
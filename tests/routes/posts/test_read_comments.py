@@ -467,4 +467,34 @@ class TestReadComments(BaseTestCase):
         comments = pagination['comments']
 
         # Assert the comments list
-        assert_comment_list(self, comments)
\ No newline at end of file
+        assert_comment_list(self, comments)
+
+    def test_read_comments_with_replies(self):
+        # Create a post
+        post = PostFactory()
+
+        # Create a thread of comments
+        root = CommentFactory(post=post)
+        reply = CommentFactory(post=post, comment=root)
+        nested = CommentFactory(post=post, comment=reply)
+
+        # Get the comments
+        response = self.client.get(
+            self.route.format(post.id)
+        )
+
+        # Check status code
+        self.assertEqual(response.status_code, 200)
+
+        # Get the comments
+        comments = response.json['comments']
+
+        # Assert only the root comment is listed
+        assert_comment_list(self, comments, 1)
+
+        # Assert the replies are nested
+        replies = comments[0]['replies']
+
+        self.assertEqual([r['id'] for r in replies], [reply.id])
+        self.assertEqual([r['id'] for r in replies[0]['replies']], [nested.id])
+        self.assertEqual(replies[0]['replies'][0]['replies'], [])
@@ -0,0 +1,138 @@
+# Base
+from tests.base.base_test_case import BaseTestCase
+
+# Factories
+from tests.factories.post_factory import PostFactory
+from tests.factories.user_factory import UserFactory
+
+# Models
+from app.models.community import CommunitySubscriber
+
+# Managers
+from app.managers.post import PostManager
+from app.managers.post import PostVoteManager
+from app.managers.post import PostBookmarkManager
+
+# Utils
+from tests.utils.tokens import get_access_token
+from tests.utils.queries import capture_queries
+
+
+class TestReadPostConditional(BaseTestCase):
+    route = '/post/{}'
+
+    def read(self, post_id, etag=None, access_token=None):
+        headers = {}
+
+        if etag is not None:
+            headers['If-None-Match'] = f'"{etag}"'
+
+        if access_token is not None:
+            headers['Authorization'] = f'Bearer {access_token}'
+
+        return self.client.get(self.route.format(post_id), headers=headers)
+
+    def test_read_post_not_modified(self):
+        # Create a post
+        post = PostFactory()
+
+        # Read the post
+        response = self.read(post.id)
+
+        etag, _ = response.get_etag()
+
+        self.assertIsNotNone(etag)
+        self.assertIsNotNone(response.last_modified)
+
+        # Read the post again with its ETag
+        response = self.read(post.id, etag=etag)
+
+        # Assert the post was not sent again
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b'')
+
+    def test_read_post_modified_by_vote(self):
+        # Create a post and a voter
+        post = PostFactory()
+        user = UserFactory()
+
+        CommunitySubscriber(community=post.community, user=user).save()
+
+        # Read the post
+        etag, _ = self.read(post.id).get_etag()
+
+        # Upvote the post
+        PostVoteManager.create(user, post, direction=1)
+
+        # Read the post again with the old ETag
+        response = self.read(post.id, etag=etag)
+
+        # Assert the new version was sent
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json['stats']['upvotes_count'], 1)
+        self.assertNotEqual(response.get_etag()[0], etag)
+
+    def test_read_post_modified_by_viewer_bookmark(self):
+        # Create a post and a viewer
+        post = PostFactory()
+        user = UserFactory()
+
+        CommunitySubscriber(community=post.community, user=user).save()
+
+        access_token = get_access_token(user)
+
+        # Read the post
+        etag, _ = self.read(post.id, access_token=access_token).get_etag()
+
+        # Bookmark the post
+        PostBookmarkManager.create(user, post)
+
+        # Read the post again with the old ETag
+        response = self.read(post.id, etag=etag, access_token=access_token)
+
+        # Assert the new version was sent
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json['bookmarked'])
+
+    def test_read_post_etag_per_viewer(self):
+        # Create a post and a viewer
+        post = PostFactory()
+        user = UserFactory()
+
+        # Read the post anonymously
+        etag, _ = self.read(post.id).get_etag()
+
+        # Read the post as the viewer with the anonymous ETag
+        response = self.read(post.id, etag=etag, access_token=get_access_token(user))
+
+        # Assert the viewer got their own version
+        self.assertEqual(response.status_code, 200)
+
+    def test_read_post_cached_for_anonymous(self):
+        # Create a post
+        post = PostFactory()
+
+        # Read the post to cache it
+        first = self.read(post.id)
+
+        # Read the post again
+        with capture_queries() as statements:
+            second = self.read(post.id)
+
+        # Assert the cached response was served without a query
+        self.assertEqual(len(statements), 0)
+        self.assertEqual(second.json, first.json)
+        self.assertEqual(second.get_etag(), first.get_etag())
+
+    def test_read_post_cache_invalidated_by_update(self):
+        # Create a post
+        post = PostFactory()
+
+        # Read the post to cache it
+        self.read(post.id)
+
+        # Update the post
+        PostManager.update(post.owner, post, {'title': 'New title'})
+
+        # Assert the new version was sent
+        self.assertEqual(self.read(post.id).json['title'], 'New title')
@@ -1,17 +1,29 @@
+# Datetime
+from datetime import datetime
+from datetime import timedelta
+
 # Base
 from tests.base.base_test_case import BaseTestCase
 
 # Factories
 from tests.factories.post_factory import PostFactory
 from tests.factories.user_factory import UserFactory
+from tests.factories.post_vote_factory import PostVoteFactory
 
 # models
 from app.models.user import Block
 
+# Extensions
+from app.extensions.cache import cache
+
 # utils
 from tests.utils.tokens import get_access_token
 from tests.utils.assert_pagination import assert_pagination_structure_posts
 from tests.utils.assert_list import assert_post_list
+from tests.utils.queries import capture_queries
+from tests.utils.queries import count_queries_on
+from app.utils.pagination import encode_cursor
+from app.utils.pagination import decode_cursor
 
 
 class TestDeletePost(BaseTestCase):
@@ -526,3 +538,277 @@ class TestDeletePost(BaseTestCase):
 
         # Assert the response data
         assert_post_list(self, posts, expected_count=0)
+
+    def test_read_posts_flag_queries_independent_of_per_page(self):
+        # Create a user
+        user = UserFactory()
+
+        # Create multiple posts
+        PostFactory.create_batch(20)
+
+        # Get user access token
+        access_token = get_access_token(user)
+
+        flag_queries = []
+
+        for per_page in (5, 20):
+            # Get the posts
+            with capture_queries() as statements:
+                response = self.client.get(
+                    self.route,
+                    headers={'Authorization': f'Bearer {access_token}'},
+                    query_string={'page': 1, 'per_page': per_page}
+                )
+
+            # Assert the response status code
+            self.assertEqual(response.status_code, 200)
+
+            # Assert the response data
+            assert_post_list(self, response.json['posts'], expected_count=per_page)
+
+            flag_queries.append(
+                count_queries_on(statements, 'post_bookmarks') +
+                count_queries_on(statements, 'post_votes')
+            )
+
+        # Assert the flags cost the same whatever the page size
+        self.assertEqual(flag_queries, [2, 2])
+
+    def test_read_posts_block_graph_cached(self):
+        # Create a user
+        user = UserFactory()
+
+        # Create multiple posts
+        posts = PostFactory.create_batch(3)
+
+        # Block the owner of a post
+        Block(blocker=user, blocked=posts[0].owner).save()
+
+        # Get user access token
+        access_token = get_access_token(user)
+
+        block_queries = []
+
+        for _ in range(2):
+            # Get the posts
+            with capture_queries() as statements:
+                response = self.client.get(
+                    self.route,
+                    headers={'Authorization': f'Bearer {access_token}'}
+                )
+
+            # Assert the blocked owner's post is filtered out
+            assert_post_list(self, response.json['posts'], expected_count=2)
+
+            block_queries.append(
+                sum(1 for statement in statements if statement.startswith('SELECT blocks.'))
+            )
+
+        # Assert the block graph is only loaded once
+        self.assertEqual(block_queries, [1, 0])
+
+    def test_read_posts_cursor(self):
+        # Number of posts
+        n = 7
+
+        # Create the posts
+        posts = PostFactory.create_batch(n)
+
+        # Get the first page in cursor mode
+        response = self.client.get(self.route, query_string={'cursor': '', 'per_page': 3})
+
+        # Assert the response status code
+        self.assertEqual(response.status_code, 200)
+
+        # Get the response pagination
+        pagination = response.json
+
+        # Assert the total is not counted and there is no previous page
+        self.assertIsNone(pagination['total'])
+        self.assertIsNone(pagination['page'])
+        self.assertNotIn('prev', pagination['links'])
+
+        # Follow the next links
+        pages = [pagination]
+
+        while 'next' in pages[-1]['links']:
+            pages.append(self.client.get(pages[-1]['links']['next']).json)
+
+        # Assert every post is read exactly once
+        ids = [post['id'] for page in pages for post in page['posts']]
+
+        self.assertEqual([len(page['posts']) for page in pages], [3, 3, 1])
+        self.assertCountEqual(ids, [post.id for post in posts])
+
+        # Go back from the last page
+        response = self.client.get(pages[-1]['links']['prev'])
+
+        # Assert the previous page is the second page
+        self.assertEqual(response.json['posts'], pages[1]['posts'])
+        self.assertIn('next', response.json['links'])
+
+    def test_read_posts_cursor_args(self):
+        # Number of posts
+        n = 5
+
+        # Create the posts
+        PostFactory.create_batch(n)
+
+        # Get the first page sorted by upvotes
+        query_string = {'cursor': '', 'per_page': 2, 'sort_by': 'upvotes', 'sort_order': 'asc', 'include_total': True}
+
+        response = self.client.get(self.route, query_string=query_string)
+
+        # Assert the total is counted on request
+        self.assertEqual(response.json['total'], n)
+
+        # Follow the next links
+        ids = [post['id'] for post in response.json['posts']]
+
+        while 'next' in response.json['links']:
+            response = self.client.get(response.json['links']['next'])
+
+            ids.extend(post['id'] for post in response.json['posts'])
+
+        # Assert the ties are broken by ID
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual(len(ids), n)
+
+    def test_read_posts_cursor_per_page_invalid(self):
+        # Number of posts
+        n = 21
+
+        # Create the posts
+        PostFactory.create_batch(n)
+
+        for per_page in (0, -3):
+            # Get the first page with an invalid page size
+            response = self.client.get(self.route, query_string={'cursor': '', 'per_page': per_page})
+
+            # Assert the response status code
+            self.assertEqual(response.status_code, 200)
+
+            # Assert the page falls back to the default size
+            self.assertEqual(response.json['per_page'], 20)
+            self.assertEqual(len(response.json['posts']), 20)
+            self.assertIn('next', response.json['links'])
+
+    def test_read_posts_cursor_invalid(self):
+        # Get the posts with a malformed cursor
+        response = self.client.get(self.route, query_string={'cursor': 'not-a-cursor'})
+
+        # Assert the response status code
+        self.assertEqual(response.status_code, 422)
+
+    def test_read_posts_cursor_tampered(self):
+        # Create a post
+        post = PostFactory()
+
+        cursors = [
+            # A key that is not a date
+            encode_cursor('created_at', 'notadate', post.id, 'next'),
+            # A key that is not a number
+            encode_cursor('upvotes', 'notanumber', post.id, 'next'),
+            # No key
+            encode_cursor('created_at', None, post.id, 'next'),
+        ]
+
+        for cursor, sort_by in zip(cursors, ('created_at', 'upvotes', 'created_at')):
+            # Get the posts with the tampered cursor
+            response = self.client.get(self.route, query_string={'cursor': cursor, 'sort_by': sort_by})
+
+            # Assert the response status code
+            self.assertEqual(response.status_code, 422)
+
+    def test_read_posts_cursor_changed_sort(self):
+        # Create the posts
+        PostFactory.create_batch(3)
+
+        # Get the first page sorted by upvotes
+        response = self.client.get(self.route, query_string={'cursor': '', 'per_page': 2, 'sort_by': 'upvotes'})
+
+        next_cursor = decode_cursor(response.json['links']['next'].split('cursor=')[1].split('&')[0])
+
+        # Assert the cursor carries its sort
+        self.assertEqual(next_cursor['sort'], 'upvotes')
+
+        # Get the next page sorted by date
+        cursor = encode_cursor(**next_cursor)
+
+        response = self.client.get(self.route, query_string={'cursor': cursor, 'sort_by': 'created_at'})
+
+        # Assert the response status code
+        self.assertEqual(response.status_code, 422)
+
+    def test_read_posts_total_cached(self):
+        # Number of posts
+        n = 5
+
+        # Create the posts
+        PostFactory.create_batch(n)
+
+        # Read the posts twice
+        response = self.client.get(self.route)
+
+        with capture_queries() as statements:
+            cached_response = self.client.get(self.route)
+
+        # Assert the second total is served from the cache
+        self.assertEqual(response.json['total'], n)
+        self.assertEqual(cached_response.json['total'], n)
+        self.assertFalse([statement for statement in statements if 'count(*)' in statement])
+
+        # Create another post
+        PostFactory()
+
+        # Assert the cached total is served until it is dropped
+        response = self.client.get(self.route)
+
+        self.assertEqual(response.json['total'], n)
+
+        cache.clear()
+
+        response = self.client.get(self.route)
+
+        self.assertEqual(response.json['total'], n + 1)
+
+    def test_read_posts_sort_hot(self):
+        # Create an old post with upvotes and a new one without
+        old_post = PostFactory(created_at=datetime.now() - timedelta(days=7))
+        new_post = PostFactory(created_at=datetime.now())
+
+        PostVoteFactory.create_batch(10, post=old_post, direction=1)
+
+        # Get the hot posts
+        response = self.client.get(self.route, query_string={'sort_by': 'hot'})
+
+        # Assert the response status code
+        self.assertEqual(response.status_code, 200)
+
+        # Assert the new post outranks the old one
+        ids = [post['id'] for post in response.json['posts']]
+
+        self.assertEqual(ids, [new_post.id, old_post.id])
+
+    def test_read_posts_sort_best(self):
+        # Create the posts
+        few_votes = PostFactory()
+        many_votes = PostFactory()
+        downvoted = PostFactory()
+
+        # One upvote, ten upvotes with a downvote, and a downvote
+        PostVoteFactory(post=few_votes, direction=1)
+        PostVoteFactory.create_batch(10, post=many_votes, direction=1)
+        PostVoteFactory(post=many_votes, direction=-1)
+        PostVoteFactory(post=downvoted, direction=-1)
+
+        # Get the best posts
+        response = self.client.get(self.route, query_string={'sort_by': 'best'})
+
+        # Assert the response status code
+        self.assertEqual(response.status_code, 200)
+
+        # Assert the posts are ranked by the confidence in their upvote share
+        ids = [post['id'] for post in response.json['posts']]
+
+        self.assertEqual(ids, [many_votes.id, few_votes.id, downvoted.id])
@@ -0,0 +1,142 @@
+# Base
+from tests.base.base_test_case import BaseTestCase
+
+# Factories
+from tests.factories.post_factory import PostFactory
+from tests.factories.user_factory import UserFactory
+
+# Extensions
+from app.extensions.database import db
+
+# utils
+from tests.utils.tokens import get_access_token
+from tests.utils.queries import capture_queries
+from tests.utils.queries import count_queries_on
+
+
+class TestReadPostsFieldset(BaseTestCase):
+    route = '/post/'
+
+    def read_posts(self, query, access_token=None):
+        # Start from an empty session, as a new request would
+        db.session.expunge_all()
+
+        headers = {'Authorization': f'Bearer {access_token}'} if access_token else {}
+
+        with capture_queries() as statements:
+            response = self.client.get(f'{self.route}?{query}', headers=headers)
+
+        return response, statements
+
+    def test_read_posts_fields(self):
+        # Create posts
+        PostFactory.create_batch(3)
+
+        # Get only the titles of the posts
+        response, statements = self.read_posts('fields=id,title')
+
+        # Assert the posts only have the requested fields
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json['posts']), 3)
+
+        for post in response.json['posts']:
+            self.assertEqual(list(post), ['id', 'title'])
+
+        # Assert the users and communities were not read
+        self.assertEqual(count_queries_on(statements, 'users'), 0)
+        self.assertEqual(count_queries_on(statements, 'communities'), 0)
+        self.assertEqual(count_queries_on(statements, 'community_stats'), 0)
+
+    def test_read_posts_fields_skip_viewer_flags(self):
+        # Create a user and posts
+        user = UserFactory()
+        PostFactory.create_batch(3)
+
+        # Get the access token
+        access_token = get_access_token(user)
+
+        # Get only the titles of the posts
+        response, statements = self.read_posts('fields=title', access_token)
+
+        # Assert the bookmarks and votes of the viewer were not read
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(count_queries_on(statements, 'post_bookmarks'), 0)
+        self.assertEqual(count_queries_on(statements, 'post_votes'), 0)
+
+    def test_read_posts_nested_fields(self):
+        # Create posts
+        posts = PostFactory.create_batch(3)
+        usernames = {post.owner.username for post in posts}
+
+        # Get the titles of the posts and the names of their owners
+        response, statements = self.read_posts('fields=title,owner.username')
+
+        # Assert the owners only have their username
+        self.assertEqual(response.status_code, 200)
+
+        for post in response.json['posts']:
+            self.assertEqual(list(post), ['title', 'owner'])
+            self.assertEqual(list(post['owner']), ['username'])
+
+        self.assertEqual({post['owner']['username'] for post in response.json['posts']}, usernames)
+
+        # Assert the owners were loaded with a single query
+        self.assertEqual(count_queries_on(statements, 'users'), 1)
+        self.assertEqual(count_queries_on(statements, 'communities'), 0)
+
+    def test_read_posts_include(self):
+        # Create posts
+        PostFactory.create_batch(3)
+
+        # Get the posts with their owner but not their community
+        response, statements = self.read_posts('include=owner')
+
+        # Assert the posts have their plain fields and their owner
+        self.assertEqual(response.status_code, 200)
+
+        for post in response.json['posts']:
+            self.assertIn('title', post)
+            self.assertIn('stats', post['owner'])
+            self.assertNotIn('community', post)
+            self.assertNotIn('stats', post)
+
+        # Assert the owners and their stats were eager-loaded
+        self.assertEqual(count_queries_on(statements, 'users'), 1)
+        self.assertEqual(count_queries_on(statements, 'user_stats'), 1)
+        self.assertEqual(count_queries_on(statements, 'communities'), 0)
+
+    def test_read_posts_fields_and_include(self):
+        # Create posts
+        PostFactory.create_batch(2)
+
+        # Get the titles of the posts with their community
+        response, _ = self.read_posts('fields=title,owner.username&include=community,owner')
+
+        # Assert the included relationships are dumped in full
+        self.assertEqual(response.status_code, 200)
+
+        for post in response.json['posts']:
+            self.assertEqual(list(post), ['title', 'owner', 'community'])
+            self.assertIn('stats', post['owner'])
+            self.assertIn('name', post['community'])
+
+    def test_read_posts_fieldset_cursor(self):
+        # Create posts
+        PostFactory.create_batch(3)
+
+        # Get a cursor page of titles
+        response, statements = self.read_posts('cursor=&per_page=2&fields=title')
+
+        # Assert the page only has the titles
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([list(post) for post in response.json['posts']], [['title'], ['title']])
+        self.assertIn('next', response.json['links'])
+        self.assertEqual(count_queries_on(statements, 'users'), 0)
+
+    def test_read_posts_fieldset_invalid(self):
+        # Ask for unknown fields and relationships
+        for query in ('fields=nope', 'fields=title.length', 'fields=', 'include=title', 'fields=password'):
+            response, _ = self.read_posts(query)
+
+            # Assert the request is rejected
+            self.assertEqual(response.status_code, 422, query)
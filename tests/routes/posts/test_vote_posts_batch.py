@@ -0,0 +1,228 @@
+# Base
+from tests.base.base_test_case import BaseTestCase
+
+# Factories
+from tests.factories.user_factory import UserFactory
+from tests.factories.community_factory import CommunityFactory
+from tests.factories.post_factory import PostFactory
+from tests.factories.post_vote_factory import PostVoteFactory
+
+# Utils
+from tests.utils.tokens import get_access_token
+from tests.utils.queries import capture_queries
+
+# Extensions
+from app.extensions.database import db
+from app.extensions.cache import cache
+
+# Models
+from app.models.post import PostVote
+from app.models.community import CommunitySubscriber
+from app.models.community import CommunityBan
+from app.models.user import Block
+
+
+class TestVotePostsBatch(BaseTestCase):
+    route = '/post/votes:batch'
+
+    def vote(self, user, votes):
+        return self.client.post(
+            self.route,
+            json={'votes': votes},
+            headers={'Authorization': f'Bearer {get_access_token(user)}'}
+        )
+
+    def test_vote_posts_batch(self):
+        # Create a community
+        community = CommunityFactory()
+
+        # Create posts in the community
+        posts = PostFactory.create_batch(3, community=community)
+
+        # Create a user
+        user = UserFactory()
+
+        # Append the user to the community's subscribers
+        CommunitySubscriber(community=community, user=user).save()
+
+        # Downvote the last post
+        PostVoteFactory(user=user, post=posts[2], direction=-1)
+
+        # Vote on the posts
+        response = self.vote(user, [
+            {'id': posts[0].id, 'direction': 1},
+            {'id': posts[1].id, 'direction': -1},
+            {'id': posts[2].id, 'direction': 1},
+        ])
+
+        # Check status code
+        self.assertEqual(response.status_code, 200)
+
+        # Assert every vote was applied
+        self.assertEqual(response.json['votes'], [
+            {'id': posts[0].id, 'direction': 1, 'error': None},
+            {'id': posts[1].id, 'direction': -1, 'error': None},
+            {'id': posts[2].id, 'direction': 1, 'error': None},
+        ])
+
+        # Assert the votes were written
+        for post, direction in zip(posts, (1, -1, 1)):
+            self.assertEqual(PostVote.get_by_user_and_post(user, post).direction, direction)
+
+        # Assert the stats of the posts were updated
+        for post, counts in zip(posts, ((1, 0), (0, 1), (1, 0))):
+            db.session.refresh(post.stats)
+
+            self.assertEqual((post.stats.upvotes_count, post.stats.downvotes_count), counts)
+
+    def test_vote_posts_batch_again(self):
+        # Create a community
+        community = CommunityFactory()
+
+        # Create posts in the community
+        posts = PostFactory.create_batch(2, community=community)
+
+        # Create a user
+        user = UserFactory()
+
+        # Append the user to the community's subscribers
+        CommunitySubscriber(community=community, user=user).save()
+
+        votes = [{'id': post.id, 'direction': 1} for post in posts]
+
+        # Send the same batch twice
+        self.vote(user, votes)
+        response = self.vote(user, votes)
+
+        # Assert the votes were accepted
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(all(vote['error'] is None for vote in response.json['votes']))
+
+        # Assert the votes were counted once
+        for post in posts:
+            db.session.refresh(post.stats)
+
+            self.assertEqual(post.stats.upvotes_count, 1)
+
+    def test_vote_posts_batch_last_vote_wins(self):
+        # Create a post
+        post = PostFactory()
+
+        # Create a user
+        user = UserFactory()
+
+        # Append the user to the post's community's subscribers
+        CommunitySubscriber(community=post.community, user=user).save()
+
+        # Upvote then downvote the post in the same batch
+        response = self.vote(user, [
+            {'id': post.id, 'direction': 1},
+            {'id': post.id, 'direction': -1},
+        ])
+
+        # Assert the post is reported once
+        self.assertEqual(response.json['votes'], [{'id': post.id, 'direction': -1, 'error': None}])
+
+        # Assert only the last vote was counted
+        db.session.refresh(post.stats)
+
+        self.assertEqual((post.stats.upvotes_count, post.stats.downvotes_count), (0, 1))
+
+    def test_vote_posts_batch_rejected(self):
+        # Create a user
+        user = UserFactory()
+
+        # Create a post the user can vote on
+        post = PostFactory()
+        CommunitySubscriber(community=post.community, user=user).save()
+
+        # Create a post in a community the user is not subscribed to
+        unsubscribed_post = PostFactory()
+
+        # Create a post in a community the user is banned from
+        banned_post = PostFactory()
+        CommunitySubscriber(community=banned_post.community, user=user).save()
+        CommunityBan(community=banned_post.community, user=user).save()
+
+        # Create a post of a user blocked by the user
+        blocked_post = PostFactory()
+        CommunitySubscriber(community=blocked_post.community, user=user).save()
+        Block(blocker=user, blocked=blocked_post.owner).save()
+
+        # Vote on the posts and on a post that does not exist
+        response = self.vote(user, [
+            {'id': post.id, 'direction': 1},
+            {'id': unsubscribed_post.id, 'direction': 1},
+            {'id': banned_post.id, 'direction': 1},
+            {'id': blocked_post.id, 'direction': 1},
+            {'id': 0, 'direction': 1},
+        ])
+
+        # Assert each vote has its reason
+        self.assertEqual([vote['error'] for vote in response.json['votes']], [
+            None,
+            'You are not subscribed to this community.',
+            'You are banned from this community.',
+            'You cannot vote on this post.',
+            'Post not found.',
+        ])
+
+        # Assert only the allowed vote was written
+        self.assertIsNotNone(PostVote.get_by_user_and_post(user, post))
+
+        for rejected_post in (unsubscribed_post, banned_post, blocked_post):
+            self.assertIsNone(PostVote.get_by_user_and_post(user, rejected_post))
+
+    def test_vote_posts_batch_invalid(self):
+        # Create a user
+        user = UserFactory()
+
+        # Send an empty batch, an invalid direction and a batch too large
+        for votes in (
+            [],
+            [{'id': 1, 'direction': 2}],
+            [{'id': i, 'direction': 1} for i in range(self.app.config['VOTES_BATCH_MAX_SIZE'] + 1)],
+        ):
+            response = self.vote(user, votes)
+
+            # Check status code
+            self.assertEqual(response.status_code, 400)
+
+    def test_vote_posts_batch_query_count(self):
+        # Create a community
+        community = CommunityFactory()
+
+        # Create a user
+        user = UserFactory()
+
+        # Append the user to the community's subscribers
+        CommunitySubscriber(community=community, user=user).save()
+
+        counts = []
+
+        for size in (2, 10):
+            # Create posts in the community, half of them downvoted
+            posts = PostFactory.create_batch(size, community=community)
+
+            for post in posts[::2]:
+                PostVoteFactory(user=user, post=post, direction=-1)
+
+            votes = [{'id': post.id, 'direction': 1} for post in posts]
+
+            cache.clear()
+
+            # Upvote the posts
+            with capture_queries() as statements:
+                self.vote(user, votes)
+
+            counts.append(len(statements))
+
+        # Assert the queries do not depend on the size of the batch
+        self.assertEqual(counts[0], counts[1])
+
+    def test_vote_posts_batch_unauthenticated(self):
+        # Vote without a token
+        response = self.client.post(self.route, json={'votes': [{'id': 1, 'direction': 1}]})
+
+        # Check status code
+        self.assertEqual(response.status_code, 401)
@@ -0,0 +1,175 @@
+# Base
+from tests.base.base_test_case import BaseTestCase
+
+# Factories
+from tests.factories.user_factory import UserFactory
+from tests.factories.community_factory import CommunityFactory
+from tests.factories.post_factory import PostFactory
+from tests.factories.comment_factory import CommentFactory
+from tests.factories.post_vote_factory import PostVoteFactory
+from tests.factories.post_bookmark_factory import PostBookmarkFactory
+from tests.factories.comment_vote_factory import CommentVoteFactory
+from tests.factories.comment_bookmark_factory import CommentBookmarkFactory
+from tests.factories.follow_factory import FollowFactory
+from tests.factories.block_factory import BlockFactory
+
+# Extensions
+from app.extensions.database import db
+
+# Models
+from app.models.user import User
+from app.models.community import CommunitySubscriber
+from app.models.community import CommunityModerator
+from app.models.community import CommunityBan
+from app.models.feed import FeedItem
+
+# Utils
+from tests.utils.tokens import get_access_token
+from tests.utils.queries import assert_constant_queries
+
+
+# Tables of the objects dumped in the listings, leaving out the viewer flags
+RELATIONSHIP_TABLES = (
+    'users', 'user_stats', 'communities', 'community_stats',
+    'posts', 'post_stats', 'comments', 'comment_stats',
+)
+
+
+def repeat(create):
+    return lambda n: [create() for _ in range(n)]
+
+
+class TestListingQueries(BaseTestCase):
+    def assert_constant_viewer_queries(self, route, create):
+        # Create the viewer, read again from the session each time a row is added
+        user_id = UserFactory().id
+
+        viewer = lambda: db.session.get(User, user_id)
+
+        headers = {'Authorization': f'Bearer {get_access_token(viewer())}'}
+
+        assert_constant_queries(self, route, repeat(lambda: create(viewer())), headers=headers, tables=RELATIONSHIP_TABLES)
+
+    def test_read_posts(self):
+        assert_constant_queries(self, '/post/', repeat(PostFactory))
+
+    def test_read_post_upvoters(self):
+        post = PostFactory()
+
+        assert_constant_queries(self, f'/post/{post.id}/upvoters', repeat(lambda: PostVoteFactory(post=post, direction=1)))
+
+    def test_read_post_downvoters(self):
+        post = PostFactory()
+
+        assert_constant_queries(self, f'/post/{post.id}/downvoters', repeat(lambda: PostVoteFactory(post=post, direction=-1)))
+
+    def test_read_post_comments(self):
+        post = PostFactory()
+
+        def create():
+            comment = CommentFactory(post=post)
+            CommentFactory(post=post, comment_id=comment.id)
+
+        assert_constant_queries(self, f'/post/{post.id}/comments', repeat(create))
+
+    def test_read_comments(self):
+        assert_constant_queries(self, '/comment/', repeat(CommentFactory))
+
+    def test_read_comment_upvoters(self):
+        comment = CommentFactory()
+
+        assert_constant_queries(self, f'/comment/{comment.id}/upvoters', repeat(lambda: CommentVoteFactory(comment=comment, direction=1)))
+
+    def test_read_comment_downvoters(self):
+        comment = CommentFactory()
+
+        assert_constant_queries(self, f'/comment/{comment.id}/downvoters', repeat(lambda: CommentVoteFactory(comment=comment, direction=-1)))
+
+    def test_read_communities(self):
+        assert_constant_queries(self, '/community/', repeat(CommunityFactory))
+
+    def test_read_community_subscribers(self):
+        community = CommunityFactory()
+
+        create = lambda: CommunitySubscriber(community=community, user=UserFactory()).save()
+
+        assert_constant_queries(self, f'/community/{community.name}/subscribers', repeat(create))
+
+    def test_read_community_moderators(self):
+        community = CommunityFactory()
+
+        create = lambda: CommunityModerator(community=community, user=UserFactory()).save()
+
+        assert_constant_queries(self, f'/community/{community.name}/moderators', repeat(create))
+
+    def test_read_community_banned(self):
+        community = CommunityFactory()
+
+        create = lambda: CommunityBan(community=community, user=UserFactory()).save()
+
+        assert_constant_queries(self, f'/community/{community.name}/banned', repeat(create))
+
+    def test_read_community_posts(self):
+        community = CommunityFactory()
+
+        assert_constant_queries(self, f'/community/{community.name}/posts', repeat(lambda: PostFactory(community=community)))
+
+    def test_read_users(self):
+        assert_constant_queries(self, '/user/', repeat(UserFactory))
+
+    def test_read_following(self):
+        user = UserFactory()
+
+        assert_constant_queries(self, f'/user/{user.username}/following', repeat(lambda: FollowFactory(follower=user)))
+
+    def test_read_followers(self):
+        user = UserFactory()
+
+        assert_constant_queries(self, f'/user/{user.username}/followers', repeat(lambda: FollowFactory(followed=user)))
+
+    def test_read_subscriptions(self):
+        user = UserFactory()
+
+        create = lambda: CommunitySubscriber(community=CommunityFactory(), user=user).save()
+
+        assert_constant_queries(self, f'/user/{user.username}/subscriptions', repeat(create))
+
+    def test_read_user_posts(self):
+        user = UserFactory()
+
+        assert_constant_queries(self, f'/user/{user.username}/posts', repeat(lambda: PostFactory(owner=user)))
+
+    def test_read_user_comments(self):
+        user = UserFactory()
+
+        assert_constant_queries(self, f'/user/{user.username}/comments', repeat(lambda: CommentFactory(owner=user)))
+
+    def test_read_blocked(self):
+        self.assert_constant_viewer_queries('/user/blocked', lambda user: BlockFactory(blocker=user))
+
+    def test_read_bookmarked_posts(self):
+        self.assert_constant_viewer_queries('/user/posts/bookmarked', lambda user: PostBookmarkFactory(user=user))
+
+    def test_read_upvoted_posts(self):
+        self.assert_constant_viewer_queries('/user/posts/upvoted', lambda user: PostVoteFactory(user=user, direction=1))
+
+    def test_read_downvoted_posts(self):
+        self.assert_constant_viewer_queries('/user/posts/downvoted', lambda user: PostVoteFactory(user=user, direction=-1))
+
+    def test_read_bookmarked_comments(self):
+        self.assert_constant_viewer_queries('/user/comments/bookmarked', lambda user: CommentBookmarkFactory(user=user))
+
+    def test_read_upvoted_comments(self):
+        self.assert_constant_viewer_queries('/user/comments/upvoted', lambda user: CommentVoteFactory(user=user, direction=1))
+
+    def test_read_downvoted_comments(self):
+        self.assert_constant_viewer_queries('/user/comments/downvoted', lambda user: CommentVoteFactory(user=user, direction=-1))
+
+    def test_read_feed(self):
+        def create(user):
+            post = PostFactory()
+
+            db.session.add(FeedItem(user_id=user.id, post_id=post.id, created_at=post.created_at))
+            db.session.commit()
+
+        self.assert_constant_viewer_queries('/feed/', create)
@@ -0,0 +1,51 @@
+# Base
+from tests.base.base_test_case import BaseTestCase
+
+# Factories
+from tests.factories.user_factory import UserFactory
+
+# Managers
+from app.managers.user import FollowManager
+
+# Utils
+from tests.utils.tokens import get_access_token
+
+
+class TestReadUserConditional(BaseTestCase):
+    route = '/user/{}'
+
+    def test_read_user_not_modified(self):
+        # Create a user
+        user = UserFactory()
+
+        # Read the user
+        etag, _ = self.client.get(self.route.format(user.username)).get_etag()
+
+        # Read the user again with the ETag
+        response = self.client.get(self.route.format(user.username), headers={'If-None-Match': f'"{etag}"'})
+
+        # Assert the user was not sent again
+        self.assertEqual(response.status_code, 304)
+
+    def test_read_user_modified_by_follow(self):
+        # Create users
+        user, follower = UserFactory.create_batch(2)
+
+        access_token = get_access_token(follower)
+        headers = {'Authorization': f'Bearer {access_token}'}
+
+        # Read the user
+        etag, _ = self.client.get(self.route.format(user.username), headers=headers).get_etag()
+
+        # Follow the user
+        FollowManager.create(follower, user)
+
+        # Read the user again with the old ETag
+        headers['If-None-Match'] = f'"{etag}"'
+
+        response = self.client.get(self.route.format(user.username), headers=headers)
+
+        # Assert the new version was sent
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json['following'])
+        self.assertEqual(response.json['stats']['followers_count'], 1)
@@ -0,0 +1,87 @@
+# Types
+from types import SimpleNamespace
+
+# Flask-JWT-Extended
+from flask_jwt_extended import verify_jwt_in_request
+
+# Base
+from tests.base.base_test_case import BaseTestCase
+
+# Factories
+from tests.factories.community_factory import CommunityFactory
+from tests.factories.post_factory import PostFactory
+from tests.factories.comment_factory import CommentFactory
+
+# Extensions
+from app.extensions.database import db
+
+# Models
+from app.models.user import User
+from app.models.community import Community
+from app.models.post import Post
+from app.models.comment import Comment
+
+# Schemas
+from app.schemas.user import UserSchema
+from app.schemas.user import user_pagination_response_schema
+from app.schemas.user import user_pagination_response_serializer
+from app.schemas.community import community_pagination_response_schema
+from app.schemas.community import community_pagination_response_serializer
+from app.schemas.post import post_pagination_response_schema
+from app.schemas.post import post_pagination_response_serializer
+from app.schemas.comment import comment_pagination_response_schema
+from app.schemas.comment import comment_pagination_response_serializer
+
+# Utils
+from app.utils.serializer import compile_schema
+
+
+class TestDump(BaseTestCase):
+    def assert_same_response(self, model, schema, serializer, path):
+        with self.app.test_request_context(path):
+            verify_jwt_in_request(optional=True)
+
+            paginated_objects = db.paginate(db.select(model).order_by(model.id), page=1, per_page=10)
+
+            expected = self.app.json.response(schema.dump(paginated_objects)).get_data()
+            response = serializer.jsonify(paginated_objects)
+
+        # Assert the compiled serializer wrote the same bytes
+        self.assertEqual(response.mimetype, 'application/json')
+        self.assertEqual(response.get_data(), expected)
+
+    def test_dump_posts(self):
+        # Create posts, with non ASCII and control characters
+        PostFactory(title='Plain title')
+        PostFactory(title='Título ünïcode ✓', content='Tab\tand \x7f delete')
+        PostFactory(content='Line\nbreak "quoted" \\ back')
+
+        # Assert the posts are serialized as Marshmallow does
+        self.assert_same_response(Post, post_pagination_response_schema, post_pagination_response_serializer, '/post?page=1')
+
+    def test_dump_comments_with_replies(self):
+        # Create a comment with nested replies
+        comment = CommentFactory()
+        reply = CommentFactory(post=comment.post, comment_id=comment.id)
+        CommentFactory(post=comment.post, comment_id=reply.id, content='Réponse')
+
+        # Assert the comments are serialized as Marshmallow does
+        self.assert_same_response(Comment, comment_pagination_response_schema, comment_pagination_response_serializer, '/comment')
+
+    def test_dump_users_and_communities(self):
+        # Create communities and their owners
+        CommunityFactory.create_batch(3)
+
+        # Assert the users and communities are serialized as Marshmallow does
+        self.assert_same_response(User, user_pagination_response_schema, user_pagination_response_serializer, '/user?per_page=10')
+        self.assert_same_response(Community, community_pagination_response_schema, community_pagination_response_serializer, '/community')
+
+    def test_dump_missing_and_none_values(self):
+        # Build a user without some attributes and without stats
+        user = SimpleNamespace(id=1, username='user', email=None, is_verified=1, stats=None)
+
+        schema = UserSchema()
+
+        # Assert the missing attributes are skipped and None is kept
+        self.assertEqual(compile_schema(schema).dump(user), schema.dump(user))
+        self.assertEqual(compile_schema(schema).dump([user, user], many=True), schema.dump([user, user], many=True))
@@ -0,0 +1,80 @@
+# contextlib
+from contextlib import contextmanager
+
+# SQLAlchemy
+from sqlalchemy import event
+
+# Extensions
+from app.extensions.database import db
+from app.extensions.cache import cache
+
+
+@contextmanager
+def capture_queries():
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+
+def count_queries_on(statements, table):
+    return sum(1 for statement in statements if f'FROM {table}' in statement)
+
+
+@contextmanager
+def capture_commits():
+    commits = []
+
+    def commit(conn):
+        commits.append(conn)
+
+    event.listen(db.engine, 'commit', commit)
+
+    try:
+        yield commits
+    finally:
+        event.remove(db.engine, 'commit', commit)
+
+
+def assert_constant_queries(test, route, create, headers=None, tables=None):
+    '''
+    Assert that reading a listing takes as many queries whatever the number
+    of rows, i.e. that serializing a page does not query once per row.
+
+    :param test: The test case.
+    :param route: The route of the listing.
+    :param create: Callable adding a given number of rows to the listing.
+    :param headers: The headers of the requests.
+    :param tables: Count only the queries on these tables, e.g. to leave
+        out the viewer flags of authenticated requests.
+    '''
+
+    def read():
+        # Start from an empty session and cache, as a cold request would
+        db.session.expunge_all()
+        cache.clear()
+
+        with capture_queries() as statements:
+            response = test.client.get(route, headers=headers or {})
+
+        test.assertEqual(response.status_code, 200)
+
+        if tables is not None:
+            statements = [statement for statement in statements if any(f'FROM {table}' in statement for table in tables)]
+
+        return len(statements)
+
+    create(1)
+    few = read()
+
+    create(4)
+    many = read()
+
+    test.assertEqual(many, few)
@@ -0,0 +1,49 @@
+# re
+import re
+
+# contextlib
+from contextlib import contextmanager
+
+# SQLAlchemy
+from sqlalchemy import event
+
+# Extensions
+from app.extensions.database import db
+
+
+FULL_SCAN = re.compile(r'^SCAN (\w+)$')
+
+
+@contextmanager
+def capture_executions():
+    executions = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        executions.append((statement, parameters))
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+    try:
+        yield executions
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+
+def explain(statement, parameters):
+    rows = db.session.connection().exec_driver_sql(f'EXPLAIN QUERY PLAN {statement}', parameters).all()
+
+    return [row[-1] for row in rows]
+
+
+def full_scans(statement, parameters):
+    tables = db.metadata.tables
+
+    scans = []
+
+    for detail in explain(statement, parameters):
+        match = FULL_SCAN.match(detail)
+
+        if match and match.group(1) in tables:
+            scans.append(match.group(1))
+
+    return scans